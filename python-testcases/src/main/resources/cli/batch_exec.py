@@ -0,0 +1,140 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Run a list of commands on a node in a single remote call.
+            The commands are shipped as one shell script which captures
+            stdout, stderr and return code of each command separately and
+            prints them back in delimited blocks. Each command is encoded
+            in the script and run by a shell of its own, so one that is
+            not valid shell fails alone.
+'''
+
+import base64
+import uuid
+
+MARKER = '@@litp-batch-{0}@@'
+
+
+def build_batch_script(cmds, token, parallel=False):
+    """
+    Description:
+        Render the shell script running the given commands
+    Args:
+        cmds (list): Commands to run
+        token (str): Unique token used to delimit the output blocks
+        parallel (bool): Run the commands concurrently
+    Returns:
+        str. The shell script
+    """
+    marker = MARKER.format(token)
+    lines = ['d=$(mktemp -d) || exit 1']
+    for index, cmd in enumerate(cmds):
+        encoded = base64.b64encode(cmd.encode('utf-8')).decode('ascii')
+        run = '/bin/sh -c "$(echo {0} | base64 -d)" >"$d/{1}.out" ' \
+              '2>"$d/{1}.err" </dev/null; echo $? >"$d/{1}.rc"'.format(
+                  encoded, index)
+        lines.append('{{ {0}; }}{1}'.format(run, ' &' if parallel else ''))
+    lines.append('wait')
+    lines.append('for i in $(seq 0 {0}); do'.format(len(cmds) - 1))
+    lines.append('  echo "{0} OUT $i"'.format(marker))
+    lines.append('  cat "$d/$i.out"; [ -n "$(tail -c1 "$d/$i.out")" ] '
+                 '&& echo')
+    lines.append('  echo "{0} ERR $i"'.format(marker))
+    lines.append('  cat "$d/$i.err"; [ -n "$(tail -c1 "$d/$i.err")" ] '
+                 '&& echo')
+    lines.append('  echo "{0} RC $i $(cat "$d/$i.rc")"'.format(marker))
+    lines.append('done')
+    lines.append('rm -rf "$d"')
+    return '\n'.join(lines) + '\n'
+
+
+def get_batch_cmd(cmds, parallel=False):
+    """
+    Description:
+        Build the single command line which runs all the given commands
+    Args:
+        cmds (list): Commands to run
+        parallel (bool): Run the commands concurrently
+    Returns:
+        str, str. The command line and the token delimiting its output
+    """
+    token = uuid.uuid4().hex
+    script = build_batch_script(cmds, token, parallel)
+    encoded = base64.b64encode(script.encode('utf-8')).decode('ascii')
+    return 'echo {0} | base64 -d | /bin/sh'.format(encoded), token
+
+
+def parse_batch_output(stdout, token, count):
+    """
+    Description:
+        Split the output of a batch back into per command results
+    Args:
+        stdout (list): Output lines of the batch command
+        token (str): Token returned by get_batch_cmd
+        count (int): Number of commands in the batch
+    Returns:
+        list. One [stdout, stderr, rc] entry per command, in order
+    Raises:
+        ValueError if the output does not hold a result for every command
+    """
+    marker = MARKER.format(token)
+    results = [None] * count
+    current = None
+    for line in stdout:
+        if not line.startswith(marker):
+            if current is not None:
+                current.append(line)
+            continue
+        fields = line[len(marker):].split()
+        index = int(fields[1])
+        if fields[0] == 'OUT':
+            results[index] = [[], [], None]
+            current = results[index][0]
+        elif fields[0] == 'ERR':
+            current = results[index][1]
+        else:
+            results[index][2] = int(fields[2]) if len(fields) > 2 else None
+            current = None
+    missing = [index for index, result in enumerate(results)
+               if result is None or result[2] is None]
+    if missing:
+        raise ValueError('No result for batched commands {0}'.format(missing))
+    return results
+
+
+class BatchExecutor(object):
+    """
+    Runs batches through any callable with the signature of
+    SessionPool.execute: execute(node, cmd) -> (stdout, stderr, rc)
+    """
+
+    def __init__(self, execute):
+        self.execute = execute
+
+    def run(self, node, cmds, parallel=False):
+        """
+        Description:
+            Run the commands on a node in one round trip
+        Args:
+            node (str): Node the commands are run on
+            cmds (list): Commands to run
+            parallel (bool): Run the commands concurrently on the node
+        Returns:
+            list. One [stdout, stderr, rc] entry per command, in order
+        """
+        if not cmds:
+            return []
+        cmd, token = get_batch_cmd(cmds, parallel)
+        stdout, stderr, returnc = self.execute(node, cmd)
+        try:
+            return parse_batch_output(stdout, token, len(cmds))
+        except ValueError:
+            raise RuntimeError('Batch failed on {0} (rc {1}): {2}'.format(
+                node, returnc, '\n'.join(stderr)))
@@ -0,0 +1,1004 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Common base class of the cli testsets
+'''
+
+import json
+import os
+import shlex
+import time
+
+import test_constants
+from litp_generic_test import GenericTest
+from litp_generic_utils import GenericUtils
+from session_pool import HOSTS_ENV, LocalSession, SessionPool, \
+    get_host_att, load_host_properties, paramiko
+from batch_exec import BatchExecutor
+from model_cache import ModelCache, is_under
+from litp_rest import get_litp_rest_utils
+from rest_client import FAKE_LITPD_ENV, LitpRestClient, get_litpd_address, \
+    httplib
+from plan_waiter import PlanWaiter, REST_PLAN_STATES
+from shared_plan import SharedPlanClient, CONCURRENT_ENV, LEAD
+from model_snapshot import ModelSnapshot, MODEL_ACTIONS, get_unapplied_paths
+from cmd_timing import CommandTimer
+from text_match import get_missing_texts
+from show_parser import parse_show, strip_inherited_marker
+from model_fixture import get_load_cmd
+from package_inventory import PackageInventory, get_inventory_cmd, \
+    get_stamp_cmd, parse_stamp
+from rpm_cache import get_changed, get_file_hash, get_install_cmd, \
+    get_query_cmd, get_remote_path, parse_query
+from help_snapshot import HelpPage, HelpSnapshot, HELP_ACTIONS, \
+    HELP_ARGS, RECORD_ENV, diff_sections, format_diffs, load_golden, \
+    save_golden
+
+# litp actions which never change the model. Commands using them carry no
+# cleanup bookkeeping in GenericTest and can be served from shortcuts
+LITP_READ_ACTIONS = ('show', 'show_plan', 'version')
+LITP_HELP_ARGS = ('-h', '--help')
+BATCH_CMD_SUFFIX = '| base64 -d | /bin/sh'
+# GenericTest.run_command option bounding the wait for a command, and its
+# default, which pooled commands honour too
+TIMEOUT_KWARG = 'connection_timeout_secs'
+DEFAULT_CMD_TIMEOUT_SECS = 600
+# test_constants plan state -> state reported by the REST API
+PLAN_STATES = dict((getattr(test_constants, name), rest_state)
+                   for name, rest_state in REST_PLAN_STATES.items()
+                   if hasattr(test_constants, name))
+
+
+def get_litp_action(cmd):
+    """
+    Description:
+        Find the litp action of a command line
+    Args:
+        cmd (str): Command line
+    Returns:
+        str. The litp action (e.g. 'create'), '' for 'litp' with no action
+             and None if the command does not run litp
+    """
+    try:
+        tokens = shlex.split(cmd)
+    except ValueError:
+        tokens = cmd.split()
+    for index, token in enumerate(tokens):
+        if token == 'litp' or token.endswith('/litp'):
+            args = tokens[index + 1:]
+            if not args or args[0].startswith('-'):
+                return ''
+            return args[0]
+    return None
+
+
+def is_read_only_cmd(cmd):
+    """
+    Description:
+        Check whether a command leaves the LITP model untouched
+    Args:
+        cmd (str): Command line
+    Returns:
+        bool. True for litp read actions and help; what other programs
+              do is not known, so False for them
+    """
+    action = get_litp_action(cmd)
+    if action is None:
+        return False
+    if action == '' or action in LITP_READ_ACTIONS:
+        return True
+    return any(arg in cmd.split() for arg in LITP_HELP_ARGS)
+
+
+def get_cmd_label(cmd):
+    """
+    Description:
+        Label a command is timed under
+    Args:
+        cmd (str): Command line
+    Returns:
+        str. 'litp <action>' for litp, 'batch' for a batch of commands,
+             otherwise the name of the program run
+    """
+    action = get_litp_action(cmd)
+    if action is not None:
+        return 'litp {0}'.format(action).rstrip()
+    if cmd.rstrip().endswith(BATCH_CMD_SUFFIX):
+        return 'batch'
+    tokens = cmd.split()
+    return tokens[0].split('/')[-1] if tokens else ''
+
+
+class CliGenericTest(GenericTest):
+    """
+    GenericTest with the plumbing shared by the cli testsets.
+
+    Commands that GenericTest has no bookkeeping for (litp commands that
+    only read the model or the help, and the read only commands of this
+    class, not run as root) are sent through a pool of persistent SSH
+    sessions that lives for the whole testset. Lists of such commands
+    given to run_commands are shipped to each node as one batch.
+
+    find is answered from a per test copy of the model which is dropped
+    by any command or REST request that may change the model, and is
+    bypassed while a plan is running. The text output of 'litp show'
+    read by execute_show_data_cmd and get_props_from_url is parsed once
+    per show on the same terms (see show_parser).
+
+    wait_for_plan_state follows the plan over REST (see plan_waiter) and
+    logs how long each phase took, or waits on the CLI when litpd does not
+    answer as expected. create_run_and_wait_for_plan shares the
+    plan with the other tests of a shared plan group when the test is run
+    by the plan scheduler (see shared_plan).
+
+    Testsets setting use_model_snapshot have the model put back after each
+    test from a snapshot taken once per testset (see model_snapshot)
+    rather than item by item; GenericTest then keeps no cleanup for litp
+    model commands. Tests run next to other model changing tests (see
+    tools/parallel_runner.py) keep the item by item cleanup.
+
+    Every command and REST request is timed (see cmd_timing) for
+    tools/cmd_report.py.
+
+    get_help serves the help of litp and its actions from a snapshot of
+    every help page, fetched in one batch the first time any testset of
+    the process asks for help on a node (see help_snapshot).
+
+    load_fixture sets up a declarative model fixture with a single
+    remote 'litp load' (see model_fixture).
+
+    provision_rpms copies and installs only the RPMs whose content is not
+    installed yet (see rpm_cache).
+
+    get_package_inventory lists the installed LITP packages once per
+    process and node, and again only after the rpm database changed (see
+    package_inventory).
+
+    get_node_att takes node addresses and passwords from the
+    host.properties named in LITP_TEST_HOSTS when the runner sets it.
+
+    With LITP_FAKE_LITPD set to the URL of a fake litpd (see fake_litpd),
+    the REST requests go to the fake and the pooled commands run in a
+    local shell.
+    """
+
+    use_session_pool = True
+    use_batch_commands = True
+    use_model_cache = True
+    use_plan_waiter = True
+    use_model_snapshot = False
+    use_cmd_timing = True
+    use_help_snapshot = True
+    _session_pool = None
+    _model_snapshot = None
+    _cmd_timer = None
+    # shared by all testsets of the process, node -> HelpSnapshot
+    _help_snapshots = {}
+    # shared by all testsets of the process, (node, group) ->
+    # PackageInventory
+    _package_inventories = {}
+    # shared by all testsets of the process, host.properties path ->
+    # output of load_host_properties
+    _env_hosts = {}
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Close the pooled sessions opened by the testset
+        """
+        if cls._session_pool is not None:
+            cls._session_pool.close()
+            cls._session_pool = None
+        if cls._cmd_timer is not None:
+            cls._cmd_timer.flush()
+        super(CliGenericTest, cls).tearDownClass()
+
+    def setUp(self):
+        """
+        Start every test with an empty model cache
+        """
+        super(CliGenericTest, self).setUp()
+        self._model_caches = {}
+        self._show_results = {}
+        self._plan_running = False
+        self._plans_run = 0
+        self._model_changed = False
+        self._rest_utils = []
+        self._fixture_paths = []
+        self._shared_plan = SharedPlanClient.from_env()
+        self._snapshot = None
+        # a restore would also undo the changes of the rest of the group,
+        # or of the tests running next to this one
+        if self.use_model_snapshot and self._shared_plan is None \
+                and not os.environ.get(CONCURRENT_ENV):
+            self._snapshot = self._get_model_snapshot()
+
+    def tearDown(self):
+        """
+        Put the model back and tear down, once the other tests of a shared
+        plan group allow it
+        """
+        client = getattr(self, '_shared_plan', None)
+        if client is not None:
+            client.wait_for_teardown()
+        try:
+            try:
+                self._restore_model()
+            finally:
+                self._log_rest_stats()
+                try:
+                    super(CliGenericTest, self).tearDown()
+                finally:
+                    # fixtures were loaded before the items of the test
+                    # that GenericTest cleans up, so they go after them
+                    if self._snapshot is None:
+                        self._remove_fixtures()
+        finally:
+            if client is not None:
+                client.leave()
+            if self._cmd_timer is not None:
+                self._cmd_timer.flush()
+
+    def _record_timing(self, kind, label, node, start):
+        """
+        Record a call that started at start and has just finished
+        """
+        if not self.use_cmd_timing:
+            return
+        cls = type(self)
+        if cls._cmd_timer is None:
+            cls._cmd_timer = CommandTimer()
+        cls._cmd_timer.record(self.id(), kind, label, node, start,
+                              time.time() - start)
+
+    def _get_model_snapshot(self):
+        """
+        Return the model snapshot of the testset, taking it on first use,
+        or None if the model cannot be restored from a snapshot
+        """
+        cls = type(self)
+        if cls._model_snapshot is None:
+            node = self.get_management_node_filename()
+            snapshot = ModelSnapshot(node, cls.__name__)
+            stdout, stderr, returnc = self.run_command(
+                node, self.cli.get_show_cmd('/', args='-r -j'),
+                logging=False)
+            try:
+                unapplied = get_unapplied_paths(json.loads('\n'.join(stdout)))
+            except ValueError:
+                unapplied = None
+            if returnc != 0 or stderr or unapplied is None:
+                snapshot.disable('model could not be read')
+            elif unapplied:
+                snapshot.disable('items not Applied: {0}'.format(
+                    ', '.join(unapplied[:5])))
+            else:
+                for branch, filepath in snapshot.files:
+                    self.execute_cli_export_cmd(node, branch, filepath)
+                snapshot.captured()
+            cls._model_snapshot = snapshot
+        if not cls._model_snapshot.usable:
+            self.log('info', 'Model snapshot not used: {0}'.format(
+                cls._model_snapshot.reason))
+            return None
+        return cls._model_snapshot
+
+    def _restore_model(self):
+        """
+        Undo the model changes of the test: from the snapshot in a fixed
+        number of commands, or else through the REST cleanup lists
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            for rest in self._rest_utils:
+                rest.clean_paths()
+            return
+        if not self._model_changed:
+            return
+        if not self._plans_run:
+            self.execute_cli_restoremodel_cmd(snapshot.node)
+        else:
+            for _, filepath in snapshot.files:
+                self.execute_cli_load_cmd(snapshot.node, '/', filepath,
+                                          '--replace')
+            _, stderr, _ = self.run_command(
+                snapshot.node, self.cli.get_create_plan_cmd())
+            if not self.is_text_in_list('DoNothingPlanError', stderr):
+                self.assertEqual([], stderr)
+                self.execute_cli_runplan_cmd(snapshot.node)
+                self.assertTrue(self.wait_for_plan_state(
+                    snapshot.node, test_constants.PLAN_COMPLETE),
+                    'Plan restoring the model snapshot did not complete')
+        self.invalidate_model_cache()
+
+    def _get_help_snapshot(self, node):
+        """
+        Return the help snapshot of a node, fetching every help page in
+        one batch on first use
+        """
+        snapshot = CliGenericTest._help_snapshots.get(node)
+        if snapshot is None:
+            snapshot = HelpSnapshot(node, GenericUtils().get_text_in_help)
+            cmds = dict((self._get_help_cmd(action, help_arg),
+                         (action, help_arg))
+                        for action in HELP_ACTIONS for help_arg in HELP_ARGS)
+            results = self.run_commands(node, sorted(cmds),
+                                        add_to_cleanup=False)
+            for cmd, (stdout, stderr, returnc) in results[node].items():
+                snapshot.add(cmds[cmd][0], cmds[cmd][1], stdout, stderr,
+                             returnc)
+            CliGenericTest._help_snapshots[node] = snapshot
+        return snapshot
+
+    def _get_help_cmd(self, action, help_arg):
+        """
+        Command line printing the help of an action, '' for litp itself
+        """
+        return ' '.join(arg for arg in (self.cli.litp_path, action, help_arg)
+                        if arg)
+
+    def _get_help_page(self, node, action, help_arg):
+        """
+        Return the help page of an action, running the command if the help
+        snapshot is not used or does not hold it
+        """
+        snapshot = None
+        if self.use_help_snapshot:
+            snapshot = self._get_help_snapshot(node)
+            page = snapshot.get(action, help_arg)
+            if page is not None:
+                return page
+        stdout, stderr, returnc = self.run_command(
+            node, self._get_help_cmd(action, help_arg), add_to_cleanup=False,
+            logging=False)
+        if snapshot is None:
+            return HelpPage(action, help_arg, stdout, stderr, returnc,
+                            GenericUtils().get_text_in_help)
+        return snapshot.add(action, help_arg, stdout, stderr, returnc)
+
+    def get_help(self, node, action='', help_arg='--help', logging=True,
+                 default_asserts=False):
+        """
+        Description:
+            Return the output of a litp help command, from the help snapshot
+            of the node unless use_help_snapshot is off
+        Args:
+            node (str): Node the CLI is run on
+            action (str): litp action, '' for the help of litp itself
+            help_arg (str): -h or --help
+            logging (bool): Log the command and its output
+            default_asserts (bool): Assert return code 0 and empty stderr
+        Returns:
+            list, list, int. stdout lines, stderr lines and return code
+        """
+        page = self._get_help_page(node, action, help_arg)
+        if logging:
+            self.log('info', '[{0}] # {1}'.format(
+                node, self._get_help_cmd(action, help_arg)))
+            for line in page.stdout + page.stderr:
+                self.log('info', line)
+        if default_asserts:
+            self.assertEqual(0, page.returnc)
+            self.assertEqual([], page.stderr)
+        return page.stdout, page.stderr, page.returnc
+
+    def get_help_section(self, node, action, section, help_arg='--help'):
+        """
+        Description:
+            Return a section of the help of an action as
+            gen_utils.get_text_in_help gives it
+        Args:
+            node (str): Node the CLI is run on
+            action (str): litp action, '' for litp itself
+            section (str): Section name, e.g. 'Usage'
+            help_arg (str): -h or --help
+        Returns:
+            str. Text of the section, None if the help has no such section
+        """
+        return self._get_help_page(node, action, help_arg).section(section)
+
+    def assert_help_matches_golden(self, node, action, help_args=HELP_ARGS):
+        """
+        Description:
+            Assert that the help of an action succeeds and that each section
+            held by its golden file matches, whitespace ignored. With
+            LITP_HELP_RECORD set the golden file is written instead.
+        Args:
+            node (str): Node the CLI is run on
+            action (str): litp action, '' for litp itself
+            help_args (tuple): Help arguments to check
+        """
+        for help_arg in help_args:
+            page = self._get_help_page(node, action, help_arg)
+            self.log('info', '[{0}] # {1}'.format(
+                node, self._get_help_cmd(action, help_arg)))
+            self.assertEqual(0, page.returnc)
+            self.assertEqual([], page.stderr)
+            self.assertNotEqual([], page.stdout, 'Standard output is empty')
+            if os.environ.get(RECORD_ENV):
+                save_golden(action, page.sections)
+                continue
+            golden = load_golden(action)
+            self.assertTrue(golden is not None, 'No golden help for litp '
+                            '{0}'.format(action).rstrip())
+            diffs = diff_sections(golden, page.sections)
+            if diffs:
+                self.fail(format_diffs(action, help_arg, diffs))
+
+    def assert_texts_in_list(self, texts, lines, what='output'):
+        """
+        Description:
+            Assert that every text is in one of the lines. The lines are
+            scanned once for all the texts (see text_match) and every
+            missing text is reported in the one failure.
+        Args:
+            texts (list): Texts to look for
+            lines (list): Lines to look in, e.g. stdout of run_command
+            what (str): Name of the lines for the failure message
+        """
+        missing = get_missing_texts(texts, lines)
+        if missing:
+            self.fail('{0} of {1} expected texts not in {2}: {3}'.format(
+                len(missing), len(texts), what,
+                ', '.join('"{0}"'.format(text) for text in missing)))
+
+    def get_node_att(self, node, att):
+        """
+        Description:
+            Return an attribute of a node. When the runner names a
+            host.properties in LITP_TEST_HOSTS, as the run.sh of a shard
+            does (see tools/shard_plan.py), the address and password of the
+            nodes it describes are taken from it, so that the tests run
+            against the MS of the shard.
+        Args:
+            node (str): Node name, e.g. ms1
+            att (str): Attribute, e.g. ipv4
+        Returns:
+            str. The value of the attribute
+        """
+        path = os.environ.get(HOSTS_ENV)
+        if path and att in ('ipv4', 'password'):
+            hosts = CliGenericTest._env_hosts.get(path)
+            if hosts is None:
+                hosts = load_host_properties(path)
+                CliGenericTest._env_hosts[path] = hosts
+            username = super(CliGenericTest, self).get_node_att(
+                node, 'username') if att == 'password' else None
+            value = get_host_att(hosts, node, att, username)
+            if value is not None:
+                return value
+        return super(CliGenericTest, self).get_node_att(node, att)
+
+    def get_session_pool(self):
+        """
+        Description:
+            Return the session pool of the testset, creating it on first use
+        Returns:
+            SessionPool. The pool, or None if sessions cannot be pooled
+        """
+        fake_litpd = os.environ.get(FAKE_LITPD_ENV)
+        if not self.use_session_pool or (paramiko is None and
+                                         not fake_litpd):
+            return None
+        cls = type(self)
+        if cls._session_pool is None:
+            # next to a fake litpd the commands run on this host, whose
+            # litp client is to be set up to reach the fake
+            cls._session_pool = SessionPool(session_factory=LocalSession) \
+                if fake_litpd else SessionPool()
+        return cls._session_pool
+
+    def _pooled(self, node):
+        """
+        Return the session pool if it can serve the given node
+        """
+        pool = self.get_session_pool()
+        if pool is None:
+            return None
+        if not pool.is_registered(node):
+            try:
+                pool.register(node, self.get_node_att(node, 'ipv4'),
+                              self.get_node_att(node, 'username'),
+                              self.get_node_att(node, 'password'))
+            except (AssertionError, AttributeError, KeyError):
+                return None
+        return pool
+
+    def run_command(self, node, cmd, add_to_cleanup=True, su_root=False,
+                    logging=True, default_asserts=False, read_only=False,
+                    **kwargs):
+        """
+        Description:
+            Run a command on a node. Read only commands run by the default
+            user go through the pooled session of the node, anything else
+            is handed to GenericTest.run_command.
+        Args:
+            node (str): Node the command is run on
+            cmd (str): Command to run
+            add_to_cleanup (bool): Passed to GenericTest.run_command
+            su_root (bool): Run the command as root
+            logging (bool): Log the command and its output
+            default_asserts (bool): Assert return code 0 and empty stderr
+            read_only (bool): The command is known to change nothing,
+                              for commands other than litp ones
+            kwargs: Passed to GenericTest.run_command; a pooled command
+                    honours connection_timeout_secs only
+        Returns:
+            list, list, int. stdout lines, stderr lines and return code
+        Raises:
+            socket.timeout. A pooled command did not finish in time
+        """
+        pool = None
+        if not su_root and set(kwargs) <= set([TIMEOUT_KWARG]) \
+                and (read_only or is_read_only_cmd(cmd)):
+            pool = self._pooled(node)
+        else:
+            self.invalidate_model_cache()
+            action = get_litp_action(cmd)
+            if action == 'run_plan':
+                self._plan_running = True
+                self._plans_run += 1
+            if action in MODEL_ACTIONS:
+                self._model_changed = True
+                if getattr(self, '_snapshot', None) is not None:
+                    # undone by the snapshot in tearDown
+                    add_to_cleanup = False
+        start = time.time()
+        try:
+            if pool is None:
+                return super(CliGenericTest, self).run_command(
+                    node, cmd, add_to_cleanup=add_to_cleanup, su_root=su_root,
+                    logging=logging, default_asserts=default_asserts, **kwargs)
+
+            if logging:
+                self.log('info', '[{0}] # {1}'.format(node, cmd))
+            stdout, stderr, returnc = pool.execute(
+                node, cmd, timeout=kwargs.get(TIMEOUT_KWARG,
+                                              DEFAULT_CMD_TIMEOUT_SECS))
+            if logging:
+                for line in stdout + stderr:
+                    self.log('info', line)
+            if default_asserts:
+                self.assertEqual(0, returnc)
+                self.assertEqual([], stderr)
+            return stdout, stderr, returnc
+        finally:
+            self._record_timing('cmd', get_cmd_label(cmd), node, start)
+
+    def run_commands(self, nodes, cmds, add_to_cleanup=True, su_root=False,
+                     parallel=False, **kwargs):
+        """
+        Description:
+            Run a list of commands on one or more nodes. When every command
+            is read only the whole list is run on each node in a single
+            remote call, otherwise GenericTest.run_commands is used.
+        Args:
+            nodes (list|str): Node(s) the commands are run on
+            cmds (list): Commands to run
+            add_to_cleanup (bool): Passed to GenericTest.run_commands
+            su_root (bool): Run the commands as root
+            parallel (bool): Run a batch concurrently on the node
+        Returns:
+            dict. Results in the layout of GenericTest.run_commands: per
+                  node, per command, [stdout, stderr, return code]
+        """
+        if isinstance(nodes, basestring):
+            nodes = [nodes]
+        batch = (self.use_batch_commands and not su_root and not kwargs
+                 and all(is_read_only_cmd(cmd) for cmd in cmds))
+        if not batch:
+            return super(CliGenericTest, self).run_commands(
+                nodes, cmds, add_to_cleanup=add_to_cleanup, su_root=su_root,
+                **kwargs)
+
+        executor = BatchExecutor(self._run_batch_cmd)
+        results = {}
+        for node in nodes:
+            self.log('info', '[{0}] running {1} commands in one batch'
+                     .format(node, len(cmds)))
+            results[node] = dict(
+                zip(cmds, executor.run(node, cmds, parallel=parallel)))
+            for cmd in cmds:
+                stdout, stderr, _ = results[node][cmd]
+                self.log('info', '[{0}] # {1}'.format(node, cmd))
+                for line in stdout + stderr:
+                    self.log('info', line)
+        return results
+
+    def _run_batch_cmd(self, node, cmd):
+        """
+        Run the command line of a batch without logging its encoded script
+        """
+        return self.run_command(node, cmd, add_to_cleanup=False,
+                                logging=False, read_only=True)
+
+    def load_fixture(self, node, fixture, expect_positive=True):
+        """
+        Description:
+            Set up the items of a model fixture (see model_fixture) in one
+            remote command, which loads the XML of each collection the
+            fixture creates items in with 'litp load --merge'. The items
+            are removed in tearDown, after the cleanup of GenericTest,
+            unless the model is restored from a snapshot.
+        Args:
+            node (str): Management node
+            fixture (ModelFixture): Items to set up
+            expect_positive (bool): Assert that the items were loaded
+        Returns:
+            list, list, int. stdout, stderr and return code of the loads
+        """
+        types = dict((path, self.execute_show_data_cmd(node, path, 'type'))
+                     for path in fixture.get_unknown_types())
+        documents = fixture.render(types)
+        self.log('info', '[{0}] loading {1} fixture items into {2}'.format(
+            node, len(fixture.items),
+            ', '.join(owner for owner, _ in documents)))
+        stdout, stderr, returnc = self.run_command(
+            node, get_load_cmd(documents, self.cli.litp_path),
+            add_to_cleanup=False, logging=False)
+        if returnc == 0:
+            self._fixture_paths.extend((node, path) for path in fixture.paths)
+        if expect_positive:
+            self.assertEqual([], stderr)
+            self.assertEqual(0, returnc)
+        return stdout, stderr, returnc
+
+    def _remove_fixtures(self):
+        """
+        Remove the items of the loaded fixtures, newest first, in one
+        remote command; descendants of a removed item go with it
+        """
+        loaded = self._fixture_paths
+        self._fixture_paths = []
+        nodes = []
+        for node, _ in loaded:
+            if node not in nodes:
+                nodes.append(node)
+        for node in nodes:
+            paths = [path for loaded_node, path in loaded
+                     if loaded_node == node]
+            paths = [path for index, path in enumerate(paths)
+                     if not any(is_under(path, other)
+                                for other in paths[:index])]
+            cmd = ' ; '.join(self.cli.get_remove_cmd(path)
+                             for path in reversed(paths))
+            self.run_command(node, cmd, add_to_cleanup=False)
+
+    def provision_rpms(self, node, rpms):
+        """
+        Description:
+            Make sure a node has packages installed from the given local
+            RPMs. The installed packages are checked in one remote query,
+            and only the RPMs that are not installed as they are locally
+            are copied and then installed in one rpm transaction. The
+            packages are left installed.
+        Args:
+            node (str): Node to install on
+            rpms (dict): Package name to the path of its local RPM
+        Returns:
+            list. Names of the packages that were installed
+        """
+        hashes = dict((name, get_file_hash(path))
+                      for name, path in rpms.items())
+        stdout, _, _ = self.run_command(node, get_query_cmd(sorted(rpms)),
+                                        add_to_cleanup=False, read_only=True)
+        changed = get_changed(hashes, *parse_query(stdout))
+        if not changed:
+            self.log('info', '[{0}] {1} already installed'.format(
+                node, ', '.join(sorted(rpms))))
+            return changed
+        remote = {}
+        for name in changed:
+            remote[name] = get_remote_path(rpms[name])
+            self.assertTrue(self.copy_file_to(node, rpms[name], remote[name],
+                                              add_to_cleanup=False))
+        _, stderr, returnc = self.run_command(
+            node, get_install_cmd(remote, hashes), add_to_cleanup=False,
+            su_root=True)
+        self.assertEqual(0, returnc, '\n'.join(stderr))
+        for key in list(CliGenericTest._package_inventories):
+            if key[0] == node:
+                del CliGenericTest._package_inventories[key]
+        return changed
+
+    def get_package_inventory(self, node, group):
+        """
+        Description:
+            Return the installed packages of a yum group, listed again only
+            when the rpm database changed since they were last listed in
+            this process
+        Args:
+            node (str): Node the packages are installed on
+            group (str): yum group, e.g. LITP2
+        Returns:
+            PackageInventory. The installed packages
+        """
+        inventory = CliGenericTest._package_inventories.get((node, group))
+        if inventory is not None:
+            stdout, _, _ = self.run_command(node, get_stamp_cmd(),
+                                            add_to_cleanup=False,
+                                            read_only=True)
+            if parse_stamp(stdout) == inventory.stamp:
+                return inventory
+        stdout, _, _ = self.run_command(node, get_inventory_cmd(group),
+                                        add_to_cleanup=False, su_root=True,
+                                        default_asserts=True)
+        inventory = PackageInventory(stdout)
+        CliGenericTest._package_inventories[(node, group)] = inventory
+        return inventory
+
+    def get_rest_utils(self, ip_address):
+        """
+        Description:
+            Return a RestUtils whose model changes drop the model cache.
+            Its cleanup list is cleaned in tearDown unless the model is
+            restored from a snapshot.
+        Args:
+            ip_address (str): IP address of the MS
+        Returns:
+            LitpRestUtils. REST client for litpd on the MS, or for the
+                           fake litpd named in LITP_FAKE_LITPD
+        """
+        rest = get_litp_rest_utils(ip_address)
+        rest.listeners.append(
+            lambda method, path, secs: self._rest_request(ip_address, method,
+                                                          secs))
+        self._rest_utils.append(rest)
+        return rest
+
+    def _log_rest_stats(self):
+        """
+        Log how many REST requests of the run so far reused a connection
+        """
+        for rest in self._rest_utils:
+            stats = rest.stats()
+            self.log('info', 'REST {0}: {1} requests over {2} connections, '
+                     '{3} reused'.format(rest.pool.host, stats['requests'],
+                                         stats['connections'],
+                                         stats['reused']))
+
+    def _rest_request(self, ip_address, method, secs):
+        """
+        Time a REST request, and note it if it may have changed the model
+        """
+        self._record_timing('rest', method, ip_address, time.time() - secs)
+        if method != 'GET':
+            self._model_changed = True
+            self.invalidate_model_cache()
+
+    def invalidate_model_cache(self):
+        """
+        Drop the cached model of every node
+        """
+        for cache in getattr(self, '_model_caches', {}).values():
+            cache.invalidate()
+        if getattr(self, '_show_results', None):
+            self._show_results = {}
+
+    def _cached_model(self, node, path):
+        """
+        Return the model cache of a node with the subtree holding the given
+        path loaded, or None if the cache cannot be used
+        """
+        if not self.use_model_cache or self._plan_running \
+                or not path.startswith('/'):
+            return None
+        cache = self._model_caches.setdefault(node, ModelCache())
+        if cache.covers(path):
+            return cache
+        # load the whole top level branch so that sibling lookups hit
+        root = '/' + path.strip('/').split('/')[0]
+        stdout, stderr, returnc = self.run_command(
+            node, self.cli.get_show_cmd(root, args='-r -j'), logging=False)
+        if returnc != 0 or stderr:
+            return None
+        try:
+            cache.load(root, json.loads('\n'.join(stdout)))
+        except ValueError:
+            return None
+        return cache
+
+    def find(self, node, path, resource, rtn_type_children=True, **kwargs):
+        """
+        Description:
+            GenericTest.find served from the model cache when possible
+        Args:
+            node (str): Node the CLI is run on
+            path (str): Path to search from
+            resource (str): Item type to look for
+            rtn_type_children (bool): If False return the collections of
+                                      the item type instead
+        Returns:
+            list. Paths of the matching items
+        """
+        cache = None if kwargs else self._cached_model(node, path)
+        if cache is not None:
+            found = cache.find(path, resource, rtn_type_children)
+            if found:
+                return found
+        return super(CliGenericTest, self).find(
+            node, path, resource, rtn_type_children, **kwargs)
+
+    def execute_show_data_cmd(self, node, url, filter_value,
+                              expect_positive=True, **kwargs):
+        """
+        Description:
+            GenericTest.execute_show_data_cmd served from the parsed
+            output of 'litp show' (see get_show_items) when the value is
+            known
+        Args:
+            node (str): Node the CLI is run on
+            url (str): Item path
+            filter_value (str): state, type, inherited from or a property
+                                name
+            expect_positive (bool): False if the value must not exist
+        Returns:
+            str. The value 'litp show -o' prints
+        """
+        if expect_positive and not kwargs:
+            items = self.get_show_items(node, url)
+            value = None if items is None or url not in items \
+                else items[url].get_value(filter_value)
+            if value is not None:
+                return value
+        return super(CliGenericTest, self).execute_show_data_cmd(
+            node, url, filter_value, expect_positive=expect_positive,
+            **kwargs)
+
+    def excl_inherit_symbol(self, value):
+        """
+        Description:
+            GenericTest.excl_inherit_symbol for single values, using the
+            marker show_parser strips
+        Args:
+            value (str): Value as 'litp show' prints it
+        Returns:
+            str. The value without the inherited marker
+        """
+        if isinstance(value, (list, tuple)):
+            return super(CliGenericTest, self).excl_inherit_symbol(value)
+        return strip_inherited_marker(value)
+
+    def get_show_items(self, node, path, args=''):
+        """
+        Description:
+            Run 'litp show' and parse its text output (see show_parser).
+            The result is kept until the model may have changed, so the
+            same show is run and parsed once.
+        Args:
+            node (str): Node the CLI is run on
+            path (str): Path to show
+            args (str): Further show arguments, e.g. '-r' or '-l'
+        Returns:
+            dict. Path to ShowItem, None if the show failed
+        """
+        key = (node, path, args)
+        items = self._show_results.get(key)
+        if items is None:
+            stdout, stderr, returnc = self.run_command(
+                node, self.cli.get_show_cmd(path, args=args), logging=False)
+            if returnc != 0 or stderr:
+                return None
+            items = parse_show(stdout)
+            if not self._plan_running:
+                self._show_results[key] = items
+        return items
+
+    def get_props_from_url(self, node, url, filter_prop=None, **kwargs):
+        """
+        Description:
+            GenericTest.get_props_from_url, with the text output of
+            'litp show' (show_option='') parsed by show_parser
+        Args:
+            node (str): Node the CLI is run on
+            url (str): Item path
+            filter_prop (str): Only return the value of this property
+        Returns:
+            dict|str. Properties, values marked [*] when inherited, or the
+                      value of filter_prop (None if the item has no such
+                      property)
+        """
+        items = None
+        if kwargs == {'show_option': ''}:
+            items = self.get_show_items(node, url)
+        if items is None or url not in items:
+            return super(CliGenericTest, self).get_props_from_url(
+                node, url, filter_prop, **kwargs)
+        if filter_prop is not None:
+            return items[url].get_property(filter_prop)
+        return items[url].get_properties()
+
+    def get_rest_client(self, node):
+        """
+        Description:
+            Return a REST client for litpd on a node
+        Args:
+            node (str): Management node
+        Returns:
+            LitpRestClient. Client authenticated as the node's user, for
+                            the fake litpd named in LITP_FAKE_LITPD if any
+        """
+        host, port, secure = get_litpd_address(
+            self.get_node_att(node, 'ipv4'))
+        return LitpRestClient(host, port,
+                              username=self.get_node_att(node, 'username'),
+                              password=self.get_node_att(node, 'password'),
+                              secure=secure)
+
+    def wait_for_plan_state(self, node, state, timeout_mins=15, **kwargs):
+        """
+        Description:
+            Wait for the plan to reach a state. Unless told otherwise the
+            plan is followed over REST and the wait ends as soon as the
+            plan reaches a final state; the model cache is then dropped.
+        Args:
+            node (str): Management node
+            state (int): test_constants plan state to wait for
+            timeout_mins (int): Maximum time to wait
+        Returns:
+            bool. True if the plan reached the expected state
+        """
+        result = None
+        if self.use_plan_waiter and not kwargs and state in PLAN_STATES:
+            client = self.get_rest_client(node)
+            waiter = PlanWaiter(client)
+            try:
+                result = waiter.wait(PLAN_STATES[state], timeout_mins * 60)
+            except (RuntimeError, IOError, httplib.HTTPException) as error:
+                self.log('info', 'Plan not followed over REST, waiting on '
+                         'the CLI: {0}'.format(error))
+            finally:
+                client.close()
+            for phase_id, secs in waiter.phase_durations():
+                self.log('info', 'Plan phase {0} took {1:.1f}s'
+                         .format(phase_id, secs))
+        if result is None:
+            result = super(CliGenericTest, self).wait_for_plan_state(
+                node, state, timeout_mins=timeout_mins, **kwargs)
+        self.invalidate_model_cache()
+        self._plan_running = False
+        return result
+
+    def _run_own_plan(self, node, timeout_mins):
+        """
+        Create and run a plan and wait for it to complete
+        """
+        self.execute_cli_createplan_cmd(node)
+        self.execute_cli_runplan_cmd(node)
+        return self.wait_for_plan_state(node, test_constants.PLAN_COMPLETE,
+                                        timeout_mins=timeout_mins)
+
+    def create_run_and_wait_for_plan(self, node, timeout_mins=60):
+        """
+        Description:
+            Create and run a plan and wait for it to complete. In a shared
+            plan group the call returns once a plan holding the changes of
+            every test of the group has run.
+        Args:
+            node (str): Management node
+            timeout_mins (int): Maximum time to wait for the plan
+        Returns:
+            bool. True if the plan completed successfully
+        """
+        client = self._shared_plan
+        if client is None:
+            return self._run_own_plan(node, timeout_mins)
+        outcome = client.wait_for_plan()
+        if outcome != LEAD:
+            self.log('info', 'Plan run by another test of the group {0}'
+                     .format('succeeded' if outcome else 'failed'))
+            self.invalidate_model_cache()
+            return outcome
+        success = False
+        try:
+            success = self._run_own_plan(node, timeout_mins)
+        finally:
+            client.plan_done(success)
+        return success
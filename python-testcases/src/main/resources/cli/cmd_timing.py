@@ -0,0 +1,85 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Records how long each command and REST request made by the cli
+            testsets takes. Every nosetests process appends its records as
+            JSON lines to a file of its own under LITP_CMD_TIMING_DIR
+            (default: cmd_timings), from which tools/cmd_report.py builds
+            the report.
+'''
+
+import json
+import os
+
+TIMING_DIR_ENV = 'LITP_CMD_TIMING_DIR'
+DEFAULT_TIMING_DIR = 'cmd_timings'
+
+
+def get_test_key(test_id):
+    """
+    Description:
+        Key a test is reported under, the same whether it comes from
+        unittest or from a nose xunit report
+    Args:
+        test_id (str): e.g. cli.testset_story245.Story245.test_01_p_create
+    Returns:
+        str. e.g. Story245.test_01_p_create
+    """
+    return '.'.join(test_id.split('.')[-2:])
+
+
+class CommandTimer(object):
+    """
+    Collects timing records in memory and appends them to the timing file
+    of the process on flush()
+    """
+
+    def __init__(self, directory=None):
+        if directory is None:
+            directory = os.environ.get(TIMING_DIR_ENV, DEFAULT_TIMING_DIR)
+        self.directory = directory
+        self.records = []
+
+    def record(self, test_id, kind, label, node, start, secs):
+        """
+        Description:
+            Add a timing record
+        Args:
+            test_id (str): Test the call was made by
+            kind (str): cmd or rest
+            label (str): What was run, e.g. 'litp create' or 'POST'
+            node (str): Node or address the call went to
+            start (float): When the call started
+            secs (float): How long the call took
+        """
+        self.records.append({'test': get_test_key(test_id), 'kind': kind,
+                             'label': label, 'node': node,
+                             'start': round(start, 3),
+                             'secs': round(secs, 4)})
+
+    def flush(self):
+        """
+        Append the records to the timing file and forget them
+        """
+        if not self.records or not self.directory:
+            return
+        if not os.path.isdir(self.directory):
+            try:
+                os.makedirs(self.directory)
+            except OSError:
+                # created by another process in the meantime
+                pass
+        path = os.path.join(self.directory,
+                            'timings_{0}.jsonl'.format(os.getpid()))
+        with open(path, 'a') as timings:
+            for record in self.records:
+                timings.write(json.dumps(record) + '\n')
+        self.records = []
+
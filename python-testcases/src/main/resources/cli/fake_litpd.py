@@ -0,0 +1,840 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   In memory stand-in for the litpd REST API, used to run the
+            functional logic of the cli testsets and the benchmarks
+            without a deployed MS.
+
+            Covers items and properties, inherit with live source values
+            and the [*] semantics of properties-overwritten, item states
+            (Initial, Applied, Updated, ForRemoval), plan create, run,
+            stop and remove with timed tasks, and the ValidationError,
+            InvalidLocationError, ItemExistsError, InvalidRequestError and
+            DoNothingPlanError responses.
+
+            The cli testsets send their REST requests to a fake litpd
+            instead of the MS when LITP_FAKE_LITPD holds its URL (see
+            rest_client.get_litpd_address), and then run their pooled
+            commands in a local shell.
+
+            Usage:
+                python fake_litpd.py [--port 9999] [--certfile cert.pem]
+                                     [--nodes 2] [--task-secs 0.1]
+                LITP_FAKE_LITPD=http://127.0.0.1:9999 nosetests ...
+'''
+
+import argparse
+import json
+import re
+import ssl
+import threading
+import time
+
+try:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+    from urlparse import urlparse, parse_qs
+except ImportError:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+    from urllib.parse import urlparse, parse_qs
+
+REST_ROOT = '/litp/rest/v1'
+DEFAULT_PORT = 9999
+DEFAULT_TASK_SECS = 0.1
+TASKS_PER_PHASE = 5
+
+BOOLEAN = r'^(true|false)$'
+INTEGER = r'^[0-9]+$'
+ANY = r'^.*$'
+
+# item type -> (properties with the regex their values must match,
+#               mandatory properties, child collections created with it)
+ITEM_TYPES = {
+    'deployment': ({}, (), {'clusters': 'collection-of-cluster'}),
+    'cluster': ({}, (), {'nodes': 'collection-of-node',
+                         'configs': 'collection-of-cluster-config'}),
+    'node': ({'hostname': r'^[a-zA-Z0-9\-]+$'}, ('hostname',),
+             {'items': 'ref-collection-of-software-item',
+              'configs': 'collection-of-node-config'}),
+    'ms': ({'hostname': r'^[a-zA-Z0-9\-]+$'}, ('hostname',),
+           {'items': 'ref-collection-of-software-item',
+            'configs': 'collection-of-node-config'}),
+    'os-profile': ({'name': ANY, 'version': ANY, 'path': ANY, 'arch': ANY,
+                    'breed': ANY, 'kopts_post': ANY},
+                   ('name', 'path'), {}),
+    'package': ({'name': ANY, 'version': ANY, 'release': ANY, 'arch': ANY,
+                 'config': r'^(keep|replace)$', 'epoch': INTEGER,
+                 'repository': ANY, 'replaces': ANY},
+                ('name',), {}),
+    'package-list': ({'name': ANY, 'version': ANY}, ('name',),
+                     {'packages': 'collection-of-package'}),
+    'yum-repository': ({'name': ANY, 'ms_url_path': ANY, 'base_url': ANY,
+                        'cache_metadata': BOOLEAN, 'checksum': ANY},
+                       ('name',), {}),
+    'logrotate-rule-config': ({}, (),
+                              {'rules': 'collection-of-logrotate-rule'}),
+    'logrotate-rule': ({'name': ANY, 'path': ANY, 'rotate': INTEGER,
+                        'size': r'^[0-9]+[kMG]?$', 'copytruncate': BOOLEAN,
+                        'compress': BOOLEAN, 'copy': BOOLEAN,
+                        'delaycompress': BOOLEAN},
+                       ('name', 'path'), {}),
+    'firewall-node-config': ({}, (), {'rules': 'collection-of-firewall-rule'}),
+    'firewall-cluster-config': ({}, (),
+                                {'rules': 'collection-of-firewall-rule'}),
+    'firewall-rule': ({'name': ANY, 'source': ANY, 'dport': ANY,
+                       'proto': ANY, 'provider': r'^(iptables|ip6tables)$',
+                       'chain': r'^(INPUT|OUTPUT|FORWARD)$', 'action': ANY},
+                      ('name',), {}),
+}
+
+ERROR_STATUS = {
+    'InvalidLocationError': 404,
+    'ItemExistsError': 409,
+    'ValidationError': 422,
+    'DoNothingPlanError': 422,
+    'InvalidRequestError': 422,
+    'MethodNotAllowedError': 405,
+}
+
+
+class LitpError(Exception):
+    """
+    Error reported to the client in the litpd message format
+    """
+
+    def __init__(self, error_type, message, path=None, property_name=None):
+        super(LitpError, self).__init__(message)
+        self.error_type = error_type
+        self.message = message
+        self.path = path
+        self.property_name = property_name
+
+    def to_dict(self, base):
+        """
+        Description:
+            Render the error as litpd does
+        Args:
+            base (str): URL prefix of the REST API
+        Returns:
+            dict. Response body
+        """
+        msg = {'type': self.error_type, 'message': self.message,
+               '_links': {'self': {'href': base + (self.path or '/')}}}
+        if self.property_name:
+            msg['property_name'] = self.property_name
+        return {'messages': [msg]}
+
+
+class Item(object):
+    """
+    Model item. Properties of an inherited item are read live from its
+    source unless they are overwritten locally.
+    """
+
+    def __init__(self, item_id, item_type, parent=None, properties=None,
+                 source=None):
+        self.id = item_id
+        self.type = item_type
+        self.parent = parent
+        self.children = {}
+        self.order = []
+        self.local = dict(properties or {})
+        self.source = source
+        self.references = []
+        self.applied = None
+        self.for_removal = False
+        if source is not None:
+            source.references.append(self)
+
+    @property
+    def path(self):
+        """ Model path of the item """
+        if self.parent is None:
+            return '/'
+        parent = self.parent.path
+        return (parent if parent != '/' else '') + '/' + self.id
+
+    def add(self, child):
+        """ Attach a child item """
+        self.children[child.id] = child
+        self.order.append(child.id)
+        return child
+
+    def detach(self, child_id):
+        """ Remove a child item """
+        del self.children[child_id]
+        self.order.remove(child_id)
+
+    def walk(self):
+        """ This item and all its descendants, parents first """
+        yield self
+        for child_id in self.order:
+            for item in self.children[child_id].walk():
+                yield item
+
+    def properties(self):
+        """ Effective properties of the item """
+        props = self.source.properties() if self.source is not None else {}
+        props.update(self.local)
+        return props
+
+    def is_for_removal(self):
+        """ True if the item or its source is marked for removal """
+        return self.for_removal or (self.source is not None
+                                    and self.source.is_for_removal())
+
+    def state(self):
+        """ LITP state of the item """
+        if self.applied is None:
+            return 'Initial'
+        if self.is_for_removal():
+            return 'ForRemoval'
+        if self.properties() != self.applied:
+            return 'Updated'
+        return 'Applied'
+
+
+class Plan(object):
+    """
+    Plan made of timed tasks, one per item which is not Applied
+    """
+
+    def __init__(self, items, tasks_per_phase=TASKS_PER_PHASE):
+        self.state = 'initial'
+        self.phases = []
+        for start in range(0, len(items), tasks_per_phase):
+            self.phases.append([{'item': item, 'state': 'Initial',
+                                 'description': '{0} {1}'.format(
+                                     'Remove' if item.is_for_removal()
+                                     else 'Configure', item.path)}
+                                for item in items[start:start +
+                                                  tasks_per_phase]])
+
+    def tasks(self):
+        """ All the tasks of the plan in execution order """
+        return [task for phase in self.phases for task in phase]
+
+
+class FakeLitpModel(object):
+    """
+    The model and the plan, guarded by one lock. Every change bumps
+    version and wakes up the requests waiting for one.
+    """
+
+    def __init__(self, task_secs=DEFAULT_TASK_SECS,
+                 tasks_per_phase=TASKS_PER_PHASE):
+        self.task_secs = task_secs
+        self.tasks_per_phase = tasks_per_phase
+        self.fail_paths = set()
+        self.root = Item('', 'root')
+        self.plan = None
+        self.version = 0
+        self.changed = threading.Condition(threading.RLock())
+
+    def _bump(self):
+        """ Record a change; the lock must be held """
+        self.version += 1
+        self.changed.notify_all()
+
+    def get(self, path):
+        """
+        Description:
+            Find an item
+        Args:
+            path (str): Model path
+        Returns:
+            Item. The item
+        Raises:
+            LitpError InvalidLocationError if there is no such item
+        """
+        item = self.root
+        for part in [part for part in path.split('/') if part]:
+            item = item.children.get(part)
+            if item is None:
+                raise LitpError('InvalidLocationError', 'Not found', path)
+        return item
+
+    @staticmethod
+    def _validate(item_type, props, path, deleted=()):
+        """ Check property names and values against ITEM_TYPES """
+        if item_type not in ITEM_TYPES:
+            return
+        allowed, mandatory, _ = ITEM_TYPES[item_type]
+        for name, value in props.items():
+            if name not in allowed:
+                raise LitpError('ValidationError',
+                                '"{0}" is not an allowed property of {1}'
+                                .format(name, item_type), path, name)
+            if not re.match(allowed[name], value):
+                raise LitpError('ValidationError',
+                                "Invalid value '{0}'.".format(value),
+                                path, name)
+        for name in deleted:
+            if name in mandatory:
+                raise LitpError('ValidationError',
+                                'ItemType "{0}" is required to have a '
+                                'property with name "{1}"'
+                                .format(item_type, name), path, name)
+
+    def _new_item(self, parent, item_id, item_type, props, source=None):
+        """ Create an item and the collections its type comes with """
+        item = parent.add(Item(item_id, item_type, parent, props, source))
+        for name, coll_type in ITEM_TYPES.get(item_type,
+                                              ({}, (), {}))[2].items():
+            if source is not None and name in source.children:
+                continue
+            item.add(Item(name, coll_type, item))
+        if source is not None:
+            for child_id in source.order:
+                child = source.children[child_id]
+                self._new_item(item, child_id, child.type, {}, child)
+        return item
+
+    def create(self, parent_path, item_id, item_type, props):
+        """
+        Description:
+            Create an item (POST with a type)
+        Returns:
+            Item. The new item
+        """
+        with self.changed:
+            parent = self.get(parent_path)
+            if not item_id or not item_type:
+                raise LitpError('InvalidRequestError',
+                                'Both id and type must be given', parent_path)
+            path = parent_path.rstrip('/') + '/' + item_id
+            if item_id in parent.children:
+                raise LitpError('ItemExistsError',
+                                'Item {0} already exists'.format(path), path)
+            self._validate(item_type, props, path)
+            missing = [name for name in ITEM_TYPES.get(
+                item_type, ({}, (), {}))[1] if name not in props]
+            if missing:
+                raise LitpError('ValidationError',
+                                'ItemType "{0}" is required to have a '
+                                'property with name "{1}"'.format(
+                                    item_type, missing[0]), path, missing[0])
+            item = self._new_item(parent, item_id, item_type, props)
+            self._bump()
+            return item
+
+    def inherit(self, parent_path, item_id, source_path, props):
+        """
+        Description:
+            Create a reference to a source item (POST with inherit)
+        Returns:
+            Item. The new reference
+        """
+        with self.changed:
+            parent = self.get(parent_path)
+            path = parent_path.rstrip('/') + '/' + item_id
+            source = self.get(source_path)
+            if item_id in parent.children:
+                raise LitpError('ItemExistsError',
+                                'Item {0} already exists'.format(path), path)
+            self._validate(source.type, props, path)
+            item = self._new_item(parent, item_id, source.type, props, source)
+            self._bump()
+            return item
+
+    def update(self, path, props):
+        """
+        Description:
+            Update and delete (null value) properties of an item (PUT)
+        Returns:
+            Item. The updated item
+        """
+        with self.changed:
+            item = self.get(path)
+            updates = dict((name, value) for name, value in props.items()
+                           if value is not None)
+            deleted = [name for name, value in props.items() if value is None]
+            self._validate(item.type, updates, path,
+                           deleted if item.source is None else ())
+            for name in deleted:
+                if name not in item.properties():
+                    raise LitpError('ValidationError',
+                                    'Unable to delete property "{0}" as it '
+                                    'does not exist'.format(name), path, name)
+            item.local.update(updates)
+            for name in deleted:
+                item.local.pop(name, None)
+            item.for_removal = False
+            self._bump()
+            return item
+
+    def _delete_now(self, item):
+        """ Drop an item, its descendants and their references """
+        for descendant in list(item.walk()):
+            for reference in list(descendant.references):
+                if reference.parent is not None \
+                        and reference.id in reference.parent.children:
+                    self._delete_now(reference)
+            # a reference inheriting from another one of the same subtree
+            # may have been dropped with it already
+            if descendant.source is not None \
+                    and descendant in descendant.source.references:
+                descendant.source.references.remove(descendant)
+        item.parent.detach(item.id)
+
+    def remove(self, path):
+        """
+        Description:
+            Remove an item (DELETE); Initial items go at once, others are
+            marked ForRemoval
+        Returns:
+            Item. The removed item
+        """
+        with self.changed:
+            item = self.get(path)
+            if item.parent is None or item.parent.parent is None:
+                raise LitpError('MethodNotAllowedError',
+                                'Item {0} cannot be removed'.format(path),
+                                path)
+            if item.applied is None:
+                self._delete_now(item)
+            else:
+                for descendant in item.walk():
+                    descendant.for_removal = True
+            self._bump()
+            return item
+
+    def create_plan(self):
+        """
+        Description:
+            Create the plan from the items which are not Applied
+        Returns:
+            Plan. The new plan
+        """
+        with self.changed:
+            if self.plan is not None and self.plan.state in ('running',
+                                                            'stopping'):
+                raise LitpError('InvalidRequestError',
+                                'Plan is currently running', '/plans')
+            items = [item for item in self.root.walk()
+                     if item.parent is not None
+                     and not item.type.startswith('collection-of')
+                     and not item.type.startswith('ref-collection-of')
+                     and item.state() != 'Applied']
+            if not items:
+                raise LitpError('DoNothingPlanError',
+                                'Create plan failed: no tasks were generated',
+                                '/plans')
+            self.plan = Plan(items, self.tasks_per_phase)
+            self._bump()
+            return self.plan
+
+    def run_plan(self):
+        """ Start running the plan in the background """
+        with self.changed:
+            if self.plan is None:
+                raise LitpError('InvalidLocationError', 'Plan does not exist',
+                                '/plans/plan')
+            if self.plan.state != 'initial':
+                raise LitpError('InvalidRequestError',
+                                'Plan not in initial state', '/plans/plan')
+            self.plan.state = 'running'
+            self._bump()
+            runner = threading.Thread(target=self._execute, args=(self.plan,))
+            runner.daemon = True
+            runner.start()
+
+    def stop_plan(self):
+        """ Ask the running plan to stop after its current task """
+        with self.changed:
+            if self.plan is None or self.plan.state != 'running':
+                raise LitpError('InvalidRequestError', 'Plan not running',
+                                '/plans/plan')
+            self.plan.state = 'stopping'
+            self._bump()
+
+    def remove_plan(self):
+        """ Delete the plan """
+        with self.changed:
+            if self.plan is None:
+                raise LitpError('InvalidLocationError', 'Plan does not exist',
+                                '/plans/plan')
+            if self.plan.state in ('running', 'stopping'):
+                raise LitpError('InvalidRequestError',
+                                'Removing a running/stopping plan is not '
+                                'allowed', '/plans/plan')
+            self.plan = None
+            self._bump()
+
+    def _execute(self, plan):
+        """ Run the tasks of a plan, then apply the model """
+        for task in plan.tasks():
+            with self.changed:
+                if plan.state == 'stopping':
+                    plan.state = 'stopped'
+                    self._bump()
+                    return
+                task['state'] = 'Running'
+                self._bump()
+            time.sleep(self.task_secs)
+            with self.changed:
+                if task['item'].path in self.fail_paths:
+                    task['state'] = 'Failed'
+                    plan.state = 'failed'
+                    self._bump()
+                    return
+                task['state'] = 'Success'
+                self._apply(task['item'])
+                self._bump()
+        with self.changed:
+            plan.state = 'stopped' if plan.state == 'stopping' \
+                else 'successful'
+            self._bump()
+
+    def _apply(self, item):
+        """ Make an item Applied, or drop it if it was for removal """
+        attached = item.parent is not None \
+            and item.parent.children.get(item.id) is item
+        if not attached:
+            return
+        if item.is_for_removal():
+            self._delete_now(item)
+            return
+        item.applied = item.properties()
+        ancestor = item.parent
+        while ancestor is not None and ancestor.applied is None:
+            ancestor.applied = ancestor.properties()
+            ancestor = ancestor.parent
+        for child in item.walk():
+            if child.type.startswith(('collection-of', 'ref-collection-of')):
+                child.applied = child.properties()
+
+    def render_item(self, item, base, depth):
+        """
+        Description:
+            Render an item as the REST API does
+        Args:
+            item (Item): Item to render
+            base (str): URL prefix of the REST API
+            depth (int): Levels of children to embed
+        Returns:
+            dict. REST representation
+        """
+        # items inherited from a source are typed as references to it
+        type_name = item.type if item.source is None \
+            else 'reference-to-' + item.type
+        data = {'id': item.id or '/', 'item-type-name': type_name,
+                'state': item.state(),
+                'applied_properties_determinable': True,
+                '_links': {'self': {'href': base + item.path},
+                           'item-type': {'href': base.replace(
+                               REST_ROOT, REST_ROOT + '/item-types') +
+                               '/' + item.type}}}
+        props = item.properties()
+        if props:
+            data['properties'] = props
+        if item.source is not None:
+            data['_links']['inherited-from'] = {
+                'href': base + item.source.path}
+            if item.local:
+                data['properties-overwritten'] = sorted(item.local)
+        if depth > 0 and item.order:
+            data['_embedded'] = {'item': [
+                self.render_item(item.children[child_id], base, depth - 1)
+                for child_id in item.order]}
+        return data
+
+    def render_plan(self, base, depth):
+        """ Render /plans/plan as the REST API does """
+        plan = self.plan
+        data = {'id': 'plan', 'item-type-name': 'plan', 'state': plan.state,
+                '_links': {'self': {'href': base + '/plans/plan'}}}
+        if depth > 0:
+            phases = []
+            for index, phase in enumerate(plan.phases, 1):
+                tasks = [{'id': str(num), 'item-type-name': 'task',
+                          'state': task['state'],
+                          'description': task['description'],
+                          'call_type': 'fake_litpd',
+                          '_links': {'rel': {'href':
+                                             base + task['item'].path}}}
+                         for num, task in enumerate(phase, 1)]
+                phases.append({'id': str(index), 'item-type-name': 'phase',
+                               '_embedded': {'item': [{
+                                   'id': 'tasks',
+                                   'item-type-name': 'collection-of-task',
+                                   '_embedded': {'item': tasks}}]}})
+            data['_embedded'] = {'item': [{
+                'id': 'phases', 'item-type-name': 'collection-of-phase',
+                '_embedded': {'item': phases}}]}
+        return data
+
+
+def build_default_model(model, nodes=2):
+    """
+    Description:
+        Populate a model with the skeleton of a deployed two node system
+    Args:
+        model (FakeLitpModel): Empty model
+        nodes (int): Number of peer nodes in the deployment
+    """
+    root = model.root
+    for name, item_type in (('deployments', 'collection-of-deployment'),
+                            ('infrastructure', 'infrastructure'),
+                            ('litp', 'litp'), ('plans', 'collection-of-plan'),
+                            ('software', 'software')):
+        root.add(Item(name, item_type, root))
+    software = model.get('/software')
+    for name, item_type in (('items', 'collection-of-software-item'),
+                            ('profiles', 'collection-of-profile'),
+                            ('deployables', 'collection-of-software-item')):
+        software.add(Item(name, item_type, software))
+    model.create('/software/profiles', 'rhel_7', 'os-profile',
+                 {'name': 'sample-profile', 'version': 'rhel7',
+                  'path': '/var/www/html/7/os/x86_64/', 'arch': 'x86_64',
+                  'breed': 'redhat'})
+    model._new_item(root, 'ms', 'ms', {'hostname': 'ms1'})
+    model.get('/ms/configs').add(Item('logrotate', 'logrotate-rule-config',
+                                      model.get('/ms/configs')))
+    model.create('/deployments', 'd1', 'deployment', {})
+    model.create('/deployments/d1/clusters', 'c1', 'cluster', {})
+    model.create('/deployments/d1/clusters/c1/configs', 'fw_config',
+                 'firewall-cluster-config', {})
+    for num in range(1, nodes + 1):
+        node = '/deployments/d1/clusters/c1/nodes/n{0}'.format(num)
+        model.create('/deployments/d1/clusters/c1/nodes', 'n{0}'.format(num),
+                     'node', {'hostname': 'node{0}'.format(num)})
+        model.inherit(node, 'os', '/software/profiles/rhel_7', {})
+        model.create(node + '/configs', 'logrotate',
+                     'logrotate-rule-config', {})
+        model.create(node + '/configs', 'fw_config',
+                     'firewall-node-config', {})
+    for item in root.walk():
+        item.applied = item.properties()
+
+
+class FakeLitpdHandler(BaseHTTPRequestHandler):
+    """
+    Maps the REST requests onto FakeLitpModel
+    """
+
+    protocol_version = 'HTTP/1.1'
+    # the status line and headers go out in separate writes, which Nagle
+    # would hold back for the client's delayed ACK on every response
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        """ Keep the test output clean """
+        pass
+
+    def _base(self):
+        """ URL prefix of the REST API as seen by the client """
+        scheme = 'https' if self.server.secure else 'http'
+        return '{0}://localhost:{1}{2}'.format(
+            scheme, self.server.server_address[1], REST_ROOT)
+
+    def _send(self, status, body=None, headers=None):
+        """ Send a JSON response """
+        data = json.dumps(body).encode('utf-8') if body is not None else b''
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _request(self):
+        """ Model path, query and decoded body of the request """
+        url = urlparse(self.path)
+        if not url.path.startswith(REST_ROOT):
+            raise LitpError('InvalidLocationError', 'Not found', url.path)
+        path = url.path[len(REST_ROOT):].rstrip('/') or '/'
+        length = int(self.headers.get('Content-Length') or 0)
+        raw = self.rfile.read(length) if length else b''
+        try:
+            body = json.loads(raw.decode('utf-8')) if raw else {}
+        except ValueError:
+            raise LitpError('InvalidRequestError', 'Invalid JSON', path)
+        return path, parse_qs(url.query), body
+
+    def _handle(self, method):
+        """ Dispatch a request and turn LitpErrors into responses """
+        model = self.server.model
+        try:
+            path, query, body = self._request()
+            depth = query.get('recurse_depth', ['1'])[0]
+            if not re.match(INTEGER, depth):
+                raise LitpError('InvalidRequestError',
+                                'Invalid value for recurse_depth', path)
+            depth = int(depth)
+            if path == '/plans/plan' or path.startswith('/plans/plan/'):
+                self._handle_plan(method, path, body, depth)
+                return
+            if method == 'GET':
+                with model.changed:
+                    data = model.render_item(model.get(path), self._base(),
+                                             depth)
+                self._send(200, data)
+            elif method == 'POST' and path == '/plans':
+                with model.changed:
+                    model.create_plan()
+                    data = model.render_plan(self._base(), 0)
+                self._send(201, data)
+            elif method == 'POST':
+                props = body.get('properties', {})
+                if 'inherit' in body:
+                    source = body['inherit'].split(REST_ROOT)[-1]
+                    item = model.inherit(path, body.get('id'), source, props)
+                else:
+                    item = model.create(path, body.get('id'),
+                                        body.get('type'), props)
+                with model.changed:
+                    data = model.render_item(item, self._base(), 0)
+                self._send(201, data)
+            elif method == 'PUT':
+                item = model.update(path, body.get('properties', {}))
+                with model.changed:
+                    data = model.render_item(item, self._base(), 0)
+                self._send(200, data)
+            elif method == 'DELETE':
+                item = model.remove(path)
+                with model.changed:
+                    data = model.render_item(item, self._base(), 0)
+                self._send(200, data)
+        except LitpError as error:
+            self._send(ERROR_STATUS.get(error.error_type, 400),
+                       error.to_dict(self._base()))
+
+    def _handle_plan(self, method, path, body, depth):
+        """ Requests on /plans/plan """
+        model = self.server.model
+        if method == 'GET':
+            self._get_plan(depth)
+            return
+        if method == 'PUT' and path == '/plans/plan':
+            state = body.get('properties', {}).get('state')
+            if state == 'running':
+                model.run_plan()
+            elif state == 'stopped':
+                model.stop_plan()
+            else:
+                raise LitpError('InvalidRequestError',
+                                'Invalid state {0}'.format(state), path)
+        elif method == 'DELETE' and path == '/plans/plan':
+            model.remove_plan()
+            self._send(200, {'id': 'plan'})
+            return
+        else:
+            raise LitpError('MethodNotAllowedError', 'Not allowed', path)
+        with model.changed:
+            data = model.render_plan(self._base(), 0)
+        self._send(200, data)
+
+    def _get_plan(self, depth):
+        """
+        GET /plans/plan, honouring If-None-Match and Prefer: wait so that
+        clients can long poll for plan changes
+        """
+        model = self.server.model
+        etag = self.headers.get('If-None-Match')
+        wait = re.search(r'wait=(\d+)', self.headers.get('Prefer') or '')
+        deadline = time.time() + (int(wait.group(1)) if wait else 0)
+        with model.changed:
+            while etag == '"{0}"'.format(model.version) \
+                    and time.time() < deadline:
+                model.changed.wait(deadline - time.time())
+            if model.plan is None:
+                raise LitpError('InvalidLocationError', 'Plan does not exist',
+                                '/plans/plan')
+            current = '"{0}"'.format(model.version)
+            if etag == current:
+                self._send(304, headers={'ETag': current})
+                return
+            data = model.render_plan(self._base(), depth)
+        self._send(200, data, {'ETag': current})
+
+    def do_GET(self):
+        """ GET """
+        self._handle('GET')
+
+    def do_POST(self):
+        """ POST """
+        self._handle('POST')
+
+    def do_PUT(self):
+        """ PUT """
+        self._handle('PUT')
+
+    def do_DELETE(self):
+        """ DELETE """
+        self._handle('DELETE')
+
+
+class FakeLitpd(ThreadingMixIn, HTTPServer):
+    """
+    Threaded HTTP(S) server around a FakeLitpModel. Bind to port 0 to get
+    a free port; server_address[1] holds the port in use.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, port=DEFAULT_PORT, model=None, certfile=None,
+                 host='127.0.0.1'):
+        HTTPServer.__init__(self, (host, port), FakeLitpdHandler)
+        if model is None:
+            model = FakeLitpModel()
+            build_default_model(model)
+        self.model = model
+        self.secure = certfile is not None
+        if self.secure:
+            context = ssl.SSLContext(ssl.PROTOCOL_SSLv23)
+            context.load_cert_chain(certfile)
+            self.socket = context.wrap_socket(self.socket, server_side=True)
+        self._thread = None
+
+    @property
+    def port(self):
+        """ Port the server listens on """
+        return self.server_address[1]
+
+    def start(self):
+        """ Serve requests in a background thread """
+        self._thread = threading.Thread(target=self.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """ Stop serving and release the port """
+        self.shutdown()
+        self.server_close()
+
+
+def main():
+    """
+    Run a fake litpd in the foreground
+    """
+    summary = __doc__.split('@summary:')[1].split('Usage:')[0]
+    parser = argparse.ArgumentParser(description=' '.join(summary.split()))
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--certfile', help='PEM file with key and '
+                        'certificate, serves HTTPS when given')
+    parser.add_argument('--nodes', type=int, default=2)
+    parser.add_argument('--task-secs', type=float, default=DEFAULT_TASK_SECS)
+    args = parser.parse_args()
+    model = FakeLitpModel(task_secs=args.task_secs)
+    build_default_model(model, args.nodes)
+    server = FakeLitpd(args.port, model, args.certfile, host='0.0.0.0')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
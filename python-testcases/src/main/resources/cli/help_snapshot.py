@@ -0,0 +1,222 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   The help output of every litp action, fetched once per run in
+            a single batch and kept split into its sections ('Usage',
+            'Optional Arguments', ...), and the golden files the help is
+            compared against.
+
+            A golden file help_golden/<action>.json holds the expected
+            text of some or all sections of the help of an action; only
+            the sections it holds are compared, whitespace ignored.
+            Setting LITP_HELP_RECORD rewrites the golden files from the
+            help of the system under test instead of comparing.
+'''
+
+import difflib
+import json
+import os
+import re
+
+# '' is the help of litp itself
+HELP_ACTIONS = ('', 'create', 'inherit', 'update', 'remove', 'show',
+                'load', 'export', 'import', 'import_iso', 'create_plan',
+                'show_plan', 'run_plan', 'stop_plan', 'remove_plan',
+                'restore_model', 'prepare_restore', 'version', 'upgrade',
+                'create_snapshot', 'remove_snapshot', 'restore_snapshot')
+HELP_ARGS = ('-h', '--help')
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          'help_golden')
+RECORD_ENV = 'LITP_HELP_RECORD'
+
+SECTION_RE = re.compile(r'^([A-Z][A-Za-z ]*[a-z]):')
+
+
+def get_section_names(lines):
+    """
+    Description:
+        Find the section headers of a help output
+    Args:
+        lines (list): Help output
+    Returns:
+        list. Section names in the order they appear, e.g. ['Usage',
+              'Required Arguments', 'Optional Arguments', 'Example']
+    """
+    names = []
+    for line in lines:
+        match = SECTION_RE.match(line)
+        if match and match.group(1) not in names:
+            names.append(match.group(1))
+    return names
+
+
+def strip_whitespace(text):
+    """
+    Text with all whitespace removed, the form sections are compared in
+    """
+    return ''.join(text.split())
+
+
+def diff_sections(expected, actual):
+    """
+    Description:
+        Compare sections of a help output against their golden text
+    Args:
+        expected (dict): Section name to golden text
+        actual (dict): Section name to text of the help output
+    Returns:
+        list. One entry per section that differs: {'section', 'expected',
+              'actual', 'changes'}, where changes lists the differing
+              fragments as (operation, expected fragment, actual fragment)
+    """
+    diffs = []
+    for name in sorted(expected):
+        want = strip_whitespace(expected[name])
+        got = actual.get(name)
+        if got is not None:
+            got = strip_whitespace(got)
+        if want == got:
+            continue
+        changes = []
+        if got is not None:
+            matcher = difflib.SequenceMatcher(None, want, got, autojunk=False)
+            changes = [(operation, want[start1:end1], got[start2:end2])
+                       for operation, start1, end1, start2, end2
+                       in matcher.get_opcodes() if operation != 'equal']
+        diffs.append({'section': name, 'expected': want, 'actual': got,
+                      'changes': changes})
+    return diffs
+
+
+def format_diffs(action, help_arg, diffs):
+    """
+    Description:
+        Render the result of diff_sections for an assertion message
+    Args:
+        action (str): litp action whose help was compared
+        help_arg (str): -h or --help
+        diffs (list): Result of diff_sections
+    Returns:
+        str. One block per differing section
+    """
+    cmd = ' '.join(arg for arg in ('litp', action, help_arg) if arg)
+    lines = ["help of '{0}' does not match {1}".format(
+        cmd, get_golden_path(action))]
+    for diff in diffs:
+        if diff['actual'] is None:
+            lines.append('  {0}: section missing'.format(diff['section']))
+            continue
+        lines.append('  {0}:'.format(diff['section']))
+        for operation, want, got in diff['changes']:
+            lines.append("    {0}: expected '{1}', got '{2}'".format(
+                operation, want, got))
+    return '\n'.join(lines)
+
+
+def get_golden_path(action, directory=GOLDEN_DIR):
+    """
+    Golden file of the help of an action
+    """
+    return os.path.join(directory, '{0}.json'.format(action or 'litp'))
+
+
+def load_golden(action, directory=GOLDEN_DIR):
+    """
+    Description:
+        Read the golden sections of the help of an action
+    Args:
+        action (str): litp action, '' for litp itself
+        directory (str): Directory holding the golden files
+    Returns:
+        dict. Section name to text, None if there is no golden file
+    """
+    path = get_golden_path(action, directory)
+    if not os.path.exists(path):
+        return None
+    with open(path) as golden:
+        return json.load(golden)
+
+
+def save_golden(action, sections, directory=GOLDEN_DIR):
+    """
+    Description:
+        Write the golden file of the help of an action
+    Args:
+        action (str): litp action, '' for litp itself
+        sections (dict): Section name to text
+        directory (str): Directory holding the golden files
+    """
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    with open(get_golden_path(action, directory), 'w') as golden:
+        json.dump(sections, golden, indent=4, sort_keys=True)
+        golden.write('\n')
+
+
+class HelpPage(object):
+    """
+    Output of one help command, split into sections on first use
+    """
+
+    def __init__(self, action, help_arg, stdout, stderr, returnc,
+                 section_parser):
+        self.action = action
+        self.help_arg = help_arg
+        self.stdout = stdout
+        self.stderr = stderr
+        self.returnc = returnc
+        self._section_parser = section_parser
+        self._sections = None
+
+    @property
+    def sections(self):
+        """ Section name to the text section_parser returns for it """
+        if self._sections is None:
+            self._sections = dict(
+                (name, self._section_parser(self.stdout, name))
+                for name in get_section_names(self.stdout))
+        return self._sections
+
+    def section(self, name):
+        """ Text of a section, None if the help has no such section """
+        return self.sections.get(name)
+
+
+class HelpSnapshot(object):
+    """
+    Help pages of one node keyed by (action, help argument)
+    """
+
+    def __init__(self, node, section_parser):
+        self.node = node
+        self.section_parser = section_parser
+        self.pages = {}
+
+    def add(self, action, help_arg, stdout, stderr, returnc):
+        """
+        Description:
+            Store the output of a help command
+        Args:
+            action (str): litp action, '' for litp itself
+            help_arg (str): -h or --help
+            stdout (list): Output lines
+            stderr (list): Error lines
+            returnc (int): Return code
+        Returns:
+            HelpPage. The stored page
+        """
+        page = HelpPage(action, help_arg, stdout, stderr, returnc,
+                        self.section_parser)
+        self.pages[(action, help_arg)] = page
+        return page
+
+    def get(self, action, help_arg):
+        """ The stored page, None if it has not been fetched """
+        return self.pages.get((action, help_arg))
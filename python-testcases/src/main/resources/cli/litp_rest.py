@@ -0,0 +1,208 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   RestUtils used by the cli testsets
+'''
+
+import json
+import time
+
+try:
+    import httplib
+except ImportError:
+    import http.client as httplib
+
+from rest_utils import RestUtils
+
+from model_cache import get_link_path, is_under
+from rest_client import DEFAULT_POOL_SIZE, LITP_REST_PORT, \
+    get_litpd_address, get_pool
+
+# statuses of a successful delete, or of an item already gone
+DELETED_STATUSES = (200, 404)
+
+
+def parse_header(header):
+    """
+    Description:
+        Convert a RestUtils header argument into request headers
+    Args:
+        header (str|list|dict): e.g. 'Content-Type:application/json'
+    Returns:
+        dict. Header name to value
+    """
+    if not header:
+        return {}
+    if isinstance(header, dict):
+        return dict(header)
+    if not isinstance(header, (list, tuple)):
+        header = [header]
+    headers = {}
+    for line in header:
+        name, _, value = line.partition(':')
+        headers[name.strip()] = value.strip()
+    return headers
+
+
+class LitpRestUtils(RestUtils):
+    """
+    RestUtils which sends its requests over a pool of keep-alive
+    connections to litpd, shared by every LitpRestUtils of the run, and
+    tells its listeners about every request it made, so that anything
+    derived from the model (such as the model cache of CliGenericTest)
+    can be dropped after a change, and requests can be timed.
+
+    Requests return (body, stderr, status) as with RestUtils; stderr
+    holds the error of a request that got no response, whose status is 0.
+    Items created with post are deleted by clean_paths.
+
+    Listeners are called as listener(method, path, secs).
+    """
+
+    def __init__(self, ip_address, port=LITP_REST_PORT, secure=True,
+                 pool_size=DEFAULT_POOL_SIZE):
+        RestUtils.__init__(self, ip_address)
+        self.listeners = []
+        self.pool = get_pool(ip_address, port, secure=secure,
+                             size=pool_size)
+        self.created_paths = []
+
+    def _request(self, method, path, header=None, data=None):
+        """
+        Make a request over the pool, then call the listeners
+        """
+        start = time.time()
+        try:
+            status, _, body = self.pool.request(method, path, data,
+                                                parse_header(header))
+            result = body, '', status
+        except (httplib.HTTPException, IOError) as error:
+            result = '', str(error), 0
+        secs = time.time() - start
+        for listener in self.listeners:
+            listener(method, path, secs)
+        if method == 'POST' and result[2] == 201:
+            self._add_created(path, result[0])
+        return result
+
+    def _add_created(self, path, body):
+        """
+        Add the item a POST created to the cleanup list
+        """
+        try:
+            created = get_link_path(json.loads(body), 'self')
+        except (ValueError, AttributeError):
+            created = None
+        self.created_paths.append(created or path)
+
+    def get(self, path, header=None):
+        """
+        Description:
+            GET a resource
+        Args:
+            path (str): Model path
+            header (str): Request header, e.g. HEADER_JSON
+        Returns:
+            str, str, int. Body, error and status
+        """
+        return self._request('GET', path, header)
+
+    def post(self, path, header=None, data=None):
+        """
+        Description:
+            POST to a collection, adding the created item to the
+            cleanup list
+        Args:
+            path (str): Model path
+            header (str): Request header, e.g. HEADER_JSON
+            data (str): Request body
+        Returns:
+            str, str, int. Body, error and status
+        """
+        return self._request('POST', path, header, data)
+
+    def put(self, path, header=None, data=None):
+        """
+        Description:
+            PUT to an item
+        Args:
+            path (str): Model path
+            header (str): Request header, e.g. HEADER_JSON
+            data (str): Request body
+        Returns:
+            str, str, int. Body, error and status
+        """
+        return self._request('PUT', path, header, data)
+
+    def delete(self, path, header=None):
+        """
+        Description:
+            DELETE an item
+        Args:
+            path (str): Model path
+            header (str): Request header
+        Returns:
+            str, str, int. Body, error and status
+        """
+        return self._request('DELETE', path, header)
+
+    def run_all(self, requests):
+        """
+        Description:
+            Make independent requests concurrently over the pool
+        Args:
+            requests (list): (method, path, header, data) per request;
+                             header and data may be left out
+        Returns:
+            list. (body, stderr, status) per request, in the order given
+        """
+        return self.pool.run_all(self._request, requests)
+
+    def clean_paths(self):
+        """
+        Description:
+            Delete the items created with post. The topmost ones are
+            deleted concurrently, their descendants go with them; those
+            that fail, e.g. because a later item still refers to them,
+            are retried one at a time, newest first.
+        """
+        paths = [path for index, path in enumerate(self.created_paths)
+                 if not any(is_under(path, other) and other != path
+                            for other in self.created_paths[:index])]
+        paths = sorted(set(paths), key=paths.index)
+        self.created_paths = []
+        results = self.run_all(('DELETE', path) for path in paths)
+        failed = [path for path, (_, _, status) in zip(paths, results)
+                  if status not in DELETED_STATUSES]
+        for path in reversed(failed):
+            self.delete(path)
+
+    def stats(self):
+        """
+        Description:
+            Connection reuse of the pool this instance uses
+        Returns:
+            dict. See RestConnectionPool.stats
+        """
+        return self.pool.stats()
+
+
+def get_litp_rest_utils(ip_address):
+    """
+    Description:
+        Return a LitpRestUtils for the litpd of an MS, or for the fake
+        litpd named in LITP_FAKE_LITPD (see rest_client.get_litpd_address)
+    Args:
+        ip_address (str): IP address of the MS
+    Returns:
+        LitpRestUtils. REST client for the litpd
+    """
+    host, port, secure = get_litpd_address(ip_address)
+    return LitpRestUtils(host, port, secure=secure)
@@ -0,0 +1,137 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   In memory copy of LITP model subtrees, loaded from the output
+            of 'litp show -r -j', used to answer find lookups without
+            running the CLI again.
+'''
+
+REST_ROOT = '/litp/rest/v1'
+
+
+def href_to_path(href):
+    """
+    Description:
+        Convert the href of a REST link into a model path
+    Args:
+        href (str): e.g. https://localhost:9999/litp/rest/v1/ms/items
+    Returns:
+        str. Model path, e.g. /ms/items
+    """
+    if REST_ROOT in href:
+        href = href.split(REST_ROOT, 1)[1]
+    href = href.rstrip('/')
+    return href or '/'
+
+
+def get_link_path(item, link):
+    """
+    Description:
+        Return the model path an item links to
+    Args:
+        item (dict): Item as returned by the REST API
+        link (str): Link name, e.g. self or inherited-from
+    Returns:
+        str. Model path or None if the item has no such link
+    """
+    href = item.get('_links', {}).get(link, {}).get('href')
+    if href is None:
+        return None
+    return href_to_path(href)
+
+
+def is_under(path, root):
+    """
+    Description:
+        Check whether a model path is within the subtree of another one
+    Args:
+        path (str): Path to check
+        root (str): Root of the subtree
+    Returns:
+        bool. True if path is root or one of its descendants
+    """
+    if root == '/':
+        return True
+    return path == root or path.startswith(root.rstrip('/') + '/')
+
+
+class ModelCache(object):
+    """
+    Items of the loaded subtrees keyed by path, in the order 'litp show -r'
+    lists them. A mutation anywhere in the model must be followed by
+    invalidate().
+    """
+
+    def __init__(self):
+        self._items = {}
+        self._order = []
+        self._roots = []
+        self.hits = 0
+        self.loads = 0
+
+    def invalidate(self):
+        """
+        Drop everything that was loaded
+        """
+        self._items = {}
+        self._order = []
+        self._roots = []
+
+    def covers(self, path):
+        """
+        Description:
+            Check whether a path lies in a loaded subtree
+        Args:
+            path (str): Model path
+        Returns:
+            bool. True if lookups on the path can be answered
+        """
+        return any(is_under(path, root) for root in self._roots)
+
+    def load(self, root, data):
+        """
+        Description:
+            Add a subtree to the cache
+        Args:
+            root (str): Path the subtree was shown from
+            data (dict): Parsed output of 'litp show -p <root> -r -j'
+        """
+        pending = [data]
+        while pending:
+            item = pending.pop()
+            path = get_link_path(item, 'self')
+            if path is not None and path not in self._items:
+                self._order.append(path)
+            if path is not None:
+                self._items[path] = {'type': item.get('item-type-name')}
+            children = item.get('_embedded', {}).get('item', [])
+            pending.extend(reversed(children))
+        self._roots.append(root)
+        self.loads += 1
+
+    def find(self, path, resource, rtn_type_children=True):
+        """
+        Description:
+            Same semantics as GenericTest.find for a loaded subtree
+        Args:
+            path (str): Path to search from
+            resource (str): Item type to look for
+            rtn_type_children (bool): If False return the collections of
+                                      the item type instead
+        Returns:
+            list. Matching paths in 'litp show -r' order
+        """
+        wanted = resource if rtn_type_children \
+            else 'collection-of-{0}'.format(resource)
+        found = [item_path for item_path in self._order
+                 if is_under(item_path, path)
+                 and self._items[item_path]['type'] == wanted]
+        self.hits += 1
+        return found
@@ -0,0 +1,280 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Declarative model fixtures. The items a test needs are
+            described up front and rendered as LITP XML, one document per
+            collection they are created in, so that the whole fixture is
+            set up by 'litp load --merge' in a single remote command
+            instead of one 'litp create' or 'litp inherit' per item.
+
+                fixture = ModelFixture()
+                fixture.create('/software/items/pkgs', 'package-list',
+                               name='pkgs')
+                fixture.create('/software/items/pkgs/packages/finger',
+                               'package', name='finger')
+                fixture.inherit('/ms/items/pkgs', '/software/items/pkgs')
+'''
+
+import base64
+import posixpath
+from xml.sax.saxutils import escape, quoteattr
+
+XML_HEADER = "<?xml version='1.0' encoding='utf-8'?>"
+XML_NAMESPACES = ('xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+                  'xmlns:litp="http://www.ericsson.com/litp" '
+                  'xsi:schemaLocation="http://www.ericsson.com/litp '
+                  'litp-xml-schema/litp.xsd"')
+# types of the items every model has, which need no lookup
+TOP_LEVEL_TYPES = {'/': 'root', '/software': 'software', '/ms': 'ms',
+                   '/infrastructure': 'infrastructure'}
+
+
+def get_collection_tag(owner_type, collection_id):
+    """
+    XML tag of a collection, e.g. software-items-collection for
+    /software/items
+    """
+    return 'litp:{0}-{1}-collection'.format(owner_type, collection_id)
+
+
+class FixtureItem(object):
+    """
+    One item of a fixture: created with an item type, or inherited from
+    source_path, in which case item_type is the type of the source.
+    Properties are rendered in the order given when given as a list of
+    (name, value) pairs, sorted by name when given as a dict.
+    """
+
+    def __init__(self, path, item_type=None, properties=None,
+                 source_path=None):
+        self.path = path.rstrip('/')
+        self.item_id = posixpath.basename(self.path)
+        self.item_type = item_type
+        self.source_path = source_path
+        if isinstance(properties, dict):
+            properties = sorted(properties.items())
+        self.properties = list(properties or [])
+        self.children = []
+        # the collection the item is created in, and the item owning it
+        self.collection_path = posixpath.dirname(self.path)
+        self.owner_path = posixpath.dirname(self.collection_path) or '/'
+
+    def render(self, lines, indent):
+        """
+        Description:
+            Append the XML of the item and its children
+        Args:
+            lines (list): Lines rendered so far
+            indent (str): Indentation of the item element
+        """
+        if self.source_path is not None:
+            tag = 'litp:{0}-inherit'.format(self.item_type)
+            attrs = 'source_path={0} id={1}'.format(
+                quoteattr(self.source_path), quoteattr(self.item_id))
+        else:
+            tag = 'litp:{0}'.format(self.item_type)
+            attrs = 'id={0}'.format(quoteattr(self.item_id))
+        if not self.properties and not self.children:
+            lines.append('{0}<{1} {2}/>'.format(indent, tag, attrs))
+            return
+        lines.append('{0}<{1} {2}>'.format(indent, tag, attrs))
+        for name, value in self.properties:
+            lines.append('{0}  <{1}>{2}</{1}>'.format(indent, name,
+                                                       escape(str(value))))
+        collections = []
+        for child in self.children:
+            collection_id = posixpath.basename(child.collection_path)
+            if collection_id not in collections:
+                collections.append(collection_id)
+        for collection_id in collections:
+            ctag = get_collection_tag(self.item_type, collection_id)
+            lines.append('{0}  <{1} id={2}>'.format(
+                indent, ctag, quoteattr(collection_id)))
+            for child in self.children:
+                if posixpath.basename(child.collection_path) == collection_id:
+                    child.render(lines, indent + '    ')
+            lines.append('{0}  </{1}>'.format(indent, ctag))
+        lines.append('{0}</{1}>'.format(indent, tag))
+
+
+class ModelFixture(object):
+    """
+    Items to set up in the model. An item whose owner is also in the
+    fixture is rendered inside the owner's element; the others are the
+    roots, loaded into the existing collections they are created in.
+    """
+
+    def __init__(self):
+        self.items = []
+        self._by_path = {}
+        # items whose owner is not in the fixture (yet), by owner path
+        self._orphans = {}
+
+    def add(self, item):
+        """
+        Description:
+            Add an item, nesting it in the item owning its collection when
+            that is in the fixture too
+        Args:
+            item (FixtureItem): Item to add
+        Returns:
+            FixtureItem. The item
+        """
+        if item.path in self._by_path:
+            raise ValueError('{0} is already in the fixture'.format(
+                item.path))
+        owner = self._by_path.get(item.owner_path)
+        if owner is not None:
+            owner.children.append(item)
+        else:
+            self._orphans.setdefault(item.owner_path, []).append(item)
+        item.children.extend(self._orphans.pop(item.path, []))
+        self.items.append(item)
+        self._by_path[item.path] = item
+        return item
+
+    def create(self, path, item_type, properties=None, **kwargs):
+        """
+        Description:
+            Describe an item as 'litp create' would create it
+        Args:
+            path (str): Path of the new item
+            item_type (str): Item type
+            properties (list|dict): Properties, or give them as kwargs
+        Returns:
+            FixtureItem. The item
+        """
+        return self.add(FixtureItem(path, item_type,
+                                    properties or kwargs or None))
+
+    def inherit(self, path, source_path, properties=None, item_type=None,
+                **kwargs):
+        """
+        Description:
+            Describe an item as 'litp inherit' would create it
+        Args:
+            path (str): Path of the new item
+            source_path (str): Item inherited from
+            properties (list|dict): Overwritten properties, or give them
+                                    as kwargs
+            item_type (str): Type of the source, needed when the source is
+                             not in the fixture and its type is not looked
+                             up by the caller
+        Returns:
+            FixtureItem. The item
+        """
+        return self.add(FixtureItem(path, item_type,
+                                    properties or kwargs or None,
+                                    source_path))
+
+    @property
+    def paths(self):
+        """ Paths of all the items, in the order they were added """
+        return [item.path for item in self.items]
+
+    @property
+    def roots(self):
+        """ Items not rendered inside another item of the fixture """
+        return [item for item in self.items
+                if item.owner_path not in self._by_path]
+
+    def get_unknown_types(self):
+        """
+        Description:
+            Find the types needed to render the fixture that only the
+            model can tell: of the owners of the root collections, and of
+            the sources of inherited items outside the fixture
+        Returns:
+            list. Model paths whose item type is needed
+        """
+        paths = []
+        for item in self.roots:
+            if item.owner_path not in TOP_LEVEL_TYPES \
+                    and item.owner_path not in paths:
+                paths.append(item.owner_path)
+        for item in self.items:
+            if item.item_type is None \
+                    and item.source_path not in self._by_path \
+                    and item.source_path not in TOP_LEVEL_TYPES \
+                    and item.source_path not in paths:
+                paths.append(item.source_path)
+        return paths
+
+    def set_types(self, types):
+        """
+        Description:
+            Fill in the types of inherited items, from their source when it
+            is in the fixture, else from looked up types
+        Args:
+            types (dict): Model path to item type
+        """
+        for item in self.items:
+            if item.item_type is None:
+                source = self._by_path.get(item.source_path)
+                item.item_type = source.item_type if source is not None \
+                    else types[item.source_path]
+
+    def render(self, owner_types):
+        """
+        Description:
+            Render the fixture as LITP XML
+        Args:
+            owner_types (dict): Item type of every path get_unknown_types
+                                returned
+        Returns:
+            list. (owner path, XML document) per collection the root
+                  items are created in, to be loaded into the owner with
+                  --merge
+        """
+        types = dict(TOP_LEVEL_TYPES)
+        types.update(owner_types)
+        self.set_types(types)
+        documents = []
+        groups = {}
+        for item in self.roots:
+            if item.collection_path not in groups:
+                groups[item.collection_path] = []
+                documents.append(item.collection_path)
+            groups[item.collection_path].append(item)
+        rendered = []
+        for collection_path in documents:
+            owner_path = posixpath.dirname(collection_path) or '/'
+            collection_id = posixpath.basename(collection_path)
+            tag = get_collection_tag(types[owner_path], collection_id)
+            lines = [XML_HEADER, '<{0} {1} id={2}>'.format(
+                tag, XML_NAMESPACES, quoteattr(collection_id))]
+            for item in groups[collection_path]:
+                item.render(lines, '  ')
+            lines.append('</{0}>'.format(tag))
+            rendered.append((owner_path, '\n'.join(lines) + '\n'))
+        return rendered
+
+
+def get_load_cmd(documents, litp='litp'):
+    """
+    Description:
+        Build one command line writing the documents to a temporary
+        directory on the node and loading them in order
+    Args:
+        documents (list): (owner path, XML document) from render
+        litp (str): Path of the litp command
+    Returns:
+        str. The command line; it fails as soon as a load fails
+    """
+    steps = ['d=$(mktemp -d)']
+    for index, (owner_path, document) in enumerate(documents):
+        encoded = base64.b64encode(document.encode('utf-8')).decode('ascii')
+        steps.append('echo {0} | base64 -d >"$d/{1}.xml"'.format(encoded,
+                                                                index))
+    for index, (owner_path, _) in enumerate(documents):
+        steps.append('{0} load -p {1} -f "$d/{2}.xml" --merge'.format(
+            litp, owner_path, index))
+    return '{0}; rc=$?; rm -rf "$d"; test $rc -eq 0'.format(
+        ' && '.join(steps))
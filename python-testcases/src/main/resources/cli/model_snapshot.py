@@ -0,0 +1,87 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Snapshot of the model taken once per testset, used to put the
+            model back after each test in a fixed number of commands
+            instead of one remove per item the test created.
+
+            A test that ran no plan is undone with 'litp restore_model',
+            which drops every change made since the last successful plan.
+            A test that ran plans is undone by loading the exported
+            top level branches back with --replace and running one plan.
+
+            Both undo every change of the model, so the snapshot is not
+            used by a test that shares the MS with other tests changing the
+            model, which tools/parallel_runner.py flags with
+            LITP_TEST_CONCURRENT (see shared_plan).
+'''
+
+from model_cache import get_link_path
+
+# top level branches exported with the snapshot and loaded back into /
+SNAPSHOT_BRANCHES = ('/software', '/infrastructure', '/deployments', '/ms')
+SNAPSHOT_DIR = '/tmp'
+
+# litp actions whose cleanup the snapshot takes over from GenericTest
+MODEL_ACTIONS = ('create', 'inherit', 'update', 'remove', 'load')
+
+
+def get_unapplied_paths(data):
+    """
+    Description:
+        Find the items of a model tree that are not Applied
+    Args:
+        data (dict): Parsed output of 'litp show -p / -r -j'
+    Returns:
+        list. Model paths of the items in any other state
+    """
+    paths = []
+    pending = [data]
+    while pending:
+        item = pending.pop()
+        if item.get('state', 'Applied') != 'Applied':
+            paths.append(get_link_path(item, 'self'))
+        pending.extend(item.get('_embedded', {}).get('item', []))
+    return paths
+
+
+class ModelSnapshot(object):
+    """
+    Where the snapshot of a testset lives on the MS and whether it can be
+    used. A snapshot is only usable if every item was Applied when it was
+    taken, otherwise restore_model would also drop changes that were
+    there before the testset.
+    """
+
+    def __init__(self, node, name, branches=SNAPSHOT_BRANCHES,
+                 directory=SNAPSHOT_DIR):
+        self.node = node
+        self.usable = False
+        self.reason = 'not captured'
+        self.files = [(branch, '{0}/{1}_{2}.xml'.format(
+            directory, name, branch.strip('/')))
+            for branch in branches]
+
+    def disable(self, reason):
+        """
+        Description:
+            Mark the snapshot as unusable
+        Args:
+            reason (str): Why, for the test log
+        """
+        self.usable = False
+        self.reason = reason
+
+    def captured(self):
+        """
+        Mark the snapshot as taken
+        """
+        self.usable = True
+        self.reason = None
@@ -0,0 +1,117 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Inventory of the LITP packages installed on a node: the
+            packages of a yum group with their version and CXP number,
+            indexed by package name.
+
+            Listing them takes seconds ('yum groupinfo'), so an inventory
+            is kept with a stamp of the rpm database, which any RPM
+            install or upgrade changes, whether made by the testsets or
+            before them (e.g. the upgradeERIClitpcliRPM step of the TAF
+            runner). Checking the stamp is a cheap read only command; the
+            packages are only listed again when it changed.
+'''
+
+import re
+
+RPMDB_DIR = '/var/lib/rpm'
+STAMP_MARKER = '@stamp'
+# 'ERIClitpcore: 2.3.4 CXP9030418' in the output of 'litp version -a'
+VERSION_LINE_RE = re.compile(r'^\s*(\S+): (\S+) (CXP\d+)\b')
+
+
+def get_stamp_cmd():
+    """
+    Command line printing a stamp of the rpm database, which changes with
+    every RPM install, upgrade or removal
+    """
+    return ("echo {0} $(stat -c '%n %Y %s' {1}/* 2>/dev/null | md5sum | "
+            "cut -c1-32)".format(STAMP_MARKER, RPMDB_DIR))
+
+
+def get_inventory_cmd(group):
+    """
+    Description:
+        Build the command line listing the installed packages of a yum
+        group, preceded by the stamp of the rpm database
+    Args:
+        group (str): yum group, e.g. LITP2
+    Returns:
+        str. The command line, to run as root, for PackageInventory
+    """
+    return ("{0}; /bin/rpm -qa --qf '%-{{name}} %-{{version}}\\n' | "
+            "sort -k1 | egrep \"`yum groupinfo {1} | grep CXP | "
+            "tr -d ' ' | tr '\\n' '|' | sed 's/|$//g'`\"").format(
+                get_stamp_cmd(), group)
+
+
+def parse_stamp(lines):
+    """ The rpm database stamp in command output, None if there is none """
+    for line in lines:
+        fields = line.split()
+        if len(fields) == 2 and fields[0] == STAMP_MARKER:
+            return fields[1]
+    return None
+
+
+def parse_version_output(lines):
+    """
+    Description:
+        Index the packages listed by 'litp version -a'
+    Args:
+        lines (list): Output lines
+    Returns:
+        dict. Package name to (version, CXP number)
+    """
+    packages = {}
+    for line in lines:
+        match = VERSION_LINE_RE.match(line)
+        if match:
+            packages[match.group(1)] = (match.group(2), match.group(3))
+    return packages
+
+
+class PackageInventory(object):
+    """
+    Installed packages of a node as listed by the command of
+    get_inventory_cmd, by name without the CXP number
+    """
+
+    def __init__(self, lines):
+        self.stamp = parse_stamp(lines)
+        self.packages = {}
+        for line in lines:
+            fields = line.split()
+            if len(fields) != 2 or fields[0] == STAMP_MARKER \
+                    or '_' not in fields[0]:
+                continue
+            name, cxp = fields[0].rsplit('_', 1)
+            self.packages[name] = (fields[1], cxp)
+
+    def get_version(self, name):
+        """ Installed version of a package, None if it is not installed """
+        return self.packages.get(name, (None, None))[0]
+
+    def get_differences(self, shown):
+        """
+        Description:
+            Compare the inventory with the packages shown by a command
+        Args:
+            shown (dict): Package name to (version, CXP number), e.g. from
+                          parse_version_output
+        Returns:
+            dict. Name to (installed, shown) of every installed package
+                  that is shown with another version or CXP number, or
+                  not at all (shown None)
+        """
+        return dict((name, (installed, shown.get(name)))
+                    for name, installed in self.packages.items()
+                    if shown.get(name) != installed)
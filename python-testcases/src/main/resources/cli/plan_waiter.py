@@ -0,0 +1,196 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Wait for the plan to reach a state by watching /plans/plan
+            over REST instead of polling 'litp show_plan' on a fixed
+            interval. Requests are conditional (If-None-Match) and ask the
+            server to hold them until the plan changes (Prefer: wait). The
+            next request goes out straight away only when the server is
+            known to answer such requests: after a Not Modified it held
+            for the whole wait, or after a change from a server that has
+            answered Not Modified before. Otherwise, and whenever the plan
+            comes back unchanged, the interval starts short and backs off
+            while the plan does not change.
+            Any other answer from the server ends the wait with an error,
+            so the caller can fall back to the CLI.
+'''
+
+import time
+
+PLAN_PATH = '/plans/plan?recurse_depth=5'
+MIN_INTERVAL_SECS = 0.5
+MAX_INTERVAL_SECS = 5.0
+LONG_POLL_SECS = 30
+
+PLAN_FINAL_STATES = ('successful', 'failed', 'stopped', 'invalid')
+TASK_FINAL_STATES = ('Success', 'Failed', 'Stopped')
+
+# name of the test_constants plan state -> state reported by the REST API
+REST_PLAN_STATES = {'PLAN_COMPLETE': 'successful',
+                    'PLAN_FAILED': 'failed',
+                    'PLAN_STOPPED': 'stopped',
+                    'PLAN_IN_PROGRESS': 'running',
+                    'PLAN_NOT_RUNNING': 'initial',
+                    'PLAN_STOPPING': 'stopping',
+                    'PLAN_INVALID': 'invalid'}
+
+
+def get_embedded(item, item_id=None):
+    """
+    Description:
+        Return the embedded children of a REST item
+    Args:
+        item (dict): REST item
+        item_id (str): Only return the child with this id
+    Returns:
+        list|dict. All children, or the child with the given id (None if
+                   there is no such child)
+    """
+    children = item.get('_embedded', {}).get('item', [])
+    if item_id is None:
+        return children
+    for child in children:
+        if child.get('id') == item_id:
+            return child
+    return None
+
+
+def get_phase_task_states(plan):
+    """
+    Description:
+        Collect the task states of each phase of a plan
+    Args:
+        plan (dict): /plans/plan as returned by the REST API
+    Returns:
+        list. (phase id, [task states]) in phase order
+    """
+    phases = get_embedded(plan, 'phases') or {}
+    result = []
+    for phase in get_embedded(phases):
+        tasks = get_embedded(phase, 'tasks') or {}
+        result.append((phase.get('id'),
+                       [task.get('state') for task in get_embedded(tasks)]))
+    return result
+
+
+class PlanWaiter(object):
+    """
+    Follows the plan over REST and records when the plan and each of its
+    phases changed state.
+
+    timings['plan'] maps each plan state seen to the time it was first
+    seen, timings['phases'] maps phase ids to {'start': t, 'end': t}.
+    """
+
+    def __init__(self, client, min_interval=MIN_INTERVAL_SECS,
+                 max_interval=MAX_INTERVAL_SECS, long_poll=LONG_POLL_SECS):
+        self.client = client
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.long_poll = long_poll
+        self.requests = 0
+        # the server has answered Not Modified, so it honours ETags
+        self.conditional = False
+        self.timings = {'plan': {}, 'phases': {}}
+
+    def _record(self, plan, now):
+        """
+        Record plan and phase state transitions
+        """
+        self.timings['plan'].setdefault(plan.get('state'), now)
+        for phase_id, states in get_phase_task_states(plan):
+            phase = self.timings['phases'].setdefault(phase_id, {})
+            if 'start' not in phase and any(state != 'Initial'
+                                            for state in states):
+                phase['start'] = now
+            if 'end' not in phase and states \
+                    and all(state in TASK_FINAL_STATES for state in states):
+                phase.setdefault('start', now)
+                phase['end'] = now
+
+    def phase_durations(self):
+        """
+        Description:
+            Time taken by each phase that ran to completion
+        Returns:
+            list. (phase id, seconds) in phase order
+        """
+        def sort_key(phase_id):
+            """ Numeric phase ids sort numerically """
+            return (0, int(phase_id)) if str(phase_id).isdigit() \
+                else (1, phase_id)
+        phases = self.timings['phases']
+        return [(phase_id, phases[phase_id]['end'] - phases[phase_id]['start'])
+                for phase_id in sorted(phases, key=sort_key)
+                if 'end' in phases[phase_id]]
+
+    def wait(self, state, timeout_secs):
+        """
+        Description:
+            Wait for the plan to reach a state
+        Args:
+            state (str): REST plan state to wait for, e.g. successful
+            timeout_secs (int): Maximum time to wait
+        Returns:
+            bool. True if the plan reached the state, False if it ended in
+                  another final state, disappeared or the wait timed out
+        Raises:
+            RuntimeError. The server answered with anything but the plan,
+                          Not Modified or Not Found; errors of the client
+                          are raised as they are
+        """
+        deadline = time.time() + timeout_secs
+        interval = self.min_interval
+        etag = None
+        last_seen = None
+        while True:
+            remaining = deadline - time.time()
+            wait = int(max(1, min(self.long_poll, remaining)))
+            headers = {'Prefer': 'wait={0}'.format(wait)}
+            if etag:
+                headers['If-None-Match'] = etag
+            sent = time.time()
+            status, resp_headers, plan = self.client.get_json(
+                PLAN_PATH, headers=headers)
+            self.requests += 1
+            now = time.time()
+            changed = False
+            if status == 404:
+                return False
+            if status == 200 and plan:
+                etag = resp_headers.get('etag')
+                self._record(plan, now)
+                current = plan.get('state')
+                if current == state:
+                    return True
+                if current in PLAN_FINAL_STATES:
+                    return False
+                seen = (current, get_phase_task_states(plan))
+                changed = seen != last_seen
+                if changed:
+                    # the plan is moving, keep a close eye on it
+                    interval = self.min_interval
+                    last_seen = seen
+            elif status == 304:
+                self.conditional = True
+            else:
+                raise RuntimeError('GET {0} answered {1}'.format(
+                    PLAN_PATH, status))
+            if now >= deadline:
+                return False
+            if status == 304 and now - sent >= wait - self.min_interval:
+                # the server held the request for the whole wait
+                continue
+            if changed and self.conditional:
+                # the next request is held or answered Not Modified
+                continue
+            time.sleep(min(interval, max(0, deadline - now)))
+            if not changed:
+                interval = min(interval * 2, self.max_interval)
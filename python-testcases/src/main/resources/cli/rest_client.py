@@ -0,0 +1,338 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Minimal client for the litpd REST API over a persistent
+            connection. Used where the tests need response headers or
+            conditional requests, which RestUtils does not expose.
+
+            RestConnectionPool keeps several such connections to one litpd
+            for requests made from many places, or from several threads
+            at once.
+'''
+
+import base64
+import json
+import os
+import socket
+import ssl
+import threading
+from contextlib import contextmanager
+
+try:
+    import httplib
+    from urlparse import urlparse
+except ImportError:
+    import http.client as httplib
+    from urllib.parse import urlparse
+
+LITP_REST_PORT = 9999
+LITP_REST_ROOT = '/litp/rest/v1'
+LITP_REST_USER = 'litp-admin'
+LITP_REST_PASSWORD = 'litp_admin'
+REQUEST_TIMEOUT_SECS = 60
+DEFAULT_POOL_SIZE = 4
+# methods litpd may be sent twice without changing the model
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS')
+# URL of a fake litpd (see fake_litpd) to send the REST requests of the
+# tests to instead of the MS, e.g. http://127.0.0.1:9999
+FAKE_LITPD_ENV = 'LITP_FAKE_LITPD'
+
+# pools by (host, port, username, secure), shared by the whole run
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+
+
+class LitpRestClient(object):
+    """
+    Keeps one HTTP(S) connection to litpd open and re-opens it when the
+    server closes it.
+    """
+
+    def __init__(self, host, port=LITP_REST_PORT, username=LITP_REST_USER,
+                 password=LITP_REST_PASSWORD, secure=True,
+                 timeout=REQUEST_TIMEOUT_SECS):
+        self.host = host
+        self.port = port
+        self.secure = secure
+        self.timeout = timeout
+        credentials = '{0}:{1}'.format(username, password).encode('utf-8')
+        self.auth = 'Basic ' + base64.b64encode(credentials).decode('ascii')
+        self.connects = 0
+        self.requests = 0
+        self._conn = None
+
+    def _connect(self):
+        """
+        Open a new connection to litpd
+        """
+        if self.secure:
+            kwargs = {}
+            # litpd runs with a self signed certificate
+            if hasattr(ssl, '_create_unverified_context'):
+                kwargs['context'] = ssl._create_unverified_context()
+            conn = httplib.HTTPSConnection(self.host, self.port,
+                                           timeout=self.timeout, **kwargs)
+        else:
+            conn = httplib.HTTPConnection(self.host, self.port,
+                                          timeout=self.timeout)
+        self.connects += 1
+        return conn
+
+    def request(self, method, path, body=None, headers=None):
+        """
+        Description:
+            Send a request over the persistent connection
+        Args:
+            method (str): HTTP method
+            path (str): Model path, e.g. /plans/plan, may hold a query
+            body (str|dict): Request body, dicts are sent as JSON
+            headers (dict): Extra request headers
+        Returns:
+            int, dict, str. Status, lower cased response headers and body
+
+        A request that fails on a kept alive connection is sent again on
+        a new one when it cannot have reached litpd (it failed while being
+        sent) or repeating it changes nothing (GET). Timeouts are never
+        retried.
+        """
+        all_headers = {'Authorization': self.auth,
+                       'Accept': 'application/json'}
+        if isinstance(body, dict):
+            body = json.dumps(body)
+            all_headers['Content-Type'] = 'application/json'
+        all_headers.update(headers or {})
+        url = LITP_REST_ROOT + path
+        while True:
+            reused = self._conn is not None
+            if not reused:
+                self._conn = self._connect()
+            sent = False
+            try:
+                self._conn.request(method, url, body, all_headers)
+                sent = True
+                response = self._conn.getresponse()
+                data = response.read()
+                break
+            except (httplib.HTTPException, IOError) as error:
+                self.close()
+                # only a stale keep-alive connection is worth a new one
+                if not reused or isinstance(error, socket.timeout) or \
+                        (sent and method.upper() not in IDEMPOTENT_METHODS):
+                    raise
+        self.requests += 1
+        resp_headers = dict((name.lower(), value)
+                            for name, value in response.getheaders())
+        if resp_headers.get('connection', '').lower() == 'close':
+            self.close()
+        if not isinstance(data, str):
+            data = data.decode('utf-8')
+        return response.status, resp_headers, data
+
+    def get_json(self, path, headers=None):
+        """
+        Description:
+            GET a resource and decode its JSON body
+        Args:
+            path (str): Model path
+            headers (dict): Extra request headers
+        Returns:
+            int, dict, dict. Status, response headers and decoded body,
+                             None if the body is empty or not JSON
+        """
+        status, resp_headers, data = self.request('GET', path,
+                                                  headers=headers)
+        try:
+            body = json.loads(data) if data else None
+        except ValueError:
+            body = None
+        return status, resp_headers, body
+
+    def close(self):
+        """
+        Close the connection
+        """
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class RestConnectionPool(object):
+    """
+    Keep-alive connections to one litpd. Each request borrows an idle
+    connection, opening one only when all of them are busy, so at most
+    size requests are in flight at once.
+    """
+
+    def __init__(self, host, port=LITP_REST_PORT, size=DEFAULT_POOL_SIZE,
+                 **kwargs):
+        self.host = host
+        self.port = port
+        self.size = size
+        self._kwargs = kwargs
+        self._clients = []
+        self._idle = []
+        self._lock = threading.Lock()
+        self._slots = threading.Semaphore(size)
+
+    @contextmanager
+    def client(self):
+        """
+        Borrow a connection, waiting while size of them are in use
+        """
+        self._slots.acquire()
+        try:
+            with self._lock:
+                if self._idle:
+                    client = self._idle.pop()
+                else:
+                    client = LitpRestClient(self.host, self.port,
+                                            **self._kwargs)
+                    self._clients.append(client)
+            try:
+                yield client
+            finally:
+                with self._lock:
+                    self._idle.append(client)
+        finally:
+            self._slots.release()
+
+    def request(self, method, path, body=None, headers=None):
+        """
+        Description:
+            Send a request over a pooled connection
+        Args:
+            method (str): HTTP method
+            path (str): Model path
+            body (str|dict): Request body, dicts are sent as JSON
+            headers (dict): Extra request headers
+        Returns:
+            int, dict, str. Status, lower cased response headers and body
+        """
+        with self.client() as client:
+            return client.request(method, path, body, headers)
+
+    def run_all(self, func, calls):
+        """
+        Description:
+            Make independent calls concurrently, on as many threads as the
+            pool has connections. The order they reach litpd in is not
+            defined.
+        Args:
+            func (callable): Function making a request over the pool
+            calls (list): Argument tuple per call
+        Returns:
+            list. Result of func per call, in the order given; a request
+                  error is raised once all the calls are done
+        """
+        calls = list(calls)
+        results = [None] * len(calls)
+        errors = []
+        pending = list(reversed(list(enumerate(calls))))
+
+        def worker():
+            """ Make calls until there are none left """
+            while True:
+                with self._lock:
+                    if not pending:
+                        return
+                    index, args = pending.pop()
+                try:
+                    results[index] = func(*args)
+                except (httplib.HTTPException, IOError) as error:
+                    errors.append(error)
+
+        threads = [threading.Thread(target=worker)
+                   for _ in range(min(self.size, len(calls)))]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+        return results
+
+    def request_all(self, requests):
+        """
+        Description:
+            Send independent requests concurrently
+        Args:
+            requests (list): (method, path, body, headers) per request
+        Returns:
+            list. request() result per request, in the order given
+        """
+        return self.run_all(self.request, requests)
+
+    def stats(self):
+        """
+        Description:
+            Connection reuse of the pool so far
+        Returns:
+            dict. connections opened, requests sent and reused, the
+                  number of requests that did not need a new connection
+        """
+        with self._lock:
+            connects = sum(client.connects for client in self._clients)
+            requests = sum(client.requests for client in self._clients)
+        return {'connections': connects, 'requests': requests,
+                'reused': max(0, requests - connects)}
+
+    def close(self):
+        """
+        Close the idle connections
+        """
+        with self._lock:
+            for client in self._idle:
+                client.close()
+
+
+def get_litpd_address(host):
+    """
+    Description:
+        Where to reach the litpd of an MS: on the MS, or at the fake litpd
+        named in LITP_FAKE_LITPD
+    Args:
+        host (str): Address of the MS
+    Returns:
+        str, int, bool. Host, REST port and whether to use HTTPS
+    """
+    url = os.environ.get(FAKE_LITPD_ENV)
+    if not url:
+        return host, LITP_REST_PORT, True
+    parsed = urlparse(url)
+    return parsed.hostname, parsed.port or LITP_REST_PORT, \
+        parsed.scheme == 'https'
+
+
+def get_pool(host, port=LITP_REST_PORT, username=LITP_REST_USER,
+             password=LITP_REST_PASSWORD, secure=True,
+             size=DEFAULT_POOL_SIZE):
+    """
+    Description:
+        Return the connection pool of a litpd, creating it on first use
+    Args:
+        host (str): litpd address
+        port (int): REST port
+        username (str): litpd user
+        password (str): Password of the user
+        secure (bool): Use HTTPS
+        size (int): Most connections of a new pool
+    Returns:
+        RestConnectionPool. Pool shared by every caller with these
+                            arguments
+    """
+    key = (host, port, username, secure)
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = _POOLS[key] = RestConnectionPool(
+                host, port, size, username=username, password=password,
+                secure=secure)
+    return pool
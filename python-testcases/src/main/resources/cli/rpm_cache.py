@@ -0,0 +1,127 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Content hash cache for the test plug-in RPMs installed on a
+            node. Installing an RPM records the SHA-256 of the file it was
+            installed from next to the install time rpm reports for the
+            package. Before the next install, one remote query returns
+            what is installed and what was recorded, and only the RPMs
+            that are missing, were reinstalled from elsewhere, or whose
+            local file changed are copied and installed, in a single rpm
+            transaction.
+'''
+
+import hashlib
+import posixpath
+
+# where the hash of the file each package was installed from is kept
+STATE_DIR = '/var/tmp/litp_cli_rpms'
+REMOTE_DIR = '/tmp'
+RPM_MARKER = '@rpm'
+HASH_MARKER = '@hash'
+HASH_CHUNK = 1 << 20
+
+
+def get_file_hash(path):
+    """
+    Description:
+        SHA-256 of a local file
+    Args:
+        path (str): Path of the file
+    Returns:
+        str. Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as rpm_file:
+        for chunk in iter(lambda: rpm_file.read(HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_query_cmd(names):
+    """
+    Description:
+        Build one command line reporting the install time of every package
+        and the hash and install time recorded for it
+    Args:
+        names (list): Package names
+    Returns:
+        str. The command line, for parse_query
+    """
+    return ("rpm -q --qf '{0} %{{NAME}} %{{INSTALLTIME}}\\n' {1} "
+            "2>/dev/null; for n in {1}; do test -f {2}/$n && "
+            "echo \"{3} $n $(cat {2}/$n)\"; done; true").format(
+                RPM_MARKER, ' '.join(names), STATE_DIR, HASH_MARKER)
+
+
+def parse_query(lines):
+    """
+    Description:
+        Read the output of the command of get_query_cmd
+    Args:
+        lines (list): stdout lines
+    Returns:
+        dict, dict. Install time per installed package, and the recorded
+                    (hash, install time) per package
+    """
+    installed = {}
+    recorded = {}
+    for line in lines:
+        fields = line.split()
+        if len(fields) == 3 and fields[0] == RPM_MARKER:
+            installed[fields[1]] = fields[2]
+        elif len(fields) == 4 and fields[0] == HASH_MARKER:
+            recorded[fields[1]] = (fields[2], fields[3])
+    return installed, recorded
+
+
+def get_changed(hashes, installed, recorded):
+    """
+    Description:
+        Find the packages to install
+    Args:
+        hashes (dict): Package name to the hash of its local RPM
+        installed (dict): Install times from parse_query
+        recorded (dict): Recorded hashes from parse_query
+    Returns:
+        list. Names of the packages whose installed RPM is not the local
+              one, sorted
+    """
+    return sorted(name for name, digest in hashes.items()
+                  if name not in installed
+                  or recorded.get(name) != (digest, installed[name]))
+
+
+def get_remote_path(local_path):
+    """ Where a local RPM is copied to on the node """
+    return posixpath.join(REMOTE_DIR, posixpath.basename(local_path))
+
+
+def get_install_cmd(rpms, hashes):
+    """
+    Description:
+        Build one command line installing RPMs copied to the node in a
+        single transaction, recording their hashes and removing the copies
+    Args:
+        rpms (dict): Package name to the path of its RPM on the node
+        hashes (dict): Package name to the hash of its RPM
+    Returns:
+        str. The command line, to run as root; it fails if the install does
+    """
+    names = sorted(rpms)
+    paths = ' '.join(rpms[name] for name in names)
+    steps = ['rpm -Uvh --replacepkgs --oldpackage {0}'.format(paths),
+             'mkdir -p {0}'.format(STATE_DIR)]
+    for name in names:
+        steps.append(
+            "echo \"{0} $(rpm -q --qf '%{{INSTALLTIME}}' {1})\" "
+            ">{2}/{1}".format(hashes[name], name, STATE_DIR))
+    return '{0}; rc=$?; rm -f {1}; test $rc -eq 0'.format(
+        ' && '.join(steps), paths)
@@ -0,0 +1,398 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Pool of persistent SSH sessions, one per node, shared by all
+            the tests of a testset. Commands are multiplexed as separate
+            channels over the same authenticated transport so connection
+            set up and authentication are paid once per node and testset
+            instead of once per command.
+'''
+
+import os
+import signal
+import socket
+import subprocess
+import threading
+import time
+
+try:
+    import paramiko
+except ImportError:
+    paramiko = None
+
+DEFAULT_SSH_PORT = 22
+CONNECT_TIMEOUT_SECS = 10
+KEEPALIVE_SECS = 30
+# sshd's default MaxSessions is 10, stay below it
+MAX_CHANNELS_PER_NODE = 8
+RECV_BUFFER = 32768
+# set by tools/parallel_runner to the host.properties of the deployment
+# the tests run against, e.g. that of a shard (see tools/shard_plan.py)
+HOSTS_ENV = 'LITP_TEST_HOSTS'
+
+
+def split_output(data):
+    """
+    Description:
+        Convert raw command output into the list of lines returned by
+        GenericTest.run_command
+    Args:
+        data (str): Raw output of a command
+    Returns:
+        list. Output lines without line terminators
+    """
+    if not data:
+        return []
+    if not isinstance(data, str):
+        data = data.decode('utf-8', 'replace')
+    return data.splitlines()
+
+
+def load_host_properties(path):
+    """
+    Description:
+        Parse a TAF host.properties file into connection details per node
+    Args:
+        path (str): Path to host.properties
+    Returns:
+        dict. Node name (e.g. ms1) mapped to a dict with keys 'ip', 'port'
+              and 'users' (user name to password)
+    """
+    hosts = {}
+    with open(path) as props_file:
+        for line in props_file:
+            line = line.strip()
+            if not line or line.startswith('#') or '=' not in line:
+                continue
+            key, value = line.split('=', 1)
+            parts = key.strip().split('.')
+            if len(parts) < 3 or parts[0] != 'host':
+                continue
+            host = hosts.setdefault(parts[1], {'ip': None,
+                                               'port': DEFAULT_SSH_PORT,
+                                               'users': {}})
+            value = value.strip()
+            if parts[2] == 'ip':
+                host['ip'] = value
+            elif parts[2:4] == ['port', 'ssh']:
+                host['port'] = int(value)
+            elif parts[2] == 'user' and parts[-1] == 'pass':
+                host['users']['.'.join(parts[3:-1])] = value
+    return hosts
+
+
+def get_host_att(hosts, node, att, username):
+    """
+    Description:
+        Look up the address or a password of a node in the output of
+        load_host_properties
+    Args:
+        hosts (dict): Output of load_host_properties
+        node (str): Node name, e.g. ms1
+        att (str): 'ipv4' or 'password'
+        username (str): User whose password is asked for
+    Returns:
+        str. The value, or None if the hosts do not give it
+    """
+    details = hosts.get(node)
+    if details is None:
+        return None
+    if att == 'ipv4':
+        return details['ip']
+    if att == 'password':
+        return details['users'].get(username)
+    return None
+
+
+class SshSession(object):
+    """
+    One authenticated SSH transport to a node. Every command is run on a
+    new channel of the transport; the transport is re-established if the
+    node dropped it.
+    """
+
+    def __init__(self, host, username, password, port=DEFAULT_SSH_PORT,
+                 timeout=CONNECT_TIMEOUT_SECS):
+        if paramiko is None:
+            raise RuntimeError('paramiko is required for SSH sessions')
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+        self.connects = 0
+        self.commands = 0
+        self._client = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        """
+        Open and authenticate a new transport to the node
+        """
+        client = paramiko.SSHClient()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        client.connect(self.host, port=self.port, username=self.username,
+                       password=self.password, timeout=self.timeout,
+                       allow_agent=False, look_for_keys=False)
+        client.get_transport().set_keepalive(KEEPALIVE_SECS)
+        self._client = client
+        self.connects += 1
+
+    def _transport(self):
+        """
+        Return the live transport, connecting if necessary
+        """
+        with self._lock:
+            transport = None
+            if self._client is not None:
+                transport = self._client.get_transport()
+            if transport is None or not transport.is_active():
+                self._connect()
+                transport = self._client.get_transport()
+            return transport
+
+    def _open_channel(self):
+        """
+        Open a channel, reconnecting once if the transport went away
+        """
+        try:
+            return self._transport().open_session()
+        except (paramiko.SSHException, EOFError):
+            self.close()
+            return self._transport().open_session()
+
+    def execute(self, cmd, timeout=None):
+        """
+        Description:
+            Run a command on a new channel of the shared transport
+        Args:
+            cmd (str): Command to run
+            timeout (int): Seconds to wait for the command, None waits
+                           forever
+        Returns:
+            list, list, int. stdout lines, stderr lines and return code
+        Raises:
+            socket.timeout. The command did not finish in time
+        """
+        channel = self._open_channel()
+        stdout, stderr = [], []
+        deadline = None if timeout is None else time.time() + timeout
+        try:
+            channel.settimeout(timeout)
+            channel.exec_command(cmd)
+            # drain both streams together so a chatty stderr can never
+            # fill the channel window while we block on stdout
+            while True:
+                if channel.recv_ready():
+                    stdout.append(channel.recv(RECV_BUFFER))
+                elif channel.recv_stderr_ready():
+                    stderr.append(channel.recv_stderr(RECV_BUFFER))
+                elif channel.exit_status_ready():
+                    break
+                elif deadline is not None and time.time() >= deadline:
+                    raise socket.timeout('{0} did not finish in {1}s on '
+                                         '{2}'.format(cmd, timeout,
+                                                      self.host))
+                else:
+                    channel.status_event.wait(0.01)
+            while channel.recv_ready():
+                stdout.append(channel.recv(RECV_BUFFER))
+            while channel.recv_stderr_ready():
+                stderr.append(channel.recv_stderr(RECV_BUFFER))
+            rc = channel.recv_exit_status()
+        finally:
+            channel.close()
+        self.commands += 1
+        return (split_output(b''.join(stdout)),
+                split_output(b''.join(stderr)), rc)
+
+    def close(self):
+        """
+        Close the transport
+        """
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+
+class LocalSession(object):
+    """
+    Stand-in for SshSession that runs commands on the local host. Used to
+    exercise the pool offline; it accepts and ignores the connection
+    details.
+    """
+
+    def __init__(self, host=None, username=None, password=None,
+                 port=DEFAULT_SSH_PORT, timeout=None):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+        self.connects = 1
+        self.commands = 0
+
+    def execute(self, cmd, timeout=None):
+        """
+        Description:
+            Run a command in a local shell
+        Args:
+            cmd (str): Command to run
+            timeout (int): Seconds to wait for the command, None waits
+                           forever
+        Returns:
+            list, list, int. stdout lines, stderr lines and return code
+        Raises:
+            socket.timeout. The command did not finish in time; it is
+                            killed with everything it started
+        """
+        proc = subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE, preexec_fn=os.setsid)
+        expired = []
+
+        def expire():
+            """ Kill the process group of the command """
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except OSError:
+                # it finished in the meantime
+                return
+            expired.append(True)
+
+        timer = None
+        if timeout is not None:
+            timer = threading.Timer(timeout, expire)
+            timer.start()
+        try:
+            stdout, stderr = proc.communicate()
+        finally:
+            if timer is not None:
+                timer.cancel()
+        if expired:
+            raise socket.timeout('{0} did not finish in {1}s'.format(
+                cmd, timeout))
+        self.commands += 1
+        return split_output(stdout), split_output(stderr), proc.returncode
+
+    def close(self):
+        """
+        Nothing to release for a local session
+        """
+        pass
+
+
+class SessionPool(object):
+    """
+    Sessions keyed by node name. Connection details are registered once
+    and the session is opened lazily on the first command for that node.
+    """
+
+    def __init__(self, session_factory=SshSession,
+                 max_channels=MAX_CHANNELS_PER_NODE):
+        self.session_factory = session_factory
+        self.max_channels = max_channels
+        self._nodes = {}
+        self._sessions = {}
+        self._channels = {}
+        self._lock = threading.Lock()
+
+    def register(self, node, host, username, password,
+                 port=DEFAULT_SSH_PORT):
+        """
+        Description:
+            Record how to reach a node
+        Args:
+            node (str): Node name, e.g. ms1
+            host (str): IP address or hostname
+            username (str): User to authenticate as
+            password (str): Password of the user
+            port (int): SSH port
+        """
+        with self._lock:
+            self._nodes[node] = (host, username, password, port)
+
+    def register_hosts(self, hosts, username):
+        """
+        Description:
+            Register every node returned by load_host_properties
+        Args:
+            hosts (dict): Output of load_host_properties
+            username (str): User to authenticate as on every node
+        """
+        for node, details in hosts.items():
+            if details['ip'] and username in details['users']:
+                self.register(node, details['ip'], username,
+                              details['users'][username], details['port'])
+
+    def is_registered(self, node):
+        """
+        Description:
+            Check whether connection details are known for a node
+        Args:
+            node (str): Node name
+        Returns:
+            bool. True if the node can be used with execute
+        """
+        return node in self._nodes
+
+    def _session(self, node):
+        """
+        Return the session of a node, creating it on first use
+        """
+        with self._lock:
+            session = self._sessions.get(node)
+            if session is None:
+                host, username, password, port = self._nodes[node]
+                session = self.session_factory(host, username, password,
+                                               port=port)
+                self._sessions[node] = session
+                self._channels[node] = threading.BoundedSemaphore(
+                    self.max_channels)
+            return session, self._channels[node]
+
+    def execute(self, node, cmd, timeout=None):
+        """
+        Description:
+            Run a command on a node over its pooled session
+        Args:
+            node (str): Node name the command is run on
+            cmd (str): Command to run
+            timeout (int): Seconds to wait for the command, None waits
+                           forever
+        Returns:
+            list, list, int. stdout lines, stderr lines and return code
+        Raises:
+            socket.timeout. The command did not finish in time
+        """
+        session, channels = self._session(node)
+        with channels:
+            return session.execute(cmd, timeout=timeout)
+
+    def stats(self):
+        """
+        Description:
+            Report connection reuse per node
+        Returns:
+            dict. Node name mapped to number of connects and commands
+        """
+        return dict((node, {'connects': session.connects,
+                            'commands': session.commands})
+                    for node, session in self._sessions.items())
+
+    def close(self):
+        """
+        Close every open session
+        """
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions = {}
+            self._channels = {}
@@ -0,0 +1,105 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Test side of a shared plan execution. Tests tagged 'plan_shared'
+            that the scheduler runs side by side (see
+            tools/plan_scheduler.py) meet at their plan: once every test of
+            the group is waiting for one, a single plan is created and run
+            by one of them (the lead) and all of them carry on with its
+            outcome. Teardowns are taken one at a time, once no test of
+            the group still needs a plan.
+
+            Outside such a group from_env() returns None and the tests run
+            their own plans.
+'''
+
+import os
+
+from multiprocessing.connection import Client
+
+COORDINATOR_ENV = 'LITP_PLAN_COORDINATOR'
+MEMBER_ENV = 'LITP_PLAN_MEMBER'
+AUTHKEY_ENV = 'LITP_PLAN_AUTHKEY'
+# set by the runner for tests run next to other tests changing the model
+CONCURRENT_ENV = 'LITP_TEST_CONCURRENT'
+
+SHARED_TAG = 'plan_shared'
+DELTA_PREFIX = 'delta_'
+
+LEAD = 'lead'
+
+
+class SharedPlanClient(object):
+    """
+    Connection of one test to the plan coordinator of its group
+    """
+
+    def __init__(self, address, member, authkey):
+        self.member = member
+        self._conn = Client(address, authkey=authkey)
+
+    @classmethod
+    def from_env(cls):
+        """
+        Description:
+            Connect to the coordinator given in the environment
+        Returns:
+            SharedPlanClient. The client, or None when the test is not run
+                              as part of a shared plan group
+        """
+        address = os.environ.get(COORDINATOR_ENV)
+        member = os.environ.get(MEMBER_ENV)
+        if not address or not member:
+            return None
+        host, port = address.rsplit(':', 1)
+        authkey = os.environ.get(AUTHKEY_ENV, '').encode('ascii')
+        return cls((host, int(port)), member, authkey)
+
+    def _call(self, *message):
+        """
+        Send a message and wait for the coordinator's answer
+        """
+        self._conn.send((message[0], self.member) + message[1:])
+        return self._conn.recv()
+
+    def wait_for_plan(self):
+        """
+        Description:
+            Block until the group's plan can run
+        Returns:
+            str|bool. LEAD if this test must run the plan (and report it
+                      with plan_done), otherwise whether the plan run by
+                      the lead succeeded
+        """
+        return self._call('plan')
+
+    def plan_done(self, success):
+        """
+        Description:
+            Report the outcome of the plan this test led
+        Args:
+            success (bool): True if the plan completed successfully
+        """
+        self._call('done', bool(success))
+
+    def wait_for_teardown(self):
+        """
+        Block until this test may tear down
+        """
+        self._call('teardown')
+
+    def leave(self):
+        """
+        Tell the coordinator this test is finished
+        """
+        try:
+            self._call('leave')
+        finally:
+            self._conn.close()
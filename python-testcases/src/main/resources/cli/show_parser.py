@@ -0,0 +1,180 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Parser of the text output of 'litp show', 'litp show -r' and
+            'litp show -l' into one record per item:
+
+                /ms/items/telnet
+                    inherited from: /software/items/telnet
+                    type: reference-to-package
+                    state: Applied
+                    properties:
+                        name: telnet [*]
+                    children:
+                        ...
+
+            Items are yielded as soon as their block ends, so a recursive
+            show of a large subtree is parsed in one pass holding a single
+            item at a time.
+'''
+
+INHERITED_MARKER = ' [*]'
+PROPERTIES_HEADER = 'properties'
+CHILDREN_HEADER = 'children'
+
+
+def strip_inherited_marker(value):
+    """
+    Description:
+        Remove the marker 'litp show' puts on inherited property values
+    Args:
+        value (str): Value as printed, e.g. 'redhat [*]'
+    Returns:
+        str. The value without the marker, e.g. 'redhat'
+    """
+    if value is not None and value.endswith(INHERITED_MARKER):
+        return value[:-len(INHERITED_MARKER)]
+    return value
+
+
+class ShowItem(object):
+    """
+    One item of a 'litp show' output. properties holds the values without
+    the inherited marker; inherited names the properties that carried it.
+    """
+
+    __slots__ = ('path', 'type', 'state', 'inherited_from', 'properties',
+                 'inherited', 'children', 'attributes')
+
+    def __init__(self, path):
+        self.path = path
+        self.type = None
+        self.state = None
+        self.inherited_from = None
+        self.properties = {}
+        self.inherited = set()
+        self.children = []
+        # any other 'name: value' line of the item
+        self.attributes = {}
+
+    def get_property(self, name, marker=True):
+        """
+        Description:
+            Value of a property as 'litp show -o <name>' prints it
+        Args:
+            name (str): Property name
+            marker (bool): Keep the inherited marker
+        Returns:
+            str. The value, None if the item has no such property
+        """
+        value = self.properties.get(name)
+        if value is not None and marker and name in self.inherited:
+            value += INHERITED_MARKER
+        return value
+
+    def get_properties(self, marker=True):
+        """
+        Description:
+            All properties as 'litp show' prints them
+        Args:
+            marker (bool): Keep the inherited markers
+        Returns:
+            dict. Property name to value
+        """
+        return dict((name, self.get_property(name, marker))
+                    for name in self.properties)
+
+    def get_value(self, key):
+        """
+        Description:
+            Value as 'litp show -o <key>' prints it
+        Args:
+            key (str): state, type, inherited from or a property name
+        Returns:
+            str. The value, None if the item has no such value
+        """
+        if key == 'state':
+            return self.state
+        if key == 'type':
+            return self.type
+        if key == 'inherited from':
+            return self.inherited_from
+        return self.get_property(key)
+
+    def add_value(self, section, key, value):
+        """ Store one 'key: value' line of the item """
+        if section == PROPERTIES_HEADER:
+            if value.endswith(INHERITED_MARKER):
+                self.inherited.add(key)
+                value = value[:-len(INHERITED_MARKER)]
+            self.properties[key] = value
+        elif key == 'type':
+            self.type = value
+        elif key == 'state':
+            self.state = value
+        elif key == 'inherited from':
+            self.inherited_from = value
+        else:
+            self.attributes[key] = value
+
+
+def iter_show_items(lines):
+    """
+    Description:
+        Parse the text output of 'litp show' item by item
+    Args:
+        lines (iterable): Output lines, read once
+    Returns:
+        generator. ShowItem per item, in output order
+    """
+    item = None
+    section = None
+    for line in lines:
+        line = line.rstrip()
+        text = line.strip()
+        if not text:
+            continue
+        if text.startswith('/') and not line[0].isspace():
+            if item is not None:
+                yield item
+            item = ShowItem(text)
+            section = None
+            continue
+        if item is None:
+            continue
+        indent = len(line) - len(line.lstrip())
+        if indent <= 4:
+            section = None
+        elif section == CHILDREN_HEADER:
+            item.children.append(text)
+            continue
+        key, sep, value = text.partition(':')
+        if not sep:
+            continue
+        value = value.strip()
+        if section is None and not value \
+                and key in (PROPERTIES_HEADER, CHILDREN_HEADER):
+            section = key
+            continue
+        item.add_value(section, key, value)
+    if item is not None:
+        yield item
+
+
+def parse_show(lines):
+    """
+    Description:
+        Parse a whole 'litp show' output
+    Args:
+        lines (iterable): Output lines
+    Returns:
+        dict. Path to ShowItem
+    """
+    return dict((item.path, item) for item in iter_show_items(lines))
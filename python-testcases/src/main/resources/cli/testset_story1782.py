@@ -13,9 +13,11 @@ program(s) have been supplied.
 '''
 
 import re
-from litp_generic_test import GenericTest, attr
+from litp_generic_test import attr
+from cli_base import CliGenericTest
 import test_constants
 from litp_cli_utils import CLIUtils
+from package_inventory import parse_version_output
 
 VERSION_FILE = test_constants.LITP_PATH + ".version"
 INSTALL_FILE = test_constants.LITP_PATH + ".upgrade.history"
@@ -24,7 +26,7 @@ LITP_GROUP = "LITP2"
 VERSION_OPT = "version"
 
 
-class Story1782(GenericTest):
+class Story1782(CliGenericTest):
 
     '''
     As a LITP User I want to be able to retrieve the version information,
@@ -89,15 +91,9 @@ class Story1782(GenericTest):
 
     def _get_litp_packages(self):
         """
-        Method to get list of installed LITP packages
+        Method to get the installed LITP packages, listed once per session
         """
-        litp_pkgs_cmd = (
-           "/bin/rpm -qa --qf '%-{name} %-{version}\\n' | sort -k1 | "
-           "egrep \"`yum groupinfo " + LITP_GROUP + "| grep CXP | "
-           "tr -d ' ' | tr '\\n' '|' | sed 's/|$//g'`\"")
-        stdout, _, _ = self.run_command(self.ms_node, litp_pkgs_cmd,
-                                        su_root=True, default_asserts=True)
-        return '\n'.join(stdout)
+        return self.get_package_inventory(self.ms_node, LITP_GROUP)
 
     @attr('all', 'revert', 'cdb_priority1')
     def obsolete_01_p_retrieve_iso_version_cli(self):
@@ -175,11 +171,8 @@ class Story1782(GenericTest):
         # 3. Ensure all litp packages are in output
         self.assertTrue(self.is_text_in_list('Add-on packages:',
                                              stdout))
-        for pkg_info in litp_pkgs.split('\n'):
-            if pkg_info:
-                name, cxp_string, version = re.split('[_ ]', pkg_info)
-                ver_format = "{0}: {1} {2}".format(name, version, cxp_string)
-                self._assert_in(''.join(ver_format), ''.join(stdout))
+        self.assertEqual({}, litp_pkgs.get_differences(
+            parse_version_output(stdout)))
 
     @attr('all', 'revert')
     def obsolete_03_p_retrieve_install_info_cli(self):
@@ -232,38 +225,30 @@ class Story1782(GenericTest):
         @tms_execution_type: Automated
         """
         # 1. Run litp help command
-        litp_help_cmd = " ".join([self.cli.litp_path, "--help"])
-        stdout, _, _ = self.run_command(self.ms_node, litp_help_cmd)
+        stdout, _, _ = self.get_help(self.ms_node, help_arg="--help")
 
         # 2. Ensure version in 'litp --help' output
         help_options = [VERSION_OPT,
                         "Displays the ERIClitpcore version of LITP."]
-        for option in help_options:
-            self.assertTrue(self.is_text_in_list(option, stdout))
+        self.assert_texts_in_list(help_options, stdout, "litp help")
 
         # 3. Run 'litp version --help' command
-        litp_version_help_output = " ".join([self.cli.litp_path,
-                                             VERSION_OPT, "--help"])
-        stdout, _, _ = self.run_command(self.ms_node, litp_version_help_output)
+        stdout, _, _ = self.get_help(self.ms_node, VERSION_OPT, "--help")
 
         # 4. Ensure [-a .--all] options in 'litp version --help'
         version_help_options = ['-a', '--all',
             "Display installed LITP packages"]
-        for option in version_help_options:
-            self.assertTrue(self.is_text_in_list(option, stdout))
+        self.assert_texts_in_list(version_help_options, stdout,
+                                  "litp version help")
 
         # 5. Ensure [-a .--all] options in 'litp version -h'
-        litp_h_cmd = " ".join([self.cli.litp_path, "-h"])
-        stdout, _, _ = self.run_command(self.ms_node, litp_h_cmd)
-        for option in help_options:
-            self.assertTrue(self.is_text_in_list(option, stdout))
+        stdout, _, _ = self.get_help(self.ms_node, help_arg="-h")
+        self.assert_texts_in_list(help_options, stdout, "litp help")
 
         # 6. Ensure 'litp version -h' matches --help option
-        litp_version_h_cmd = " ".join([self.cli.litp_path, VERSION_OPT, "-h"])
-        stdout, _, _ = self.run_command(self.ms_node, litp_version_h_cmd)
-        for version in version_help_options:
-            self.assertTrue(self.is_text_in_list(version,
-                                                 stdout))
+        stdout, _, _ = self.get_help(self.ms_node, VERSION_OPT, "-h")
+        self.assert_texts_in_list(version_help_options, stdout,
+                                  "litp version help")
 
     @attr('all', 'revert')
     def obsolete_06_n_retrieve_version_with_no_version_file(self):
@@ -13,11 +13,12 @@ program(s) have been supplied.
             Agile: STORY_2093
 """
 
-from litp_generic_test import GenericTest, attr
+from litp_generic_test import attr
+from cli_base import CliGenericTest
 from litp_cli_utils import CLIUtils
 
 
-class Story2093(GenericTest):
+class Story2093(CliGenericTest):
     """
     As a LITP User I want to upgrade RHEL & 3pps on the nodes so that I can
     apply security patches.
@@ -60,8 +61,8 @@ class Story2093(GenericTest):
         for index, arg in enumerate(help_args, 1):
             self.log('info', '{0}. Execute litp {1} command'
                 .format(index, arg))
-            cmd = self.cli.get_help_cmd(help_arg=arg)
-            out = self.run_command(self.ms_node, cmd, default_asserts=True)[0]
+            out = self.get_help(self.ms_node, help_arg=arg,
+                                default_asserts=True)[0]
             exp = "upgrade             " \
                 "Updates the packages on a defined node or cluster to a"
             self.assertTrue(self.is_text_in_list(exp, out),
@@ -70,9 +71,8 @@ class Story2093(GenericTest):
         for index, arg in enumerate(help_args, 3):
             self.log('info', '{0}. Execute litp upgrade {1} command.'
                 .format(index, arg))
-            cmd = self.cli.get_help_cmd(help_arg=arg, help_action='upgrade')
-            out = self.run_command(self.ms_node, cmd, default_asserts=True)[0]
+            out = self.get_help(self.ms_node, 'upgrade', arg,
+                                default_asserts=True)[0]
 
-            for description in descriptions:
-                self.assertTrue(self.is_text_in_list(description, out),
-                    "{0} not in {1}".format(description, out))
+            self.assert_texts_in_list(descriptions, out,
+                                      "litp upgrade {0} output".format(arg))
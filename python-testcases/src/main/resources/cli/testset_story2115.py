@@ -13,11 +13,12 @@ program(s) have been supplied.
             operations so that I can revert to them later on.
             Agile: LITPCDS-2115
 """
-from litp_generic_test import GenericTest, attr
+from litp_generic_test import attr
+from cli_base import CliGenericTest
 from litp_cli_utils import CLIUtils
 
 
-class Story2115(GenericTest):
+class Story2115(CliGenericTest):
     """
     As a LITP admin I want to snapshot LVM volumes present in my
     deployment when I am doing maintenance operations so that
@@ -68,8 +69,8 @@ class Story2115(GenericTest):
         @tms_execution_type: Automated
         """
         self.log("info", "1. Run 'litp --help'")
-        cmd = self.cli.get_help_cmd()
-        out = self.run_command(self.ms_node, cmd, default_asserts=True)[0]
+        out = self.get_help(self.ms_node, help_arg='--help',
+                            default_asserts=True)[0]
 
         self.log("info", "Verify create_snapshot action "
                          "is listed with a summary")
@@ -80,8 +81,8 @@ class Story2115(GenericTest):
                         '{0} not in {1}'.format(create_msg, help_str))
 
         self.log("info", "2. Run 'litp create_snapshot --help'")
-        cmd = self.cli.get_help_cmd(help_action='create_snapshot')
-        out = self.run_command(self.ms_node, cmd, default_asserts=True)[0]
+        out = self.get_help(self.ms_node, 'create_snapshot', '--help',
+                            default_asserts=True)[0]
 
         self.log("info", "Verify that description is provided for "
                          "create_snapshot action, including 'Usage', "
@@ -89,14 +90,12 @@ class Story2115(GenericTest):
         usage_strs = ["Usage: litp create_snapshot [-h] "
                       "[-n NAME [-e EXCLUDE_NODES]] [-j]",
                       "Optional Arguments:", "Example: litp create_snapshot"]
-        for usage_str in usage_strs:
-            self.assertTrue(self.is_text_in_list(usage_str, out),
-                            "{0} not found in 'litp create_snapshot --help' "
-                            "output".format(usage_str))
+        self.assert_texts_in_list(usage_strs, out,
+                                  "'litp create_snapshot --help' output")
 
         self.log("info", "3. Run 'litp -h'")
-        cmd = self.cli.get_help_cmd(help_arg='-h')
-        out = self.run_command(self.ms_node, cmd, default_asserts=True)[0]
+        out = self.get_help(self.ms_node, help_arg='-h',
+                            default_asserts=True)[0]
 
         self.log("info", "Verify that create_snapshot action is "
                          "listed with a summary.")
@@ -107,17 +106,14 @@ class Story2115(GenericTest):
                         '{0} not in {1}'.format(create_msg, help_str))
 
         self.log("info", "4. Run 'litp create_snapshot -h'")
-        cmd = self.cli.get_help_cmd(help_arg='-h',
-                                    help_action='create_snapshot')
-        out = self.run_command(self.ms_node, cmd, default_asserts=True)[0]
+        out = self.get_help(self.ms_node, 'create_snapshot', '-h',
+                            default_asserts=True)[0]
 
         self.log("info", "Verify that description is provided for "
                          "create_snapshot action, including 'Usage', "
                          "'Arguments', and an example.")
-        for usage_str in usage_strs:
-            self.assertTrue(self.is_text_in_list(usage_str, out),
-                            "{0} not found in 'litp create_snapshot -h' "
-                            "output".format(usage_str))
+        self.assert_texts_in_list(usage_strs, out,
+                                  "'litp create_snapshot -h' output")
 
     @attr('all', 'revert', 'story2115', 'story2115_tc02')
     def test_02_p_remove_snapshot_cmd_help(self):
@@ -140,8 +136,8 @@ class Story2115(GenericTest):
         @tms_execution_type: Automated
         """
         self.log("info", "1. Run 'litp --help'")
-        cmd = self.cli.get_help_cmd()
-        out = self.run_command(self.ms_node, cmd, default_asserts=True)[0]
+        out = self.get_help(self.ms_node, help_arg='--help',
+                            default_asserts=True)[0]
 
         self.log("info", "Verify remove_snapshot action "
                          "is listed with a summary")
@@ -151,8 +147,8 @@ class Story2115(GenericTest):
                         '{0} not in {1}'.format(remove_msg, help_str))
 
         self.log("info", "2. Run 'litp remove_snapshot --help'")
-        cmd = self.cli.get_help_cmd(help_action='remove_snapshot')
-        out = self.run_command(self.ms_node, cmd, default_asserts=True)[0]
+        out = self.get_help(self.ms_node, 'remove_snapshot', '--help',
+                            default_asserts=True)[0]
 
         self.log("info", "Verify that description is provided for "
                          "remove_snapshot action, including 'Usage', "
@@ -160,14 +156,12 @@ class Story2115(GenericTest):
         usage_strs = ["Usage: litp remove_snapshot [-h] "
                       "[-n NAME [-e EXCLUDE_NODES]] [-j] [-f]",
                       "Optional Arguments:", "Example: litp remove_snapshot"]
-        for usage_str in usage_strs:
-            self.assertTrue(self.is_text_in_list(usage_str, out),
-                            "{0} not found in 'litp remove_snapshot --help' "
-                            "output".format(usage_str))
+        self.assert_texts_in_list(usage_strs, out,
+                                  "'litp remove_snapshot --help' output")
 
         self.log("info", "3. Run 'litp -h'")
-        cmd = self.cli.get_help_cmd(help_arg='-h')
-        out = self.run_command(self.ms_node, cmd, default_asserts=True)[0]
+        out = self.get_help(self.ms_node, help_arg='-h',
+                            default_asserts=True)[0]
 
         self.log("info", "Verify that remove_snapshot action is "
                          "listed with a summary.")
@@ -177,17 +171,14 @@ class Story2115(GenericTest):
                         '{0} not in {1}'.format(remove_msg, help_str))
 
         self.log("info", "4. Run 'litp remove_snapshot -h'")
-        cmd = self.cli.get_help_cmd(help_arg='-h',
-                                    help_action='remove_snapshot')
-        out = self.run_command(self.ms_node, cmd, default_asserts=True)[0]
+        out = self.get_help(self.ms_node, 'remove_snapshot', '-h',
+                            default_asserts=True)[0]
 
         self.log("info", "Verify that description is provided for "
                          "remove_snapshot action, including 'Usage', "
                          "'Arguments', and an example.")
-        for usage_str in usage_strs:
-            self.assertTrue(self.is_text_in_list(usage_str, out),
-                            "{0} not found in 'litp remove_snapshot -h' "
-                            "output".format(usage_str))
+        self.assert_texts_in_list(usage_strs, out,
+                                  "'litp remove_snapshot -h' output")
 
     @attr('all', 'revert', 'story2115', 'story2115_tc03')
     def test_03_p_restore_snapshot_cmd_help(self):
@@ -210,8 +201,8 @@ class Story2115(GenericTest):
         @tms_execution_type: Automated
         """
         self.log("info", "1. Run 'litp --help'")
-        cmd = self.cli.get_help_cmd()
-        out = self.run_command(self.ms_node, cmd, default_asserts=True)[0]
+        out = self.get_help(self.ms_node, help_arg='--help',
+                            default_asserts=True)[0]
 
         self.log("info", "Verify restore_snapshot action "
                          "is listed with a summary")
@@ -221,22 +212,20 @@ class Story2115(GenericTest):
                         '{0} not in {1}'.format(restore_msg, help_str))
 
         self.log("info", "2. Run 'litp restore_snapshot --help'")
-        cmd = self.cli.get_help_cmd(help_action='restore_snapshot')
-        out = self.run_command(self.ms_node, cmd, default_asserts=True)[0]
+        out = self.get_help(self.ms_node, 'restore_snapshot', '--help',
+                            default_asserts=True)[0]
 
         self.log("info", "Verify that description is provided for "
                          "restore_snapshot action, including 'Usage', "
                          "'Arguments', and an example.")
         usage_strs = ["Usage: litp restore_snapshot [-h] [-j] [-f]",
                       "Optional Arguments:", "Example: litp restore_snapshot"]
-        for usage_str in usage_strs:
-            self.assertTrue(self.is_text_in_list(usage_str, out),
-                            "{0} not found in 'litp restore_snapshot --help' "
-                            "output".format(usage_str))
+        self.assert_texts_in_list(usage_strs, out,
+                                  "'litp restore_snapshot --help' output")
 
         self.log("info", "3. Run 'litp -h'")
-        cmd = self.cli.get_help_cmd(help_arg='-h')
-        out = self.run_command(self.ms_node, cmd, default_asserts=True)[0]
+        out = self.get_help(self.ms_node, help_arg='-h',
+                            default_asserts=True)[0]
 
         self.log("info", "Verify that restore_snapshot action is "
                          "listed with a summary.")
@@ -246,14 +235,11 @@ class Story2115(GenericTest):
                         '{0} not in {1}'.format(restore_msg, help_str))
 
         self.log("info", "4. Run 'litp restore_snapshot -h'")
-        cmd = self.cli.get_help_cmd(help_arg='-h',
-                                    help_action='restore_snapshot')
-        out = self.run_command(self.ms_node, cmd, default_asserts=True)[0]
+        out = self.get_help(self.ms_node, 'restore_snapshot', '-h',
+                            default_asserts=True)[0]
 
         self.log("info", "Verify that description is provided for "
                          "restore_snapshot action, including 'Usage', "
                          "'Arguments', and an example.")
-        for usage_str in usage_strs:
-            self.assertTrue(self.is_text_in_list(usage_str, out),
-                            "{0} not found in 'litp restore_snapshot -h' "
-                            "output".format(usage_str))
+        self.assert_texts_in_list(usage_strs, out,
+                                  "'litp restore_snapshot -h' output")
@@ -15,13 +15,13 @@ program(s) have been supplied.
             Agile: STORY LITPCDS-212 and LITPCDS-239
 """
 
-from litp_generic_test import GenericTest, attr
+from litp_generic_test import attr
+from cli_base import CliGenericTest
 from litp_cli_utils import CLIUtils
-from litp_generic_utils import GenericUtils
 import test_constants as consts
 
 
-class Story212Story239(GenericTest):
+class Story212Story239(CliGenericTest):
     """
     As a system admin I want to export and import the current deployment model
     to an XML file(s) so that I can use it as a basis for a future deployment
@@ -32,7 +32,6 @@ class Story212Story239(GenericTest):
         super(Story212Story239, self).setUp()
         self.test_node = self.get_management_node_filename()
         self.cli = CLIUtils()
-        self.gen_utils = GenericUtils()
 
     def tearDown(self):
         """ Runs after every single test """
@@ -53,46 +52,7 @@ class Story212Story239(GenericTest):
          @tms_test_precondition: NA
          @tms_execution_type: Automated
         """
-        usage = 'litp export [-h] -p PATH [-f FILE] ' \
-                'Exports the deployment model to a local XML file.'.\
-                replace(' ', '')
-        required_arguments = '-p PATH, --path PATH  Location of item in ' \
-                             'the LITP model'.replace(' ', '')
-        optional_arguments = '-h, --help Show this help message and exit' \
-                             '-f FILE, --file FILE  XML file to which to ' \
-                             'export'.replace(' ', '')
-        example = 'litp export -p /deployments/dep1 -f dep1.xml'.\
-                  replace(' ', '')
-
-        export_cmds = ["{0} {1} {2}".format(self.cli.litp_path,
-                                            "export", "-h"),
-                       "{0} {1} {2}".format(self.cli.litp_path,
-                                            "export", "--help")]
-
-        for index, cmd in enumerate(export_cmds):
-            self.log('info', '{0}. Execute: {1}'.format(index + 1, cmd))
-            stdout = self.run_command(self.test_node, cmd,
-                                      add_to_cleanup=False,
-                                      logging=False,
-                                      default_asserts=True)[0]
-            self.assertNotEqual(stdout, [], "Standard output is empty")
-
-            self.assertEqual(self.gen_utils.get_text_in_help(stdout, 'Usage'),
-                             usage,
-                             'Usage string did not match')
-            self.assertEqual(self.gen_utils.get_text_in_help(stdout,
-                             'Required Arguments'),
-                             required_arguments,
-                             'Required Arguments string did not match')
-            self.assertEqual(self.gen_utils.get_text_in_help(stdout,
-                             'Optional Arguments'),
-                             optional_arguments,
-                             'Optional Arguments string did not match')
-            self.assertEqual(self.gen_utils.get_text_in_help(
-                             stdout,
-                             'Example'),
-                             example,
-                             'Example string did not match')
+        self.assert_help_matches_golden(self.test_node, 'export')
 
     @attr('all', 'revert', 'tooltest', 'story212_239', 'story212_239_tc13')
     def test_13_p_import_help(self):
@@ -109,49 +69,18 @@ class Story212Story239(GenericTest):
          @tms_test_precondition: NA
          @tms_execution_type: Automated
         """
-        usage = 'litp import [-h] [-j] source_path destination_path' \
-                'Imports packages into Yum repositories.'.replace(' ', '')
-        required_arguments = ' source_path Absolute path with rpm packages.' \
-                             ' This can be a single RPM or a directory' \
-                             ' of RPMs. destination_path  Absolute path to ' \
-                             'destination repo directory or one of "litp" ' \
-                             'or "3pp_rhel7" to import RPMs into the LITP or' \
-                             ' 3PP repo. This should be used for LITP RPMs ' \
-                             'only.'.\
-                             replace(' ', '')
-        optional_arguments = '-h, --help Show this help message and exit' \
-                             '-j, --json Output raw JSON response from ' \
-                             'server'.replace(' ', '')
         example = 'litp import /mnt/rhel-iso {0}os litp import' \
                   ' /root/libyaml-0.1.3-1.el7.x86_64.rpm {1}/'.\
                   replace(' ', '').format(consts.PARENT_PKG_REPO_DIR,
                                           consts.PP_PKG_REPO_DIR)
 
-        import_cmds = ["{0} {1} {2}".format(self.cli.litp_path,
-                                            "import", "-h"),
-                       "{0} {1} {2}".format(self.cli.litp_path,
-                                            "import", "--help")]
-
-        for index, cmd in enumerate(import_cmds):
-            self.log('info', '{0}. Execute: {1}'.format(index + 1, cmd))
-            stdout = self.run_command(self.test_node, cmd,
-                                      add_to_cleanup=False,
-                                      logging=False,
-                                      default_asserts=True)[0]
-            self.assertNotEqual(stdout, [], "Standard output is empty")
-
-            self.assertEqual(self.gen_utils.get_text_in_help(stdout, 'Usage'),
-                             usage,
-                             'Usage string did not match')
-            self.assertEqual(self.gen_utils.get_text_in_help(stdout,
-                             'Required Arguments'),
-                             required_arguments,
-                             'Required Arguments string did not match')
-            self.assertEqual(self.gen_utils.get_text_in_help(stdout,
-                             'Optional Arguments'),
-                             optional_arguments,
-                             'Optional Arguments string did not match')
-            self.assertEqual(self.gen_utils.get_text_in_help(stdout,
-                             'Examples'),
+        for index, help_arg in enumerate(['-h', '--help']):
+            self.log('info', '{0}. Execute: litp import {1}'.format(
+                index + 1, help_arg))
+            self.assert_help_matches_golden(self.test_node, 'import',
+                                            help_args=(help_arg,))
+            # the example depends on the repo directories of the release
+            self.assertEqual(self.get_help_section(self.test_node, 'import',
+                                                   'Examples', help_arg),
                              example,
                              'Examples string did not match')
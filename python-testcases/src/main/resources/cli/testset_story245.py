@@ -15,20 +15,22 @@ program(s) have been supplied.
 '''
 
 
-from litp_generic_test import GenericTest, attr
-from rest_utils import RestUtils
+from litp_generic_test import attr
+from cli_base import CliGenericTest
 from litp_cli_utils import CLIUtils
 from json_utils import JSONUtils
 import test_constants
 
 
-class Story245(GenericTest):
+class Story245(CliGenericTest):
 
     '''
     As a Product Designer I want a CLI that uses only the new REST API,
     so that the old API can be retired
     '''
 
+    use_model_snapshot = True
+
     def setUp(self):
         """
         Description:
@@ -44,7 +46,7 @@ class Story245(GenericTest):
         super(Story245, self).setUp()
         self.ms_node = self.get_management_node_filename()
         self.ms_ip_address = self.get_node_att(self.ms_node, 'ipv4')
-        self.rest = RestUtils(self.ms_ip_address)
+        self.rest = self.get_rest_utils(self.ms_ip_address)
         self.cli = CLIUtils()
         self.json = JSONUtils()
         self.os_path = test_constants.LITP_DEFAULT_OS_PROFILE_PATH_RHEL7
@@ -59,7 +61,6 @@ class Story245(GenericTest):
         Results:
             Items used in the test are cleaned up and the
         """
-        self.rest.clean_paths()
         super(Story245, self).tearDown()
 
     def create_profile(self, profile_name, add_to_cleanup=True):
@@ -792,8 +793,8 @@ class Story245(GenericTest):
         @tms_execution_type: Automated
         """
         self.log('info', 'Run " litp --help')
-        cmd = "{0} {1}".format(self.cli.litp_path, "--help")
-        stdout, stderr, return_code = self.run_command(self.ms_node, cmd)
+        stdout, stderr, return_code = self.get_help(self.ms_node,
+                                                    help_arg="--help")
 
         self.assertEqual(0, return_code)
         self.assertEqual([], stderr)
@@ -802,8 +803,8 @@ class Story245(GenericTest):
                         "create command is not in litp help")
 
         self.log('info', 'Run " litp -h')
-        cmd = "{0} {1}".format(self.cli.litp_path, "-h")
-        stdout, stderr, return_code = self.run_command(self.ms_node, cmd)
+        stdout, stderr, return_code = self.get_help(self.ms_node,
+                                                    help_arg="-h")
 
         self.assertEqual(0, return_code)
         self.assertEqual([], stderr)
@@ -812,64 +813,32 @@ class Story245(GenericTest):
                         "create command is not in litp help")
 
         self.log('info', 'Run " litp create --h')
-        cmd = "{0} {1} {2}".format(self.cli.litp_path, "create", "-h")
-        stdout, stderr, return_code = self.run_command(self.ms_node, cmd,
-                                                       add_to_cleanup=False)
+        stdout, stderr, return_code = self.get_help(self.ms_node, "create",
+                                                    "-h")
 
         self.assertEqual(0, return_code)
         self.assertEqual([], stderr)
 
         # CHECK CREATE COMMAND OPTIONS
-        self.assertTrue(self.is_text_in_list("-t TYPE", stdout),
-                        "-t option is not in litp create help")
-        self.assertTrue(self.is_text_in_list("--type TYPE", stdout),
-                        "--type option is not in litp create help")
-        self.assertTrue(self.is_text_in_list("-p PATH", stdout),
-                        "-p option is not in litp create help")
-        self.assertTrue(self.is_text_in_list("--path PATH", stdout),
-                        "--path option is not in litp create help")
-        self.assertTrue(self.is_text_in_list("-j,", stdout),
-                        "-j option is not in litp create help")
-        self.assertTrue(self.is_text_in_list("--json", stdout),
-                        "--json option is not in litp create help")
-        self.assertTrue(self.is_text_in_list("-o PROPERTIES", stdout),
-                        "-o option is not in litp create help")
-        self.assertTrue(self.is_text_in_list("--options PROPERTIES", stdout),
-                        "--options option is not in litp create help")
-        self.assertTrue(self.is_text_in_list("-h,", stdout),
-                        "-h option is not in litp create help")
-        self.assertTrue(self.is_text_in_list("--help", stdout),
-                        "--help option is not in litp create help")
+        self.assert_texts_in_list(["-t TYPE", "--type TYPE", "-p PATH",
+                                   "--path PATH", "-j,", "--json",
+                                   "-o PROPERTIES", "--options PROPERTIES",
+                                   "-h,", "--help"],
+                                  stdout, "litp create help")
 
         self.log('info', 'Run " litp create --help')
-        cmd = "{0} {1} {2}".format(self.cli.litp_path, "create", "--help")
-        stdout, stderr, return_code = self.run_command(self.ms_node, cmd,
-                                                       add_to_cleanup=False)
+        stdout, stderr, return_code = self.get_help(self.ms_node, "create",
+                                                    "--help")
 
         self.assertEqual(0, return_code)
         self.assertEqual([], stderr)
 
         # CHECK CREATE COMMAND OPTIONS
-        self.assertTrue(self.is_text_in_list("-t TYPE", stdout),
-                        "-t option is not in litp create help")
-        self.assertTrue(self.is_text_in_list("--type TYPE", stdout),
-                        "--type option is not in litp create help")
-        self.assertTrue(self.is_text_in_list("-p PATH", stdout),
-                        "-p option is not in litp create help")
-        self.assertTrue(self.is_text_in_list("--path PATH", stdout),
-                        "--path option is not in litp create help")
-        self.assertTrue(self.is_text_in_list("-j,", stdout),
-                        "-j option is not in litp create help")
-        self.assertTrue(self.is_text_in_list("--json", stdout),
-                        "--json option is not in litp create help")
-        self.assertTrue(self.is_text_in_list("-o PROPERTIES", stdout),
-                        "-o option is not in litp create help")
-        self.assertTrue(self.is_text_in_list("--options PROPERTIES", stdout),
-                        "--options option is not in litp create help")
-        self.assertTrue(self.is_text_in_list("-h,", stdout),
-                        "-h option is not in litp create help")
-        self.assertTrue(self.is_text_in_list("--help", stdout),
-                        "--help option is not in litp create help")
+        self.assert_texts_in_list(["-t TYPE", "--type TYPE", "-p PATH",
+                                   "--path PATH", "-j,", "--json",
+                                   "-o PROPERTIES", "--options PROPERTIES",
+                                   "-h,", "--help"],
+                                  stdout, "litp create help")
 
     @attr('all', 'revert')
     def obsolete_12_p_cli_link(self):
@@ -1651,8 +1620,8 @@ class Story245(GenericTest):
         @tms_execution_type: Automated
         """
         # GET LITP HELP WITH --help
-        cmd = "{0} {1}".format(self.cli.litp_path, "--help")
-        stdout, stderr, return_code = self.run_command(self.ms_node, cmd)
+        stdout, stderr, return_code = self.get_help(self.ms_node,
+                                                    help_arg="--help")
 
         self.assertEqual(0, return_code)
         self.assertEqual([], stderr)
@@ -1662,8 +1631,8 @@ class Story245(GenericTest):
                         "update command is not in litp help")
 
         # GET LITP HELP WITH -h
-        cmd = "{0} {1}".format(self.cli.litp_path, "-h")
-        stdout, stderr, return_code = self.run_command(self.ms_node, cmd)
+        stdout, stderr, return_code = self.get_help(self.ms_node,
+                                                    help_arg="-h")
 
         self.assertEqual(0, return_code)
         self.assertEqual([], stderr)
@@ -1673,56 +1642,30 @@ class Story245(GenericTest):
                         "update command is not in litp help")
 
         # GET LITP UPDATE HELP WITH -h
-        cmd = "{0} {1} {2}".format(self.cli.litp_path, "update", "-h")
-        stdout, stderr, return_code = self.run_command(self.ms_node, cmd,
-                                                       add_to_cleanup=False)
+        stdout, stderr, return_code = self.get_help(self.ms_node, "update",
+                                                    "-h")
 
         self.assertEqual(0, return_code)
         self.assertEqual([], stderr)
 
         # CHECK UPDATE COMMAND OPTIONS
-        self.assertTrue(self.is_text_in_list("-p PATH", stdout),
-                        "-p option is not in litp update help")
-        self.assertTrue(self.is_text_in_list("--path PATH", stdout),
-                        "--path option is not in litp update help")
-        self.assertTrue(self.is_text_in_list("-j,", stdout),
-                        "-j option is not in litp update help")
-        self.assertTrue(self.is_text_in_list("--json", stdout),
-                        "--json option is not in litp update help")
-        self.assertTrue(self.is_text_in_list("-o PROPERTIES", stdout),
-                        "-o option is not in litp update help")
-        self.assertTrue(self.is_text_in_list("--options PROPERTIES", stdout),
-                        "--options option is not in litp update help")
-        self.assertTrue(self.is_text_in_list("-h,", stdout),
-                        "-h option is not in litp update help")
-        self.assertTrue(self.is_text_in_list("--help", stdout),
-                        "--help option is not in litp update help")
+        self.assert_texts_in_list(["-p PATH", "--path PATH", "-j,", "--json",
+                                   "-o PROPERTIES", "--options PROPERTIES",
+                                   "-h,", "--help"],
+                                  stdout, "litp update help")
 
         # GET LITP UPDATE HELP WITH --help
-        cmd = "{0} {1} {2}".format(self.cli.litp_path, "update", "--help")
-        stdout, stderr, return_code = self.run_command(self.ms_node, cmd,
-                                                       add_to_cleanup=False)
+        stdout, stderr, return_code = self.get_help(self.ms_node, "update",
+                                                    "--help")
 
         self.assertEqual(0, return_code)
         self.assertEqual([], stderr)
 
         # CHECK UPDATE COMMAND OPTIONS
-        self.assertTrue(self.is_text_in_list("-p PATH", stdout),
-                        "-p option is not in litp update help")
-        self.assertTrue(self.is_text_in_list("--path PATH", stdout),
-                        "--path option is not in litp update help")
-        self.assertTrue(self.is_text_in_list("-j,", stdout),
-                        "-j option is not in litp update help")
-        self.assertTrue(self.is_text_in_list("--json", stdout),
-                        "--json option is not in litp update help")
-        self.assertTrue(self.is_text_in_list("-o PROPERTIES", stdout),
-                        "-o option is not in litp update help")
-        self.assertTrue(self.is_text_in_list("--options PROPERTIES", stdout),
-                        "--options option is not in litp update help")
-        self.assertTrue(self.is_text_in_list("-h,", stdout),
-                        "-h option is not in litp update help")
-        self.assertTrue(self.is_text_in_list("--help", stdout),
-                        "--help option is not in litp update help")
+        self.assert_texts_in_list(["-p PATH", "--path PATH", "-j,", "--json",
+                                   "-o PROPERTIES", "--options PROPERTIES",
+                                   "-h,", "--help"],
+                                  stdout, "litp update help")
 
     @attr('all', 'revert', 'story245', 'story245_tc35', 'cdb_priority1')
     def test_35_p_cli_remove_item(self):
@@ -2213,8 +2156,8 @@ class Story245(GenericTest):
 
         """
         self.log('info', 'Run " litp --help')
-        cmd = "{0} {1}".format(self.cli.litp_path, "--help")
-        stdout, stderr, return_code = self.run_command(self.ms_node, cmd)
+        stdout, stderr, return_code = self.get_help(self.ms_node,
+                                                    help_arg="--help")
 
         self.assertEqual(0, return_code)
         self.assertEqual([], stderr)
@@ -2224,8 +2167,8 @@ class Story245(GenericTest):
                         "remove command is not in litp help")
 
         # GET LITP HELP WITH -h
-        cmd = "{0} {1}".format(self.cli.litp_path, "-h")
-        stdout, stderr, return_code = self.run_command(self.ms_node, cmd)
+        stdout, stderr, return_code = self.get_help(self.ms_node,
+                                                    help_arg="-h")
 
         self.assertEqual(0, return_code)
         self.assertEqual([], stderr)
@@ -2235,48 +2178,28 @@ class Story245(GenericTest):
                         "remove command is not in litp help")
 
         # GET LITP REMOVE HELP WITH -h
-        cmd = "{0} {1} {2}".format(self.cli.litp_path, "remove", "-h")
-        stdout, stderr, return_code = self.run_command(self.ms_node, cmd,
-                                                       add_to_cleanup=False)
+        stdout, stderr, return_code = self.get_help(self.ms_node, "remove",
+                                                    "-h")
 
         self.assertEqual(0, return_code)
         self.assertEqual([], stderr)
 
         # CHECK REMOVE COMMAND OPTIONS
-        self.assertTrue(self.is_text_in_list("-p PATH", stdout),
-                        "-p option is not in litp remove help")
-        self.assertTrue(self.is_text_in_list("--path PATH", stdout),
-                        "--path option is not in litp remove help")
-        self.assertTrue(self.is_text_in_list("-j,", stdout),
-                        "-j option is not in litp remove help")
-        self.assertTrue(self.is_text_in_list("--json", stdout),
-                        "--json option is not in litp remove help")
-        self.assertTrue(self.is_text_in_list("-h,", stdout),
-                        "-h option is not in litp remove help")
-        self.assertTrue(self.is_text_in_list("--help", stdout),
-                        "--help option is not in litp remove help")
+        self.assert_texts_in_list(["-p PATH", "--path PATH", "-j,", "--json",
+                                   "-h,", "--help"],
+                                  stdout, "litp remove help")
 
         # GET LITP REMOVE HELP WITH --help
-        cmd = "{0} {1} {2}".format(self.cli.litp_path, "remove", "--help")
-        stdout, stderr, return_code = self.run_command(self.ms_node, cmd,
-                                                       add_to_cleanup=False)
+        stdout, stderr, return_code = self.get_help(self.ms_node, "remove",
+                                                    "--help")
 
         self.assertEqual(0, return_code)
         self.assertEqual([], stderr)
 
         # CHECK REMOVE COMMAND OPTIONS
-        self.assertTrue(self.is_text_in_list("-p PATH", stdout),
-                        "-p option is not in litp remove help")
-        self.assertTrue(self.is_text_in_list("--path PATH", stdout),
-                        "--path option is not in litp remove help")
-        self.assertTrue(self.is_text_in_list("-j,", stdout),
-                        "-j option is not in litp remove help")
-        self.assertTrue(self.is_text_in_list("--json", stdout),
-                        "--json option is not in litp remove help")
-        self.assertTrue(self.is_text_in_list("-h,", stdout),
-                        "-h option is not in litp remove help")
-        self.assertTrue(self.is_text_in_list("--help", stdout),
-                        "--help option is not in litp remove help")
+        self.assert_texts_in_list(["-p PATH", "--path PATH", "-j,", "--json",
+                                   "-h,", "--help"],
+                                  stdout, "litp remove help")
 
     @attr('all', 'revert', 'story245', 'story245_tc47', 'cdb_priority1')
     def test_47_p_cli_create_plan(self):
@@ -2449,16 +2372,9 @@ class Story245(GenericTest):
         stdout, _, _ = self.execute_cli_showplan_cmd(self.ms_node)
         self.assertFalse(self.is_text_in_list("Phase 0", stdout),
                          "Phase 0 is in show_plan output")
-        self.assertTrue(self.is_text_in_list("Phase 1", stdout),
-                        "Phase 1 is not in show_plan output")
-        self.assertTrue(self.is_text_in_list("Tasks:", stdout),
-                        "Tasks is not in show_plan output")
-        self.assertTrue(self.is_text_in_list("Initial:", stdout),
-                        "Initial is not in show_plan output")
-        self.assertTrue(self.is_text_in_list("Running:", stdout),
-                        "Running is not in show_plan output")
-        self.assertTrue(self.is_text_in_list("Failed:", stdout),
-                        "Failed is not in show_plan output")
+        self.assert_texts_in_list(["Phase 1", "Tasks:", "Initial:", "Running:",
+                                   "Failed:"],
+                                  stdout, "show_plan output")
 
     @attr('all', 'revert', 'story245', 'story245_tc51')
     def test_51_n_cli_show_plan_empty(self):
@@ -2778,75 +2694,53 @@ class Story245(GenericTest):
 
         """
         # GET LITP HELP WITH --help
-        cmd = "{0} {1}".format(self.cli.litp_path, "--help")
-        stdout, stderr, return_code = self.run_command(self.ms_node, cmd)
+        stdout, stderr, return_code = self.get_help(self.ms_node,
+                                                    help_arg="--help")
 
         self.assertEqual(0, return_code)
         self.assertEqual([], stderr)
 
         # CHECK PLAN COMMANDS
-        for command in ["create_plan", "show_plan", "run_plan",
-                        "stop_plan", "remove_plan"]:
-            self.assertTrue(self.is_text_in_list(command, stdout),
-                            "{0} command is not in litp help".format(command))
+        self.assert_texts_in_list(["create_plan", "show_plan", "run_plan",
+                                   "stop_plan", "remove_plan"],
+                                  stdout, "litp help")
 
         # GET LITP HELP WITH -h
-        cmd = "{0} {1}".format(self.cli.litp_path, "-h")
-        stdout, stderr, return_code = self.run_command(self.ms_node, cmd)
+        stdout, stderr, return_code = self.get_help(self.ms_node,
+                                                    help_arg="-h")
 
         self.assertEqual(0, return_code)
         self.assertEqual([], stderr)
 
         # CHECK PLAN COMMANDS
-        for command in ["create_plan", "show_plan", "run_plan",
-                        "stop_plan", "remove_plan"]:
-            self.assertTrue(self.is_text_in_list(command, stdout),
-                            "{0} command is not in litp help".format(command))
+        self.assert_texts_in_list(["create_plan", "show_plan", "run_plan",
+                                   "stop_plan", "remove_plan"],
+                                  stdout, "litp help")
 
         # GET LITP PLAN COMMANDS HELP WITH -h
         for command in ["create_plan", "show_plan", "run_plan",
                         "stop_plan", "remove_plan"]:
-            cmd = "{0} {1} {2}".format(self.cli.litp_path, command, "-h")
-            stdout, stderr, return_code = \
-                self.run_command(self.ms_node, cmd, add_to_cleanup=False)
+            stdout, stderr, return_code = self.get_help(self.ms_node, command,
+                                                        "-h")
 
             self.assertEqual(0, return_code)
             self.assertEqual([], stderr)
 
             # CHECK PLAN COMMAND OPTIONS
-            self.assertTrue(self.is_text_in_list("-j,", stdout),
-                            "-j option is not in litp {0} help".
-                            format(command))
-            self.assertTrue(self.is_text_in_list("--json", stdout),
-                            "--json option is not in litp {0} help".
-                            format(command))
-            self.assertTrue(self.is_text_in_list("-h,", stdout),
-                            "-h option is not in litp {0} help".
-                            format(command))
-            self.assertTrue(self.is_text_in_list("--help", stdout),
-                            "--help option is not in litp {0} help".
-                            format(command))
+            self.assert_texts_in_list(["-j,", "--json", "-h,", "--help"],
+                                      stdout,
+                                      "litp {0} help".format(command))
 
         # GET LITP REMOVE HELP WITH --help
         for command in ["create_plan", "show_plan", "run_plan",
                         "stop_plan", "remove_plan"]:
-            cmd = "{0} {1} {2}".format(self.cli.litp_path, command, "--help")
-            stdout, stderr, return_code = \
-                self.run_command(self.ms_node, cmd, add_to_cleanup=False)
+            stdout, stderr, return_code = self.get_help(self.ms_node, command,
+                                                        "--help")
 
             self.assertEqual(0, return_code)
             self.assertEqual([], stderr)
 
             # CHECK PLAN COMMAND OPTIONS
-            self.assertTrue(self.is_text_in_list("-j,", stdout),
-                            "-j option is not in litp {0} help".
-                            format(command))
-            self.assertTrue(self.is_text_in_list("--json", stdout),
-                            "--json option is not in litp {0} help".
-                            format(command))
-            self.assertTrue(self.is_text_in_list("-h,", stdout),
-                            "-h option is not in litp {0} help".
-                            format(command))
-            self.assertTrue(self.is_text_in_list("--help", stdout),
-                            "--help option is not in litp {0} help".
-                            format(command))
+            self.assert_texts_in_list(["-j,", "--json", "-h,", "--help"],
+                                      stdout,
+                                      "litp {0} help".format(command))
@@ -14,12 +14,12 @@ program(s) have been supplied.
             Agile: STORY LITPCDS-2507
 '''
 
-from litp_generic_test import GenericTest, attr
+from litp_generic_test import attr
+from cli_base import CliGenericTest
 from litp_cli_utils import CLIUtils
-from litp_generic_utils import GenericUtils
 
 
-class Story2507(GenericTest):
+class Story2507(CliGenericTest):
 
     '''
     As a LITP administrator I want to be able to import an XML file into an
@@ -41,7 +41,6 @@ class Story2507(GenericTest):
         # 1. Set up variable used in the tests
         self.test_node = self.get_management_node_filename()
         self.cli = CLIUtils()
-        self.gen_utils = GenericUtils()
 
     def tearDown(self):
         """
@@ -73,60 +72,10 @@ class Story2507(GenericTest):
         @tms_execution_type: Automated
         """
 
-        usage = 'litp load [-h] -p PATH -f FILE [--merge | ' \
-                '--replace] [-j]Loads the deployment model from a ' \
-                'local XML file.'
-
-        required_arguments = '-p PATH, --path PATH  Location of item in ' \
-                             'the LITP model -f FILE, --file FILE  XML ' \
-                             'file to load'
-
-        optional_arguments = '-h, --help Show this help message and exit' \
-                             '--merge Merge XML file into deployment model,' \
-                             'creating items which do not exist and updating' \
-                             'model values with values from the file ' \
-                             '--replace Recreate the active model with ' \
-                             'contents of the specified XML file, removing ' \
-                             'items not present in the file' \
-                             '-j, --json Output raw JSON response from server'
-
-        example = 'litp load -p /infrastructure/networking/' \
-                  'networks -f networks.xml'
-
         self.log('info', '1. Execute the following command: litp load -h')
-        cmd = "{0} {1} {2}".format(self.cli.litp_path, "load", "-h")
-        stdout, _, _ = self.run_command(self.test_node, cmd,
-                                        add_to_cleanup=False, logging=False,
-                                        default_asserts=True)
-        self.assertEqual(self.gen_utils.get_text_in_help(stdout, 'Usage'),
-                         usage.replace(' ', ''), 'Usage string did not match')
-        self.assertEqual(self.gen_utils.get_text_in_help(stdout,
-                         'Required Arguments'),
-                         required_arguments.replace(' ', ''),
-                         'Required Arguments string did not match')
-        self.assertEqual(self.gen_utils.get_text_in_help(stdout,
-                         'Optional Arguments'),
-                         optional_arguments.replace(' ', ''),
-                         'Optional Arguments string did not match')
-        self.assertEqual(self.gen_utils.get_text_in_help(stdout, 'Example'),
-                         example.replace(' ', ''),
-                         'Example string did not match')
+        self.assert_help_matches_golden(self.test_node, 'load',
+                                        help_args=('-h',))
 
         self.log('info', '2. Execute the following command: litp load --help')
-        cmd = "{0} {1} {2}".format(self.cli.litp_path, "load", "--help")
-        stdout, _, _ = self.run_command(self.test_node, cmd,
-                                        add_to_cleanup=False, logging=False,
-                                        default_asserts=True)
-        self.assertEqual(self.gen_utils.get_text_in_help(stdout, 'Usage'),
-                         usage.replace(' ', ''), 'Usage string did not match')
-        self.assertEqual(self.gen_utils.get_text_in_help(stdout,
-                         'Required Arguments'),
-                         required_arguments.replace(' ', ''),
-                         'Required Arguments string did not match')
-        self.assertEqual(self.gen_utils.get_text_in_help(stdout,
-                         'Optional Arguments'),
-                         optional_arguments.replace(' ', ''),
-                         'Optional Arguments string did not match')
-        self.assertEqual(self.gen_utils.get_text_in_help(stdout, 'Example'),
-                         example.replace(' ', ''),
-                         'Example string did not match')
+        self.assert_help_matches_golden(self.test_node, 'load',
+                                        help_args=('--help',))
@@ -12,10 +12,11 @@ program(s) have been supplied.
             Agile: LITPCDS-3844
 '''
 
-from litp_generic_test import GenericTest, attr
+from litp_generic_test import attr
+from cli_base import CliGenericTest
 
 
-class Story3844(GenericTest):
+class Story3844(CliGenericTest):
 
     '''
     As a LITP User I want "litp show" to print value of a specific property,
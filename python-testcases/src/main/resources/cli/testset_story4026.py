@@ -17,10 +17,12 @@ program(s) have been supplied.
 
 import os
 import test_constants as const
-from litp_generic_test import GenericTest, attr
+from litp_generic_test import attr
+from cli_base import CliGenericTest
+from model_fixture import ModelFixture
 
 
-class Story4026(GenericTest):
+class Story4026(CliGenericTest):
     """As a LITP Developer I want subclass model items so that I can more
        efficiently create populated items but with their own configurable
        properties"""
@@ -68,13 +70,12 @@ class Story4026(GenericTest):
         local_rpm_paths = self.get_local_rpm_paths(
             os.path.dirname(repr(__file__).strip('\'')), self.story_id)
 
-        for local_rpm_path in local_rpm_paths:
-            pkg = os.path.basename(local_rpm_path).strip('.rpm')
-            installed = self.check_pkgs_installed(
-                                self.ms1, [pkg + "_CXP1234567"], su_root=True)
-            if not installed:
-                self.assertTrue(self.copy_and_install_rpms(self.ms1,
-                                                           [local_rpm_path]))
+        # only the RPMs not installed as they are here are copied, in one
+        # transaction
+        rpms = dict(
+            (os.path.basename(path)[:-len('.rpm')] + "_CXP1234567", path)
+            for path in local_rpm_paths)
+        self.provision_rpms(self.ms1, rpms)
 
     def add_package_model_item(self):
         """create a package-list/package in the software model"""
@@ -89,22 +90,19 @@ class Story4026(GenericTest):
             software_items, '{0}_packages'.format(self.story_id)
         )
 
-        # create package-list
-        self.execute_cli_create_cmd(
-            self.ms1, package_list, 'package-list',
-            'name=\'{0}_packages\''.format(self.story_id)
-        )
-
         # package create path
         package = os.path.join(
             package_list, 'packages/{0}'.format(self.story_id)
         )
 
-        # create package
-        props = "name='finger' config='keep' epoch='0'"
-        self.execute_cli_create_cmd(
-            self.ms1, package, 'package', props
-        )
+        # create package-list and package with one load
+        fixture = ModelFixture()
+        fixture.create(package_list, 'package-list',
+                       name='{0}_packages'.format(self.story_id))
+        fixture.create(package, 'package', [('name', 'finger'),
+                                            ('config', 'keep'),
+                                            ('epoch', '0')])
+        self.load_fixture(self.ms1, fixture)
 
         return package_list, package
 
@@ -16,11 +16,12 @@ program(s) have been supplied.
             imported.
             Agile: STORY-4060
 """
-from litp_generic_test import GenericTest, attr
+from litp_generic_test import attr
+from cli_base import CliGenericTest
 from litp_cli_utils import CLIUtils
 
 
-class Story4060(GenericTest):
+class Story4060(CliGenericTest):
     """
     Description:
         I want the contents of my LITP compliant ISO to be imported.
@@ -57,8 +58,8 @@ class Story4060(GenericTest):
         @tms_test_precondition: NA
         @tms_execution_type: Automated
         """
-        cmd = self.cli.get_help_cmd(help_arg='--help')
-        stdout, stderr, returnc = self.run_command(self.ms_node, cmd)
+        stdout, stderr, returnc = self.get_help(self.ms_node,
+                                                help_arg='--help')
         exp = ("import_iso          "
                "Imports packages and VM images from a LITP-compliant")
 
@@ -66,10 +67,8 @@ class Story4060(GenericTest):
         self.assertEquals([], stderr)
         self.assertTrue(self.is_text_in_list(exp, stdout))
 
-        cmd = self.cli.get_help_cmd(help_arg='--help',
-                                    help_action='import_iso')
-        stdout, stderr, returnc = self.run_command(self.ms_node, cmd,
-                                                   add_to_cleanup=False)
+        stdout, stderr, returnc = self.get_help(self.ms_node, 'import_iso',
+                                                '--help')
         self.assertEquals(0, returnc)
         self.assertEquals([], stderr)
         self.assertTrue(
@@ -13,18 +13,20 @@ program(s) have been supplied.
 '''
 
 
-from litp_generic_test import GenericTest, attr
-from rest_utils import RestUtils
+from litp_generic_test import attr
+from cli_base import CliGenericTest
 import test_constants
 
 
-class Story5164(GenericTest):
+class Story5164(CliGenericTest):
 
     '''
     As a LITP user I want a CLI option for deleting a property from an
     item so that I can unset/reset a previous value
     '''
 
+    use_model_snapshot = True
+
     def setUp(self):
         """
         Description:
@@ -41,7 +43,7 @@ class Story5164(GenericTest):
         self.ms_node = self.get_management_node_filename()
         self.ms_ip_address = self.get_node_att(self.ms_node,
                                            test_constants.NODE_ATT_IPV4)
-        self.rest = RestUtils(self.ms_ip_address)
+        self.rest = self.get_rest_utils(self.ms_ip_address)
 
     def tearDown(self):
         """
@@ -53,7 +55,6 @@ class Story5164(GenericTest):
         Results:
             Items used in the test are cleaned up and the
         """
-        self.rest.clean_paths()
         super(Story5164, self).tearDown()
 
     @attr('all', 'revert', 'story5164', 'story5164_tc01', 'cdb_priority1')
@@ -20,10 +20,11 @@ program(s) have been supplied.
                 As a LITP User I want the ability to reinstall
                 a peer node that is already deployed
 """
-from litp_generic_test import GenericTest, attr
+from litp_generic_test import attr
+from cli_base import CliGenericTest
 
 
-class Story6067(GenericTest):
+class Story6067(CliGenericTest):
     """
         LITPCDS-6067:
         As a LITP administrator in a disaster recovery situation
@@ -154,17 +155,18 @@ class Story6067(GenericTest):
         @tms_execution_type: Automated
         """
         cmd = self.cli.get_help_cmd("-h")
-        stdout, _, _ = self.run_command(self.ms_node, cmd)
+        stdout, _, _ = self.get_help(self.ms_node, help_arg="-h")
         self.check_prepare_restore_is_on_help(cmd, stdout)
 
         cmd = self.cli.get_help_cmd("--help")
-        stdout, _, _ = self.run_command(self.ms_node, cmd)
+        stdout, _, _ = self.get_help(self.ms_node, help_arg="--help")
         self.check_prepare_restore_is_on_help(cmd, stdout)
 
         cmd = self.cli.get_help_cmd("-h", "prepare_restore")
-        stdout, _, _ = self.run_command(self.ms_node, cmd)
+        stdout, _, _ = self.get_help(self.ms_node, "prepare_restore", "-h")
         self.check_prepare_restore_help_has_usage(cmd, stdout)
 
         cmd = self.cli.get_help_cmd("--help", "prepare_restore")
-        stdout, _, _ = self.run_command(self.ms_node, cmd)
+        stdout, _, _ = self.get_help(self.ms_node, "prepare_restore",
+                                     "--help")
         self.check_prepare_restore_help_has_usage(cmd, stdout)
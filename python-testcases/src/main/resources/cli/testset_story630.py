@@ -13,10 +13,11 @@ program(s) have been supplied.
 Agile:      STORY-630
 '''
 
-from litp_generic_test import GenericTest, attr
+from litp_generic_test import attr
+from cli_base import CliGenericTest
 
 
-class Story630(GenericTest):
+class Story630(CliGenericTest):
     """
     As a Product Designer I want the LITP CLI to utilize the new REST API
     for all read operations (show) so that the old interface can be deprecated
@@ -119,7 +120,8 @@ class Story630(GenericTest):
         self.setup_cmds.append(self.cli.get_show_cmd(path, args='-Tjrn 2'))
         self.setup_cmds.append(self.cli.get_show_cmd(path, args='-jrn 2'))
         self.setup_cmds.append(self.cli.get_show_cmd("/", args='-h'))
-        self.results = self.run_commands([self.test_node], self.setup_cmds)
+        self.results = self.run_commands([self.test_node], self.setup_cmds,
+                                         parallel=True)
 
         # 3. assert that the commands were run succussfully
         self.assertEqual([], self.get_errors(self.results))
@@ -226,7 +228,8 @@ class Story630(GenericTest):
                                                      args='--json --recursive '
                                                           '--depth 2'))
         self.setup_cmds.append(self.cli.get_show_cmd("/", args='--help'))
-        self.results = self.run_commands([self.test_node], self.setup_cmds)
+        self.results = self.run_commands([self.test_node], self.setup_cmds,
+                                         parallel=True)
 
         #3. assert that the commands were run succussfully
         self.assertEqual([], self.get_errors(self.results))
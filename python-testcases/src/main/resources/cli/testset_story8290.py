@@ -19,17 +19,19 @@ program(s) have been supplied.
                 are all processed
 '''
 
-from litp_generic_test import GenericTest, attr
-from rest_utils import RestUtils
+from litp_generic_test import attr
+from cli_base import CliGenericTest
 import test_constants
 
 
-class Story8290(GenericTest):
+class Story8290(CliGenericTest):
     '''
     As a LITP user, I want to be able to update and delete
     a property via CLI in the same command
     '''
 
+    use_model_snapshot = True
+
     def setUp(self):
         """
         Description:
@@ -44,7 +46,8 @@ class Story8290(GenericTest):
         # 1. Call super class setup
         super(Story8290, self).setUp()
         self.ms_node = self.get_management_node_filename()
-        self.rest = RestUtils(self.get_node_att(self.ms_node, 'ipv4'))
+        self.rest = self.get_rest_utils(
+            self.get_node_att(self.ms_node, 'ipv4'))
 
     def tearDown(self):
         """
@@ -56,7 +59,6 @@ class Story8290(GenericTest):
         Results:
             Items used in the test are cleaned up and the
         """
-        self.rest.clean_paths()
         super(Story8290, self).tearDown()
 
     def _create_my_repo(self, repo):
@@ -90,14 +92,19 @@ class Story8290(GenericTest):
                        expected state
         state (str): Expected plan state
         """
-        self.execute_cli_createplan_cmd(self.ms_node)
-        self.execute_cli_runplan_cmd(self.ms_node)
-        result = self.wait_for_plan_state(self.ms_node, state,
-                                         timeout_mins=timeout)
+        if state == test_constants.PLAN_COMPLETE:
+            # shared with the other tests of the group under the scheduler
+            result = self.create_run_and_wait_for_plan(self.ms_node, timeout)
+        else:
+            self.execute_cli_createplan_cmd(self.ms_node)
+            self.execute_cli_runplan_cmd(self.ms_node)
+            result = self.wait_for_plan_state(self.ms_node, state,
+                                              timeout_mins=timeout)
         self.assertTrue(result,
             "Plan did not complete with expected state {0}".format(state))
 
-    @attr('all', 'revert', 'story8290', 'story8290_tc01')
+    @attr('all', 'revert', 'story8290', 'story8290_tc01',
+          'plan_shared', 'delta_n1_logrotate')
     def test_01_pn_cli_update_delete_property_one_command(self):
         """
         @tms_id:
@@ -323,9 +330,10 @@ class Story8290(GenericTest):
 
         self.log('info', 'Verify that plan can be created and run '
                          'successfully')
-        self.run_and_check_plan(self.ms_node, test_constants.PLAN_COMPLETE, 10)
+        self._create_run_and_wait_for_plan(10)
 
-    @attr('all', 'revert', 'story8290', 'story8290_tc02')
+    @attr('all', 'revert', 'story8290', 'story8290_tc02',
+          'plan_shared', 'delta_n2_firewall')
     def test_02_p_rest_update_delete_property_one_command(self):
         """
         @tms_id:
@@ -421,7 +429,8 @@ class Story8290(GenericTest):
             "Expected provider = {0}, found {1} "
             .format(expected, props_after_update.get('source')))
 
-    @attr('all', 'revert', 'story8290', 'story8290_tc05')
+    @attr('all', 'revert', 'story8290', 'story8290_tc05',
+          'plan_shared', 'delta_sw_yum_repo')
     def test_05_p_cli_replace_mutually_exclusive_properties(self):
         """
         @tms_id:
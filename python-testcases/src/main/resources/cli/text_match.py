@@ -0,0 +1,131 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Look for many substrings in a command output in one pass.
+            The expected texts are compiled into an Aho-Corasick automaton
+            which reads the output once, however many texts there are,
+            instead of one is_text_in_list scan per text.
+'''
+
+from collections import deque
+
+# compiled matchers by tuple of texts, the same checks recur across tests
+_MATCHERS = {}
+
+
+class TextMatcher(object):
+    """
+    Aho-Corasick automaton over a fixed set of texts. A text matches an
+    output when it is a substring of one of its lines, as with
+    is_text_in_list.
+    """
+
+    def __init__(self, texts):
+        self.texts = list(texts)
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [set()]
+        for index, text in enumerate(self.texts):
+            self._add(index, text)
+        self._link()
+
+    def _add(self, index, text):
+        """ Add a text to the trie """
+        state = 0
+        for char in text:
+            nxt = self._goto[state].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(set())
+                self._goto[state][char] = nxt
+            state = nxt
+        self._out[state].add(index)
+
+    def _link(self):
+        """ Set the failure links, breadth first """
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(char, 0)
+                self._out[nxt] |= self._out[self._fail[nxt]]
+
+    def found(self, lines):
+        """
+        Description:
+            Scan an output once for all the texts
+        Args:
+            lines (list): Output lines
+        Returns:
+            set. Indexes in texts of the texts found
+        """
+        found = set()
+        wanted = len(self.texts)
+        for line in lines:
+            # the empty text is in any line
+            found |= self._out[0]
+            state = 0
+            for char in line:
+                while state and char not in self._goto[state]:
+                    state = self._fail[state]
+                state = self._goto[state].get(char, 0)
+                if self._out[state]:
+                    found |= self._out[state]
+            if len(found) == wanted:
+                break
+        return found
+
+    def missing(self, lines):
+        """
+        Description:
+            Find the texts that are not in an output
+        Args:
+            lines (list): Output lines
+        Returns:
+            list. Texts not found, in the order they were given
+        """
+        found = self.found(lines)
+        return [text for index, text in enumerate(self.texts)
+                if index not in found]
+
+
+def get_matcher(texts):
+    """
+    Description:
+        Return the compiled matcher of a list of texts
+    Args:
+        texts (list): Texts to look for
+    Returns:
+        TextMatcher. Matcher, shared by every caller with the same texts
+    """
+    key = tuple(texts)
+    matcher = _MATCHERS.get(key)
+    if matcher is None:
+        matcher = _MATCHERS[key] = TextMatcher(key)
+    return matcher
+
+
+def get_missing_texts(texts, lines):
+    """
+    Description:
+        Find which of the texts are not in an output
+    Args:
+        texts (list): Texts to look for
+        lines (list): Output lines
+    Returns:
+        list. Texts not found in any line
+    """
+    return get_matcher(texts).missing(lines)
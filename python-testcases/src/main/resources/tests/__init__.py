@@ -0,0 +1,15 @@
+"""
+Python init file. Unit tests of the helpers in cli/ and tools/ that need
+no MS, run from the directory holding cli/ with
+    python -m unittest discover -s tests -t .
+The helpers in cli/ import each other by module name, as the testsets
+do, so cli/ is put on the path.
+"""
+
+import os
+import sys
+
+CLI_DIR = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), 'cli')
+if CLI_DIR not in sys.path:
+    sys.path.insert(0, CLI_DIR)
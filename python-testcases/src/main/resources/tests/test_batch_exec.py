@@ -0,0 +1,107 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Unit tests of cli/batch_exec.py. Batches are run in a local
+            shell through LocalSession.
+'''
+
+import time
+import unittest
+
+from batch_exec import BatchExecutor, MARKER, get_batch_cmd, \
+    parse_batch_output
+from session_pool import LocalSession
+
+CMDS = ['echo a; echo b', 'echo e >&2; exit 4', 'printf noeol', 'true']
+EXPECTED = [[['a', 'b'], [], 0], [[], ['e'], 4], [['noeol'], [], 0],
+            [[], [], 0]]
+
+
+def run_locally(node, cmd):
+    """ BatchExecutor callable running the batch in a local shell """
+    return LocalSession().execute(cmd)
+
+
+class TestParse(unittest.TestCase):
+    """ Splitting batch output back into results """
+
+    def test_blocks(self):
+        """ Every command gets its own stdout, stderr and return code """
+        marker = MARKER.format('t')
+        lines = [marker + ' OUT 0', 'x', marker + ' ERR 0',
+                 marker + ' RC 0 0', marker + ' OUT 1', marker + ' ERR 1',
+                 'oops', 'more', marker + ' RC 1 2']
+        self.assertEqual([[['x'], [], 0], [[], ['oops', 'more'], 2]],
+                         parse_batch_output(lines, 't', 2))
+
+    def test_missing(self):
+        """ A command without a result is an error """
+        marker = MARKER.format('t')
+        self.assertRaises(ValueError, parse_batch_output,
+                          [marker + ' OUT 0', marker + ' ERR 0'], 't', 1)
+
+    def test_other_token(self):
+        """ Markers of another batch are output, not delimiters """
+        other = MARKER.format('other')
+        marker = MARKER.format('t')
+        lines = [marker + ' OUT 0', other + ' RC 0 1', marker + ' ERR 0',
+                 marker + ' RC 0 0']
+        self.assertEqual([[[other + ' RC 0 1'], [], 0]],
+                         parse_batch_output(lines, 't', 1))
+
+
+class TestBatch(unittest.TestCase):
+    """ Batches run in a shell """
+
+    def test_command_line(self):
+        """ The script travels encoded, as one command line """
+        cmd, token = get_batch_cmd(CMDS)
+        self.assertTrue(cmd.endswith('| base64 -d | /bin/sh'))
+        self.assertFalse('echo a' in cmd)
+        self.assertEqual(32, len(token))
+
+    def test_sequential(self):
+        """ Results in order, including output without a newline """
+        self.assertEqual(EXPECTED,
+                         BatchExecutor(run_locally).run('ms1', CMDS))
+
+    def test_parallel(self):
+        """ Commands run at once give the same results """
+        self.assertEqual(EXPECTED, BatchExecutor(run_locally).run(
+            'ms1', CMDS, parallel=True))
+        start = time.time()
+        results = BatchExecutor(run_locally).run(
+            'ms1', ['sleep 0.5; echo {0}'.format(num) for num in range(4)],
+            parallel=True)
+        self.assertTrue(time.time() - start < 1.5)
+        self.assertEqual([[[str(num)], [], 0] for num in range(4)], results)
+
+    def test_bad_command_alone(self):
+        """ A command that is not valid shell fails without the others """
+        results = BatchExecutor(run_locally).run(
+            'ms1', ['echo before', 'echo "unbalanced', 'echo after'])
+        self.assertEqual([['before'], [], 0], results[0])
+        self.assertNotEqual(0, results[1][2])
+        self.assertTrue(results[1][1])
+        self.assertEqual([['after'], [], 0], results[2])
+
+    def test_quoting(self):
+        """ Quotes, variables and markers of the command are kept """
+        cmd = 'x=1; echo "$x" \'$x\' $((x + 1))'
+        self.assertEqual([[['1 $x 2'], [], 0]],
+                         BatchExecutor(run_locally).run('ms1', [cmd]))
+
+    def test_empty(self):
+        """ No commands, no remote call """
+        self.assertEqual([], BatchExecutor(None).run('ms1', []))
+
+
+if __name__ == '__main__':
+    unittest.main()
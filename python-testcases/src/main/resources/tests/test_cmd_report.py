@@ -0,0 +1,113 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Unit tests of the aggregation of tools/cmd_report.py
+'''
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from tools.cmd_report import build_report, load_xunit, percentile, summarise
+
+XUNIT = """<?xml version="1.0" encoding="UTF-8"?>
+<testsuite name="nosetests" tests="2" errors="0" failures="1" skip="0">
+<testcase classname="cli.testset_story245.Story245" name="test_01_p_show"
+ time="12.5"/>
+<testcase classname="cli.testset_story245.Story245" name="test_02_n_show"
+ time="3.0"><failure type="AssertionError" message="x">x</failure>
+</testcase>
+</testsuite>
+"""
+
+
+class TestPercentile(unittest.TestCase):
+    """ Nearest rank percentiles """
+
+    def test_no_values(self):
+        """ No values give 0 """
+        self.assertEqual(0.0, percentile([], 0.95))
+
+    def test_one_value(self):
+        """ A single value is every percentile """
+        for fraction in (0.01, 0.5, 0.95, 1.0):
+            self.assertEqual(7, percentile([7], fraction))
+
+    def test_nearest_rank(self):
+        """ The smallest value with at least the fraction at or below it """
+        values = list(range(1, 21))
+        self.assertEqual(10, percentile(values, 0.5))
+        self.assertEqual(19, percentile(values, 0.95))
+        self.assertEqual(20, percentile(values, 1.0))
+        self.assertEqual(1, percentile(values, 0.05))
+        self.assertEqual(2, percentile(values, 0.06))
+
+    def test_odd_count(self):
+        """ The median of an odd count is the middle value """
+        self.assertEqual(3, percentile([1, 2, 3, 4, 5], 0.5))
+        self.assertEqual(5, percentile([1, 2, 3, 4, 5], 0.95))
+
+
+class TestSummarise(unittest.TestCase):
+    """ Grouping of timing records """
+
+    def test_groups(self):
+        """ Records are grouped by the key, largest total first """
+        records = [{'label': 'litp show', 'secs': secs}
+                   for secs in (0.3, 0.1, 0.2)]
+        records.append({'label': 'litp create', 'secs': 2.0})
+        rows = summarise(records, 'label')
+        self.assertEqual(['litp create', 'litp show'],
+                         [row['name'] for row in rows])
+        show = rows[1]
+        self.assertEqual(3, show['count'])
+        self.assertEqual(0.6, show['total'])
+        self.assertEqual(0.2, show['p50'])
+        self.assertEqual(0.3, show['p95'])
+        self.assertEqual(0.3, show['max'])
+
+    def test_no_records(self):
+        """ No records give no rows """
+        self.assertEqual([], summarise([], 'node'))
+
+
+class TestBuildReport(unittest.TestCase):
+    """ Joining timing records with the xunit report """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_join(self):
+        """ Each test gets its own duration, outcome and command time """
+        path = os.path.join(self.directory, 'nosetests.xml')
+        with open(path, 'w') as report:
+            report.write(XUNIT)
+        records = [{'test': 'Story245.test_01_p_show', 'label': 'litp show',
+                    'node': 'ms1', 'secs': 2.0},
+                   {'test': 'Story245.test_01_p_show', 'label': 'GET',
+                    'node': 'ms1', 'secs': 0.5}]
+        report = build_report(records, load_xunit(path))
+        self.assertEqual({'calls': 2, 'secs': 2.5, 'tests': 2},
+                         report['totals'])
+        first, second = report['tests']
+        self.assertEqual('Story245.test_01_p_show', first['name'])
+        self.assertEqual((12.5, 'passed', 2.5, 2),
+                         (first['secs'], first['result'], first['cmd_secs'],
+                          first['calls']))
+        self.assertEqual((3.0, 'failure', 0),
+                         (second['secs'], second['result'], second['calls']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Unit tests sending the REST requests of the cli testsets to
+            cli/fake_litpd.py through LITP_FAKE_LITPD. The tests of
+            LitpRestUtils need the RestUtils of the test framework.
+'''
+
+import json
+import os
+import time
+import unittest
+
+from fake_litpd import FakeLitpd, FakeLitpModel, build_default_model
+from rest_client import FAKE_LITPD_ENV, LITP_REST_PORT, get_litpd_address
+
+try:
+    from litp_rest import get_litp_rest_utils
+except ImportError:
+    get_litp_rest_utils = None
+
+JSON = 'Content-Type:application/json'
+NODE2_FW = '/deployments/d1/clusters/c1/nodes/n2/configs/fw_config'
+
+
+def start_fake_litpd():
+    """ Fake litpd with fast plans, and LITP_FAKE_LITPD naming it """
+    model = FakeLitpModel(task_secs=0.01)
+    build_default_model(model)
+    server = FakeLitpd(0, model).start()
+    os.environ[FAKE_LITPD_ENV] = 'http://127.0.0.1:{0}'.format(server.port)
+    return server
+
+
+class TestLitpdAddress(unittest.TestCase):
+    """ Where the REST requests go """
+
+    def tearDown(self):
+        os.environ.pop(FAKE_LITPD_ENV, None)
+
+    def test_ms(self):
+        """ Without LITP_FAKE_LITPD to litpd on the MS """
+        os.environ.pop(FAKE_LITPD_ENV, None)
+        self.assertEqual(('10.0.0.1', LITP_REST_PORT, True),
+                         get_litpd_address('10.0.0.1'))
+
+    def test_fake(self):
+        """ With LITP_FAKE_LITPD to the fake, over HTTP or HTTPS """
+        os.environ[FAKE_LITPD_ENV] = 'http://127.0.0.1:8999'
+        self.assertEqual(('127.0.0.1', 8999, False),
+                         get_litpd_address('10.0.0.1'))
+        os.environ[FAKE_LITPD_ENV] = 'https://fake'
+        self.assertEqual(('fake', LITP_REST_PORT, True),
+                         get_litpd_address('10.0.0.1'))
+
+
+@unittest.skipIf(get_litp_rest_utils is None,
+                 'needs the RestUtils of the test framework')
+class TestStoryRestPaths(unittest.TestCase):
+    """ REST steps of the testsets against the fake litpd """
+
+    def setUp(self):
+        self.server = start_fake_litpd()
+        self.rest = get_litp_rest_utils('10.0.0.1')
+
+    def tearDown(self):
+        self.rest.clean_paths()
+        self.rest.pool.close()
+        os.environ.pop(FAKE_LITPD_ENV, None)
+        self.server.stop()
+
+    def get_item(self, path):
+        """ GET an item and decode it """
+        body, stderr, status = self.rest.get(path)
+        self.assertEqual((200, ''), (status, stderr))
+        return json.loads(body)
+
+    def run_plan(self):
+        """ Create and run a plan, wait for it to succeed """
+        _, _, status = self.rest.post('/plans', JSON, json.dumps(
+            {'id': 'plan', 'type': 'plan'}))
+        self.assertEqual(201, status)
+        _, _, status = self.rest.put('/plans/plan', JSON, json.dumps(
+            {'properties': {'state': 'running'}}))
+        self.assertEqual(200, status)
+        deadline = time.time() + 10
+        while self.get_item('/plans/plan')['state'] == 'running':
+            self.assertTrue(time.time() < deadline, 'plan did not finish')
+            time.sleep(0.05)
+        self.assertEqual('successful', self.get_item('/plans/plan')['state'])
+
+    def test_fake_target(self):
+        """ The requests meant for the MS reach the fake """
+        self.assertEqual(('127.0.0.1', self.server.port),
+                         (self.rest.pool.host, self.rest.pool.port))
+
+    def test_story8290_tc02(self):
+        """ Update and delete properties of a firewall rule in one PUT """
+        body, stderr, status = self.rest.post(
+            NODE2_FW + '/rules', JSON, json.dumps(
+                {'id': 'test02a', 'type': 'firewall-rule',
+                 'properties': {'name': '122 test2a',
+                                'source': '192.168.1.100-192.168.1.200',
+                                'dport': '22', 'proto': 'tcp',
+                                'provider': 'iptables', 'chain': 'INPUT'}}))
+        self.assertEqual((201, ''), (status, stderr))
+        self.assertNotEqual('', body)
+        self.run_plan()
+        body, stderr, status = self.rest.put(
+            NODE2_FW + '/rules/test02a', JSON, json.dumps(
+                {'properties': {'name': '122 test2a', 'source': None,
+                                'dport': None, 'proto': 'tcp',
+                                'provider': 'ip6tables',
+                                'chain': 'OUTPUT'}}))
+        self.assertEqual((200, ''), (status, stderr))
+        self.run_plan()
+        item = self.get_item(NODE2_FW + '/rules/test02a')
+        self.assertEqual('Applied', item['state'])
+        self.assertEqual('ip6tables', item['properties']['provider'])
+        self.assertFalse('source' in item['properties'])
+        self.assertFalse('dport' in item['properties'])
+
+    def test_story5164_tc01(self):
+        """ Removing an overwritten property shows the source value """
+        _, _, status = self.rest.post('/software/items', JSON, json.dumps(
+            {'id': 'story5164', 'type': 'package',
+             'properties': {'name': 'telnet', 'version': '1.0'}}))
+        self.assertEqual(201, status)
+        _, _, status = self.rest.post('/ms/items', JSON, json.dumps(
+            {'id': 'story5164', 'inherit': '/software/items/story5164',
+             'properties': {'version': '2.0'}}))
+        self.assertEqual(201, status)
+        item = self.get_item('/ms/items/story5164')
+        self.assertEqual('2.0', item['properties']['version'])
+        self.assertEqual(['version'], item['properties-overwritten'])
+        self.assertTrue(item['_links']['inherited-from']['href'].endswith(
+            '/software/items/story5164'))
+        _, _, status = self.rest.put('/ms/items/story5164', JSON, json.dumps(
+            {'properties': {'version': None}}))
+        self.assertEqual(200, status)
+        item = self.get_item('/ms/items/story5164')
+        self.assertEqual('1.0', item['properties']['version'])
+        self.assertFalse('properties-overwritten' in item)
+        _, _, status = self.rest.put('/software/items/story5164', JSON,
+                                     json.dumps(
+                                         {'properties': {'version': None}}))
+        self.assertEqual(200, status)
+        item = self.get_item('/ms/items/story5164')
+        self.assertFalse('version' in item['properties'])
+
+    def test_cleanup(self):
+        """ Items created with post are gone after clean_paths """
+        self.rest.post('/software/items', JSON, json.dumps(
+            {'id': 'story5164', 'type': 'package',
+             'properties': {'name': 'telnet'}}))
+        self.rest.post('/ms/items', JSON, json.dumps(
+            {'id': 'story5164', 'inherit': '/software/items/story5164'}))
+        self.rest.clean_paths()
+        for path in ('/ms/items/story5164', '/software/items/story5164'):
+            self.assertEqual(404, self.rest.get(path)[2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Unit tests of the file comparison of tools/impact_scan.py,
+            between rpm dump listings and unpacked directories
+'''
+
+import hashlib
+import os
+import shutil
+import tempfile
+import unittest
+
+from tools.impact_scan import align_manifests, get_changed_files, \
+    read_manifest
+
+LIB = '/opt/ericsson/nms/litp/lib/litpcli'
+FILES = {'litp.py': b'main', 'litp_plan.py': b'plan', 'bin/litp': b'bin'}
+
+
+def get_digest(content):
+    """ Digest of a file as rpm --dump and read_manifest give it """
+    return hashlib.sha256(content).hexdigest()
+
+
+def make_dump(files, root=LIB):
+    """ 'rpm -q --dump' lines of files installed under root """
+    return ''.join('{0}/{1} {2} 1700000000 {3} 0100644 root root 0 0 0 X\n'
+                   .format(root, path, len(content), get_digest(content))
+                   for path, content in sorted(files.items()))
+
+
+class TestManifests(unittest.TestCase):
+    """ Files that changed between the two sides """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write_dump(self, name, files, root=LIB):
+        """ Save a dump listing """
+        path = os.path.join(self.directory, name)
+        with open(path, 'w') as dump:
+            dump.write(make_dump(files, root))
+        return path
+
+    def write_tree(self, name, files):
+        """ Unpack files into a directory """
+        top = os.path.join(self.directory, name)
+        for path, content in files.items():
+            path = os.path.join(top, path)
+            if not os.path.isdir(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+            with open(path, 'wb') as tree_file:
+                tree_file.write(content)
+        return top
+
+    def compare(self, old, new):
+        """ get_changed_files on two sources """
+        return get_changed_files(*align_manifests(read_manifest(old),
+                                                  read_manifest(new)))
+
+    def test_dumps(self):
+        """ Two dump listings compare by install path """
+        changed = dict(FILES, **{'litp_plan.py': b'new plan'})
+        self.assertEqual([LIB + '/litp_plan.py'], self.compare(
+            self.write_dump('old', FILES), self.write_dump('new', changed)))
+
+    def test_directories(self):
+        """ Two directories compare by relative path """
+        changed = dict(FILES, **{'bin/litp': b'new bin'})
+        self.assertEqual(['bin/litp'], self.compare(
+            self.write_tree('old', FILES), self.write_tree('new', changed)))
+
+    def test_directory_and_dump(self):
+        """ A directory is keyed by where the rpm installs its files """
+        changed = dict(FILES, **{'litp_plan.py': b'new plan'})
+        new = self.write_tree('new', changed)
+        self.assertEqual([LIB + '/litp_plan.py'],
+                         self.compare(self.write_dump('old', FILES), new))
+        self.assertEqual([LIB + '/litp_plan.py'],
+                         self.compare(new, self.write_dump('dump', FILES)))
+        self.assertEqual([], self.compare(self.write_dump('same_dump', FILES),
+                                          self.write_tree('same_tree', FILES)))
+
+    def test_unpacked_rpm(self):
+        """ An rpm unpacked at / keeps the install paths """
+        tree = dict(('opt/ericsson/nms/litp/lib/litpcli/' + path, content)
+                    for path, content in FILES.items())
+        self.assertEqual([], self.compare(self.write_dump('old', FILES),
+                                          self.write_tree('new', tree)))
+
+    def test_unrelated(self):
+        """ A directory sharing no file with the rpm is refused """
+        self.assertRaises(ValueError, self.compare,
+                          self.write_dump('old', FILES),
+                          self.write_tree('new', {'other.py': b'x'}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,262 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Unit tests of the REST connection pool of cli/rest_client.py
+            and of cli/litp_rest.py, against cli/fake_litpd.py and against
+            a server dropping kept alive connections. The tests of
+            LitpRestUtils need the RestUtils of the test framework.
+'''
+
+import json
+import socket
+import threading
+import unittest
+
+try:
+    import httplib
+except ImportError:
+    import http.client as httplib
+
+from fake_litpd import FakeLitpd, FakeLitpModel, build_default_model
+from rest_client import RestConnectionPool
+
+try:
+    from litp_rest import LitpRestUtils
+except ImportError:
+    LitpRestUtils = None
+
+JSON = 'Content-Type:application/json'
+NODE2_FW = '/deployments/d1/clusters/c1/nodes/n2/configs/fw_config'
+RULE = {'id': 'test02a', 'type': 'firewall-rule',
+        'properties': {'name': '122 test2a', 'dport': '22',
+                       'proto': 'tcp', 'provider': 'iptables'}}
+PACKAGE = {'id': 'telnet', 'type': 'package',
+           'properties': {'name': 'telnet'}}
+ANSWER = (b'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n'
+          b'Content-Length: 2\r\n\r\n{}')
+DROP = 'drop'
+
+
+def start_fake_litpd():
+    """ Fake litpd with fast plans """
+    model = FakeLitpModel(task_secs=0.01)
+    build_default_model(model)
+    return FakeLitpd(0, model).start()
+
+
+class DroppingServer(threading.Thread):
+    """
+    HTTP server keeping connections alive, which on its first connection
+    reads the requests after the first one and closes the connection
+    without answering, as litpd does with a connection it timed out.
+    methods lists the requests received.
+    """
+
+    def __init__(self):
+        threading.Thread.__init__(self)
+        self.daemon = True
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.bind(('127.0.0.1', 0))
+        self.sock.listen(5)
+        self.port = self.sock.getsockname()[1]
+        self.methods = []
+
+    def run(self):
+        first = True
+        while True:
+            try:
+                conn, _ = self.sock.accept()
+            except (IOError, OSError):
+                return
+            handler = threading.Thread(target=self.serve, args=(conn, first))
+            handler.daemon = True
+            handler.start()
+            first = False
+
+    def serve(self, conn, first):
+        """ Answer the requests of one connection """
+        stream = conn.makefile('rb')
+        try:
+            while True:
+                line = stream.readline()
+                if not line:
+                    return
+                length = 0
+                header = stream.readline()
+                while header.strip():
+                    name, _, value = header.decode('ascii').partition(':')
+                    if name.lower() == 'content-length':
+                        length = int(value)
+                    header = stream.readline()
+                stream.read(length)
+                self.methods.append(line.split()[0].decode('ascii'))
+                if first and len(self.methods) > 1:
+                    return
+                conn.sendall(ANSWER)
+        finally:
+            stream.close()
+            conn.close()
+
+    def stop(self):
+        """ Stop accepting connections """
+        self.sock.close()
+
+
+class TestPool(unittest.TestCase):
+    """ RestConnectionPool against the fake litpd """
+
+    def setUp(self):
+        self.server = start_fake_litpd()
+        self.pool = RestConnectionPool('127.0.0.1', self.server.port,
+                                       size=2, secure=False)
+
+    def tearDown(self):
+        self.pool.close()
+        self.server.stop()
+
+    def test_statuses(self):
+        """ Created items answer 201, updates and deletes 200 """
+        status, _, body = self.pool.request('POST', NODE2_FW + '/rules',
+                                            RULE)
+        self.assertEqual(201, status)
+        self.assertEqual('test02a', json.loads(body)['id'])
+        path = NODE2_FW + '/rules/test02a'
+        self.assertEqual(200, self.pool.request('PUT', path, {
+            'properties': {'dport': None, 'provider': 'ip6tables'}})[0])
+        self.assertEqual(200, self.pool.request('GET', path)[0])
+        self.assertEqual(200, self.pool.request('DELETE', path)[0])
+        self.assertEqual(404, self.pool.request('GET', path)[0])
+
+    def test_create_plan(self):
+        """ A plan created over REST answers 201 (story245 test_47) """
+        self.pool.request('POST', '/software/items', PACKAGE)
+        status, _, body = self.pool.request('POST', '/plans',
+                                            {'id': 'plan', 'type': 'plan'})
+        self.assertEqual(201, status)
+        self.assertEqual('plan', json.loads(body)['id'])
+
+    def test_reuse(self):
+        """ Requests share the kept alive connections """
+        for _ in range(5):
+            self.assertEqual(200, self.pool.request('GET', '/ms')[0])
+        self.assertEqual({'connections': 1, 'requests': 5, 'reused': 4},
+                         self.pool.stats())
+        results = self.pool.request_all([('GET', '/software')] * 8)
+        self.assertEqual([200] * 8, [result[0] for result in results])
+        stats = self.pool.stats()
+        self.assertEqual(13, stats['requests'])
+        self.assertTrue(stats['connections'] <= 2, stats)
+        self.assertEqual(13 - stats['connections'], stats['reused'])
+
+    def test_unsent_request_resent(self):
+        """ A POST that could not be sent goes out on a new connection """
+        self.assertEqual(200, self.pool.request('GET', '/ms')[0])
+        with self.pool.client() as client:
+            client._conn.sock.close()
+        self.assertEqual(201, self.pool.request('POST', '/software/items',
+                                                PACKAGE)[0])
+        self.assertEqual(2, self.pool.stats()['connections'])
+
+
+class TestRetry(unittest.TestCase):
+    """ Requests failing on a dropped keep-alive connection """
+
+    def setUp(self):
+        self.server = DroppingServer()
+        self.server.start()
+        self.pool = RestConnectionPool('127.0.0.1', self.server.port,
+                                       size=1, secure=False)
+
+    def tearDown(self):
+        self.pool.close()
+        self.server.stop()
+
+    def test_get_retried(self):
+        """ A GET is sent again on a new connection """
+        self.assertEqual(200, self.pool.request('GET', '/ms')[0])
+        self.assertEqual(200, self.pool.request('GET', '/ms')[0])
+        self.assertEqual(['GET', 'GET', 'GET'], self.server.methods)
+        self.assertEqual({'connections': 2, 'requests': 2, 'reused': 0},
+                         self.pool.stats())
+
+    def test_sent_post_not_retried(self):
+        """ A POST litpd may have applied is not sent twice """
+        self.assertEqual(200, self.pool.request('GET', '/ms')[0])
+        self.assertRaises((httplib.HTTPException, IOError),
+                          self.pool.request, 'POST', '/software/items',
+                          PACKAGE)
+        self.assertEqual(['GET', 'POST'], self.server.methods)
+
+
+@unittest.skipIf(LitpRestUtils is None,
+                 'needs the RestUtils of the test framework')
+class TestLitpRestUtils(unittest.TestCase):
+    """ RestUtils requests over the pool """
+
+    def setUp(self):
+        self.server = start_fake_litpd()
+        self.rest = LitpRestUtils('127.0.0.1', self.server.port,
+                                  secure=False)
+        self.calls = []
+        self.rest.listeners.append(
+            lambda method, path, secs: self.calls.append((method, path)))
+
+    def tearDown(self):
+        self.rest.pool.close()
+        self.server.stop()
+
+    def test_statuses(self):
+        """ story8290 test_02 and story245 test_47 get their statuses """
+        body, stderr, status = self.rest.post(NODE2_FW + '/rules', JSON,
+                                              json.dumps(RULE))
+        self.assertEqual((201, ''), (status, stderr))
+        self.assertEqual('test02a', json.loads(body)['id'])
+        _, stderr, status = self.rest.put(
+            NODE2_FW + '/rules/test02a', JSON,
+            json.dumps({'properties': {'provider': 'ip6tables'}}))
+        self.assertEqual((200, ''), (status, stderr))
+        self.rest.post('/software/items', JSON, json.dumps(PACKAGE))
+        _, stderr, status = self.rest.post(
+            '/plans', JSON, json.dumps({'id': 'plan', 'type': 'plan'}))
+        self.assertEqual((201, ''), (status, stderr))
+        self.assertEqual([NODE2_FW + '/rules/test02a',
+                          '/software/items/telnet', '/plans/plan'],
+                         self.rest.created_paths)
+        self.assertEqual(['POST', 'PUT', 'POST', 'POST'],
+                         [method for method, _ in self.calls])
+        self.rest.clean_paths()
+        self.assertEqual(404, self.rest.get('/software/items/telnet')[2])
+
+    def test_stats(self):
+        """ stats tells how many requests reused a connection """
+        for _ in range(3):
+            self.rest.get('/ms')
+        self.assertEqual({'connections': 1, 'requests': 3, 'reused': 2},
+                         self.rest.stats())
+
+    def test_request_error(self):
+        """ A POST lost with its connection answers status 0 """
+        server = DroppingServer()
+        server.start()
+        rest = LitpRestUtils('127.0.0.1', server.port, secure=False)
+        try:
+            self.assertEqual(200, rest.get('/ms')[2])
+            body, stderr, status = rest.post('/software/items', JSON,
+                                             json.dumps(PACKAGE))
+            self.assertEqual(('', 0), (body, status))
+            self.assertNotEqual('', stderr)
+            self.assertEqual([], rest.created_paths)
+        finally:
+            rest.pool.close()
+            server.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Unit tests of cli/package_inventory.py on the output of
+            'litp version -a' and of the inventory command
+'''
+
+import re
+import subprocess
+import unittest
+
+from package_inventory import PackageInventory, get_stamp_cmd, \
+    parse_stamp, parse_version_output
+
+STAMP = '0cc175b9c0f1b6a831c399e269772661'
+
+# as printed by 'litp version -a' on an MS
+VERSION_OUTPUT = [
+    'LITP2 2.2.11 CSA 113 110 R1CZ02',
+    '',
+    'ERIClitpcore: 2.3.4 CXP9030418',
+    '    ERIClitpcli: 1.3.11 CXP9030420',
+    'ERIClitpdocs: 1.5.2 CXP9030557 R1A02',
+    'not a package line',
+]
+
+# as printed by get_inventory_cmd: the stamp, then 'rpm -qa' names with
+# the CXP number and versions, sorted
+INVENTORY_OUTPUT = [
+    '@stamp ' + STAMP,
+    'ERIClitpcli_CXP9030420 1.3.11',
+    'ERIClitpcore_CXP9030418 2.3.4',
+    'ERIClitpdocs_CXP9030557 1.5.2',
+    'EXTRlitppuppet 3.3.2',
+]
+
+
+class TestVersionOutput(unittest.TestCase):
+    """ Parsing 'litp version -a' """
+
+    def test_packages(self):
+        """ Package lines give version and CXP number, others are left """
+        self.assertEqual({'ERIClitpcore': ('2.3.4', 'CXP9030418'),
+                          'ERIClitpcli': ('1.3.11', 'CXP9030420'),
+                          'ERIClitpdocs': ('1.5.2', 'CXP9030557')},
+                         parse_version_output(VERSION_OUTPUT))
+
+
+class TestPackageInventory(unittest.TestCase):
+    """ The installed packages and the rpm database stamp """
+
+    def test_inventory(self):
+        """ Packages by name without the CXP number, and the stamp """
+        inventory = PackageInventory(INVENTORY_OUTPUT)
+        self.assertEqual(STAMP, inventory.stamp)
+        self.assertEqual(['ERIClitpcli', 'ERIClitpcore', 'ERIClitpdocs'],
+                         sorted(inventory.packages))
+        self.assertEqual('1.3.11', inventory.get_version('ERIClitpcli'))
+        self.assertEqual(None, inventory.get_version('EXTRlitppuppet'))
+
+    def test_no_differences(self):
+        """ An inventory matches the version output of the same MS """
+        inventory = PackageInventory(INVENTORY_OUTPUT)
+        self.assertEqual({}, inventory.get_differences(
+            parse_version_output(VERSION_OUTPUT)))
+
+    def test_differences(self):
+        """ Other versions and missing packages are reported """
+        inventory = PackageInventory(INVENTORY_OUTPUT)
+        shown = parse_version_output(
+            [line.replace('2.3.4', '2.3.5') for line in VERSION_OUTPUT
+             if 'docs' not in line])
+        self.assertEqual(
+            {'ERIClitpcore': (('2.3.4', 'CXP9030418'),
+                              ('2.3.5', 'CXP9030418')),
+             'ERIClitpdocs': (('1.5.2', 'CXP9030557'), None)},
+            inventory.get_differences(shown))
+
+    def test_no_stamp(self):
+        """ Output without a stamp has none """
+        self.assertEqual(None, parse_stamp(INVENTORY_OUTPUT[1:]))
+
+    def test_stamp_cmd(self):
+        """ The stamp command prints a stamp parse_stamp reads """
+        output = subprocess.Popen(get_stamp_cmd(), shell=True,
+                                  stdout=subprocess.PIPE).communicate()[0]
+        stamp = parse_stamp(output.decode('utf-8').splitlines())
+        self.assertTrue(re.match('^[0-9a-f]{32}$', stamp or ''), stamp)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Unit tests of tools/parallel_runner.py. Jobs are recorded
+            instead of run through nosetests.
+'''
+
+import shutil
+import tempfile
+import time
+import unittest
+
+from cli.shared_plan import CONCURRENT_ENV
+from tools import suite_scan
+from tools.parallel_runner import ParallelRunner, build_chains, \
+    estimate_run_secs
+
+
+def make_test(path, name, kind):
+    """ Test as suite_scan.scan_testset describes it """
+    return {'file': path, 'class': 'Story', 'name': name, 'attrs': {},
+            'kind': kind, 'line': 1}
+
+
+TESTS = [make_test('a.py', 'test_01', suite_scan.READ),
+         make_test('a.py', 'test_02', suite_scan.MODEL),
+         make_test('a.py', 'test_03', suite_scan.READ),
+         make_test('b.py', 'test_01', suite_scan.READ),
+         make_test('b.py', 'test_02', suite_scan.READ),
+         make_test('c.py', 'test_01', suite_scan.MODEL),
+         make_test('d.py', 'test_01', suite_scan.EXCLUSIVE)]
+
+
+class RecordingRunner(ParallelRunner):
+    """ Runner recording which jobs run at the same time """
+
+    def __init__(self, chains, workers):
+        self.directory = tempfile.mkdtemp()
+        super(RecordingRunner, self).__init__(chains, workers,
+                                              report_dir=self.directory)
+        self.running = []
+        self.overlaps = []
+        self.envs = {}
+
+    def _nose(self, report, tests, extra_env=None):
+        kind = tests[0]['kind']
+        with self._lock:
+            self.overlaps.extend((kind, other) for other in self.running)
+            self.running.append(kind)
+            self.envs[tests[0]['file']] = dict(extra_env or {})
+        time.sleep(0.05)
+        with self._lock:
+            self.running.remove(kind)
+            self.results.append({'tests': tests, 'rc': 0, 'secs': 0,
+                                 'report': report, 'output': ''})
+
+
+class TestBuildChains(unittest.TestCase):
+    """ Jobs per testset and kind """
+
+    def test_chains(self):
+        """ One job per kind of a testset, read only tests together """
+        chains = build_chains(TESTS, share_plans=False)
+        self.assertEqual([[('d.py', suite_scan.EXCLUSIVE, 1)],
+                          [('a.py', suite_scan.READ, 2),
+                           ('a.py', suite_scan.MODEL, 1)],
+                          [('c.py', suite_scan.MODEL, 1)],
+                          [('b.py', suite_scan.READ, 2)]],
+                         [[(job['tests'][0]['file'], job['kind'],
+                            len(job['tests'])) for job in chain]
+                          for chain in chains])
+
+    def test_estimate(self):
+        """ Model and exclusive jobs take their time one by one """
+        medians = {'Story.test_01': 10.0}
+        chains = [[{'kind': suite_scan.MODEL, 'tests': [TESTS[5]]}],
+                  [{'kind': suite_scan.EXCLUSIVE, 'tests': [TESTS[6]]}],
+                  [{'kind': suite_scan.READ, 'tests': [TESTS[3]]}],
+                  [{'kind': suite_scan.READ, 'tests': [TESTS[0]]}]]
+        self.assertEqual(30.0, estimate_run_secs(chains, 2, medians))
+
+
+class TestParallelRunner(unittest.TestCase):
+    """ Jobs of different testsets on several workers """
+
+    def test_gate(self):
+        """ Only read only jobs run side by side """
+        runner = RecordingRunner(build_chains(TESTS, share_plans=False), 4)
+        try:
+            results = runner.run()
+        finally:
+            shutil.rmtree(runner.directory)
+        self.assertEqual(len(TESTS), sum(len(result['tests'])
+                                         for result in results))
+        self.assertEqual(set(), set(runner.overlaps) - set(
+            [(suite_scan.READ, suite_scan.READ)]))
+
+    def test_env(self):
+        """ Jobs holding the MS alone may restore the model """
+        runner = RecordingRunner(build_chains(TESTS, share_plans=False), 4)
+        try:
+            runner.run()
+        finally:
+            shutil.rmtree(runner.directory)
+        self.assertEqual({}, runner.envs['c.py'])
+        self.assertEqual({}, runner.envs['d.py'])
+        self.assertEqual({CONCURRENT_ENV: '1'}, runner.envs['b.py'])
+
+    def test_reads_together(self):
+        """ Read only jobs of different testsets do overlap """
+        reads = [make_test('{0}.py'.format(num), 'test_01', suite_scan.READ)
+                 for num in range(3)]
+        runner = RecordingRunner(build_chains(reads), 3)
+        try:
+            runner.run()
+        finally:
+            shutil.rmtree(runner.directory)
+        self.assertTrue(runner.overlaps)
+
+
+if __name__ == '__main__':
+    unittest.main()
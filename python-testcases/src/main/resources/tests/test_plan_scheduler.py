@@ -0,0 +1,219 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Unit tests of tools/plan_scheduler.py. The tests of a group
+            are threads calling the PlanCoordinator as the connections of
+            their processes would.
+'''
+
+import threading
+import time
+import unittest
+
+from cli.shared_plan import AUTHKEY_ENV, COORDINATOR_ENV, LEAD, \
+    SharedPlanClient
+from tools.plan_scheduler import PlanCoordinator, group_shared_tests
+
+JOIN_SECS = 10
+
+
+class Member(threading.Thread):
+    """
+    A test of the group: waits for plans reporting each outcome it
+    leads, then tears down and leaves. outcomes holds the success to
+    report per plan; a lead with outcome None goes away without
+    reporting.
+    """
+
+    def __init__(self, coordinator, name, outcomes, log):
+        threading.Thread.__init__(self)
+        self.daemon = True
+        self.coordinator = coordinator
+        self.member = name
+        self.outcomes = list(outcomes)
+        self.log = log
+        self.replies = []
+
+    def record(self, event):
+        """ Add an event to the shared log, in the order they happen """
+        self.log.append((self.member, event))
+
+    def run(self):
+        handle = self.coordinator._handle
+        for outcome in self.outcomes:
+            reply = handle('plan', self.member)
+            self.replies.append(reply)
+            self.record('plan')
+            if reply == LEAD:
+                if outcome is None:
+                    self.coordinator.leave(self.member)
+                    self.record('gone')
+                    return
+                time.sleep(0.05)
+                self.record('done')
+                handle('done', self.member, outcome)
+        handle('teardown', self.member)
+        self.record('teardown')
+        time.sleep(0.05)
+        self.record('torn down')
+        handle('leave', self.member)
+
+
+def run_group(plan_counts, outcomes=None):
+    """
+    Run a group whose members wait for the given number of plans, the
+    leads reporting outcomes[member] (True for every plan by default)
+    """
+    coordinator = PlanCoordinator(plan_counts)
+    log = []
+    outcomes = outcomes or {}
+    members = dict((name, Member(coordinator, name,
+                                 outcomes.get(name, [True] * count), log))
+                   for name, count in plan_counts.items())
+    for member in members.values():
+        member.start()
+    for member in members.values():
+        member.join(JOIN_SECS)
+    return coordinator, members, log
+
+
+class TestPlanCoordinator(unittest.TestCase):
+    """ Plans and teardowns of a group """
+
+    def assert_finished(self, members):
+        """ Every member got through """
+        for member in members.values():
+            self.assertFalse(member.is_alive(), member.member)
+
+    def assert_serial_teardown(self, log):
+        """ Teardowns one at a time, after the last plan """
+        events = [event for _, event in log]
+        last_plan = max([index for index, event in enumerate(events)
+                         if event in ('plan', 'done', 'gone')] + [-1])
+        tearing_down = None
+        for index, (member, event) in enumerate(log):
+            if event == 'teardown':
+                self.assertTrue(index > last_plan, log)
+                self.assertEqual(None, tearing_down, log)
+                tearing_down = member
+            elif event == 'torn down':
+                self.assertEqual(member, tearing_down, log)
+                tearing_down = None
+
+    def test_one_plan_each(self):
+        """ One plan for the group, led by one member """
+        coordinator, members, log = run_group({'a': 1, 'b': 1, 'c': 1})
+        self.assert_finished(members)
+        self.assertEqual(1, coordinator.plans)
+        self.assertEqual([[LEAD], [True], [True]],
+                         [members[name].replies for name in 'abc'])
+        self.assert_serial_teardown(log)
+
+    def test_different_plan_counts(self):
+        """ Rounds go on with the members still wanting plans """
+        coordinator, members, log = run_group({'a': 2, 'b': 3, 'c': 0})
+        self.assert_finished(members)
+        self.assertEqual(3, coordinator.plans)
+        self.assertEqual([LEAD, LEAD], members['a'].replies)
+        self.assertEqual([True, True, LEAD], members['b'].replies)
+        self.assertEqual([], members['c'].replies)
+        self.assert_serial_teardown(log)
+
+    def test_failed_plan(self):
+        """ The outcome of the lead reaches the others """
+        _, members, _ = run_group({'a': 1, 'b': 1}, {'a': [False]})
+        self.assert_finished(members)
+        self.assertEqual([False], members['b'].replies)
+
+    def test_lead_leaves(self):
+        """ A lead going away mid round fails the plan of the round """
+        coordinator, members, log = run_group({'a': 2, 'b': 2},
+                                              {'a': [None]})
+        self.assert_finished(members)
+        self.assertEqual([LEAD], members['a'].replies)
+        self.assertEqual([False, LEAD], members['b'].replies)
+        self.assertEqual(2, coordinator.plans)
+        self.assertTrue(('a', 'gone') in log)
+        self.assert_serial_teardown(log)
+
+    def test_member_fails_early(self):
+        """ A member gone before its first plan stops holding the rest """
+        coordinator = PlanCoordinator(['a', 'b', 'c'])
+        log = []
+        members = [Member(coordinator, name, [True], log) for name in 'ab']
+        for member in members:
+            member.start()
+        time.sleep(0.2)
+        self.assertEqual([[], []], [member.replies for member in members])
+        coordinator.leave('c')
+        for member in members:
+            member.join(JOIN_SECS)
+            self.assertFalse(member.is_alive())
+        self.assertEqual(1, coordinator.plans)
+        self.assertEqual([[LEAD], [True]],
+                         [member.replies for member in members])
+
+    def test_serial_teardown(self):
+        """ Members with no plan tear down one at a time """
+        _, members, log = run_group(dict((name, 0) for name in 'abcd'))
+        self.assert_finished(members)
+        self.assertEqual(4, len([entry for entry in log
+                                 if entry[1] == 'torn down']))
+        self.assert_serial_teardown(log)
+
+    def test_connections(self):
+        """ The tests reach the coordinator through the environment """
+        coordinator = PlanCoordinator(['a', 'b']).start()
+        try:
+            replies = {}
+
+            def member(name):
+                """ One test process """
+                env = coordinator.env(name)
+                host, port = env[COORDINATOR_ENV].rsplit(':', 1)
+                client = SharedPlanClient(
+                    (host, int(port)), name,
+                    env[AUTHKEY_ENV].encode('ascii'))
+                replies[name] = client.wait_for_plan()
+                if replies[name] == LEAD:
+                    client.plan_done(True)
+                client.wait_for_teardown()
+                client.leave()
+            threads = [threading.Thread(target=member, args=(name,))
+                       for name in 'ab']
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(JOIN_SECS)
+        finally:
+            coordinator.close()
+        self.assertEqual({'a': LEAD, 'b': True}, replies)
+
+
+class TestGroups(unittest.TestCase):
+    """ Tests whose plans can be shared """
+
+    def test_groups(self):
+        """ Tagged tests with disjoint deltas share a group """
+        tests = [{'name': name, 'attrs': attrs} for name, attrs in (
+            ('t1', ['plan_shared', 'delta_x']),
+            ('t2', ['plan_shared', 'delta_y']),
+            ('t3', ['plan_shared', 'delta_x']),
+            ('t4', ['delta_z']),
+            ('t5', ['plan_shared']))]
+        groups, rest = group_shared_tests(tests)
+        self.assertEqual([['t1', 't2']],
+                         [[test['name'] for test in group]
+                          for group in groups])
+        self.assertEqual(['t3', 't4', 't5'], [test['name'] for test in rest])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,172 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Unit tests of cli/plan_waiter.py, against cli/fake_litpd.py
+            and against scripted servers on a virtual clock
+'''
+
+import re
+import unittest
+
+import plan_waiter
+from fake_litpd import FakeLitpd, FakeLitpModel, build_default_model
+from plan_waiter import PlanWaiter
+from rest_client import LitpRestClient
+
+HOLD = 'hold'
+
+
+def make_plan(state, task_states=('Initial',)):
+    """ /plans/plan with one phase as the REST API renders it """
+    tasks = [{'id': str(num), 'state': task_state}
+             for num, task_state in enumerate(task_states, 1)]
+    return {'id': 'plan', 'state': state, '_embedded': {'item': [{
+        'id': 'phases', '_embedded': {'item': [{
+            'id': '1', '_embedded': {'item': [{
+                'id': 'tasks', '_embedded': {'item': tasks}}]}}]}}]}}
+
+
+class FakeClock(object):
+    """ Stands in for the time module, recording the sleeps """
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def time(self):
+        """ Current virtual time """
+        return self.now
+
+    def sleep(self, secs):
+        """ Advance the virtual time """
+        self.sleeps.append(secs)
+        self.now += secs
+
+
+class ScriptedClient(object):
+    """
+    LitpRestClient answering get_json from a list of (status, plan, secs)
+    taking secs of virtual time each; secs HOLD takes the wait asked for.
+    The last answer is repeated.
+    """
+
+    def __init__(self, clock, answers):
+        self.clock = clock
+        self.answers = list(answers)
+        self.etags = []
+
+    def get_json(self, path, headers=None):
+        """ Next scripted answer """
+        self.etags.append(headers.get('If-None-Match'))
+        status, plan, secs = self.answers[0]
+        if len(self.answers) > 1:
+            self.answers.pop(0)
+        if secs == HOLD:
+            secs = int(re.search(r'wait=(\d+)', headers['Prefer']).group(1))
+        self.clock.now += secs
+        return status, {'etag': '"1"'}, plan
+
+
+class TestBackoff(unittest.TestCase):
+    """ When the next request goes out """
+
+    def setUp(self):
+        self.time = plan_waiter.time
+        self.clock = plan_waiter.time = FakeClock()
+
+    def tearDown(self):
+        plan_waiter.time = self.time
+
+    def wait(self, answers, timeout_secs=20):
+        """ Wait for success, returning the waiter and the result """
+        waiter = PlanWaiter(ScriptedClient(self.clock, answers),
+                            min_interval=0.5, max_interval=4.0)
+        return waiter, waiter.wait('successful', timeout_secs)
+
+    def test_slow_plain_server(self):
+        """ A slow server ignoring both headers is not hammered """
+        waiter, result = self.wait([(200, make_plan('running'), 1.0)])
+        self.assertFalse(result)
+        self.assertEqual([0.5, 0.5, 1.0, 2.0, 4.0], self.clock.sleeps[:5])
+        self.assertFalse(waiter.conditional)
+
+    def test_unchanged_plan_backs_off(self):
+        """ A plan answered unchanged always backs off """
+        running = make_plan('running', ['Running'])
+        self.wait([(200, make_plan('running'), 0.01), (200, running, 0.01),
+                   (200, running, 0.01), (200, running, 0.01),
+                   (200, make_plan('successful', ['Success']), 0.01)])
+        self.assertEqual([0.5, 0.5, 0.5, 1.0], self.clock.sleeps)
+
+    def test_slow_etag_server(self):
+        """ Not Modified answered before the wait is over backs off """
+        waiter, result = self.wait([(200, make_plan('running'), 0.01),
+                                    (304, None, 2.0)])
+        self.assertFalse(result)
+        self.assertEqual([0.5, 0.5, 1.0, 2.0, 4.0], self.clock.sleeps[:5])
+        self.assertTrue(waiter.conditional)
+
+    def test_long_poll_server(self):
+        """ A server holding the requests is asked again straight away """
+        waiter, result = self.wait(
+            [(200, make_plan('running'), 0.01), (304, None, HOLD),
+             (200, make_plan('running', ['Running']), 3.0),
+             (200, make_plan('running', ['Success']), 2.0),
+             (200, make_plan('successful', ['Success']), 1.0)], 120)
+        self.assertTrue(result)
+        self.assertEqual([0.5], self.clock.sleeps)
+        self.assertEqual(5, waiter.requests)
+        self.assertEqual([None] + ['"1"'] * 4, waiter.client.etags)
+
+    def test_errors(self):
+        """ 404 ends the wait, other answers raise """
+        self.assertFalse(self.wait([(404, None, 0.01)])[1])
+        self.assertRaises(RuntimeError, self.wait, [(500, None, 0.01)])
+
+
+class TestFakeLitpd(unittest.TestCase):
+    """ Waiting on the plans of the fake litpd """
+
+    def setUp(self):
+        model = FakeLitpModel(task_secs=0.02)
+        build_default_model(model)
+        self.server = FakeLitpd(0, model).start()
+        self.client = LitpRestClient('127.0.0.1', self.server.port,
+                                     secure=False)
+        self.client.request('POST', '/software/items', {
+            'id': 'waiter', 'type': 'package',
+            'properties': {'name': 'telnet'}})
+        self.assertEqual(201, self.client.request(
+            'POST', '/plans', {'id': 'plan', 'type': 'plan'})[0])
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_plan_runs(self):
+        """ The wait follows the plan to success, phase by phase """
+        self.assertEqual(200, self.client.request(
+            'PUT', '/plans/plan', {'properties': {'state': 'running'}})[0])
+        waiter = PlanWaiter(self.client, min_interval=0.05)
+        self.assertTrue(waiter.wait('successful', 30))
+        self.assertTrue('successful' in waiter.timings['plan'])
+        self.assertTrue(waiter.phase_durations())
+
+    def test_plan_not_run(self):
+        """ A plan that does not move is held, not polled """
+        waiter = PlanWaiter(self.client, min_interval=0.05)
+        self.assertFalse(waiter.wait('successful', 2))
+        self.assertTrue(waiter.conditional)
+        # the plan, then held requests of whole seconds
+        self.assertTrue(waiter.requests <= 3, waiter.requests)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,324 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Unit tests of cli/session_pool.py. SshSession is driven
+            through a scripted stand-in for the paramiko client, the pool
+            through LocalSession.
+'''
+
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+import unittest
+
+import session_pool
+from session_pool import LocalSession, SessionPool, SshSession, \
+    get_host_att, load_host_properties
+
+HOST_PROPERTIES = """host.ms1.type=MS
+host.ms1.ip=192.168.0.42
+host.ms1.user.root.pass=rootpw
+host.ms1.user.litp-admin.pass=litp_admin
+host.ms1.port.ssh=2222
+host.mn1.ip=192.168.0.43
+host.mn1.user.root.pass=rootpw
+"""
+
+
+class FakeSSHException(Exception):
+    """ paramiko.SSHException """
+    pass
+
+
+class FakeChannel(object):
+    """ Channel answering a command with scripted output """
+
+    def __init__(self, stdout=b'', stderr=b'', rc=0, finishes=True):
+        self.stdout = [stdout] if stdout else []
+        self.stderr = [stderr] if stderr else []
+        self.rc = rc
+        self.finishes = finishes
+        self.status_event = threading.Event()
+        self.cmd = None
+        self.closed = False
+
+    def settimeout(self, timeout):
+        """ Nothing to do """
+        pass
+
+    def exec_command(self, cmd):
+        """ Remember the command """
+        self.cmd = cmd
+
+    def recv_ready(self):
+        """ True while stdout is left """
+        return bool(self.stdout)
+
+    def recv(self, size):
+        """ Next chunk of stdout """
+        return self.stdout.pop(0)
+
+    def recv_stderr_ready(self):
+        """ True while stderr is left """
+        return bool(self.stderr)
+
+    def recv_stderr(self, size):
+        """ Next chunk of stderr """
+        return self.stderr.pop(0)
+
+    def exit_status_ready(self):
+        """ Whether the command has finished """
+        return self.finishes
+
+    def recv_exit_status(self):
+        """ Return code of the command """
+        return self.rc
+
+    def close(self):
+        """ Close the channel """
+        self.closed = True
+
+
+class FakeTransport(object):
+    """ Transport handing out the channels queued on its client """
+
+    def __init__(self, client):
+        self.client = client
+        self.active = True
+
+    def set_keepalive(self, secs):
+        """ Nothing to do """
+        pass
+
+    def is_active(self):
+        """ False once the node dropped the transport """
+        return self.active
+
+    def open_session(self):
+        """ Next queued channel, or fail if the transport broke """
+        if self.client.broken:
+            self.client.broken -= 1
+            raise FakeSSHException('transport broken')
+        return self.client.channels.pop(0)
+
+
+class FakeSSHClient(object):
+    """ paramiko.SSHClient with transports that can be broken """
+
+    # every client made, shared by the test
+    made = []
+    channels = []
+    broken = 0
+
+    def __init__(self):
+        self.transport = None
+        FakeSSHClient.made.append(self)
+
+    def set_missing_host_key_policy(self, policy):
+        """ Nothing to do """
+        pass
+
+    def connect(self, host, **kwargs):
+        """ Open a new transport """
+        self.transport = FakeTransport(FakeSSHClient)
+
+    def get_transport(self):
+        """ The transport of the client """
+        return self.transport
+
+    def close(self):
+        """ Drop the transport """
+        self.transport = None
+
+
+class FakeParamiko(object):
+    """ The parts of the paramiko module SshSession uses """
+    SSHClient = FakeSSHClient
+    SSHException = FakeSSHException
+
+    @staticmethod
+    def AutoAddPolicy():  # pylint: disable=invalid-name
+        """ Host key policy """
+        return None
+
+
+class TestSshSession(unittest.TestCase):
+    """ Commands over one transport """
+
+    def setUp(self):
+        self.paramiko = session_pool.paramiko
+        session_pool.paramiko = FakeParamiko
+        FakeSSHClient.made = []
+        FakeSSHClient.channels = []
+        FakeSSHClient.broken = 0
+        self.session = SshSession('ms1', 'litp-admin', 'pw')
+
+    def tearDown(self):
+        session_pool.paramiko = self.paramiko
+
+    def test_output(self):
+        """ Lines of both streams and the return code come back """
+        FakeSSHClient.channels = [FakeChannel(b'a\nb\n', b'warn', 3)]
+        self.assertEqual((['a', 'b'], ['warn'], 3),
+                         self.session.execute('cmd'))
+
+    def test_one_transport(self):
+        """ Commands reuse the transport """
+        FakeSSHClient.channels = [FakeChannel(b'x'), FakeChannel(b'y')]
+        self.session.execute('first')
+        self.session.execute('second')
+        self.assertEqual((1, 2), (self.session.connects,
+                                  self.session.commands))
+
+    def test_reconnect_inactive(self):
+        """ A transport the node dropped is replaced """
+        FakeSSHClient.channels = [FakeChannel(b'x'), FakeChannel(b'y')]
+        self.session.execute('first')
+        FakeSSHClient.made[-1].transport.active = False
+        self.assertEqual((['y'], [], 0), self.session.execute('second'))
+        self.assertEqual(2, self.session.connects)
+
+    def test_reconnect_broken(self):
+        """ A transport failing to open a channel is replaced once """
+        FakeSSHClient.channels = [FakeChannel(b'x'), FakeChannel(b'y')]
+        self.session.execute('first')
+        FakeSSHClient.broken = 1
+        self.assertEqual((['y'], [], 0), self.session.execute('second'))
+        self.assertEqual(2, self.session.connects)
+
+    def test_timeout(self):
+        """ A command that never finishes raises once the time is up """
+        channel = FakeChannel(finishes=False)
+        FakeSSHClient.channels = [channel]
+        start = time.time()
+        self.assertRaises(socket.timeout, self.session.execute, 'hang',
+                          timeout=0.2)
+        self.assertTrue(time.time() - start < 5)
+        self.assertTrue(channel.closed)
+
+
+class TestLocalSession(unittest.TestCase):
+    """ Commands in a local shell """
+
+    def test_output(self):
+        """ Lines without terminators, the last one without a newline """
+        session = LocalSession()
+        self.assertEqual((['a', 'b'], ['e'], 4), session.execute(
+            'echo a; printf b; echo e >&2; exit 4'))
+
+    def test_timeout(self):
+        """ A command running too long is killed with its children """
+        session = LocalSession()
+        start = time.time()
+        self.assertRaises(socket.timeout, session.execute,
+                          'sleep 10; echo late', timeout=0.3)
+        self.assertTrue(time.time() - start < 5)
+        self.assertEqual((['on time'], [], 0),
+                         session.execute('echo on time', timeout=5))
+
+
+class CountingSession(LocalSession):
+    """ LocalSession recording how many commands run at once """
+
+    lock = threading.Lock()
+    running = 0
+    most = 0
+
+    def execute(self, cmd, timeout=None):
+        cls = CountingSession
+        with cls.lock:
+            cls.running += 1
+            cls.most = max(cls.most, cls.running)
+        try:
+            return LocalSession.execute(self, cmd, timeout)
+        finally:
+            with cls.lock:
+                cls.running -= 1
+
+
+class TestSessionPool(unittest.TestCase):
+    """ Sessions per node """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_channel_limit(self):
+        """ No more commands run at once on a node than max_channels """
+        pool = SessionPool(session_factory=CountingSession, max_channels=2)
+        pool.register('ms1', 'localhost', 'litp-admin', 'pw')
+        threads = [threading.Thread(target=pool.execute,
+                                    args=('ms1', 'sleep 0.2'))
+                   for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(2, CountingSession.most)
+        self.assertEqual({'ms1': {'connects': 1, 'commands': 6}},
+                         pool.stats())
+
+    def test_timeout(self):
+        """ The timeout reaches the session and frees the channel """
+        pool = SessionPool(session_factory=LocalSession, max_channels=1)
+        pool.register('ms1', 'localhost', 'litp-admin', 'pw')
+        self.assertRaises(socket.timeout, pool.execute, 'ms1', 'sleep 10',
+                          timeout=0.2)
+        self.assertEqual((['ok'], [], 0), pool.execute('ms1', 'echo ok',
+                                                       timeout=5))
+
+    def test_close_reopens(self):
+        """ A closed pool opens a new session on the next command """
+        pool = SessionPool(session_factory=LocalSession)
+        pool.register('ms1', 'localhost', 'litp-admin', 'pw')
+        pool.execute('ms1', 'true')
+        pool.close()
+        self.assertEqual({}, pool.stats())
+        pool.execute('ms1', 'true')
+        self.assertEqual(1, pool.stats()['ms1']['commands'])
+
+    def test_register_hosts(self):
+        """ Nodes of host.properties with the user's password """
+        path = os.path.join(self.directory, 'host.properties')
+        with open(path, 'w') as props:
+            props.write(HOST_PROPERTIES)
+        hosts = load_host_properties(path)
+        self.assertEqual({'ip': '192.168.0.42', 'port': 2222,
+                          'users': {'root': 'rootpw',
+                                    'litp-admin': 'litp_admin'}},
+                         hosts['ms1'])
+        pool = SessionPool(session_factory=LocalSession)
+        pool.register_hosts(hosts, 'litp-admin')
+        self.assertTrue(pool.is_registered('ms1'))
+        self.assertFalse(pool.is_registered('mn1'))
+
+    def test_host_att(self):
+        """ Address and passwords of the nodes of host.properties """
+        path = os.path.join(self.directory, 'host.properties')
+        with open(path, 'w') as props:
+            props.write(HOST_PROPERTIES)
+        hosts = load_host_properties(path)
+        self.assertEqual('192.168.0.43',
+                         get_host_att(hosts, 'mn1', 'ipv4', None))
+        self.assertEqual('litp_admin', get_host_att(hosts, 'ms1', 'password',
+                                                    'litp-admin'))
+        self.assertEqual(None, get_host_att(hosts, 'mn1', 'password',
+                                            'litp-admin'))
+        self.assertEqual(None, get_host_att(hosts, 'mn2', 'ipv4', None))
+        self.assertEqual(None, get_host_att(hosts, 'ms1', 'username', None))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Unit tests of tools/shard_plan.py: the split of the tests and
+            the MS each shard runs against
+'''
+
+import os
+import shlex
+import shutil
+import tempfile
+import unittest
+
+from cli.session_pool import HOSTS_ENV, get_host_att, load_host_properties
+from tools import suite_scan
+from tools.parallel_runner import ParallelRunner
+from tools.shard_plan import build_units, split_units, write_plan
+
+HOSTS = """host.ms1.type=MS
+host.ms1.ip={0}
+host.ms1.user.litp-admin.pass=pw{0}
+"""
+
+
+def make_test(cls, name, kind, line):
+    """ Test as suite_scan.scan_testset describes it """
+    return {'file': 'cli/testset_story1.py', 'class': cls, 'name': name,
+            'attrs': {}, 'kind': kind, 'line': line}
+
+
+TESTS = [make_test('A', 'test_01', suite_scan.MODEL, 1),
+         make_test('A', 'test_02', suite_scan.EXCLUSIVE, 2),
+         make_test('A', 'test_03', suite_scan.READ, 3),
+         make_test('B', 'test_01', suite_scan.READ, 4)]
+
+
+def get_run_args(run):
+    """ Arguments run.sh gives tools.parallel_runner """
+    with open(run) as script:
+        line = [line for line in script if line.startswith('exec ')][0]
+    args = shlex.split(line)
+    return args[args.index('tools.parallel_runner') + 1:]
+
+
+class TestSplit(unittest.TestCase):
+    """ Tests spread over shards """
+
+    def test_units(self):
+        """ Model changing tests of a class stay together """
+        self.assertEqual([['test_01', 'test_02'], ['test_03'], ['test_01']],
+                         [[test['name'] for test in unit]
+                          for unit in build_units(TESTS)])
+
+    def test_split(self):
+        """ Longest units first, each to the least loaded shard """
+        medians = {'A.test_01': 30.0, 'A.test_02': 30.0, 'A.test_03': 20.0,
+                   'B.test_01': 20.0}
+        planned = split_units(build_units(TESTS), 2, medians)
+        self.assertEqual([60.0, 40.0], [shard['secs'] for shard in planned])
+        self.assertEqual([['A.test_01', 'A.test_02'],
+                          ['A.test_03', 'B.test_01']],
+                         [['{0}.{1}'.format(test['class'], test['name'])
+                           for test in shard['tests']]
+                          for shard in planned])
+
+
+class TestWritePlan(unittest.TestCase):
+    """ The directory of each shard """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.hosts = []
+        for ip_address in ('10.0.0.1', '10.0.0.2'):
+            path = os.path.join(self.directory, ip_address + '.properties')
+            with open(path, 'w') as props:
+                props.write(HOSTS.format(ip_address))
+            self.hosts.append(path)
+        self.planned = split_units(build_units(TESTS), 2, {})
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_shard_ms(self):
+        """ Each run.sh points the tests at the MS of its shard """
+        plan = write_plan(self.planned, os.path.join(self.directory, 'plan'),
+                          self.hosts)
+        for shard, ip_address in zip(plan['shards'],
+                                     ('10.0.0.1', '10.0.0.2')):
+            args = get_run_args(shard['run'])
+            self.assertEqual(shard['select'],
+                             args[args.index('--select') + 1])
+            hosts = args[args.index('--hosts') + 1]
+            self.assertEqual(os.path.dirname(shard['run']),
+                             os.path.dirname(hosts))
+            env = ParallelRunner([], hosts=hosts).get_env()
+            nodes = load_host_properties(env[HOSTS_ENV])
+            self.assertEqual(ip_address,
+                             get_host_att(nodes, 'ms1', 'ipv4', None))
+            self.assertEqual('pw' + ip_address, get_host_att(
+                nodes, 'ms1', 'password', 'litp-admin'))
+
+    def test_no_hosts(self):
+        """ Without host.properties the configured MS is used """
+        plan = write_plan(self.planned, os.path.join(self.directory, 'plan'),
+                          None)
+        for shard in plan['shards']:
+            self.assertFalse('--hosts' in get_run_args(shard['run']))
+        self.assertFalse(HOSTS_ENV in ParallelRunner([]).get_env())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Unit tests of cli/show_parser.py on outputs of 'litp show',
+            'litp show -r' and 'litp show -l'
+'''
+
+import unittest
+
+from show_parser import iter_show_items, parse_show, strip_inherited_marker
+
+SHOW_R = """/ms/items
+    type: collection-of-software-item
+    state: Applied
+    children:
+        /ms/items/telnet
+/ms/items/telnet
+    inherited from: /software/items/telnet
+    type: reference-to-package
+    state: Applied
+    properties:
+        name: telnet [*]
+        arch: redhat [*]
+        version: 2.0
+/ms/items/firefox
+    inherited from: /software/items/firefox
+    type: reference-to-package
+    state: Initial
+    properties:
+        name: firefox [*]
+"""
+
+SHOW_L = """/ms
+/ms/items
+/ms/items/telnet
+"""
+
+
+class TestShowParser(unittest.TestCase):
+    """ Items of a show output """
+
+    def test_show_r(self):
+        """ Every block of a recursive show is one item """
+        items = parse_show(SHOW_R.splitlines())
+        self.assertEqual(['/ms/items', '/ms/items/telnet',
+                          '/ms/items/firefox'],
+                         [item.path for item in
+                          iter_show_items(SHOW_R.splitlines())])
+        collection = items['/ms/items']
+        self.assertEqual('collection-of-software-item', collection.type)
+        self.assertEqual(['/ms/items/telnet'], collection.children)
+        self.assertEqual({}, collection.properties)
+        self.assertEqual('Initial', items['/ms/items/firefox'].state)
+
+    def test_show_l(self):
+        """ A listing is items with a path only """
+        items = parse_show(SHOW_L.splitlines())
+        self.assertEqual(set(['/ms', '/ms/items', '/ms/items/telnet']),
+                         set(items))
+        self.assertEqual(None, items['/ms/items'].type)
+        self.assertEqual({}, items['/ms/items'].properties)
+
+    def test_inherited_marker(self):
+        """ [*] is kept apart from the value and put back on request """
+        item = parse_show(SHOW_R.splitlines())['/ms/items/telnet']
+        self.assertEqual({'name': 'telnet', 'arch': 'redhat',
+                          'version': '2.0'}, item.properties)
+        self.assertEqual(set(['name', 'arch']), item.inherited)
+        self.assertEqual('redhat [*]', item.get_property('arch'))
+        self.assertEqual('redhat', item.get_property('arch', marker=False))
+        self.assertEqual('2.0', item.get_property('version'))
+        self.assertEqual(None, item.get_property('repository'))
+        self.assertEqual({'name': 'telnet [*]', 'arch': 'redhat [*]',
+                          'version': '2.0'}, item.get_properties())
+        self.assertEqual('redhat', strip_inherited_marker('redhat [*]'))
+        self.assertEqual('os', strip_inherited_marker('os'))
+        self.assertEqual(None, strip_inherited_marker(None))
+
+    def test_show_data(self):
+        """ get_value answers as 'litp show -o' does """
+        item = parse_show(SHOW_R.splitlines())['/ms/items/telnet']
+        self.assertEqual('/software/items/telnet',
+                         item.get_value('inherited from'))
+        self.assertEqual('reference-to-package', item.get_value('type'))
+        self.assertEqual('Applied', item.get_value('state'))
+        self.assertEqual('redhat [*]', item.get_value('arch'))
+        self.assertEqual(None, item.get_value('repository'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Unit tests of tools/xml_digest.py on small LITP exports
+'''
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from tools.xml_digest import compare_files, find_differences
+
+EXPORT = """<?xml version='1.0' encoding='utf-8'?>
+<litp:root xmlns:litp="http://www.ericsson.com/litp" id="root">
+  <litp:root-deployments-collection id="deployments">
+    <litp:deployment id="d1">
+      <litp:deployment-clusters-collection id="clusters">
+        <litp:cluster id="c1">
+          <ha_mode>{ha_mode}</ha_mode>
+          <litp:cluster-nodes-collection id="nodes">
+            {nodes}
+          </litp:cluster-nodes-collection>
+        </litp:cluster>
+      </litp:deployment-clusters-collection>
+    </litp:deployment>
+  </litp:root-deployments-collection>
+</litp:root>
+"""
+NODE = '<litp:node id="{0}"><hostname>{1}</hostname></litp:node>'
+CLUSTER = '/root/deployments/d1/clusters/c1'
+
+
+def make_export(ha_mode='standby', nodes=(('n1', 'node1'),
+                                          ('n2', 'node2'))):
+    """ Export of a cluster with nodes, as (id, hostname) """
+    return EXPORT.format(ha_mode=ha_mode, nodes='\n'.join(
+        NODE.format(*node) for node in nodes))
+
+
+class TestDifferences(unittest.TestCase):
+    """ Items that differ between two exports """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, name, content):
+        """ Write an export and return its path """
+        path = os.path.join(self.directory, name)
+        with open(path, 'w') as export:
+            export.write(content)
+        return path
+
+    def compare(self, first, second, max_diffs=20):
+        """ compare_files on two exports """
+        return compare_files(self.write('first.xml', first),
+                             self.write('second.xml', second), max_diffs)
+
+    def test_equal(self):
+        """ Item order does not matter """
+        result = self.compare(make_export(), make_export(
+            nodes=(('n2', 'node2'), ('n1', 'node1'))))
+        self.assertTrue(result['equal'])
+        self.assertEqual([], result['differences'])
+        self.assertEqual([5, 5], result['items'])
+
+    def test_parent_and_child(self):
+        """ A parent differing itself is named with its differing child """
+        result = self.compare(make_export(), make_export(
+            ha_mode='failover', nodes=(('n1', 'node1'), ('n2', 'other'))))
+        self.assertFalse(result['equal'])
+        self.assertEqual([CLUSTER, CLUSTER + '/nodes/n2'],
+                         result['differences'])
+
+    def test_child_only(self):
+        """ A parent differing through a child only is not named """
+        result = self.compare(make_export(), make_export(
+            nodes=(('n1', 'node1'), ('n2', 'other'))))
+        self.assertEqual([CLUSTER + '/nodes/n2'], result['differences'])
+
+    def test_one_sided(self):
+        """ Items in one file only are named, not gone into """
+        result = self.compare(make_export(), make_export(
+            nodes=(('n1', 'node1'), ('n2', 'node2'), ('n3', 'node3'))))
+        self.assertEqual([CLUSTER + '/nodes/n3'], result['differences'])
+
+    def test_max_diffs(self):
+        """ No more paths than asked for """
+        first = self.write('first.xml', make_export())
+        second = self.write('second.xml', make_export(
+            ha_mode='failover', nodes=(('n1', 'a'), ('n2', 'b'))))
+        self.assertEqual([CLUSTER], find_differences(first, second, 1))
+
+    def test_top(self):
+        """ A top without an id is named / """
+        first = self.write('first.xml', '<a><b>1</b><c id="x">2</c></a>')
+        second = self.write('second.xml', '<a><b>2</b><c id="x">2</c></a>')
+        self.assertEqual(['/'], find_differences(first, second))
+
+
+if __name__ == '__main__':
+    unittest.main()
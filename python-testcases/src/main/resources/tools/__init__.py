@@ -0,0 +1,3 @@
+"""
+Python init file.
+"""
@@ -0,0 +1,373 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Plumbing shared by the litp benchmarks in tools/: the system
+            they run against, latency statistics, scaling curve fits and
+            the JSON result files compared across CLI releases.
+
+            A benchmark runs against an MS given with --ms-ip, where the
+            litp commands are run over SSH and the model is populated with
+            'litp load', or, without --ms-ip, against a fake litpd (see
+            cli/fake_litpd.py) started in process, where each command is
+            replaced by the REST requests it makes.
+'''
+
+import json
+import math
+import platform
+import sys
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from cli.fake_litpd import FakeLitpd, FakeLitpModel, LitpError, \
+    build_default_model
+from cli.model_fixture import FixtureItem, ModelFixture, get_load_cmd
+from cli.rest_client import LITP_REST_PASSWORD, LITP_REST_PORT, \
+    LITP_REST_USER, LitpRestClient
+from cli.session_pool import SessionPool
+from tools.cmd_report import percentile
+
+MS_NODE = 'ms1'
+LITP_CMD = '/usr/bin/litp'
+TIME_CMD = '/usr/bin/time'
+MAXRSS_MARKER = '@@maxrss'
+# items per 'litp load' command line, which must stay well below ARG_MAX
+LOAD_CHUNK_ITEMS = 1000
+
+
+def summarise_secs(secs):
+    """
+    Description:
+        Latency statistics of a list of timings
+    Args:
+        secs (list): Durations in seconds
+    Returns:
+        dict. count, mean, min, p50, p95, p99 and max seconds
+    """
+    values = sorted(secs)
+    if not values:
+        return {'count': 0}
+    return {'count': len(values),
+            'mean': sum(values) / float(len(values)),
+            'min': values[0],
+            'p50': percentile(values, 0.5),
+            'p95': percentile(values, 0.95),
+            'p99': percentile(values, 0.99),
+            'max': values[-1]}
+
+
+def fit_power_law(points):
+    """
+    Description:
+        Least squares fit of y = a * x ** b on a log-log scale
+    Args:
+        points (list): (x, y) pairs, pairs with x or y <= 0 are ignored
+    Returns:
+        dict. a, b (the scaling exponent: 1 is linear) and r2, None with
+              fewer than two usable points
+    """
+    logs = [(math.log(x), math.log(y)) for x, y in points if x > 0 and y > 0]
+    if len(logs) < 2:
+        return None
+    count = float(len(logs))
+    mean_x = sum(x for x, _ in logs) / count
+    mean_y = sum(y for _, y in logs) / count
+    sxx = sum((x - mean_x) ** 2 for x, _ in logs)
+    if sxx == 0:
+        return None
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in logs)
+    slope = sxy / sxx
+    intercept = mean_y - slope * mean_x
+    ss_tot = sum((y - mean_y) ** 2 for _, y in logs)
+    ss_res = sum((y - intercept - slope * x) ** 2 for x, y in logs)
+    return {'a': math.exp(intercept), 'b': slope,
+            'r2': 1.0 - ss_res / ss_tot if ss_tot else 1.0}
+
+
+def get_max_rss_kb():
+    """ Peak resident memory of this process in KB, None if unknown """
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+class LocalTarget(object):
+    """
+    Fake litpd served from this process. The model is populated directly
+    and commands are made over REST.
+    """
+
+    kind = 'local'
+
+    def __init__(self, nodes=2):
+        model = FakeLitpModel(task_secs=0)
+        build_default_model(model, nodes)
+        self.model = model
+        self.server = FakeLitpd(0, model).start()
+        # how to reach the REST API, for clients of the benchmark's own
+        self.rest_args = {'host': '127.0.0.1', 'port': self.server.port,
+                          'secure': False}
+        self.rest = LitpRestClient(**self.rest_args)
+
+    def describe(self):
+        """ What the results were measured against """
+        return {'kind': self.kind, 'litpd': 'fake_litpd'}
+
+    def load_fixture(self, fixture):
+        """
+        Description:
+            Create the items of a ModelFixture, owners first
+        Args:
+            fixture (ModelFixture): Items to create
+        """
+        items = sorted(fixture.items, key=lambda item: item.path.count('/'))
+        for item in items:
+            parent = item.collection_path
+            props = dict(item.properties)
+            if item.source_path is not None:
+                self.model.inherit(parent, item.item_id, item.source_path,
+                                   props)
+            else:
+                self.model.create(parent, item.item_id, item.item_type,
+                                  props)
+
+    def remove(self, path):
+        """
+        Drop an item with everything under it, whatever its state; an
+        item that is already gone is ignored
+        """
+        with self.model.changed:
+            try:
+                item = self.model.get(path)
+            except LitpError:
+                return
+            for descendant in item.walk():
+                descendant.applied = None
+            self.model.remove(path)
+
+    def apply_model(self):
+        """
+        Make every item Applied, as if a plan had run, so that removes
+        mark items ForRemoval instead of dropping them
+        """
+        with self.model.changed:
+            for item in self.model.root.walk():
+                item.applied = item.properties()
+                item.for_removal = False
+
+    def close(self):
+        """ Stop the fake litpd """
+        self.rest.close()
+        self.server.stop()
+
+
+class MsTarget(object):
+    """
+    Deployed MS. litp commands are run over a pooled SSH session as the
+    given user, who also authenticates the REST requests.
+    """
+
+    kind = 'ms'
+
+    def __init__(self, host, username=LITP_REST_USER,
+                 password=LITP_REST_PASSWORD):
+        self.host = host
+        self.pool = SessionPool()
+        self.pool.register(MS_NODE, host, username, password)
+        self.rest_args = {'host': host, 'port': LITP_REST_PORT,
+                          'username': username, 'password': password}
+        self.rest = LitpRestClient(**self.rest_args)
+        _, _, returnc = self.execute('test -x {0}'.format(TIME_CMD))
+        self.has_time = returnc == 0
+
+    def open_client(self):
+        """ Another target on the same MS, with an SSH session of its own """
+        return MsTarget(self.host, self.rest_args['username'],
+                        self.rest_args['password'])
+
+    def describe(self):
+        """ What the results were measured against """
+        stdout, _, _ = self.execute('{0} version'.format(LITP_CMD))
+        return {'kind': self.kind, 'host': self.host,
+                'litp_version': ' '.join(stdout).strip()}
+
+    def execute(self, cmd):
+        """ Run a command on the MS """
+        return self.pool.execute(MS_NODE, cmd)
+
+    def run_litp(self, args):
+        """
+        Description:
+            Run and time a litp command, with the peak memory of the CLI
+            process when /usr/bin/time is available on the MS
+        Args:
+            args (str): Arguments of litp, e.g. 'show -p / -r'
+        Returns:
+            dict. secs, rc, bytes of output, max_rss_kb (or None) and
+                  stderr lines
+        """
+        cmd = '{0} {1}'.format(LITP_CMD, args)
+        if self.has_time:
+            cmd = "{0} -f '{1} %M' {2}".format(TIME_CMD, MAXRSS_MARKER, cmd)
+        start = time.time()
+        stdout, stderr, returnc = self.execute(cmd)
+        secs = time.time() - start
+        max_rss = None
+        errors = []
+        for line in stderr:
+            if line.startswith(MAXRSS_MARKER):
+                max_rss = int(line.split()[1])
+            else:
+                errors.append(line)
+        return {'secs': secs, 'rc': returnc,
+                'bytes': sum(len(line) + 1 for line in stdout),
+                'max_rss_kb': max_rss, 'stderr': errors}
+
+    def load_fixture(self, fixture):
+        """
+        Description:
+            Create the items of a ModelFixture with 'litp load', in chunks
+            of whole root items
+        Args:
+            fixture (ModelFixture): Items to create
+        """
+        types = {}
+        for path in fixture.get_unknown_types():
+            stdout, _, _ = self.execute('{0} show -p {1} -o type'.format(
+                LITP_CMD, path))
+            types[path] = stdout[0].strip() if stdout else None
+        for documents in chunk_documents(fixture, types):
+            stdout, stderr, returnc = self.execute(
+                get_load_cmd(documents, LITP_CMD))
+            if returnc != 0:
+                raise RuntimeError('litp load failed: {0}'.format(
+                    '\n'.join(stdout + stderr)))
+
+    def remove(self, path):
+        """ Remove an item with everything under it """
+        self.execute('{0} remove -p {1}'.format(LITP_CMD, path))
+
+    def close(self):
+        """ Close the SSH and REST connections """
+        self.rest.close()
+        self.pool.close()
+
+
+def wait_until(check, timeout_secs, interval_secs=0.05):
+    """
+    Description:
+        Call check until it returns true or the time runs out
+    Args:
+        check (callable): Returns true once the wait is over
+        timeout_secs (float): Longest wait
+        interval_secs (float): Pause between calls
+    Returns:
+        bool. True if check passed in time
+    """
+    deadline = time.time() + timeout_secs
+    while True:
+        if check():
+            return True
+        if time.time() >= deadline:
+            return False
+        time.sleep(interval_secs)
+
+
+def chunk_documents(fixture, types, chunk_items=LOAD_CHUNK_ITEMS):
+    """
+    Description:
+        Render a fixture as successive lists of documents of at most about
+        chunk_items items each, so that each list fits one command line.
+        A root item is never split from its descendants.
+    Args:
+        fixture (ModelFixture): Items to render
+        types (dict): Types ModelFixture.render needs
+        chunk_items (int): Items per chunk
+    Returns:
+        generator. Document lists for get_load_cmd
+    """
+    chunk = ModelFixture()
+    for root in fixture.roots:
+        family = list(walk_fixture_item(root))
+        if chunk.items and len(chunk.items) + len(family) > chunk_items:
+            yield chunk.render(types)
+            chunk = ModelFixture()
+        for item in family:
+            chunk.add(FixtureItem(item.path, item.item_type, item.properties,
+                                  item.source_path))
+    if chunk.items:
+        yield chunk.render(types)
+
+
+def walk_fixture_item(item):
+    """ A fixture item and the items nested in it, owners first """
+    yield item
+    for child in item.children:
+        for descendant in walk_fixture_item(child):
+            yield descendant
+
+
+def add_target_args(parser):
+    """
+    Add the options choosing the system a benchmark runs against
+    """
+    parser.add_argument('--ms-ip', help='MS to run against; a fake litpd '
+                        'is started in process when not given')
+    parser.add_argument('--user', default=LITP_REST_USER)
+    parser.add_argument('--password', default=LITP_REST_PASSWORD)
+    parser.add_argument('-o', '--output', help='JSON result file')
+
+
+def get_target(args):
+    """
+    Description:
+        Open the target chosen by the options of add_target_args
+    Args:
+        args (Namespace): Parsed options
+    Returns:
+        LocalTarget|MsTarget. The target
+    """
+    if args.ms_ip:
+        return MsTarget(args.ms_ip, args.user, args.password)
+    return LocalTarget()
+
+
+def write_results(path, benchmark, target, params, results, **extra):
+    """
+    Description:
+        Write the results of a benchmark run as JSON
+    Args:
+        path (str): Result file, stdout when None
+        benchmark (str): Name of the benchmark
+        target (dict): describe() of the target
+        params (dict): Parameters of the run
+        results (list): Result records
+        extra (dict): More top level entries, e.g. fits
+    Returns:
+        dict. What was written
+    """
+    data = {'benchmark': benchmark, 'target': target, 'params': params,
+            'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'results': results}
+    data.update(extra)
+    if path is None:
+        json.dump(data, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write('\n')
+    else:
+        with open(path, 'w') as output:
+            json.dump(data, output, indent=2, sort_keys=True)
+            output.write('\n')
+    return data
+
@@ -0,0 +1,269 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Builds the command latency report of a testset run from the
+            timing files written by the cli testsets (see cli/cmd_timing.py)
+            and, when given, the nose xunit report of the same run, which
+            supplies each test's own duration and outcome.
+
+            Writes a JSON report and an HTML page in which every test is a
+            bar split by the commands it spent its time on.
+
+            It is run by hand after a testset run; the TAF results only
+            hold the nose xunit report, which parseNosetestsReports reads
+            through a data provider outside this tree.
+
+            Usage, from the directory holding cli/:
+                python -m tools.cmd_report [--timing-dir cmd_timings]
+                                           [--xunit nosetests.xml]
+                                           [-o cmd_report]
+'''
+
+import argparse
+import glob
+import json
+import math
+import os
+import sys
+import xml.etree.ElementTree as ElementTree
+
+try:
+    from html import escape
+except ImportError:
+    from cgi import escape
+
+from cli.cmd_timing import DEFAULT_TIMING_DIR, get_test_key
+
+DEFAULT_OUTPUT = 'cmd_report'
+BAR_COLOURS = ('#4e79a7', '#f28e2b', '#e15759', '#76b7b2', '#59a14f',
+               '#edc948', '#b07aa1', '#ff9da7', '#9c755f', '#bab0ac')
+
+
+def load_timings(directory):
+    """
+    Description:
+        Read every timing file of a directory
+    Args:
+        directory (str): Directory the testsets wrote their timings to
+    Returns:
+        list. Timing records
+    """
+    records = []
+    for path in sorted(glob.glob(os.path.join(directory, '*.jsonl'))):
+        with open(path) as timings:
+            records.extend(json.loads(line) for line in timings
+                           if line.strip())
+    return records
+
+
+def load_xunit(path):
+    """
+    Description:
+        Read the duration and outcome of each test from a nose xunit report
+    Args:
+        path (str): xunit report
+    Returns:
+        dict. Test key to {'secs', 'result'}
+    """
+    tests = {}
+    for case in ElementTree.parse(path).getroot().iter('testcase'):
+        result = 'passed'
+        for outcome in ('failure', 'error', 'skipped'):
+            if case.find(outcome) is not None:
+                result = outcome
+        key = get_test_key('{0}.{1}'.format(case.get('classname', ''),
+                                            case.get('name', '')))
+        tests[key] = {'secs': float(case.get('time', 0)), 'result': result}
+    return tests
+
+
+def percentile(values, fraction):
+    """
+    Description:
+        Nearest rank percentile
+    Args:
+        values (list): Sorted values
+        fraction (float): e.g. 0.95
+    Returns:
+        float. The percentile, 0 for no values
+    """
+    if not values:
+        return 0.0
+    rank = max(0, int(math.ceil(fraction * len(values))) - 1)
+    return values[min(rank, len(values) - 1)]
+
+
+def summarise(records, key):
+    """
+    Description:
+        Aggregate timing records by one of their fields
+    Args:
+        records (list): Timing records
+        key (str): Field to group by, e.g. label or node
+    Returns:
+        list. Per group: name, count, total, p50, p95 and max seconds,
+              largest total first
+    """
+    groups = {}
+    for record in records:
+        groups.setdefault(record[key], []).append(record['secs'])
+    rows = []
+    for name, secs in groups.items():
+        secs.sort()
+        rows.append({'name': name, 'count': len(secs),
+                     'total': round(sum(secs), 3),
+                     'p50': percentile(secs, 0.5),
+                     'p95': percentile(secs, 0.95),
+                     'max': secs[-1]})
+    rows.sort(key=lambda row: -row['total'])
+    return rows
+
+
+def build_report(records, xunit=None):
+    """
+    Description:
+        Build the report
+    Args:
+        records (list): Timing records
+        xunit (dict): Test durations and outcomes from load_xunit
+    Returns:
+        dict. Report with totals, by_label, by_node and tests
+    """
+    xunit = xunit or {}
+    by_test = {}
+    for record in records:
+        by_test.setdefault(record['test'], []).append(record)
+    tests = []
+    for name in set(by_test) | set(xunit):
+        test_records = by_test.get(name, [])
+        cmd_secs = sum(record['secs'] for record in test_records)
+        info = xunit.get(name, {})
+        tests.append({'name': name,
+                      'secs': info.get('secs'),
+                      'result': info.get('result'),
+                      'cmd_secs': round(cmd_secs, 3),
+                      'calls': len(test_records),
+                      'by_label': summarise(test_records, 'label')})
+    tests.sort(key=lambda test: -max(test['secs'] or 0, test['cmd_secs']))
+    return {'totals': {'calls': len(records),
+                       'secs': round(sum(record['secs']
+                                         for record in records), 3),
+                       'tests': len(tests)},
+            'by_label': summarise(records, 'label'),
+            'by_node': summarise(records, 'node'),
+            'tests': tests}
+
+
+def _table(rows):
+    """
+    HTML table of summarise() rows
+    """
+    lines = ['<table><tr><th>name</th><th>count</th><th>total s</th>'
+             '<th>p50 s</th><th>p95 s</th><th>max s</th></tr>']
+    for row in rows:
+        lines.append('<tr><td>{0}</td><td>{1}</td><td>{2:.2f}</td>'
+                     '<td>{3:.3f}</td><td>{4:.3f}</td><td>{5:.3f}</td></tr>'
+                     .format(escape(str(row['name'])), row['count'],
+                             row['total'], row['p50'], row['p95'],
+                             row['max']))
+    lines.append('</table>')
+    return '\n'.join(lines)
+
+
+def render_html(report):
+    """
+    Description:
+        Render the report as a self contained HTML page
+    Args:
+        report (dict): Report from build_report
+    Returns:
+        str. The page
+    """
+    labels = [row['name'] for row in report['by_label']]
+    colours = dict((label, BAR_COLOURS[index % len(BAR_COLOURS)])
+                   for index, label in enumerate(labels))
+    longest = max([max(test['secs'] or 0, test['cmd_secs'])
+                   for test in report['tests']] or [1]) or 1
+    bars = []
+    for test in report['tests']:
+        total = max(test['secs'] or 0, test['cmd_secs'])
+        segments = []
+        for row in test['by_label']:
+            segments.append(
+                '<span style="width:{0:.2f}%;background:{1}" '
+                'title="{2}: {3} calls, {4:.2f}s"></span>'.format(
+                    100.0 * row['total'] / longest, colours[row['name']],
+                    escape(row['name']), row['count'], row['total']))
+        other = total - test['cmd_secs']
+        if other > 0:
+            segments.append(
+                '<span style="width:{0:.2f}%;background:#ddd" '
+                'title="outside commands: {1:.2f}s"></span>'.format(
+                    100.0 * other / longest, other))
+        bars.append('<div class="test"><div class="name">{0} '
+                    '<small>{1:.1f}s {2}</small></div>'
+                    '<div class="bar">{3}</div></div>'.format(
+                        escape(test['name']), total,
+                        escape(test['result'] or ''), ''.join(segments)))
+    legend = ''.join('<span class="key"><span style="background:{0}">'
+                     '</span>{1}</span>'.format(colours[label], escape(label))
+                     for label in labels)
+    totals = report['totals']
+    return '''<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>cli command timings</title>
+<style>
+body {{ font-family: sans-serif; font-size: 13px; }}
+.test {{ margin: 2px 0; }}
+.name {{ white-space: nowrap; }}
+.bar {{ display: flex; height: 14px; }}
+.bar span {{ display: block; height: 14px; }}
+.key {{ margin-right: 12px; }}
+.key span {{ display: inline-block; width: 10px; height: 10px;
+             margin-right: 3px; }}
+table {{ border-collapse: collapse; margin-bottom: 16px; }}
+td, th {{ border: 1px solid #ccc; padding: 2px 6px; text-align: right; }}
+td:first-child {{ text-align: left; }}
+</style></head><body>
+<h1>cli command timings</h1>
+<p>{calls} calls taking {secs:.1f}s over {tests} tests</p>
+<h2>By command</h2>{by_label}
+<h2>By node</h2>{by_node}
+<h2>By test</h2><p>{legend}</p>{bars}
+</body></html>
+'''.format(calls=totals['calls'], secs=totals['secs'], tests=totals['tests'],
+           by_label=_table(report['by_label']),
+           by_node=_table(report['by_node']), legend=legend,
+           bars='\n'.join(bars))
+
+
+def main(argv=None):
+    """
+    Build the JSON and HTML reports
+    """
+    parser = argparse.ArgumentParser(description='cli command timing report')
+    parser.add_argument('--timing-dir', default=DEFAULT_TIMING_DIR)
+    parser.add_argument('--xunit', help='nose xunit report of the same run')
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT,
+                        help='Report path without extension')
+    args = parser.parse_args(argv)
+    records = load_timings(args.timing_dir)
+    xunit = load_xunit(args.xunit) if args.xunit else None
+    report = build_report(records, xunit)
+    with open(args.output + '.json', 'w') as output:
+        json.dump(report, output, indent=2, sort_keys=True)
+    with open(args.output + '.html', 'w') as output:
+        output.write(render_html(report))
+    sys.stdout.write('{0} calls, {1:.1f}s: {2}.json, {2}.html\n'.format(
+        report['totals']['calls'], report['totals']['secs'], args.output))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,224 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Local SQLite history of how long each cli test took and how it
+            ended, fed from the nose xunit reports that
+            parseNosetestsReports reads. tools/parallel_runner.py uses it
+            to run the longest work first, to estimate the run time up
+            front and to warn about tests that got slower than their
+            rolling median.
+
+            Usage, from the directory holding cli/:
+                python -m tools.duration_history record nosetests.xml
+                                                 [--history FILE]
+                python -m tools.duration_history show [--history FILE]
+'''
+
+import argparse
+import os
+import sqlite3
+import sys
+import time
+
+from tools.cmd_report import load_xunit
+
+DEFAULT_HISTORY = 'test_durations.sqlite'
+HISTORY_ENV = 'LITP_TEST_HISTORY'
+# runs the rolling median of a test is taken over
+DEFAULT_WINDOW = 5
+DEFAULT_REGRESSION_FACTOR = 2.0
+# predicted duration of a test with no history
+DEFAULT_TEST_SECS = 60.0
+PASSED = 'passed'
+
+SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS runs (id INTEGER PRIMARY KEY, '
+    'started REAL NOT NULL, source TEXT)',
+    'CREATE TABLE IF NOT EXISTS results (run INTEGER NOT NULL, '
+    'test TEXT NOT NULL, secs REAL NOT NULL, outcome TEXT NOT NULL)',
+    'CREATE INDEX IF NOT EXISTS results_test ON results (test, run)',
+)
+
+
+def median(values):
+    """ Median of a list of numbers, None for none """
+    values = sorted(values)
+    if not values:
+        return None
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2.0
+
+
+def get_history_path(path=None):
+    """ History file to use: the one given, LITP_TEST_HISTORY, default """
+    return path or os.environ.get(HISTORY_ENV, DEFAULT_HISTORY)
+
+
+class DurationHistory(object):
+    """
+    Durations and outcomes of the tests of past runs, keyed the way
+    cmd_timing keys tests ('Story4026.test_14_p_...')
+    """
+
+    def __init__(self, path=None):
+        self.path = get_history_path(path)
+        self.conn = sqlite3.connect(self.path)
+        for statement in SCHEMA:
+            self.conn.execute(statement)
+        self.conn.commit()
+
+    def record(self, results, source=None, started=None):
+        """
+        Description:
+            Store the results of a run
+        Args:
+            results (dict): Test key to {'secs', 'result'}, as from
+                            cmd_report.load_xunit
+            source (str): Where the results came from, e.g. a report path
+            started (float): When the run started, now by default
+        Returns:
+            int. Id of the run
+        """
+        cursor = self.conn.execute(
+            'INSERT INTO runs (started, source) VALUES (?, ?)',
+            (started or time.time(), source))
+        run = cursor.lastrowid
+        self.conn.executemany(
+            'INSERT INTO results (run, test, secs, outcome) '
+            'VALUES (?, ?, ?, ?)',
+            [(run, test, result['secs'], result['result'])
+             for test, result in results.items()])
+        self.conn.commit()
+        return run
+
+    def record_xunit(self, path):
+        """ Store the results of a nose xunit report, returns the run id """
+        return self.record(load_xunit(path), source=path)
+
+    def get_medians(self, window=DEFAULT_WINDOW, before=None):
+        """
+        Description:
+            Rolling median duration of every test over its last passed runs
+        Args:
+            window (int): Number of runs
+            before (int): Only runs older than this run id
+        Returns:
+            dict. Test key to median seconds
+        """
+        query = 'SELECT test, secs FROM results WHERE outcome = ?'
+        params = [PASSED]
+        if before is not None:
+            query += ' AND run < ?'
+            params.append(before)
+        durations = {}
+        for test, secs in self.conn.execute(query + ' ORDER BY run DESC',
+                                            params):
+            runs = durations.setdefault(test, [])
+            if len(runs) < window:
+                runs.append(secs)
+        return dict((test, median(runs)) for test, runs in durations.items())
+
+    def get_regressions(self, run, factor=DEFAULT_REGRESSION_FACTOR,
+                        window=DEFAULT_WINDOW):
+        """
+        Description:
+            Find the tests of a run that took longer than factor times
+            their rolling median over the runs before it
+        Args:
+            run (int): Run id
+            factor (float): Slowdown that counts as a regression
+            window (int): Runs the median is taken over
+        Returns:
+            list. (test, secs, median) of each regression, worst first
+        """
+        medians = self.get_medians(window, before=run)
+        regressions = []
+        for test, secs in self.conn.execute(
+                'SELECT test, secs FROM results WHERE run = ? AND '
+                'outcome = ?', (run, PASSED)):
+            old = medians.get(test)
+            if old and secs > factor * old:
+                regressions.append((test, secs, old))
+        regressions.sort(key=lambda row: -row[1] / row[2])
+        return regressions
+
+    def close(self):
+        """ Close the database """
+        self.conn.close()
+
+
+def predict_secs(test_keys, medians, default=DEFAULT_TEST_SECS):
+    """
+    Description:
+        Predicted duration of some tests run one after the other
+    Args:
+        test_keys (list): Test keys
+        medians (dict): From DurationHistory.get_medians
+        default (float): Duration of a test with no history
+    Returns:
+        float. Seconds
+    """
+    return sum(medians.get(key, default) for key in test_keys)
+
+
+def estimate_makespan(durations, workers):
+    """
+    Description:
+        Wall clock time of running independent pieces of work on workers,
+        each taking the next piece in the order given when it is free
+    Args:
+        durations (list): Seconds of each piece, in the order taken
+        workers (int): Number of workers
+    Returns:
+        float. Seconds until the last piece is done
+    """
+    finish = [0.0] * max(1, workers)
+    for secs in durations:
+        earliest = finish.index(min(finish))
+        finish[earliest] += secs
+    return max(finish)
+
+
+def main(argv=None):
+    """
+    Record a report in the history or show what it holds
+    """
+    parser = argparse.ArgumentParser(description='cli test duration history')
+    parser.add_argument('command', choices=('record', 'show'))
+    parser.add_argument('reports', nargs='*', help='xunit reports to record')
+    parser.add_argument('--history', help='SQLite file, default {0} or '
+                        '${1}'.format(DEFAULT_HISTORY, HISTORY_ENV))
+    parser.add_argument('--window', type=int, default=DEFAULT_WINDOW)
+    parser.add_argument('--factor', type=float,
+                        default=DEFAULT_REGRESSION_FACTOR)
+    args = parser.parse_args(argv)
+    history = DurationHistory(args.history)
+    try:
+        if args.command == 'record':
+            for report in args.reports:
+                run = history.record_xunit(report)
+                for test, secs, old in history.get_regressions(
+                        run, args.factor, args.window):
+                    sys.stdout.write('{0}: {1:.1f}s, median {2:.1f}s\n'
+                                     .format(test, secs, old))
+        else:
+            medians = history.get_medians(args.window)
+            for test in sorted(medians, key=lambda key: -medians[key]):
+                sys.stdout.write('{0:10.1f}s  {1}\n'.format(medians[test],
+                                                            test))
+    finally:
+        history.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,276 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Export and import throughput benchmark. For each size it
+            loads a synthetic deployment of N nodes, each inheriting a
+            package-list of P packages, then times 'litp export' of the
+            deployment and 'litp load --replace' of that export
+            separately, with the size of the XML, the peak memory of the
+            client and the items per second. The deployment is exported
+            again after the load and both exports are compared on the MS
+            by tools/xml_digest.py, which streams them, to check that the
+            round trip kept the model as it was.
+
+            The fake litpd has no XML interface, so it runs against a
+            deployed MS only.
+
+            Usage, from the directory holding cli/:
+                python -m tools.export_bench --ms-ip IP [-o export.json]
+                                             [--sizes 10,100,1000]
+                                             [--packages 10] [--repeat 3]
+'''
+
+import argparse
+import base64
+import json
+import os
+import sys
+
+from cli.model_fixture import ModelFixture
+from tools.bench import LITP_CMD, add_target_args, fit_power_law, \
+    get_target, summarise_secs, write_results
+
+DEFAULT_SIZES = (10, 100, 1000)
+DEFAULT_PACKAGES = 10
+DEFAULT_REPEAT = 3
+BENCH_ID = 'export_bench'
+BENCH_OWNER = '/deployments'
+BENCH_ROOT = '{0}/{1}'.format(BENCH_OWNER, BENCH_ID)
+SOURCE_PATH = '/software/items/{0}'.format(BENCH_ID)
+DIGEST_SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             'xml_digest.py')
+EXPORT = 'export'
+LOAD = 'load_replace'
+ROUND_TRIP = 'round_trip'
+OPERATIONS = (EXPORT, LOAD)
+
+
+def build_model(nodes, packages):
+    """
+    Description:
+        Describe the synthetic deployment
+    Args:
+        nodes (int): Nodes in the cluster of the deployment
+        packages (int): Packages of the package-list each node inherits
+    Returns:
+        ModelFixture, ModelFixture. The package-list and the deployment
+    """
+    source = ModelFixture()
+    source.create(SOURCE_PATH, 'package-list', [('name', BENCH_ID)])
+    for num in range(1, packages + 1):
+        source.create('{0}/packages/pkg{1}'.format(SOURCE_PATH, num),
+                      'package', [('name', 'pkg{0}'.format(num)),
+                                  ('version', '1.0.{0}'.format(num))])
+    deployment = ModelFixture()
+    deployment.create(BENCH_ROOT, 'deployment')
+    deployment.create(BENCH_ROOT + '/clusters/c1', 'cluster')
+    for num in range(1, nodes + 1):
+        node = '{0}/clusters/c1/nodes/n{1}'.format(BENCH_ROOT, num)
+        deployment.create(node, 'node', hostname='export{0}'.format(num))
+        deployment.inherit('{0}/items/{1}'.format(node, BENCH_ID),
+                           SOURCE_PATH, item_type='package-list')
+    return source, deployment
+
+
+class ExportWorkspace(object):
+    """
+    Temporary directory of the MS holding the exports and a copy of
+    xml_digest.py, run with the interpreter the litp script names
+    """
+
+    def __init__(self, target):
+        self.target = target
+        with open(DIGEST_SOURCE, 'rb') as source:
+            encoded = base64.b64encode(source.read()).decode('ascii')
+        stdout, stderr, returnc = target.execute(
+            'd=$(mktemp -d) && echo {0} | base64 -d >"$d/xml_digest.py" && '
+            'echo "$d"'.format(encoded))
+        if returnc != 0 or not stdout:
+            raise RuntimeError('cannot copy xml_digest.py: {0}'.format(
+                '\n'.join(stderr)))
+        self.directory = stdout[-1].strip()
+        stdout, _, _ = target.execute(
+            "sed -n '1s/^#! *//p' {0}".format(LITP_CMD))
+        self.python = stdout[0].strip() if stdout else 'python'
+
+    def get_path(self, name):
+        """ Path of a file of the workspace """
+        return '{0}/{1}'.format(self.directory, name)
+
+    def export(self, name):
+        """
+        Description:
+            Time the export of the deployment to a file
+        Args:
+            name (str): File name in the workspace
+        Returns:
+            dict. As from MsTarget.run_litp, with the bytes of the file
+        """
+        result = self.target.run_litp('export -p {0} -f {1}'.format(
+            BENCH_ROOT, self.get_path(name)))
+        stdout, _, _ = self.target.execute('stat -c %s {0}'.format(
+            self.get_path(name)))
+        result['bytes'] = int(stdout[0]) if stdout and \
+            stdout[0].strip().isdigit() else None
+        return result
+
+    def load_replace(self, name):
+        """ Time the load of an export over the deployment, as run_litp """
+        return self.target.run_litp('load -p {0} -f {1} --replace'.format(
+            BENCH_OWNER, self.get_path(name)))
+
+    def compare(self, first, second, max_diffs):
+        """
+        Description:
+            Compare two exports of the workspace with xml_digest.py
+        Returns:
+            dict. What xml_digest.compare_files found, None if it failed
+        """
+        stdout, _, _ = self.target.execute('{0} {1} {2} {3} {4}'.format(
+            self.python, self.get_path('xml_digest.py'), self.get_path(first),
+            self.get_path(second), max_diffs))
+        try:
+            return json.loads('\n'.join(stdout))
+        except ValueError:
+            return None
+
+    def remove(self, *names):
+        """ Remove files of the workspace """
+        self.target.execute('rm -f {0}'.format(
+            ' '.join(self.get_path(name) for name in names)))
+
+    def close(self):
+        """ Remove the workspace from the MS """
+        self.target.execute('rm -rf {0}'.format(self.directory))
+
+
+def run_round(target, workspace, nodes, packages, max_diffs):
+    """
+    Description:
+        Set up the deployment, export it, load the export over it, export
+        it again and compare both exports, then remove it
+    Returns:
+        dict. export and load_replace as from run_litp, fidelity as from
+              ExportWorkspace.compare
+    """
+    source, deployment = build_model(nodes, packages)
+    target.load_fixture(source)
+    target.load_fixture(deployment)
+    try:
+        results = {EXPORT: workspace.export('before.xml')}
+        results[LOAD] = workspace.load_replace('before.xml')
+        workspace.export('after.xml')
+        results['fidelity'] = workspace.compare('before.xml', 'after.xml',
+                                                max_diffs)
+    finally:
+        workspace.remove('before.xml', 'after.xml')
+        target.remove(BENCH_ROOT)
+        target.remove(SOURCE_PATH)
+    return results
+
+
+def summarise_rounds(nodes, packages, rounds):
+    """
+    Result records of the rounds of one size, one per operation, and
+    whether every round trip kept the model
+    """
+    checks = [result['fidelity'] for result in rounds]
+    items = max([check['items'][0] for check in checks if check] or [0])
+    records = []
+    for operation in OPERATIONS:
+        runs = [result[operation] for result in rounds]
+        latency = summarise_secs([run['secs'] for run in runs])
+        rss = [run['max_rss_kb'] for run in runs
+               if run['max_rss_kb'] is not None]
+        rate = items / latency['p50'] if latency.get('p50') else None
+        records.append({
+            'nodes': nodes, 'packages': packages, 'operation': operation,
+            'items': items, 'xml_bytes': rounds[0][EXPORT]['bytes'],
+            'latency': latency, 'items_per_sec': rate,
+            'max_rss_kb': max(rss) if rss else None,
+            'failures': len([run for run in runs if run['rc'] != 0])})
+    done = [check for check in checks if check is not None]
+    broken = [check for check in done if not check['equal']]
+    rss = [check['max_rss_kb'] for check in done if check['max_rss_kb']]
+    records.append({
+        'nodes': nodes, 'packages': packages, 'operation': ROUND_TRIP,
+        'items': items, 'equal': len(broken) == 0 and len(done) == len(checks),
+        'differences': broken[0]['differences'] if broken else [],
+        'compare_secs': summarise_secs([check['secs'] for check in done]),
+        'compare_max_rss_kb': max(rss) if rss else None})
+    return records
+
+
+def fit_results(results):
+    """ Fit the latency of each operation against the items exported """
+    fits = {}
+    for operation in OPERATIONS:
+        fits[operation] = fit_power_law([
+            (record['items'], record['latency'].get('p50', 0))
+            for record in results if record['operation'] == operation])
+    return fits
+
+
+def main(argv=None):
+    """
+    Run the benchmark
+    """
+    parser = argparse.ArgumentParser(description='litp export and load '
+                                     '--replace throughput')
+    add_target_args(parser)
+    parser.add_argument('--sizes', default=','.join(
+        str(size) for size in DEFAULT_SIZES), help='Nodes per deployment')
+    parser.add_argument('--packages', type=int, default=DEFAULT_PACKAGES,
+                        help='Packages inherited by each node')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT)
+    parser.add_argument('--max-diffs', type=int, default=20,
+                        help='Differing items reported per round trip')
+    args = parser.parse_args(argv)
+    if not args.ms_ip:
+        parser.error('export and load need a deployed MS (--ms-ip)')
+    sizes = [int(size) for size in args.sizes.split(',') if size]
+    target = get_target(args)
+    results = []
+    workspace = None
+    try:
+        described = target.describe()
+        workspace = ExportWorkspace(target)
+        for nodes in sizes:
+            rounds = [run_round(target, workspace, nodes, args.packages,
+                                args.max_diffs)
+                      for _ in range(args.repeat)]
+            records = summarise_rounds(nodes, args.packages, rounds)
+            results.extend(records)
+            for record in records:
+                if record['operation'] == ROUND_TRIP:
+                    sys.stderr.write('{0} nodes: round trip {1}\n'.format(
+                        nodes, 'kept the model' if record['equal']
+                        else 'changed {0}'.format(record['differences'])))
+                    continue
+                sys.stderr.write(
+                    '{0} nodes {1}: p50 {2:.3f}s, {3} bytes, {4} items/s, '
+                    'max rss {5} KB\n'.format(
+                        nodes, record['operation'],
+                        record['latency'].get('p50', 0), record['xml_bytes'],
+                        int(record['items_per_sec'] or 0),
+                        record['max_rss_kb']))
+    finally:
+        if workspace is not None:
+            workspace.close()
+        target.close()
+    params = {'sizes': sizes, 'packages': args.packages,
+              'repeat': args.repeat}
+    write_results(args.output, 'export_load', described, params, results,
+                  fits=fit_results(results))
+    return 0 if all(record.get('equal', True) for record in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,531 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Test impact analysis for an ERIClitpcli upgrade. Selects the
+            cli tests that exercise what changed between the installed and
+            the new rpm, instead of rerunning every testset.
+
+            Each test is mapped to the features it exercises, found in its
+            source (and the helpers of its class it calls) without
+            importing it, and optionally in a command transcript recorded
+            by a previous run (the cmd_timings of cli/cmd_timing.py):
+                action:<action>          e.g. action:create_plan
+                option:<action> <opt>    e.g. option:show -j
+                type:<item type>         e.g. type:package-list
+                help:<action>            help of an action, help: of litp
+
+            The files of the two rpms are compared by digest, and every
+            changed module is mapped to feature patterns (IMPACT_RULES):
+            argument parsing to the help tests, plan modules to the plan
+            actions, a module named after an action to that action. A
+            changed module no rule knows about selects every test.
+
+            The old and new side are each an rpm file (read with
+            'rpm -qp --dump'), a saved 'rpm -q --dump' listing or an
+            unpacked directory; with --ms-ip the old side is the package
+            installed on the MS. A directory compared with an rpm is
+            taken to be unpacked at the install directory of its files.
+            The selected tests are written for
+            'tools.parallel_runner --select'; the scan is run by hand
+            before a run, not by the KGB suite, which runs every test.
+
+            Usage, from the directory holding cli/:
+                python -m tools.impact_scan --new ERIClitpcli.rpm
+                    [--old OLD | --ms-ip IP] [--changed FILE ...]
+                    [--transcript cmd_timings] [-o impact.json]
+                    [--select-file selected.txt]
+'''
+
+import argparse
+import ast
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+
+from cli.cmd_timing import get_test_key
+from cli.help_snapshot import HELP_ACTIONS
+from cli.rest_client import LITP_REST_PASSWORD, LITP_REST_USER
+from tools import suite_scan
+from tools.bench import MsTarget
+from tools.cmd_report import load_timings
+from tools.startup_bench import PACKAGE_DETAILS, read_package_details
+
+ACTIONS = tuple(action for action in HELP_ACTIONS if action)
+# calls of CliGenericTest and GenericTest that run litp commands
+ACTION_CALLS = {
+    'create_run_and_wait_for_plan': ('create_plan', 'run_plan',
+                                     'show_plan'),
+    'run_and_check_plan': ('create_plan', 'run_plan', 'show_plan'),
+    'wait_for_plan_state': ('show_plan',),
+    'load_fixture': ('load',),
+    'find': ('show',),
+    'execute_show_data_cmd': ('show',),
+    'get_props_from_url': ('show',),
+    'get_show_items': ('show',),
+}
+HELP_CALLS = frozenset(['get_help', 'get_help_section',
+                        'assert_help_matches_golden', 'get_help_cmd'])
+# calls creating an item, and the position of its type among their args
+TYPE_ARGS = {'execute_cli_create_cmd': 2, 'get_create_cmd': 1,
+             'create': 1, 'find': 2}
+CMD_CALL_RE = re.compile(r'^(?:execute_cli_|get_)(\w+?)_cmd$')
+# a command line, not a message mentioning one: 'litp show -p /'
+LITP_CMD_RE = re.compile(r'^\s*(?:\S*/)?litp ([a-z_]+)(?= -|\s*$)')
+ALL = '*'
+
+# changed file -> feature patterns, first match wins; see get_impacts
+IMPACT_RULES = (
+    (r'\.py[co]$', ()),
+    (r'(^|/)bin/', (ALL,)),
+    (r'(argparse|parser|help|usage|formatter)[^/]*\.py$', ('help:*',)),
+    (r'plan[^/]*\.py$', ('action:*plan*', 'help:*plan*')),
+    (r'snapshot[^/]*\.py$', ('action:*snapshot*', 'help:*snapshot*')),
+    (r'restore[^/]*\.py$', ('action:*restore*', 'help:*restore*')),
+)
+PY_FILE = '.py'
+
+
+def _get_str(node, constants):
+    """ Value of a string literal, or of a name bound to one, else None """
+    if isinstance(node, ast.Name):
+        return constants.get(node.id)
+    if type(node).__name__ in ('Str', 'Constant'):
+        value = getattr(node, 's', getattr(node, 'value', None))
+        if isinstance(value, (type(''), type(u''))):
+            return value
+    return None
+
+
+def get_constants(tree):
+    """
+    Description:
+        Module level names bound to string literals, e.g. VERSION_OPT
+    Args:
+        tree (ast.Module): Parsed testset
+    Returns:
+        dict. Name to string
+    """
+    constants = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            value = _get_str(node.value, constants)
+            if value is not None:
+                for target in node.targets:
+                    if isinstance(target, ast.Name):
+                        constants[target.id] = value
+    return constants
+
+
+def get_call_action(name):
+    """
+    Description:
+        litp action run by a command helper, e.g. create_plan for
+        execute_cli_createplan_cmd or show for get_show_data_value_cmd
+    Args:
+        name (str): Name of the called function
+    Returns:
+        str. The action, None if the call is no command helper
+    """
+    match = CMD_CALL_RE.match(name)
+    if not match:
+        return None
+    key = match.group(1).replace('_', '')
+    found = [action for action in ACTIONS
+             if key.startswith(action.replace('_', ''))]
+    return max(found, key=len) if found else None
+
+
+def _get_options(action, values):
+    """ option features of the strings given to a command """
+    features = set()
+    for value in values:
+        for token in value.split():
+            if token.startswith('-') and len(token) > 1:
+                features.add('option:{0} {1}'.format(action,
+                                                     token.split('=')[0]))
+    return features
+
+
+def _call_features(call, constants):
+    """
+    Features of one call; the litp command lines built from litp_path are
+    handled by _list_features
+    """
+    name = getattr(call.func, 'attr', getattr(call.func, 'id', None))
+    if name is None:
+        return set()
+    args = [_get_str(arg, constants) for arg in call.args]
+    values = [value for value in args if value is not None]
+    values.extend(value for value in
+                  (_get_str(keyword.value, constants)
+                   for keyword in call.keywords)
+                  if value is not None)
+    features = set()
+    if name in HELP_CALLS:
+        actions = [value for value in values if value in ACTIONS]
+        features.add('help:{0}'.format(actions[0] if actions else ''))
+        return features
+    action = get_call_action(name)
+    if action is not None:
+        features.add('action:{0}'.format(action))
+        features.update(_get_options(action, values))
+    for action in ACTION_CALLS.get(name, ()):
+        features.add('action:{0}'.format(action))
+    position = TYPE_ARGS.get(name)
+    if position is not None and len(args) > position \
+            and args[position] and '/' not in args[position]:
+        features.add('type:{0}'.format(args[position]))
+    return features
+
+
+def _list_features(node, constants):
+    """ Features of a [litp_path, action, args...] list or tuple """
+    elements = node.elts
+    for index, element in enumerate(elements):
+        if getattr(element, 'attr', None) == 'litp_path':
+            values = [_get_str(other, constants)
+                      for other in elements[index + 1:]]
+            values = [value for value in values if value is not None]
+            if not values or values[0] not in ACTIONS:
+                return set()
+            features = set(['action:{0}'.format(values[0])])
+            features.update(_get_options(values[0], values[1:]))
+            if any(value in ('-h', '--help') for value in values[1:]):
+                features.add('help:{0}'.format(values[0]))
+            return features
+    return set()
+
+
+def _direct_features(func, constants):
+    """
+    Features of a method from its own body, and the methods of self it
+    calls
+    """
+    features = set()
+    self_calls = set()
+    # the steps in the docstring name commands the test need not run
+    docstring = None
+    if func.body and isinstance(func.body[0], ast.Expr):
+        docstring = func.body[0].value
+    for node in ast.walk(func):
+        if node is docstring:
+            continue
+        if isinstance(node, ast.Call):
+            features.update(_call_features(node, constants))
+            owner = getattr(node.func, 'value', None)
+            if isinstance(owner, ast.Name) and owner.id == 'self':
+                self_calls.add(node.func.attr)
+        elif isinstance(node, (ast.List, ast.Tuple)):
+            features.update(_list_features(node, constants))
+        else:
+            value = _get_str(node, {})
+            if value is not None:
+                features.update('action:{0}'.format(action)
+                                for action in LITP_CMD_RE.findall(value)
+                                if action in ACTIONS)
+    return features, self_calls
+
+
+def scan_features(path):
+    """
+    Description:
+        Features exercised by every test method of a testset file,
+        including those of the helpers, setUp and tearDown of its class
+    Args:
+        path (str): Testset file
+    Returns:
+        dict. 'Class.test_name' to a set of features
+    """
+    with open(path) as source:
+        tree = ast.parse(source.read(), path)
+    constants = get_constants(tree)
+    tests = {}
+    for cls_node in tree.body:
+        if not isinstance(cls_node, ast.ClassDef):
+            continue
+        direct = dict((node.name, _direct_features(node, constants))
+                      for node in cls_node.body
+                      if isinstance(node, ast.FunctionDef))
+        for name in direct:
+            if not name.startswith(suite_scan.TEST_PREFIX):
+                continue
+            features = set()
+            seen = set()
+            pending = [name, 'setUp', 'tearDown']
+            while pending:
+                current = pending.pop()
+                if current in seen or current not in direct:
+                    continue
+                seen.add(current)
+                features.update(direct[current][0])
+                pending.extend(direct[current][1])
+            tests['{0}.{1}'.format(cls_node.name, name)] = features
+    return tests
+
+
+def get_transcript_features(directory):
+    """
+    Description:
+        Actions each test ran in a recorded run
+    Args:
+        directory (str): Timing directory of the run (see cmd_timing)
+    Returns:
+        dict. 'Class.test_name' to a set of features
+    """
+    tests = {}
+    for record in load_timings(directory):
+        label = record.get('label', '')
+        if record.get('kind') == 'cmd' and label.startswith('litp '):
+            action = label.split(' ', 1)[1]
+            if action in ACTIONS:
+                tests.setdefault(get_test_key(record['test']), set()).add(
+                    'action:{0}'.format(action))
+    return tests
+
+
+def parse_rpm_dump(lines):
+    """
+    Description:
+        Read 'rpm -q --dump' output
+    Args:
+        lines (list): Output lines: path size mtime digest mode ...
+    Returns:
+        dict. File path to digest
+    """
+    files = {}
+    for line in lines:
+        fields = line.split()
+        if len(fields) >= 4 and fields[0].startswith('/'):
+            files[fields[0]] = fields[3]
+    return files
+
+
+def read_manifest(source):
+    """
+    Description:
+        Digest of every file of one side of the comparison
+    Args:
+        source (str): rpm file, saved 'rpm -q --dump' listing or directory
+    Returns:
+        dict. File path to digest; the paths of a directory are relative
+              to it, those of an rpm are where it installs the files
+    """
+    if os.path.isdir(source):
+        files = {}
+        for root, _, names in os.walk(source):
+            for name in names:
+                path = os.path.join(root, name)
+                with open(path, 'rb') as content:
+                    digest = hashlib.sha256(content.read()).hexdigest()
+                files[os.path.relpath(path, source)] = digest
+        return files
+    if source.endswith('.rpm'):
+        output = subprocess.Popen(['rpm', '-qp', '--dump', source],
+                                  stdout=subprocess.PIPE).communicate()[0]
+        return parse_rpm_dump(output.decode('utf-8', 'replace').splitlines())
+    with open(source) as dump:
+        return parse_rpm_dump(dump.read().splitlines())
+
+
+def align_manifest(files, installed):
+    """
+    Description:
+        Key the files of an unpacked directory by where the rpm installs
+        them, so that the directory compares with the rpm. The directory
+        is taken to be unpacked at the install directory most of its
+        files are found under.
+    Args:
+        files (dict): Manifest of a directory, relative paths
+        installed (dict): Manifest of an rpm, absolute paths
+    Returns:
+        dict. File path to digest, with absolute paths
+    Raises:
+        ValueError. If no file of the directory is installed by the rpm
+    """
+    by_name = {}
+    for path in installed:
+        by_name.setdefault(os.path.basename(path), []).append(path)
+    roots = {}
+    for path in files:
+        suffix = '/' + path
+        for installed_path in by_name.get(os.path.basename(path), ()):
+            if installed_path.endswith(suffix):
+                root = installed_path[:-len(suffix)]
+                roots[root] = roots.get(root, 0) + 1
+    if not roots:
+        raise ValueError('no file of the directory is in the rpm')
+    root = max(sorted(roots), key=roots.get)
+    return dict((root + '/' + path, digest)
+                for path, digest in files.items())
+
+
+def align_manifests(old, new):
+    """
+    Description:
+        Bring the two sides of the comparison to the same root: when one
+        side is a directory and the other an rpm, the directory is keyed
+        by the install paths (see align_manifest)
+    Args:
+        old (dict): Manifest of the old side
+        new (dict): Manifest of the new side
+    Returns:
+        dict, dict. The old and new manifests
+    """
+    def is_installed(files):
+        """ Manifest of an rpm rather than of a directory """
+        return all(path.startswith('/') for path in files)
+    if not old or not new or is_installed(old) == is_installed(new):
+        return old, new
+    if is_installed(old):
+        return old, align_manifest(new, old)
+    return align_manifest(old, new), new
+
+
+def get_changed_files(old, new):
+    """ Paths that differ between two manifests, sorted """
+    return sorted(path for path in set(old) | set(new)
+                  if old.get(path) != new.get(path))
+
+
+def get_impacts(path):
+    """
+    Description:
+        Feature patterns a changed file may affect
+    Args:
+        path (str): Changed file
+    Returns:
+        tuple. fnmatch patterns of features, ALL if unknown
+    """
+    for pattern, impacts in IMPACT_RULES:
+        if re.search(pattern, path):
+            return impacts
+    if not path.endswith(PY_FILE):
+        return ()
+    key = os.path.basename(path)[:-len(PY_FILE)].replace('_', '')
+    actions = [action for action in ACTIONS
+               if action.replace('_', '') in key]
+    if actions:
+        return tuple(pattern.format(action) for action in actions
+                     for pattern in ('action:{0}', 'option:{0} *',
+                                     'help:{0}'))
+    return (ALL,)
+
+
+def select_tests(tests, features, patterns):
+    """
+    Description:
+        Select the tests exercising a feature matching a pattern
+    Args:
+        tests (list): Tests as returned by suite_scan.scan_testset
+        features (dict): 'Class.test_name' to features
+        patterns (set): fnmatch patterns of the affected features
+    Returns:
+        list. (test, matched features) of each selected test
+    """
+    selected = []
+    for test in tests:
+        key = '{0}.{1}'.format(test['class'], test['name'])
+        matched = sorted(feature for feature in features.get(key, ())
+                         if any(fnmatch.fnmatchcase(feature, pattern)
+                                for pattern in patterns))
+        if ALL in patterns or matched:
+            selected.append((test, matched))
+    return selected
+
+
+def get_installed_dump(args):
+    """ 'rpm -q --dump' of the ERIClitpcli installed on the MS """
+    name = read_package_details(PACKAGE_DETAILS)['litp_cli_pkg_name']
+    target = MsTarget(args.ms_ip, args.user, args.password)
+    try:
+        stdout, stderr, returnc = target.execute(
+            'rpm -q --dump {0}'.format(name))
+    finally:
+        target.close()
+    if returnc != 0:
+        raise RuntimeError('\n'.join(stderr))
+    return parse_rpm_dump(stdout)
+
+
+def main(argv=None):
+    """
+    Write the impact report and the list of selected tests
+    """
+    parser = argparse.ArgumentParser(description='Select the cli tests an '
+                                     'ERIClitpcli change affects')
+    parser.add_argument('--new', help='New rpm, dump listing or directory')
+    old_side = parser.add_mutually_exclusive_group()
+    old_side.add_argument('--old', help='Installed rpm, dump or directory')
+    old_side.add_argument('--ms-ip', help='MS whose installed package is '
+                          'the old side')
+    parser.add_argument('--user', default=LITP_REST_USER,
+                        help='User logging in to --ms-ip')
+    parser.add_argument('--password', default=LITP_REST_PASSWORD,
+                        help='Password of --user')
+    parser.add_argument('-o', '--output', help='JSON impact report')
+    parser.add_argument('--changed', nargs='*', default=[],
+                        help='Changed files, instead of or on top of the '
+                        'comparison')
+    parser.add_argument('--transcript', help='Timing directory of a '
+                        'previous run')
+    parser.add_argument('--testsets', nargs='*', help='Testset files, all '
+                        'cli testsets by default')
+    parser.add_argument('--select-file', help='Selected tests, one per '
+                        'line, for tools.parallel_runner --select')
+    args = parser.parse_args(argv)
+    changed = list(args.changed)
+    if args.new:
+        old = get_installed_dump(args) if args.ms_ip \
+            else read_manifest(args.old) if args.old else {}
+        try:
+            old, new = align_manifests(old, read_manifest(args.new))
+        except ValueError as error:
+            parser.error('--old and --new do not match: {0}'.format(error))
+        changed.extend(get_changed_files(old, new))
+    tests = []
+    features = {}
+    for path in args.testsets or suite_scan.find_testsets('cli'):
+        tests.extend(suite_scan.scan_testset(path))
+        features.update(scan_features(path))
+    if args.transcript:
+        for key, recorded in get_transcript_features(
+                args.transcript).items():
+            features.setdefault(key, set()).update(recorded)
+    impacts = dict((path, get_impacts(path)) for path in changed)
+    patterns = set(pattern for found in impacts.values()
+                   for pattern in found)
+    selected = select_tests(tests, features, patterns)
+    report = {'changed': impacts, 'patterns': sorted(patterns),
+              'selected': [{'test': suite_scan.nose_name(test),
+                            'matched': matched}
+                           for test, matched in selected],
+              'total': len(tests),
+              'features': dict((key, sorted(found))
+                               for key, found in features.items())}
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2, sort_keys=True)
+    names = [suite_scan.nose_name(test) for test, _ in selected]
+    if args.select_file:
+        with open(args.select_file, 'w') as select:
+            select.write(''.join(name + '\n' for name in names))
+    else:
+        sys.stdout.write(''.join(name + '\n' for name in names))
+    sys.stderr.write('{0} changed files, {1} of {2} tests selected\n'.format(
+        len(changed), len(selected), len(tests)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
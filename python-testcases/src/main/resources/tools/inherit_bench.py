@@ -0,0 +1,291 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Inherit fan-out benchmark on the model of testset_story4026:
+            a source package-list with a package is inherited into N
+            nodes (fan-out) or along a chain of N references each
+            inheriting the previous one (depth). For each shape and size
+            it times update, remove and the rollback of that remove on
+            the source, and how long it takes until every reference
+            shows the result.
+
+            Against the fake litpd the model is made Applied before the
+            operations, as after a plan, so the remove marks the items
+            ForRemoval and the rollback (an update restoring the source)
+            brings them back. A deployed MS cannot apply a model of
+            generated nodes, so there the items stay Initial: the remove
+            drops them with their references and there is no rollback.
+
+            Usage, from the directory holding cli/:
+                python -m tools.inherit_bench [--ms-ip IP] [-o inherit.json]
+                                              [--fanouts 1,10,100,1000]
+                                              [--depths 1,2,4,8,16]
+                                              [--repeat 3]
+'''
+
+import argparse
+import sys
+import time
+
+from cli.model_cache import get_link_path
+from cli.model_fixture import ModelFixture
+from tools.bench import add_target_args, fit_power_law, get_target, \
+    summarise_secs, wait_until, write_results
+
+DEFAULT_FANOUTS = (1, 10, 100, 1000)
+DEFAULT_DEPTHS = (1, 2, 4, 8, 16)
+DEFAULT_REPEAT = 3
+CONSISTENCY_TIMEOUT_SECS = 60
+BENCH_ROOT = '/deployments/inherit_bench'
+SOURCE_PATH = '/software/items/inherit_bench'
+SOURCE_ID = 'inherit_bench'
+FULL_DEPTH = 100
+VERSIONS = ('1.0', '2.0')
+
+FANOUT = 'fanout'
+DEPTH = 'depth'
+OPERATIONS = ('update', 'remove', 'rollback')
+
+
+def build_model(shape, size):
+    """
+    Description:
+        Describe the source and its references
+    Args:
+        shape (str): fanout, one reference per node, or depth, a chain of
+                     references each on its own node
+        size (int): Number of references
+    Returns:
+        ModelFixture, ModelFixture, list. The source, the deployment with
+                                          the references, and the paths of
+                                          the references
+    """
+    source = ModelFixture()
+    source.create(SOURCE_PATH, 'package-list', [('name', SOURCE_ID),
+                                                ('version', VERSIONS[0])])
+    source.create(SOURCE_PATH + '/packages/finger', 'package',
+                  [('name', 'finger'), ('config', 'keep'), ('epoch', '0')])
+    deployment = ModelFixture()
+    deployment.create(BENCH_ROOT, 'deployment')
+    deployment.create(BENCH_ROOT + '/clusters/c1', 'cluster')
+    references = []
+    inherit_from = SOURCE_PATH
+    for num in range(1, size + 1):
+        node = '{0}/clusters/c1/nodes/n{1}'.format(BENCH_ROOT, num)
+        deployment.create(node, 'node', hostname='inherit{0}'.format(num))
+        reference = '{0}/items/{1}'.format(node, SOURCE_ID)
+        deployment.inherit(reference, inherit_from, item_type='package-list')
+        references.append(reference)
+        if shape == DEPTH:
+            inherit_from = reference
+    return source, deployment, references
+
+
+def get_reference_states(target, references):
+    """
+    Description:
+        Read the references in one recursive request on the deployment
+    Args:
+        target (LocalTarget|MsTarget): System to read from
+        references (list): Paths of the references
+    Returns:
+        dict. Reference path to (state, version), None for a reference
+              that is not in the model
+    """
+    status, _, data = target.rest.get_json(
+        '{0}?recurse_depth={1}'.format(BENCH_ROOT, FULL_DEPTH))
+    found = {}
+    pending = [data] if status == 200 and data else []
+    while pending:
+        item = pending.pop()
+        path = get_link_path(item, 'self')
+        if path is not None:
+            found[path] = (item.get('state'),
+                           item.get('properties', {}).get('version'))
+        pending.extend(item.get('_embedded', {}).get('item', []))
+    return dict((path, found.get(path)) for path in references)
+
+
+def is_consistent(states, expected):
+    """ True if every reference is as expected, None for 'gone' """
+    return all(state == expected for state in states.values())
+
+
+def run_operation(target, operation, version):
+    """
+    Description:
+        Make an operation on the source
+    Args:
+        target (LocalTarget|MsTarget): System to run against
+        operation (str): update, remove or rollback
+        version (str): Version an update or rollback sets
+    Returns:
+        bool. True if the operation was accepted
+    """
+    if target.kind == 'ms':
+        if operation == 'remove':
+            args = 'remove -p {0}'.format(SOURCE_PATH)
+        else:
+            args = 'update -p {0} -o version={1}'.format(SOURCE_PATH,
+                                                        version)
+        return target.run_litp(args)['rc'] == 0
+    if operation == 'remove':
+        status, _, _ = target.rest.request('DELETE', SOURCE_PATH)
+    else:
+        status, _, _ = target.rest.request(
+            'PUT', SOURCE_PATH, {'properties': {'version': version}})
+    return status == 200
+
+
+def measure_operation(target, operation, references, version, expected):
+    """
+    Description:
+        Time an operation on the source and the wait until every
+        reference shows its result
+    Returns:
+        dict. secs of the operation, consistent_secs from its start until
+              the references were all as expected (None on timeout), ok
+    """
+    start = time.time()
+    accepted = run_operation(target, operation, version)
+    secs = time.time() - start
+    consistent = accepted and wait_until(
+        lambda: is_consistent(get_reference_states(target, references),
+                              expected), CONSISTENCY_TIMEOUT_SECS)
+    return {'secs': secs, 'ok': bool(consistent),
+            'consistent_secs': time.time() - start if consistent else None}
+
+
+def run_round(target, shape, size):
+    """
+    Description:
+        Set up the model, make the operations and remove the model
+    Returns:
+        dict. Operation to the result of measure_operation
+    """
+    source, deployment, references = build_model(shape, size)
+    applied = target.kind == 'local'
+    target.load_fixture(source)
+    target.load_fixture(deployment)
+    results = {}
+    try:
+        if applied:
+            target.apply_model()
+            results['update'] = measure_operation(
+                target, 'update', references, VERSIONS[1],
+                ('Updated', VERSIONS[1]))
+            results['remove'] = measure_operation(
+                target, 'remove', references, None,
+                ('ForRemoval', VERSIONS[1]))
+            results['rollback'] = measure_operation(
+                target, 'rollback', references, VERSIONS[0],
+                ('Applied', VERSIONS[0]))
+        else:
+            results['update'] = measure_operation(
+                target, 'update', references, VERSIONS[1],
+                ('Initial', VERSIONS[1]))
+            results['remove'] = measure_operation(
+                target, 'remove', references, None, None)
+    finally:
+        target.remove(BENCH_ROOT)
+        target.remove(SOURCE_PATH)
+    return results
+
+
+def summarise_rounds(shape, size, rounds):
+    """
+    Result records of the rounds of one shape and size, one per operation
+    """
+    records = []
+    for operation in OPERATIONS:
+        runs = [result[operation] for result in rounds
+                if operation in result]
+        if not runs:
+            continue
+        consistent = [run['consistent_secs'] for run in runs
+                      if run['consistent_secs'] is not None]
+        records.append({'shape': shape, 'size': size,
+                        'operation': operation,
+                        'latency': summarise_secs([run['secs']
+                                                   for run in runs]),
+                        'consistency': summarise_secs(consistent),
+                        'failures': len([run for run in runs
+                                         if not run['ok']])})
+    return records
+
+
+def fit_results(results):
+    """
+    Description:
+        Fit the latency and time to consistency of each operation against
+        the fan-out and the depth
+    Returns:
+        dict. shape -> operation -> {'latency', 'consistency'} fits
+    """
+    fits = {}
+    for record in results:
+        fits.setdefault(record['shape'], {}).setdefault(
+            record['operation'], {'latency': [], 'consistency': []})
+        entry = fits[record['shape']][record['operation']]
+        entry['latency'].append((record['size'],
+                                 record['latency'].get('p50', 0)))
+        entry['consistency'].append((record['size'],
+                                     record['consistency'].get('p50', 0)))
+    for operations in fits.values():
+        for entry in operations.values():
+            for key in ('latency', 'consistency'):
+                entry[key] = fit_power_law(entry[key])
+    return fits
+
+
+def main(argv=None):
+    """
+    Run the benchmark
+    """
+    parser = argparse.ArgumentParser(description='litp inherit fan-out')
+    add_target_args(parser)
+    parser.add_argument('--fanouts', default=','.join(
+        str(size) for size in DEFAULT_FANOUTS))
+    parser.add_argument('--depths', default=','.join(
+        str(size) for size in DEFAULT_DEPTHS))
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT)
+    args = parser.parse_args(argv)
+    shapes = ((FANOUT, [int(size) for size in args.fanouts.split(',')
+                        if size]),
+              (DEPTH, [int(size) for size in args.depths.split(',')
+                       if size]))
+    target = get_target(args)
+    results = []
+    try:
+        described = target.describe()
+        for shape, sizes in shapes:
+            for size in sizes:
+                rounds = [run_round(target, shape, size)
+                          for _ in range(args.repeat)]
+                records = summarise_rounds(shape, size, rounds)
+                results.extend(records)
+                for record in records:
+                    sys.stderr.write(
+                        '{0} {1} {2}: p50 {3:.3f}s, consistent p50 '
+                        '{4:.3f}s\n'.format(
+                            shape, size, record['operation'],
+                            record['latency'].get('p50', 0),
+                            record['consistency'].get('p50', 0)))
+    finally:
+        target.close()
+    params = {'shapes': dict(shapes), 'repeat': args.repeat,
+              'applied': target.kind == 'local'}
+    write_results(args.output, 'inherit_fanout', described, params,
+                  results, fits=fit_results(results))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,419 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Concurrent client load generator. Many simulated clients,
+            each on a thread of its own with its own connection, make a
+            weighted random mix of the operations of the testsets back to
+            back for a while:
+
+                show            'litp show -p', GET (story245)
+                show_property   'litp show -p -o name' (story3844)
+                update          'litp update -o' and '-o -d' on a rule of
+                                the client's own (story5164, story8290)
+                create          'litp create' of a logrotate rule
+                inherit         'litp inherit' of a package-list into
+                                /ms/items (story245)
+
+            The run is repeated for each number of clients. Each level
+            reports throughput, latency percentiles per operation and the
+            error rate, and the knee is the first level whose p95 latency
+            is more than --knee-factor times that of the first level.
+
+            Over REST it runs against the fake litpd or an MS; the CLI is
+            only measured against an MS, each client over an SSH session
+            of its own, as separate users of the CLI would be.
+
+            Usage, from the directory holding cli/:
+                python -m tools.load_gen [--ms-ip IP] [-o load.json]
+                                         [--clients 1,2,4,8,16,32]
+                                         [--secs 30]
+                                         [--mix show=40,show_property=30,
+                                                update=20,create=5,
+                                                inherit=5]
+                                         [--interface rest|cli]
+'''
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+
+try:
+    import httplib
+except ImportError:
+    import http.client as httplib
+
+from cli.model_fixture import ModelFixture
+from cli.rest_client import LITP_REST_ROOT, LitpRestClient
+from tools.bench import add_target_args, get_target, summarise_secs, \
+    write_results
+from tools.update_bench import CLI, REST, get_cli_args, get_rest_body
+
+DEFAULT_CLIENTS = (1, 2, 4, 8, 16, 32)
+DEFAULT_SECS = 30.0
+DEFAULT_KNEE_FACTOR = 2.0
+BENCH_ID = 'load_gen'
+CONFIG_PATH = '/ms/configs/{0}'.format(BENCH_ID)
+RULES_PATH = CONFIG_PATH + '/rules'
+SOURCE_PATH = '/software/items/{0}'.format(BENCH_ID)
+INHERIT_PARENT = '/ms/items'
+
+SHOW = 'show'
+SHOW_PROPERTY = 'show_property'
+UPDATE = 'update'
+CREATE = 'create'
+INHERIT = 'inherit'
+DEFAULT_MIX = ((SHOW, 40), (SHOW_PROPERTY, 30), (UPDATE, 20), (CREATE, 5),
+               (INHERIT, 5))
+
+
+def parse_mix(text):
+    """
+    Description:
+        Read an operation mix such as show=40,update=20
+    Args:
+        text (str): Comma separated operation=weight pairs
+    Returns:
+        list. (operation, weight) pairs with a positive weight
+    """
+    known = [operation for operation, _ in DEFAULT_MIX]
+    mix = []
+    for pair in text.split(','):
+        if not pair.strip():
+            continue
+        operation, weight = pair.split('=')
+        if operation.strip() not in known:
+            raise ValueError('Unknown operation {0}'.format(operation))
+        if float(weight) > 0:
+            mix.append((operation.strip(), float(weight)))
+    return mix
+
+
+def build_model(clients):
+    """
+    Description:
+        Describe the items the clients work on
+    Args:
+        clients (int): Number of clients, each updating a rule of its own
+    Returns:
+        ModelFixture, list. The inherit source and the rules, and the
+                            paths of the rules
+    """
+    fixture = ModelFixture()
+    fixture.create(SOURCE_PATH, 'package-list', [('name', BENCH_ID)])
+    fixture.create(CONFIG_PATH, 'logrotate-rule-config')
+    rules = []
+    for num in range(clients):
+        path = '{0}/r{1}'.format(RULES_PATH, num)
+        fixture.create(path, 'logrotate-rule',
+                       [('name', 'load{0}'.format(num)),
+                        ('path', '/var/log/load{0}.log'.format(num))])
+        rules.append(path)
+    return fixture, rules
+
+
+def pick(mix, rng):
+    """ Draw an operation from a weighted mix """
+    point = rng.random() * sum(weight for _, weight in mix)
+    for operation, weight in mix:
+        point -= weight
+        if point < 0:
+            return operation
+    return mix[-1][0]
+
+
+class SimulatedClient(object):
+    """
+    One client of litpd: its own REST connection or SSH session, its own
+    rule to update and its own names for the items it creates
+    """
+
+    def __init__(self, number, target, interface, rules, seed):
+        self.number = number
+        # one SSH session per client, so that clients do not queue for
+        # the channels of a shared one
+        self.target = target.open_client() if interface == CLI else target
+        self.interface = interface
+        self.rules = rules
+        self.own_rule = rules[number]
+        self.rng = random.Random(seed + number)
+        self.rest = LitpRestClient(**target.rest_args) \
+            if interface == REST else None
+        self.count = 0
+        self.updates = 0
+        # items the client created, removed after the run
+        self.created = []
+
+    def _rest(self, method, path, body=None):
+        """ Send a request, the status and decoded body """
+        status, _, data = self.rest.request(method, path, body)
+        try:
+            return status, json.loads(data) if data else None
+        except ValueError:
+            return status, None
+
+    def _litp(self, args):
+        """ Run a litp command, True if it succeeded """
+        return self.target.run_litp(args)['rc'] == 0
+
+    def show(self, prop=None):
+        """ Show any of the rules, or one property of it """
+        path = self.rng.choice(self.rules)
+        if self.interface == CLI:
+            return self._litp('show -p {0}{1}'.format(
+                path, ' -o {0}'.format(prop) if prop else ''))
+        status, data = self._rest('GET', path)
+        if prop is None:
+            return status == 200
+        return status == 200 and bool(data) and \
+            prop in data.get('properties', {})
+
+    def update(self):
+        """
+        Update the rule of the client, every other time deleting a
+        property in the same command
+        """
+        operation = {'path': self.own_rule,
+                     'set': {'rotate': str(5 + self.updates % 2)},
+                     'delete': []}
+        self.updates += 1
+        if self.updates % 2 == 0:
+            operation['delete'] = ['size']
+        else:
+            operation['set']['size'] = '10M'
+        if self.interface == CLI:
+            return self._litp(get_cli_args(operation))
+        status, _ = self._rest('PUT', self.own_rule,
+                               get_rest_body(operation))
+        return status == 200
+
+    def create(self):
+        """ Create a new rule """
+        item_id = 'c{0}_{1}'.format(self.number, self.count)
+        path = '{0}/{1}'.format(RULES_PATH, item_id)
+        props = [('name', item_id), ('path', '/var/log/{0}'.format(item_id))]
+        if self.interface == CLI:
+            created = self._litp('create -p {0} -t logrotate-rule -o {1}'
+                                 .format(path, ' '.join(
+                                     '{0}={1}'.format(name, value)
+                                     for name, value in props)))
+        else:
+            status, _ = self._rest('POST', RULES_PATH, {
+                'id': item_id, 'type': 'logrotate-rule',
+                'properties': dict(props)})
+            created = status == 201
+        return created
+
+    def inherit(self):
+        """ Inherit the package-list into /ms/items """
+        item_id = '{0}_c{1}_{2}'.format(BENCH_ID, self.number, self.count)
+        path = '{0}/{1}'.format(INHERIT_PARENT, item_id)
+        if self.interface == CLI:
+            created = self._litp('inherit -p {0} -s {1}'.format(
+                path, SOURCE_PATH))
+        else:
+            status, _ = self._rest('POST', INHERIT_PARENT, {
+                'id': item_id, 'inherit': LITP_REST_ROOT + SOURCE_PATH})
+            created = status == 201
+        if created:
+            self.created.append(path)
+        return created
+
+    def run(self, operation):
+        """
+        Description:
+            Make one operation
+        Args:
+            operation (str): One of the operations of the mix
+        Returns:
+            dict. operation, secs and ok
+        """
+        start = time.time()
+        try:
+            if operation == SHOW:
+                done = self.show()
+            elif operation == SHOW_PROPERTY:
+                done = self.show('name')
+            elif operation == UPDATE:
+                done = self.update()
+            elif operation == CREATE:
+                done = self.create()
+            else:
+                done = self.inherit()
+        except (httplib.HTTPException, IOError):
+            done = False
+        self.count += 1
+        return {'operation': operation, 'secs': time.time() - start,
+                'ok': done}
+
+    def close(self):
+        """ Close the connection of the client """
+        if self.rest is not None:
+            self.rest.close()
+        if self.interface == CLI:
+            self.target.close()
+
+
+def run_level(target, interface, clients, secs, mix, seed):
+    """
+    Description:
+        Set up the model, let the clients make operations for a while and
+        remove what they made
+    Args:
+        target (LocalTarget|MsTarget): System to run against
+        interface (str): cli or rest
+        clients (int): Number of simulated clients
+        secs (float): How long the clients keep going
+        mix (list): (operation, weight) pairs
+        seed (int): Seed of the operation choices
+    Returns:
+        list, float. Result per operation and the wall clock seconds
+    """
+    fixture, rules = build_model(clients)
+    target.load_fixture(fixture)
+    simulated = [SimulatedClient(num, target, interface, rules, seed)
+                 for num in range(clients)]
+    results = []
+    lock = threading.Lock()
+    start = time.time()
+    deadline = start + secs
+
+    def client_loop(client):
+        """ Make operations until the time is up """
+        while time.time() < deadline:
+            result = client.run(pick(mix, client.rng))
+            with lock:
+                results.append(result)
+
+    threads = [threading.Thread(target=client_loop, args=(client,))
+               for client in simulated]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        wall_secs = time.time() - start
+    finally:
+        for client in simulated:
+            client.close()
+            for path in client.created:
+                target.remove(path)
+        target.remove(CONFIG_PATH)
+        target.remove(SOURCE_PATH)
+    return results, wall_secs
+
+
+def summarise_level(interface, clients, results, secs):
+    """
+    Result record of one number of clients
+    """
+    by_operation = {}
+    for operation in sorted(set(result['operation'] for result in results)):
+        runs = [result for result in results
+                if result['operation'] == operation]
+        by_operation[operation] = {
+            'count': len(runs),
+            'errors': len([run for run in runs if not run['ok']]),
+            'latency': summarise_secs([run['secs'] for run in runs])}
+    errors = len([result for result in results if not result['ok']])
+    return {'interface': interface, 'clients': clients, 'ops': len(results),
+            'secs': secs,
+            'ops_per_sec': len(results) / secs if secs else None,
+            'latency': summarise_secs([result['secs']
+                                       for result in results]),
+            'errors': errors,
+            'error_rate': errors / float(len(results)) if results else None,
+            'by_operation': by_operation}
+
+
+def find_knee(records, factor=DEFAULT_KNEE_FACTOR):
+    """
+    Description:
+        Find the number of clients where latency falls apart
+    Args:
+        records (list): From summarise_level, by increasing clients
+        factor (float): Rise of the p95 latency over the first level that
+                        counts as falling apart
+    Returns:
+        int. Clients of the first level past the rise, None if none is
+    """
+    if not records or not records[0]['latency'].get('p95'):
+        return None
+    base = records[0]['latency']['p95']
+    for record in records[1:]:
+        if record['latency'].get('p95', 0) > factor * base:
+            return record['clients']
+    return None
+
+
+def main(argv=None):
+    """
+    Run the load generator
+    """
+    parser = argparse.ArgumentParser(description='Concurrent litpd clients')
+    add_target_args(parser)
+    parser.add_argument('--clients', help='Numbers of clients, one run '
+                        'each', default=','.join(str(count)
+                                                 for count in DEFAULT_CLIENTS))
+    parser.add_argument('--secs', type=float, default=DEFAULT_SECS,
+                        help='Length of each run')
+    parser.add_argument('--mix', default=','.join(
+        '{0}={1}'.format(operation, weight)
+        for operation, weight in DEFAULT_MIX))
+    parser.add_argument('--interface', choices=(REST, CLI), default=REST)
+    parser.add_argument('--knee-factor', type=float,
+                        default=DEFAULT_KNEE_FACTOR)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as error:
+        parser.error(str(error))
+    if not mix:
+        parser.error('the mix has no operations')
+    if args.interface == CLI and not args.ms_ip:
+        parser.error('the CLI is only measured against an MS (--ms-ip)')
+    levels = sorted(set(int(count) for count in args.clients.split(',')
+                        if count and int(count) > 0))
+    target = get_target(args)
+    results = []
+    try:
+        described = target.describe()
+        for clients in levels:
+            runs, secs = run_level(target, args.interface, clients,
+                                   args.secs, mix, args.seed)
+            record = summarise_level(args.interface, clients, runs, secs)
+            results.append(record)
+            sys.stderr.write(
+                '{0} clients: {1:.1f} ops/s, p50 {2:.3f}s, p95 {3:.3f}s, '
+                'p99 {4:.3f}s, {5:.1%} errors\n'.format(
+                    clients, record['ops_per_sec'] or 0,
+                    record['latency'].get('p50', 0),
+                    record['latency'].get('p95', 0),
+                    record['latency'].get('p99', 0),
+                    record['error_rate'] or 0))
+    finally:
+        target.close()
+    knee = find_knee(results, args.knee_factor)
+    peak = max(results, key=lambda record: record['ops_per_sec'] or 0) \
+        if results else None
+    params = {'clients': levels, 'secs': args.secs, 'mix': dict(mix),
+              'interface': args.interface, 'knee_factor': args.knee_factor,
+              'seed': args.seed}
+    write_results(args.output, 'concurrent_load', described, params,
+                  results, knee_clients=knee,
+                  peak_clients=peak['clients'] if peak else None)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
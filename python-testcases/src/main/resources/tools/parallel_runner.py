@@ -0,0 +1,414 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Runs the cli testsets concurrently, one nosetests process per
+            job, and merges the xunit reports into the single report
+            parseNosetestsReports reads.
+
+            The tests of a testset share its model namespace (the story
+            prefixed item ids such as story4026_packages), so the jobs of a
+            testset run one after the other, while different testsets run
+            side by side. The read only tests of a testset run as one job,
+            so that they share the sessions and the help snapshot of one
+            nose process. Workers get no model namespace of their own: the
+            testsets hard code their item paths, so the gate is what keeps
+            jobs apart. Jobs changing the model and exclusive jobs (see
+            suite_scan) wait until no other job runs, and read only jobs
+            wait while such a job runs; only read only jobs run side by
+            side. Tests tagged to share their plans (see plan_scheduler)
+            run as one exclusive job of concurrent processes around shared
+            plans.
+            Within each kind the longest chains, by the durations of their
+            tests in the history of tools.duration_history, start first;
+            the run time is estimated before the run and the results are
+            added to the history after it.
+
+            Usage, from the directory holding cli/:
+                python -m tools.parallel_runner [-w 4] [-o nosetests.xml]
+                                                [--select selected.txt]
+                                                [--hosts host.properties]
+                                                [--history FILE]
+                                                [testsets] [-- nose args]
+'''
+
+import argparse
+import os
+import subprocess
+import sys
+import threading
+import time
+import xml.etree.ElementTree as ElementTree
+from contextlib import contextmanager
+
+from cli.session_pool import HOSTS_ENV
+from cli.shared_plan import CONCURRENT_ENV
+from tools import suite_scan
+from tools.duration_history import DEFAULT_REGRESSION_FACTOR, \
+    DurationHistory, estimate_makespan, predict_secs
+from tools.plan_scheduler import PlanCoordinator, group_shared_tests
+
+DEFAULT_WORKERS = 4
+DEFAULT_REPORT = 'nosetests.xml'
+REPORT_DIR = 'parallel_reports'
+# kinds of job holding the MS alone: a job changing the model works on
+# fixed paths that other testsets use too, and a plan picks up every
+# pending change of the model
+ALONE_KINDS = (suite_scan.MODEL, suite_scan.EXCLUSIVE)
+
+
+class ModelGate(object):
+    """
+    Readers-writer lock between read only jobs (shared) and the jobs that
+    change the model or run plans (exclusive). Waiting exclusive jobs hold
+    back new shared ones so that they are not starved.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._shared = 0
+        self._exclusive = False
+        self._waiting = 0
+
+    @contextmanager
+    def shared(self):
+        """ Hold the gate together with other non exclusive jobs """
+        with self._cond:
+            while self._exclusive or self._waiting:
+                self._cond.wait()
+            self._shared += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._shared -= 1
+                self._cond.notify_all()
+
+    @contextmanager
+    def exclusive(self):
+        """ Hold the gate alone """
+        with self._cond:
+            self._waiting += 1
+            while self._exclusive or self._shared:
+                self._cond.wait()
+            self._waiting -= 1
+            self._exclusive = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._exclusive = False
+                self._cond.notify_all()
+
+    @contextmanager
+    def hold(self, kind):
+        """ Hold the gate as a job of the given kind needs """
+        # read only jobs too: a plan or a load --replace changes what
+        # find and show return under them
+        if kind in ALONE_KINDS:
+            with self.exclusive():
+                yield
+        else:
+            with self.shared():
+                yield
+
+
+def get_chain_secs(chain, medians):
+    """ Predicted duration of a chain from the history of its tests """
+    return predict_secs(['{0}.{1}'.format(test['class'], test['name'])
+                         for job in chain for test in job['tests']], medians)
+
+
+def estimate_run_secs(chains, workers, medians):
+    """
+    Description:
+        Predict the wall clock time of a run. A job holding the MS alone
+        holds back every other job, so those jobs take their time one
+        after the other; the read only jobs share the workers.
+    Args:
+        chains (list): From build_chains, in the order they are taken
+        workers (int): Number of workers
+        medians (dict): Past durations of the tests
+    Returns:
+        float. Predicted seconds
+    """
+    exclusive_secs = 0.0
+    durations = []
+    for chain in chains:
+        rest = [job for job in chain if job['kind'] not in ALONE_KINDS]
+        exclusive_secs += get_chain_secs(
+            [job for job in chain if job['kind'] in ALONE_KINDS], medians)
+        if rest:
+            durations.append(get_chain_secs(rest, medians))
+    return exclusive_secs + estimate_makespan(durations, workers)
+
+
+def build_chains(tests, share_plans=True, medians=None):
+    """
+    Description:
+        Group tests into jobs, and jobs into chains that must run in order
+    Args:
+        tests (list): Tests as returned by suite_scan.scan_testset
+        share_plans (bool): Run the tests tagged to share their plans as
+                            groups around shared plans
+        medians (dict): Past durations of the tests (see
+                        duration_history), to order chains of the same
+                        kind longest first
+    Returns:
+        list. Chains, each a list of jobs {'kind', 'tests', 'shared'}
+    """
+    chains = []
+    if share_plans:
+        groups, tests = group_shared_tests(tests)
+        chains.extend([{'kind': suite_scan.EXCLUSIVE, 'tests': group,
+                        'shared': True}] for group in groups)
+    by_file = {}
+    files = []
+    for test in tests:
+        if test['file'] not in by_file:
+            files.append(test['file'])
+        by_file.setdefault(test['file'], []).append(test)
+    for path in files:
+        chain = []
+        for kind in suite_scan.KINDS:
+            group = [test for test in by_file[path] if test['kind'] == kind]
+            if group:
+                chain.append({'kind': kind, 'tests': group})
+        if chain:
+            chains.append(chain)
+    # work holding the MS alone first so that it does not end up as the
+    # long tail, then the longest first
+    medians = medians or {}
+    chains.sort(key=lambda chain: (-max(suite_scan.KINDS.index(job['kind'])
+                                        for job in chain),
+                                   -get_chain_secs(chain, medians)))
+    return chains
+
+
+def merge_xunit(paths, output):
+    """
+    Description:
+        Merge nose xunit reports into one
+    Args:
+        paths (list): Reports to merge, missing ones are skipped
+        output (str): Merged report
+    Returns:
+        dict. Totals of tests, errors, failures and skip
+    """
+    totals = dict((key, 0) for key in ('tests', 'errors', 'failures',
+                                       'skip'))
+    merged = ElementTree.Element('testsuite', name='nosetests')
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+        suite = ElementTree.parse(path).getroot()
+        for key in totals:
+            totals[key] += int(suite.get(key, 0))
+        for case in suite:
+            merged.append(case)
+    for key, value in totals.items():
+        merged.set(key, str(value))
+    ElementTree.ElementTree(merged).write(output, encoding='UTF-8')
+    return totals
+
+
+class ParallelRunner(object):
+    """
+    Runs chains of nose jobs on a number of worker threads, each job in a
+    nosetests process of its own
+    """
+
+    def __init__(self, chains, workers=DEFAULT_WORKERS, nose_args=None,
+                 report_dir=REPORT_DIR, hosts=None):
+        self.chains = list(chains)
+        self.workers = workers
+        self.nose_args = list(nose_args or [])
+        self.report_dir = report_dir
+        self.hosts = hosts
+        self.gate = ModelGate()
+        self.results = []
+        self.shared_plans = 0
+        self._lock = threading.Lock()
+        self._next_job = 0
+
+    def _take_chain(self):
+        """ Next chain to run, None when all have been taken """
+        with self._lock:
+            if not self.chains:
+                return None, None
+            self._next_job += 1
+            return self._next_job, self.chains.pop(0)
+
+    def get_env(self, extra_env=None):
+        """ Environment of a nosetests process """
+        env = dict(os.environ)
+        if self.hosts:
+            env[HOSTS_ENV] = os.path.abspath(self.hosts)
+        env.update(extra_env or {})
+        return env
+
+    def _nose(self, report, tests, extra_env=None):
+        """ Run tests in a nosetests process and record the result """
+        cmd = [sys.executable, '-m', 'nose', '--with-xunit',
+               '--xunit-file={0}'.format(report)] + self.nose_args + \
+            [suite_scan.nose_name(test) for test in tests]
+        env = self.get_env(extra_env)
+        start = time.time()
+        proc = subprocess.Popen(cmd, env=env, stdout=subprocess.PIPE,
+                                stderr=subprocess.STDOUT)
+        output = proc.communicate()[0]
+        with self._lock:
+            self.results.append({'tests': tests, 'rc': proc.returncode,
+                                 'secs': time.time() - start,
+                                 'report': report, 'output': output})
+
+    def _run_shared(self, number, index, job):
+        """ Run the tests of a shared plan group side by side """
+        names = [suite_scan.nose_name(test) for test in job['tests']]
+        coordinator = PlanCoordinator(names).start()
+
+        def member(num, test, name):
+            """ Run one test of the group """
+            report = os.path.join(self.report_dir, '{0:03d}_{1}_{2}.xml'
+                                  .format(number, index, num))
+            try:
+                self._nose(report, [test], coordinator.env(name))
+            finally:
+                coordinator.leave(name)
+        threads = [threading.Thread(target=member, args=(num, test, name))
+                   for num, (test, name) in enumerate(zip(job['tests'],
+                                                          names))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        coordinator.close()
+        self.shared_plans += coordinator.plans
+
+    def _run_job(self, number, index, job):
+        """ Run one job through nosetests """
+        with self.gate.hold(job['kind']):
+            if job.get('shared'):
+                self._run_shared(number, index, job)
+            else:
+                report = os.path.join(self.report_dir, '{0:03d}_{1}.xml'
+                                      .format(number, index))
+                # only a job holding the MS alone may restore the model
+                extra_env = {} if job['kind'] in ALONE_KINDS \
+                    else {CONCURRENT_ENV: '1'}
+                self._nose(report, job['tests'], extra_env)
+
+    def _worker(self):
+        """ Take chains until none are left """
+        while True:
+            number, chain = self._take_chain()
+            if chain is None:
+                return
+            for index, job in enumerate(chain):
+                self._run_job(number, index, job)
+
+    def run(self):
+        """
+        Description:
+            Run all the chains
+        Returns:
+            list. One result per nosetests process with keys tests, rc,
+                  secs, report and output
+        """
+        if not os.path.isdir(self.report_dir):
+            os.makedirs(self.report_dir)
+        threads = [threading.Thread(target=self._worker)
+                   for _ in range(self.workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return self.results
+
+
+def main(argv=None):
+    """
+    Run the testsets in parallel and write the merged xunit report
+    """
+    argv = list(sys.argv[1:] if argv is None else argv)
+    nose_args = []
+    if '--' in argv:
+        nose_args = argv[argv.index('--') + 1:]
+        argv = argv[:argv.index('--')]
+    parser = argparse.ArgumentParser(description='Run the cli testsets in '
+                                     'parallel')
+    parser.add_argument('testsets', nargs='*',
+                        help='Testset files, all cli testsets by default')
+    parser.add_argument('-w', '--workers', type=int, default=DEFAULT_WORKERS)
+    parser.add_argument('-o', '--output', default=DEFAULT_REPORT,
+                        help='Merged xunit report')
+    parser.add_argument('--report-dir', default=REPORT_DIR)
+    parser.add_argument('--no-shared-plans', action='store_true',
+                        help='Let every test run its own plans')
+    parser.add_argument('--select', help='Run only the tests listed in '
+                        'this file, e.g. by tools.impact_scan')
+    parser.add_argument('--hosts', help='host.properties of the '
+                        'deployment to run against, e.g. that of a shard of '
+                        'tools.shard_plan')
+    parser.add_argument('--history', help='Test duration history (see '
+                        'tools.duration_history)')
+    parser.add_argument('--no-history', action='store_true',
+                        help='Neither use nor update the duration history')
+    parser.add_argument('--regression-factor', type=float,
+                        default=DEFAULT_REGRESSION_FACTOR,
+                        help='Warn about tests slower than this times their '
+                        'rolling median')
+    args = parser.parse_args(argv)
+    testsets = args.testsets or suite_scan.find_testsets('cli')
+    tests = []
+    for path in testsets:
+        tests.extend(suite_scan.scan_testset(path))
+    if args.select:
+        with open(args.select) as select:
+            names = set(line.strip() for line in select)
+        tests = [test for test in tests
+                 if suite_scan.nose_name(test) in names]
+    history = None if args.no_history else DurationHistory(args.history)
+    medians = history.get_medians() if history is not None else {}
+    chains = build_chains(tests, not args.no_shared_plans, medians)
+    sys.stdout.write('{0} tests, predicted {1:.0f}s with {2} workers, '
+                     '{3:.0f}s one by one\n'.format(
+                         len(tests), estimate_run_secs(chains, args.workers,
+                                                       medians),
+                         args.workers, sum(get_chain_secs(chain, medians)
+                                           for chain in chains)))
+    start = time.time()
+    runner = ParallelRunner(chains, args.workers, nose_args, args.report_dir,
+                            args.hosts)
+    results = runner.run()
+    totals = merge_xunit(sorted(result['report'] for result in results),
+                         args.output)
+    for result in sorted(results, key=lambda result: -result['secs']):
+        tests = result['tests']
+        sys.stdout.write('{0:8.1f}s  rc={1}  {2:9}  {3}\n'.format(
+            result['secs'], result['rc'], tests[0]['kind'],
+            ' '.join(test['name'] for test in tests)))
+    sys.stdout.write('{0} tests, {1} errors, {2} failures in {3:.1f}s with '
+                     '{4} workers, {5} shared plans\n'.format(
+                         totals['tests'], totals['errors'], totals['failures'],
+                         time.time() - start, args.workers,
+                         runner.shared_plans))
+    if history is not None:
+        run = history.record_xunit(args.output)
+        for test, secs, old in history.get_regressions(
+                run, args.regression_factor):
+            sys.stdout.write('WARNING {0} took {1:.1f}s, {2:.1f}x its median '
+                             'of {3:.1f}s\n'.format(test, secs, secs / old,
+                                                    old))
+        history.close()
+    return 0 if all(result['rc'] == 0 for result in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,221 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Coalesces the plans of independent tests. A test declares with
+            @attr tags that its plans may be shared ('plan_shared') and
+            which part of the model it changes ('delta_<name>', e.g.
+            'delta_n1_logrotate'). Tests with disjoint deltas are grouped;
+            the tests of a group run side by side and the PlanCoordinator
+            runs one plan whenever all of them are waiting for one, so a
+            group of N tests with two plans each costs two plan runs
+            instead of 2N.
+
+            A shared plan must only be expected to succeed: tests which
+            expect a plan to fail, look at the tasks of the plan or expect
+            create_plan to find nothing to do must not be tagged.
+'''
+
+import binascii
+import os
+import threading
+
+from multiprocessing.connection import Listener
+
+from cli.shared_plan import (COORDINATOR_ENV, MEMBER_ENV, AUTHKEY_ENV,
+                             SHARED_TAG, DELTA_PREFIX, LEAD)
+
+
+def get_deltas(test):
+    """
+    Description:
+        Model delta a test declares
+    Args:
+        test (dict): Test as returned by suite_scan.scan_testset
+    Returns:
+        set. The delta names, without the prefix
+    """
+    return set(tag[len(DELTA_PREFIX):] for tag in test['attrs']
+               if tag.startswith(DELTA_PREFIX))
+
+
+def group_shared_tests(tests):
+    """
+    Description:
+        Group the tests whose plans can be shared
+    Args:
+        tests (list): Tests as returned by suite_scan.scan_testset
+    Returns:
+        list, list. Groups of two or more tests with disjoint deltas, and
+                    the tests that are not in any group
+    """
+    groups = []
+    for test in tests:
+        deltas = get_deltas(test)
+        if SHARED_TAG not in test['attrs'] or not deltas:
+            continue
+        for group in groups:
+            if not deltas & group['deltas']:
+                group['tests'].append(test)
+                group['deltas'] |= deltas
+                break
+        else:
+            groups.append({'tests': [test], 'deltas': deltas})
+    grouped = [group['tests'] for group in groups
+               if len(group['tests']) > 1]
+    in_group = set(id(test) for group in grouped for test in group)
+    return grouped, [test for test in tests if id(test) not in in_group]
+
+
+class PlanCoordinator(object):
+    """
+    Barrier between the tests of a group. Whenever every test still
+    running waits for a plan or for its teardown, the tests waiting for a
+    plan are released together, one of them leading the plan. When all of
+    them wait for their teardown they are let through one at a time.
+    """
+
+    def __init__(self, members):
+        self.members = set(members)
+        self.plans = 0
+        self.authkey = binascii.hexlify(os.urandom(16))
+        self._cond = threading.Condition()
+        self._at_plan = set()
+        self._at_teardown = set()
+        self._round = None
+        self._tearing_down = None
+        self._replies = {}
+        self._listener = None
+
+    def start(self):
+        """ Listen for the tests on a free local port """
+        self._listener = Listener(('127.0.0.1', 0), authkey=self.authkey)
+        thread = threading.Thread(target=self._accept)
+        thread.daemon = True
+        thread.start()
+        return self
+
+    def env(self, member):
+        """
+        Description:
+            Environment a test needs to join the group
+        Args:
+            member (str): Name of the test
+        Returns:
+            dict. Environment variables
+        """
+        host, port = self._listener.address
+        return {COORDINATOR_ENV: '{0}:{1}'.format(host, port),
+                MEMBER_ENV: member,
+                AUTHKEY_ENV: self.authkey.decode('ascii')}
+
+    def close(self):
+        """ Stop listening """
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+
+    def _accept(self):
+        """ Serve each test on a thread of its own """
+        while True:
+            try:
+                conn = self._listener.accept()
+            except (IOError, EOFError, AttributeError):
+                return
+            thread = threading.Thread(target=self._serve, args=(conn,))
+            thread.daemon = True
+            thread.start()
+
+    def _serve(self, conn):
+        """ Answer the messages of one test """
+        try:
+            while True:
+                message = conn.recv()
+                conn.send(self._handle(*message))
+        except (IOError, EOFError):
+            pass
+        finally:
+            conn.close()
+
+    def _handle(self, action, member, *args):
+        """ Update the barrier and wait for the answer to a message """
+        with self._cond:
+            if action == 'plan':
+                self._at_plan.add(member)
+            elif action == 'teardown':
+                self._at_teardown.add(member)
+            elif action == 'done':
+                self._finish_round(member, args[0])
+                return 'ok'
+            else:
+                self._leave(member)
+                return 'ok'
+            self._release()
+            while member not in self._replies:
+                self._cond.wait()
+            return self._replies.pop(member)
+
+    def leave(self, member):
+        """
+        Description:
+            Drop a test from the group, e.g. when its process has exited
+        Args:
+            member (str): Name of the test
+        """
+        with self._cond:
+            self._leave(member)
+
+    def _leave(self, member):
+        """ Drop a test; the lock must be held """
+        if member not in self.members:
+            return
+        self.members.discard(member)
+        self._at_plan.discard(member)
+        self._at_teardown.discard(member)
+        # a lead that went away without reporting fails its plan
+        self._finish_round(member, False)
+        if self._tearing_down == member:
+            self._tearing_down = None
+        self._release()
+
+    def _finish_round(self, member, success):
+        """
+        Hand the outcome of the plan to the tests that waited for it, when
+        member leads the current round; anything else is ignored
+        """
+        if self._round is None or self._round[0] != member:
+            return
+        lead, waiting = self._round
+        for member in waiting:
+            if member != lead:
+                self._replies[member] = success
+        self._round = None
+        self._cond.notify_all()
+        self._release()
+
+    def _release(self):
+        """ Let tests through when nothing else can happen """
+        if self._round is not None or self._tearing_down is not None:
+            return
+        if not self.members \
+                or self.members - self._at_plan - self._at_teardown:
+            return
+        if self._at_plan:
+            waiting = set(self._at_plan)
+            lead = sorted(waiting)[0]
+            self._at_plan.clear()
+            self._round = (lead, waiting)
+            self._replies[lead] = LEAD
+            self.plans += 1
+        else:
+            self._tearing_down = sorted(self._at_teardown)[0]
+            self._at_teardown.discard(self._tearing_down)
+            self._replies[self._tearing_down] = 'go'
+        self._cond.notify_all()
+
@@ -0,0 +1,251 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Splits the cli testsets into shards of near equal predicted
+            run time, one per MS deployment, and merges the nose reports
+            of the shards back into the single report
+            parseNosetestsReports reads.
+
+            The tests of a class that change the model (see suite_scan)
+            depend on the plans of each other and stay together in one
+            shard; read only tests are placed one by one. Predictions come
+            from the history of tools.duration_history. Each shard gets a
+            directory holding the list of its tests, the host.properties
+            of its deployment when given, and run.sh, which runs only
+            those tests through tools.parallel_runner --select, against
+            the nodes of that host.properties (--hosts), and writes the
+            report merge reads.
+
+            The TAF suites run every testset through the PythonTestRunner
+            operator, which has no way to be given a list of tests, so a
+            shard is run with its run.sh rather than through a suite.
+
+            Usage, from the directory holding cli/:
+                python -m tools.shard_plan plan -o shards
+                    (--shards 2 | --hosts ms_a.properties ms_b.properties)
+                    [testsets]
+                sh shards/shard1/run.sh    (for each shard)
+                python -m tools.shard_plan merge -o nosetests.xml shards
+'''
+
+import argparse
+import json
+import os
+import shutil
+import sys
+
+from tools import suite_scan
+from tools.duration_history import DurationHistory, predict_secs
+from tools.parallel_runner import DEFAULT_REPORT, REPORT_DIR, merge_xunit
+
+DEFAULT_PLAN_DIR = 'shards'
+PLAN_FILE = 'shards.json'
+SELECT_FILE = 'selected.txt'
+HOSTS_FILE = 'host.properties'
+RUN_FILE = 'run.sh'
+
+
+def get_test_key(test):
+    """ Key of a test in the duration history, e.g. Story630.test_01 """
+    return '{0}.{1}'.format(test['class'], test['name'])
+
+
+def build_units(tests):
+    """
+    Description:
+        Group tests into the units a shard takes whole: the tests of a
+        class that change the model together, the others one by one
+    Args:
+        tests (list): Tests as returned by suite_scan.scan_testset
+    Returns:
+        list. Units, each a list of tests in file order
+    """
+    units = []
+    by_class = {}
+    for test in tests:
+        if test['kind'] == suite_scan.READ:
+            units.append([test])
+            continue
+        key = (test['file'], test['class'])
+        if key not in by_class:
+            by_class[key] = []
+            units.append(by_class[key])
+        by_class[key].append(test)
+    return units
+
+
+def split_units(units, shards, medians):
+    """
+    Description:
+        Spread units over shards, longest first, each to the shard with
+        the least predicted work so far
+    Args:
+        units (list): From build_units
+        shards (int): Number of shards
+        medians (dict): Past durations, from DurationHistory.get_medians
+    Returns:
+        list. Per shard a dict with the predicted 'secs' and its 'tests'
+              in file order
+    """
+    planned = [{'secs': 0.0, 'tests': []} for _ in range(max(1, shards))]
+    timed = [(predict_secs([get_test_key(test) for test in unit], medians),
+              unit) for unit in units]
+    timed.sort(key=lambda pair: (-pair[0], suite_scan.nose_name(pair[1][0])))
+    for secs, unit in timed:
+        shard = min(planned, key=lambda shard: shard['secs'])
+        shard['secs'] += secs
+        shard['tests'].extend(unit)
+    for shard in planned:
+        shard['tests'].sort(key=lambda test: (test['file'], test['line']))
+    return planned
+
+
+def write_run_script(path, shard_name, select, report, report_dir,
+                     hosts=None):
+    """
+    Description:
+        Write the script running the tests of a shard
+    Args:
+        path (str): Script to write
+        shard_name (str): Name of the shard
+        select (str): File listing the tests of the shard
+        report (str): Merged xunit report of the shard
+        report_dir (str): Directory for the reports of its jobs
+        hosts (str): host.properties of the deployment of the shard, None
+                     to run against the configured one
+    """
+    with open(path, 'w') as script:
+        script.write(
+            '#!/bin/sh\n'
+            '# Runs the tests of {0}; from the directory holding cli/\n'
+            'exec python -m tools.parallel_runner --select {1} -o {2} '
+            '--report-dir {3}{4} "$@"\n'.format(
+                shard_name, select, report, report_dir,
+                ' --hosts ' + hosts if hosts else ''))
+
+
+def write_plan(planned, plan_dir, hosts):
+    """
+    Description:
+        Write a directory per shard and the plan of all of them
+    Args:
+        planned (list): From split_units
+        plan_dir (str): Directory to write to
+        hosts (list): host.properties of the deployment of each shard,
+                      None to leave them out
+    Returns:
+        dict. The plan, as written to shards.json
+    """
+    plan = {'shards': []}
+    for index, shard in enumerate(planned):
+        name = 'shard{0}'.format(index + 1)
+        shard_dir = os.path.join(plan_dir, name)
+        if not os.path.isdir(shard_dir):
+            os.makedirs(shard_dir)
+        names = [suite_scan.nose_name(test) for test in shard['tests']]
+        select = os.path.join(shard_dir, SELECT_FILE)
+        with open(select, 'w') as select_file:
+            select_file.write(''.join(name + '\n' for name in names))
+        shard_hosts = None
+        if hosts is not None:
+            shard_hosts = os.path.join(shard_dir, HOSTS_FILE)
+            shutil.copyfile(hosts[index], shard_hosts)
+        report = os.path.join(shard_dir, DEFAULT_REPORT)
+        run = os.path.join(shard_dir, RUN_FILE)
+        write_run_script(run, name, select, report,
+                         os.path.join(shard_dir, REPORT_DIR), shard_hosts)
+        plan['shards'].append({
+            'name': name, 'hosts': hosts[index] if hosts else None,
+            'run': run, 'select': select, 'report': report,
+            'secs': round(shard['secs'], 1), 'tests': names})
+    with open(os.path.join(plan_dir, PLAN_FILE), 'w') as plan_file:
+        json.dump(plan, plan_file, indent=2, sort_keys=True)
+    return plan
+
+
+def merge_shards(plan_dir, output):
+    """
+    Description:
+        Merge the nose reports of the shards of a plan into one
+    Args:
+        plan_dir (str): Directory holding shards.json
+        output (str): Merged report
+    Returns:
+        dict, list. Totals as from parallel_runner.merge_xunit, and the
+                    names of the shards whose report is missing
+    """
+    with open(os.path.join(plan_dir, PLAN_FILE)) as plan_file:
+        plan = json.load(plan_file)
+    reports = [shard['report'] for shard in plan['shards']]
+    missing = [shard['name'] for shard in plan['shards']
+               if not os.path.exists(shard['report'])]
+    return merge_xunit(reports, output), missing
+
+
+def main(argv=None):
+    """
+    Plan the shards of the cli testsets or merge their reports
+    """
+    parser = argparse.ArgumentParser(description='Shard the cli testsets '
+                                     'over MS deployments')
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+    plan_parser = commands.add_parser('plan')
+    plan_parser.add_argument('testsets', nargs='*',
+                             help='Testset files, all cli testsets by '
+                             'default')
+    plan_parser.add_argument('-o', '--output', default=DEFAULT_PLAN_DIR,
+                             help='Directory for the shards')
+    plan_parser.add_argument('--shards', type=int,
+                             help='Number of shards, for deployments set '
+                             'up separately')
+    plan_parser.add_argument('--hosts', nargs='+',
+                             help='host.properties of each deployment, one '
+                             'shard each')
+    plan_parser.add_argument('--history', help='Test duration history (see '
+                             'tools.duration_history)')
+    merge_parser = commands.add_parser('merge')
+    merge_parser.add_argument('plan_dir', nargs='?', default=DEFAULT_PLAN_DIR)
+    merge_parser.add_argument('-o', '--output', default=DEFAULT_REPORT,
+                              help='Merged xunit report')
+    args = parser.parse_args(argv)
+    if args.command == 'merge':
+        totals, missing = merge_shards(args.plan_dir, args.output)
+        sys.stdout.write('{0} tests, {1} errors, {2} failures merged into '
+                         '{3}\n'.format(totals['tests'], totals['errors'],
+                                        totals['failures'], args.output))
+        for name in missing:
+            sys.stderr.write('No report from {0}\n'.format(name))
+        return 1 if missing else 0
+    shards = len(args.hosts) if args.hosts else args.shards
+    if not shards:
+        parser.error('give --shards or --hosts')
+    testsets = args.testsets or suite_scan.find_testsets('cli')
+    tests = []
+    for path in testsets:
+        tests.extend(suite_scan.scan_testset(path))
+    history = DurationHistory(args.history)
+    try:
+        medians = history.get_medians()
+    finally:
+        history.close()
+    planned = split_units(build_units(tests), shards, medians)
+    plan = write_plan(planned, args.output, args.hosts)
+    for shard in plan['shards']:
+        sys.stdout.write('{0}: {1} tests, predicted {2:.0f}s, run {3}{4}\n'
+                         .format(shard['name'], len(shard['tests']),
+                                 shard['secs'], shard['run'],
+                                 ' on ' + shard['hosts'] if shard['hosts']
+                                 else ''))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,280 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Scaling benchmark of the 'litp show' options checked by
+            testset_story630. For each model size a deployment of that
+            many items is generated (nodes holding firewall rules), every
+            show variant is timed on it a number of times, and the latency
+            and memory of each variant are fitted to a power law of the
+            size, so that a release whose show scales worse stands out.
+
+            Against an MS the litp CLI itself is timed, with its peak
+            memory from /usr/bin/time. Against the fake litpd the REST
+            request of the variant is timed together with the decoding
+            and printing of its output, and the memory is the peak
+            allocation of that work (Python 3 only).
+
+            Usage, from the directory holding cli/:
+                python -m tools.show_bench [--ms-ip IP] [-o show.json]
+                                           [--sizes 100,1000,10000,50000]
+                                           [--repeat 5] [--variants ...]
+'''
+
+import argparse
+import json
+import sys
+import time
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+from cli.model_fixture import ModelFixture
+from tools.bench import add_target_args, fit_power_law, get_target, \
+    summarise_secs, write_results
+
+DEFAULT_SIZES = (100, 1000, 10000, 50000)
+DEFAULT_REPEAT = 5
+ITEMS_PER_NODE = 50
+BENCH_ROOT = '/deployments/bench{0}'
+# recurse_depth standing in for an unlimited -r
+FULL_DEPTH = 100
+
+# variant -> (litp show arguments, depth of the REST request, output)
+SHOW_VARIANTS = (
+    ('show', ('', 1, 'text')),
+    ('recursive', ('-r', FULL_DEPTH, 'text')),
+    ('depth', ('-r -n 2', 2, 'text')),
+    ('json', ('-j -r', FULL_DEPTH, 'json')),
+    ('tree', ('-T -r', FULL_DEPTH, 'tree')),
+    ('list', ('-l -r', FULL_DEPTH, 'list')),
+)
+
+
+def build_deployment(size, items_per_node=ITEMS_PER_NODE):
+    """
+    Description:
+        Describe a deployment of exactly size items: the deployment, its
+        cluster, and nodes each holding a firewall config with rules
+    Args:
+        size (int): Number of items, at least 2
+        items_per_node (int): Items under and including each node
+    Returns:
+        str, ModelFixture, ModelFixture. Path of the deployment, the
+             deployment with its cluster, and the nodes
+    """
+    root = BENCH_ROOT.format(size)
+    cluster = root + '/clusters/c1'
+    skeleton = ModelFixture()
+    skeleton.create(root, 'deployment')
+    skeleton.create(cluster, 'cluster')
+    nodes = ModelFixture()
+    remaining = size - 2
+    num = 0
+    while remaining > 0:
+        num += 1
+        count = min(items_per_node, remaining)
+        remaining -= count
+        node = '{0}/nodes/n{1}'.format(cluster, num)
+        nodes.create(node, 'node', hostname='bench{0}'.format(num))
+        if count == 1:
+            continue
+        config = node + '/configs/fw'
+        nodes.create(config, 'firewall-node-config')
+        for rule in range(count - 2):
+            nodes.create('{0}/rules/r{1}'.format(config, rule),
+                         'firewall-rule',
+                         name='{0} bench{1}'.format(100 + rule, rule))
+    return root, skeleton, nodes
+
+
+def walk_rest_item(data):
+    """ An item of a REST response and the items embedded in it """
+    pending = [(data, 0)]
+    while pending:
+        item, level = pending.pop()
+        yield item, level
+        children = item.get('_embedded', {}).get('item', [])
+        pending.extend((child, level + 1) for child in reversed(children))
+
+
+def get_item_path(item):
+    """ Model path of a REST item """
+    href = item.get('_links', {}).get('self', {}).get('href', '')
+    return href.split('/litp/rest/v1', 1)[-1] or '/'
+
+
+def render_show(data, output):
+    """
+    Description:
+        Print a REST response the way a show variant does
+    Args:
+        data (dict): Decoded response
+        output (str): text, json, tree or list
+    Returns:
+        list. Output lines
+    """
+    if output == 'json':
+        return json.dumps(data, indent=4, sort_keys=True).splitlines()
+    lines = []
+    for item, level in walk_rest_item(data):
+        if output == 'list':
+            lines.append(get_item_path(item))
+        elif output == 'tree':
+            lines.append('{0}{1}'.format('    ' * level, item.get('id')))
+        else:
+            lines.append(get_item_path(item))
+            lines.append('    type: {0}'.format(item.get('item-type-name')))
+            lines.append('    state: {0}'.format(item.get('state')))
+            props = item.get('properties', {})
+            if props:
+                lines.append('    properties:')
+                lines.extend('        {0}: {1}'.format(name, props[name])
+                             for name in sorted(props))
+    return lines
+
+
+def run_local_variant(target, path, depth, output):
+    """
+    Description:
+        Make the request of a show variant on the fake litpd and print it
+    Returns:
+        dict. secs, rc and bytes of output
+    """
+    start = time.time()
+    status, _, body = target.rest.request(
+        'GET', '{0}?recurse_depth={1}'.format(path, depth))
+    lines = render_show(json.loads(body), output) if status == 200 else []
+    return {'secs': time.time() - start, 'rc': 0 if status == 200 else 1,
+            'bytes': sum(len(line) + 1 for line in lines)}
+
+
+def measure_local_memory(target, path, depth, output):
+    """ Peak KB allocated by one run of a variant, None if unknown """
+    if tracemalloc is None:
+        return None
+    tracemalloc.start()
+    try:
+        run_local_variant(target, path, depth, output)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak // 1024
+
+
+def measure_variant(target, path, variant, repeat):
+    """
+    Description:
+        Time a show variant repeatedly on a subtree
+    Args:
+        target (LocalTarget|MsTarget): System to run against
+        path (str): Subtree shown
+        variant (str): Name in SHOW_VARIANTS
+        repeat (int): Timed runs
+    Returns:
+        dict. Result record of the variant
+    """
+    args, depth, output = dict(SHOW_VARIANTS)[variant]
+    runs = []
+    for _ in range(repeat):
+        if target.kind == 'ms':
+            runs.append(target.run_litp('show -p {0} {1}'.format(path,
+                                                                 args)))
+        else:
+            runs.append(run_local_variant(target, path, depth, output))
+    failed = [run for run in runs if run['rc'] != 0]
+    if target.kind == 'ms':
+        memory = max([run['max_rss_kb'] for run in runs] or [None])
+        memory_kind = 'cli_max_rss'
+    else:
+        memory = measure_local_memory(target, path, depth, output)
+        memory_kind = 'client_peak_alloc'
+    return {'variant': variant, 'args': args,
+            'latency': summarise_secs([run['secs'] for run in runs]),
+            'bytes': runs[-1]['bytes'] if runs else 0,
+            'memory_kb': memory, 'memory_kind': memory_kind,
+            'failures': len(failed)}
+
+
+def fit_results(results):
+    """
+    Description:
+        Fit the latency and memory of each variant against the size
+    Args:
+        results (list): Result records with a size
+    Returns:
+        dict. Variant to {'latency': fit of p50, 'memory': fit}
+    """
+    fits = {}
+    for variant, _ in SHOW_VARIANTS:
+        records = [record for record in results
+                   if record['variant'] == variant]
+        if not records:
+            continue
+        fits[variant] = {
+            'latency': fit_power_law([(record['size'],
+                                       record['latency'].get('p50', 0))
+                                      for record in records]),
+            'memory': fit_power_law([(record['size'],
+                                      record['memory_kb'] or 0)
+                                     for record in records])}
+    return fits
+
+
+def main(argv=None):
+    """
+    Run the benchmark
+    """
+    parser = argparse.ArgumentParser(description='litp show scaling')
+    add_target_args(parser)
+    parser.add_argument('--sizes', default=','.join(
+        str(size) for size in DEFAULT_SIZES))
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT)
+    parser.add_argument('--items-per-node', type=int,
+                        default=ITEMS_PER_NODE)
+    parser.add_argument('--variants', default=','.join(
+        name for name, _ in SHOW_VARIANTS))
+    args = parser.parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(',')]
+    variants = args.variants.split(',')
+    target = get_target(args)
+    results = []
+    try:
+        described = target.describe()
+        for size in sizes:
+            root, skeleton, nodes = build_deployment(size,
+                                                     args.items_per_node)
+            start = time.time()
+            target.load_fixture(skeleton)
+            target.load_fixture(nodes)
+            sys.stderr.write('{0} items loaded in {1:.1f}s\n'.format(
+                size, time.time() - start))
+            try:
+                for variant in variants:
+                    record = measure_variant(target, root, variant,
+                                             args.repeat)
+                    record['size'] = size
+                    results.append(record)
+                    sys.stderr.write('  {0}: p50 {1:.3f}s\n'.format(
+                        variant, record['latency'].get('p50', 0)))
+            finally:
+                target.remove(root)
+    finally:
+        target.close()
+    params = {'sizes': sizes, 'repeat': args.repeat, 'variants': variants,
+              'items_per_node': args.items_per_node}
+    write_results(args.output, 'show_scaling', described, params, results,
+                  fits=fit_results(results))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,361 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Start-up profiler of the litp client. Every litp command of
+            the testsets, down to 'litp version' and 'litp -h', pays for
+            starting Python and importing the client before it does any
+            work. This runs litp subcommands on the MS under
+            tools/startup_probe.py and reports, per subcommand, the time
+            to the interpreter, to the first output and to the end, the
+            time spent importing each module, and a cProfile of a warm
+            run, with the page cache warm and dropped (cold).
+
+            The results are appended to a history file under the
+            litp_cli_pkg_version of package-details.properties and
+            compared with the last version before it: a subcommand whose
+            warm start-up got slower than --max-slowdown times that of the
+            previous version fails the run.
+
+            Dropping the page cache needs root; when --drop-caches-cmd
+            fails, only warm runs are made. Without --ms-ip the litp
+            script given with --litp is run on this host.
+
+            Usage, from the directory holding cli/:
+                python -m tools.startup_bench [--ms-ip IP] [-o startup.json]
+                                              [--subcommands 'version,-h']
+                                              [--repeat 10]
+                                              [--history FILE]
+                                              [--max-slowdown 1.1]
+'''
+
+import argparse
+import base64
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+from cli.session_pool import split_output
+from tools.bench import LITP_CMD, MsTarget, add_target_args, \
+    summarise_secs, write_results
+
+DEFAULT_SUBCOMMANDS = ('version', '-h', 'show -h', 'create -h', 'show -p /')
+DEFAULT_REPEAT = 10
+DEFAULT_HISTORY = 'startup_history.jsonl'
+DEFAULT_MAX_SLOWDOWN = 1.1
+DROP_CACHES_CMD = "sudo -n sh -c 'sync; echo 3 > /proc/sys/vm/drop_caches'"
+PACKAGE_DETAILS = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', '..', '..',
+    'ERICTAFlitpcli_CXP9031109', 'src', 'main', 'resources',
+    'taf_properties', 'package-details.properties')
+PROBE_SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            'startup_probe.py')
+TOP_MODULES = 30
+WARM = 'warm'
+COLD = 'cold'
+
+
+def read_package_details(path):
+    """
+    Description:
+        Read a package-details.properties file
+    Args:
+        path (str): Path of the file
+    Returns:
+        dict. Property name to value, empty if there is no file
+    """
+    details = {}
+    if not os.path.exists(path):
+        return details
+    with open(path) as props_file:
+        for line in props_file:
+            line = line.strip()
+            if line and not line.startswith('#') and '=' in line:
+                name, value = line.split('=', 1)
+                details[name.strip()] = value.strip()
+    return details
+
+
+class LocalShell(object):
+    """
+    This host, for profiling a litp client installed or checked out here
+    """
+
+    kind = 'local'
+
+    def describe(self):
+        """ What the results were measured against """
+        return {'kind': self.kind, 'host': platform.node()}
+
+    @staticmethod
+    def execute(cmd):
+        """ Run a shell command """
+        process = subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE,
+                                   stderr=subprocess.PIPE)
+        stdout, stderr = process.communicate()
+        return split_output(stdout), split_output(stderr), process.returncode
+
+    def close(self):
+        """ Nothing to close """
+
+
+class StartupProbe(object):
+    """
+    startup_probe.py copied to a temporary directory of the target, with
+    the interpreter the litp script names on its first line
+    """
+
+    def __init__(self, target, litp, drop_caches_cmd):
+        self.target = target
+        self.litp = litp
+        self.drop_caches_cmd = drop_caches_cmd
+        with open(PROBE_SOURCE, 'rb') as source:
+            encoded = base64.b64encode(source.read()).decode('ascii')
+        stdout, stderr, returnc = target.execute(
+            'd=$(mktemp -d) && echo {0} | base64 -d >"$d/probe.py" && '
+            'echo "$d"'.format(encoded))
+        if returnc != 0 or not stdout:
+            raise RuntimeError('cannot copy the probe: {0}'.format(
+                '\n'.join(stderr)))
+        self.directory = stdout[-1].strip()
+        stdout, _, _ = target.execute(
+            "sed -n '1s/^#! *//p' {0}".format(litp))
+        self.python = stdout[0].strip() if stdout else 'python'
+        self.can_drop_caches = self.drop_caches()
+
+    def drop_caches(self):
+        """ Empty the page cache, True if it was """
+        _, _, returnc = self.target.execute(self.drop_caches_cmd)
+        return returnc == 0
+
+    def run(self, mode, args, cold=False):
+        """
+        Description:
+            Run a litp subcommand under the probe, its output discarded
+        Args:
+            mode (str): plain, imports or profile
+            args (str): Arguments of litp
+            cold (bool): Drop the page cache first
+        Returns:
+            dict. What the probe recorded, None if it did not run
+        """
+        if cold:
+            self.drop_caches()
+        result_path = '{0}/result.json'.format(self.directory)
+        stdout, _, _ = self.target.execute(
+            'rm -f {0}; STARTUP_T0=$(date +%s.%N) {1} {2}/probe.py {3} {0} '
+            '{4} {5} >/dev/null 2>&1; cat {0}'.format(
+                result_path, self.python, self.directory, mode, self.litp,
+                args))
+        try:
+            return json.loads('\n'.join(stdout))
+        except ValueError:
+            return None
+
+    def close(self):
+        """ Remove the probe from the target """
+        self.target.execute('rm -rf {0}'.format(self.directory))
+
+
+def get_top_modules(imports, count=TOP_MODULES):
+    """ The modules whose own import took longest, as dicts """
+    rows = [{'module': name, 'secs': secs, 'own_secs': own}
+            for name, (secs, own) in imports.items()]
+    rows.sort(key=lambda row: -row['own_secs'])
+    return rows[:count]
+
+
+def measure_subcommand(probe, args, cache, repeat):
+    """
+    Description:
+        Time the start-up of a subcommand with a warm or cold page cache
+    Args:
+        probe (StartupProbe): Probe on the target
+        args (str): Arguments of litp
+        cache (str): warm or cold
+        repeat (int): Timed plain runs
+    Returns:
+        dict. Result record of the subcommand and cache
+    """
+    cold = cache == COLD
+    if not cold:
+        probe.run('plain', args)
+    runs = [probe.run('plain', args, cold) for _ in range(repeat)]
+    traced = probe.run('imports', args, cold)
+    done = [run for run in runs if run and run.get('rc') is not None]
+    first = [run['first_output_secs'] for run in done
+             if run['first_output_secs'] is not None]
+    record = {'subcommand': args, 'cache': cache,
+              'total': summarise_secs([run['total_secs'] for run in done]),
+              'first_output': summarise_secs(first),
+              'interpreter': summarise_secs([run['interpreter_secs']
+                                             for run in done]),
+              'rc': sorted(set(run['rc'] for run in done)),
+              'failures': len(runs) - len(done)}
+    if traced and 'imports' in traced:
+        record['import_secs'] = traced['import_secs']
+        record['imports'] = get_top_modules(traced['imports'])
+    if not cold:
+        profiled = probe.run('profile', args)
+        record['functions'] = (profiled or {}).get('functions', [])
+    return record
+
+
+def aggregate_modules(results):
+    """
+    Description:
+        Mean own import time of each module over the subcommands
+    Args:
+        results (list): Result records
+    Returns:
+        dict. Cache to the modules costing most, as dicts
+    """
+    modules = {}
+    for record in results:
+        counts = modules.setdefault(record['cache'], {})
+        for row in record.get('imports', []):
+            counts.setdefault(row['module'], []).append(row['own_secs'])
+    aggregated = {}
+    for cache, counts in modules.items():
+        rows = [{'module': name, 'mean_own_secs': sum(secs) / len(secs),
+                 'subcommands': len(secs)}
+                for name, secs in counts.items()]
+        rows.sort(key=lambda row: -row['mean_own_secs'])
+        aggregated[cache] = rows[:TOP_MODULES]
+    return aggregated
+
+
+def get_history_entry(version, installed, results):
+    """ The numbers of a run kept in the history, per subcommand """
+    subcommands = {}
+    for record in results:
+        entry = subcommands.setdefault(record['subcommand'], {})
+        entry[record['cache']] = record['total'].get('p50')
+        if record['cache'] == WARM:
+            entry['first_output'] = record['first_output'].get('p50')
+    return {'version': version, 'installed_version': installed,
+            'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'subcommands': subcommands}
+
+
+def read_history(path):
+    """ Entries of a history file, oldest first """
+    if not os.path.exists(path):
+        return []
+    with open(path) as history:
+        return [json.loads(line) for line in history if line.strip()]
+
+
+def compare_with_baseline(history, entry, max_slowdown):
+    """
+    Description:
+        Compare a run with the last one of another package version
+    Args:
+        history (list): Earlier entries, oldest first
+        entry (dict): Entry of this run
+        max_slowdown (float): Largest accepted ratio of warm start-up times
+    Returns:
+        dict. Baseline version, ratio per subcommand and the subcommands
+              slower than allowed, None without an earlier version
+    """
+    earlier = [old for old in history if old['version'] != entry['version']]
+    if not earlier:
+        return None
+    baseline = earlier[-1]
+    ratios = {}
+    for args, numbers in entry['subcommands'].items():
+        old = baseline['subcommands'].get(args, {}).get(WARM)
+        if old and numbers.get(WARM):
+            ratios[args] = numbers[WARM] / old
+    return {'version': baseline['version'], 'date': baseline['date'],
+            'ratios': ratios,
+            'regressions': sorted(args for args, ratio in ratios.items()
+                                  if ratio > max_slowdown)}
+
+
+def main(argv=None):
+    """
+    Run the profiler
+    """
+    parser = argparse.ArgumentParser(description='litp client start-up')
+    add_target_args(parser)
+    parser.add_argument('--litp', default=LITP_CMD)
+    parser.add_argument('--subcommands', default=','.join(
+        DEFAULT_SUBCOMMANDS))
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT)
+    parser.add_argument('--drop-caches-cmd', default=DROP_CACHES_CMD)
+    parser.add_argument('--package-details', default=PACKAGE_DETAILS)
+    parser.add_argument('--history', default=DEFAULT_HISTORY)
+    parser.add_argument('--max-slowdown', type=float,
+                        default=DEFAULT_MAX_SLOWDOWN)
+    args = parser.parse_args(argv)
+    details = read_package_details(args.package_details)
+    version = details.get('litp_cli_pkg_version')
+    subcommands = [sub.strip() for sub in args.subcommands.split(',')
+                   if sub.strip()]
+    target = MsTarget(args.ms_ip, args.user, args.password) \
+        if args.ms_ip else LocalShell()
+    results = []
+    installed = None
+    caches = [WARM]
+    try:
+        described = target.describe()
+        if 'litp_cli_pkg_name' in details:
+            stdout, _, returnc = target.execute(
+                "rpm -q --qf '%{{VERSION}}' {0}".format(
+                    details['litp_cli_pkg_name']))
+            installed = stdout[0].strip() if returnc == 0 and stdout \
+                else None
+        if installed and installed != version:
+            sys.stderr.write('installed {0} is {1}, package-details has '
+                             '{2}\n'.format(details['litp_cli_pkg_name'],
+                                            installed, version))
+        probe = StartupProbe(target, args.litp, args.drop_caches_cmd)
+        try:
+            if probe.can_drop_caches:
+                caches.append(COLD)
+            for sub in subcommands:
+                for cache in caches:
+                    record = measure_subcommand(probe, sub, cache,
+                                                args.repeat)
+                    results.append(record)
+                    sys.stderr.write(
+                        '{0} ({1}): p50 {2:.3f}s, first output {3:.3f}s, '
+                        'imports {4:.3f}s\n'.format(
+                            sub, cache, record['total'].get('p50', 0),
+                            record['first_output'].get('p50', 0),
+                            record.get('import_secs', 0)))
+        finally:
+            probe.close()
+    finally:
+        target.close()
+    entry = get_history_entry(version, installed, results)
+    baseline = compare_with_baseline(read_history(args.history), entry,
+                                     args.max_slowdown)
+    with open(args.history, 'a') as history:
+        history.write(json.dumps(entry, sort_keys=True) + '\n')
+    params = {'subcommands': subcommands, 'repeat': args.repeat,
+              'litp': args.litp, 'caches': caches,
+              'litp_cli_pkg_version': version,
+              'installed_version': installed}
+    write_results(args.output, 'cli_startup', described, params, results,
+                  modules=aggregate_modules(results), baseline=baseline)
+    if baseline and baseline['regressions']:
+        sys.stderr.write('slower than {0} by more than {1}x: {2}\n'.format(
+            baseline['version'], args.max_slowdown,
+            ', '.join(baseline['regressions'])))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,213 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Runs a Python script, e.g. the litp client, in place and
+            records how long it took to start: from a timestamp taken by
+            the shell before the interpreter was started (STARTUP_T0) to
+            the start of this probe, to the first byte of output, and to
+            the end. tools/startup_bench.py copies it to the MS and runs
+            the litp client under it.
+
+            Modes:
+                plain     first output and total time only
+                imports   also the time spent importing each module
+                profile   also a cProfile of the whole run
+
+            It is standalone and runs on the Python of the MS, 2.6 onwards.
+
+            Usage:
+                STARTUP_T0=$(date +%s.%N) python startup_probe.py \\
+                    MODE RESULT.json SCRIPT [ARGS...]
+'''
+
+# only what the probe needs before the script runs is imported up front,
+# so that modules the script imports are still timed; the rest is imported
+# when used
+import os
+import sys
+import time
+
+try:
+    import builtins
+except ImportError:
+    import __builtin__ as builtins
+
+STARTED = time.time()
+T0_ENV = 'STARTUP_T0'
+MODES = ('plain', 'imports', 'profile')
+TOP_FUNCTIONS = 30
+
+
+class FirstWrite(object):
+    """
+    Stream recording when output was first written to it, or to any other
+    stream sharing the same clock
+    """
+
+    def __init__(self, stream, clock):
+        self.stream = stream
+        self.clock = clock
+
+    def write(self, data):
+        """ Write, noting the time of the first output """
+        if data and not self.clock:
+            self.clock.append(time.time())
+        return self.stream.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+class ImportTimer(object):
+    """
+    Times the first import of every module, with and without the modules
+    it imports in turn
+    """
+
+    def __init__(self):
+        self.modules = {}
+        self._nested = []
+        self._import = builtins.__import__
+
+    def install(self):
+        """ Replace the import function """
+        builtins.__import__ = self.timed_import
+
+    def uninstall(self):
+        """ Restore the import function """
+        builtins.__import__ = self._import
+
+    def timed_import(self, name, *args, **kwargs):
+        """ Import, timing modules not imported yet """
+        if name in sys.modules:
+            return self._import(name, *args, **kwargs)
+        start = time.time()
+        self._nested.append(0.0)
+        try:
+            return self._import(name, *args, **kwargs)
+        finally:
+            nested = self._nested.pop()
+            secs = time.time() - start
+            if self._nested:
+                self._nested[-1] += secs
+            entry = self.modules.setdefault(name, [0.0, 0.0])
+            entry[0] += secs
+            entry[1] += secs - nested
+
+    def total_secs(self):
+        """ Time spent in imports, each second counted once """
+        return sum(own for _, own in self.modules.values())
+
+
+def get_exit_code(error):
+    """ Exit status of a SystemExit """
+    if error.code is None:
+        return 0
+    if isinstance(error.code, int):
+        return error.code
+    return 1
+
+
+def get_top_functions(profile, count=TOP_FUNCTIONS):
+    """ The functions of a profile taking the most cumulative time """
+    import pstats
+    stats = pstats.Stats(profile).stats
+    rows = []
+    for (filename, line, name), values in stats.items():
+        rows.append({'function': '{0}:{1}({2})'.format(filename, line,
+                                                       name),
+                     'calls': values[1], 'own_secs': values[2],
+                     'secs': values[3]})
+    rows.sort(key=lambda row: -row['secs'])
+    return rows[:count]
+
+
+def run_script(mode, script, args, result):
+    """
+    Description:
+        Run a script as __main__ with the probe's instrumentation
+    Args:
+        mode (str): One of MODES
+        script (str): Path of the script
+        args (list): Its arguments
+        result (dict): Filled in with the timings relative to STARTUP_T0,
+                       rc (None if the script raised) and per mode the
+                       module import times or the top functions
+    """
+    t0 = float(os.environ.get(T0_ENV) or STARTED)
+    clock = []
+    stdout, stderr = sys.stdout, sys.stderr
+    sys.stdout = FirstWrite(stdout, clock)
+    sys.stderr = FirstWrite(stderr, clock)
+    sys.argv = [script] + list(args)
+    sys.path[0] = os.path.dirname(os.path.abspath(script))
+    script_file = open(script)
+    try:
+        code = compile(script_file.read(), script, 'exec')
+    finally:
+        script_file.close()
+    namespace = {'__name__': '__main__', '__file__': script}
+    timer = ImportTimer() if mode == 'imports' else None
+    profile = None
+    if mode == 'profile':
+        import cProfile
+        profile = cProfile.Profile()
+    result.update({'mode': mode, 'rc': None,
+                   'interpreter_secs': STARTED - t0})
+    try:
+        if timer is not None:
+            timer.install()
+        if profile is not None:
+            profile.runctx(code, namespace, namespace)
+        else:
+            exec(code, namespace, namespace)
+        result['rc'] = 0
+    except SystemExit as error:
+        result['rc'] = get_exit_code(error)
+    finally:
+        end = time.time()
+        if timer is not None:
+            timer.uninstall()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        sys.stdout, sys.stderr = stdout, stderr
+        result['total_secs'] = end - t0
+        result['first_output_secs'] = clock[0] - t0 if clock else None
+        if timer is not None:
+            result['import_secs'] = timer.total_secs()
+            result['imports'] = timer.modules
+        if profile is not None:
+            profile.disable()
+            result['functions'] = get_top_functions(profile)
+
+
+def main(argv):
+    """
+    Run the script and write the result file
+    """
+    if len(argv) < 3 or argv[0] not in MODES:
+        sys.stderr.write(__doc__.split('Usage:')[-1])
+        return 2
+    mode, output, script = argv[:3]
+    result = {}
+    try:
+        run_script(mode, script, argv[3:], result)
+    finally:
+        import json
+        result_file = open(output, 'w')
+        try:
+            json.dump(result, result_file)
+        finally:
+            result_file.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,195 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Static scan of the cli testsets. Finds the test methods, their
+            @attr tags and what they do to the deployment, without
+            importing them (the testsets need atlib and a deployed MS).
+
+            Each test gets a kind:
+                read      - only reads the model or the help texts
+                model     - changes the model or files on the nodes
+                exclusive - creates/runs plans, restores the model or
+                            restarts litpd, so needs the MS to itself
+
+            Testsets setting use_model_snapshot restore the whole model only
+            after the tests run alone; the others keep the cleanup item by
+            item (see cli/model_snapshot.py), so their kind is that of
+            their own commands.
+'''
+
+import ast
+import glob
+import os
+
+READ = 'read'
+MODEL = 'model'
+EXCLUSIVE = 'exclusive'
+KINDS = (READ, MODEL, EXCLUSIVE)
+
+TESTSET_GLOB = 'testset_story*.py'
+TEST_PREFIX = 'test_'
+
+EXCLUSIVE_CALLS = frozenset([
+    'execute_cli_createplan_cmd', 'execute_cli_runplan_cmd',
+    'execute_cli_stopplan_cmd', 'execute_cli_removeplan_cmd',
+    'execute_cli_prepare_restore_cmd', 'execute_cli_restoremodel_cmd',
+    'wait_for_plan_state', 'run_and_check_plan', 'restart_litpd_service',
+    'create_run_and_wait_for_plan',
+])
+MODEL_CALLS = frozenset([
+    'execute_cli_create_cmd', 'execute_cli_update_cmd',
+    'execute_cli_remove_cmd', 'execute_cli_inherit_cmd',
+    'execute_cli_load_cmd', 'execute_cli_import_cmd',
+    'copy_file_to', 'create_dir_on_node', 'mv_file_on_node',
+    'remove_item', 'backup_path_props',
+])
+REST_CALLS = frozenset(['post', 'put', 'delete'])
+
+
+def find_testsets(cli_dir):
+    """
+    Description:
+        List the testset files of a directory
+    Args:
+        cli_dir (str): Directory holding the testsets
+    Returns:
+        list. Sorted testset paths
+    """
+    return sorted(glob.glob(os.path.join(cli_dir, TESTSET_GLOB)))
+
+
+def get_attrs(func):
+    """
+    Description:
+        Tags given to a test method with @attr(...)
+    Args:
+        func (ast.FunctionDef): Test method
+    Returns:
+        list. The tags in declaration order
+    """
+    tags = []
+    for decorator in func.decorator_list:
+        if isinstance(decorator, ast.Call) \
+                and getattr(decorator.func, 'id', None) == 'attr':
+            tags.extend(arg.s for arg in decorator.args
+                        if isinstance(arg, ast.Str))
+    return tags
+
+
+def _max_kind(*kinds):
+    """
+    The most demanding of some kinds
+    """
+    return max(kinds, key=KINDS.index)
+
+
+def _direct_kind(func):
+    """
+    Kind of a method from its own body, and the methods of self it calls
+    """
+    kind = READ
+    self_calls = set()
+    for node in ast.walk(func):
+        if not isinstance(node, ast.Call) \
+                or not isinstance(node.func, ast.Attribute):
+            continue
+        name = node.func.attr
+        owner = node.func.value
+        if isinstance(owner, ast.Name) and owner.id == 'self':
+            self_calls.add(name)
+        if name in EXCLUSIVE_CALLS:
+            kind = _max_kind(kind, EXCLUSIVE)
+        elif name in MODEL_CALLS:
+            kind = _max_kind(kind, MODEL)
+        elif name in REST_CALLS and isinstance(owner, ast.Attribute):
+            # self.rest.post(...) and friends
+            kind = _max_kind(kind, MODEL)
+        for keyword in node.keywords:
+            # True is a Name on python 2 and a constant on python 3
+            if keyword.arg == 'su_root' \
+                    and (getattr(keyword.value, 'id', None) == 'True'
+                         or getattr(keyword.value, 'value', None) is True):
+                kind = _max_kind(kind, MODEL)
+    return kind, self_calls
+
+
+def scan_class(cls_node):
+    """
+    Description:
+        Kind of every method of a test class, following calls to the
+        helper methods of the class
+    Args:
+        cls_node (ast.ClassDef): Test class
+    Returns:
+        dict. Method name to kind
+    """
+    methods = dict((node.name, node) for node in cls_node.body
+                   if isinstance(node, ast.FunctionDef))
+    direct = dict((name, _direct_kind(func))
+                  for name, func in methods.items())
+    kinds = {}
+    for name in methods:
+        kind = READ
+        seen = set()
+        pending = [name]
+        while pending:
+            current = pending.pop()
+            if current in seen or current not in direct:
+                continue
+            seen.add(current)
+            kind = _max_kind(kind, direct[current][0])
+            pending.extend(direct[current][1])
+        kinds[name] = kind
+    return kinds
+
+
+def scan_testset(path):
+    """
+    Description:
+        Describe the tests of a testset file
+    Args:
+        path (str): Testset file
+    Returns:
+        list. One dict per test method in file order, with keys
+              file, class, name, attrs, kind and line
+    """
+    with open(path) as source:
+        tree = ast.parse(source.read(), path)
+    tests = []
+    for cls_node in tree.body:
+        if not isinstance(cls_node, ast.ClassDef):
+            continue
+        kinds = scan_class(cls_node)
+        setup_kind = _max_kind(kinds.get('setUp', READ),
+                               kinds.get('tearDown', READ))
+        for func in cls_node.body:
+            if not isinstance(func, ast.FunctionDef) \
+                    or not func.name.startswith(TEST_PREFIX):
+                continue
+            attrs = get_attrs(func)
+            kind = _max_kind(kinds[func.name], setup_kind)
+            if EXCLUSIVE in attrs:
+                kind = EXCLUSIVE
+            tests.append({'file': path, 'class': cls_node.name,
+                          'name': func.name, 'attrs': attrs, 'kind': kind,
+                          'line': func.lineno})
+    return tests
+
+
+def nose_name(test):
+    """
+    Description:
+        Name of a test as nose takes it on the command line
+    Args:
+        test (dict): Test as returned by scan_testset
+    Returns:
+        str. e.g. cli/testset_story630.py:Story630.test_01_p_show
+    """
+    return '{0}:{1}.{2}'.format(test['file'], test['class'], test['name'])
@@ -0,0 +1,325 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Throughput benchmark of property updates and deletes, the
+            'litp update -o/-d' mixes of testset_story8290 and
+            testset_story5164 at scale. Thousands of operations are
+            spread over many logrotate rules, each setting and deleting
+            several properties at once, through the CLI and through REST
+            (a PUT with null values deleting properties, as in
+            story8290 test_02). Reports operations per second and latency
+            percentiles per kind of operation.
+
+            Every so often an operation carries an invalid value. These
+            are reported apart: they must be rejected and must leave the
+            properties of the item as they were, which is checked.
+
+            The CLI is only measured against an MS; against the fake litpd
+            only REST is.
+
+            Usage, from the directory holding cli/:
+                python -m tools.update_bench [--ms-ip IP] [-o update.json]
+                                             [--items 100] [--ops 2000]
+                                             [--props-per-op 4]
+                                             [--invalid-every 20]
+                                             [--workers 1]
+                                             [--interfaces cli,rest]
+'''
+
+import argparse
+import json
+import sys
+import threading
+import time
+
+from cli.model_fixture import ModelFixture
+from cli.rest_client import RestConnectionPool
+from tools.bench import add_target_args, get_target, summarise_secs, \
+    write_results
+
+CONFIG_PATH = '/ms/configs/update_bench'
+DEFAULT_ITEMS = 100
+DEFAULT_OPS = 2000
+DEFAULT_PROPS_PER_OP = 4
+DEFAULT_INVALID_EVERY = 20
+CLI = 'cli'
+REST = 'rest'
+
+# optional properties of a logrotate-rule with two valid values each
+OPTIONAL_PROPS = (('rotate', ('5', '7')), ('size', ('10M', '20M')),
+                  ('copytruncate', ('true', 'false')),
+                  ('compress', ('true', 'false')),
+                  ('copy', ('true', 'false')),
+                  ('delaycompress', ('true', 'false')))
+INVALID_PROP = ('rotate', 'never')
+
+UPDATE = 'update'
+DELETE = 'delete'
+MIXED = 'mixed'
+INVALID = 'invalid'
+
+
+def build_rules(items):
+    """
+    Description:
+        Describe the logrotate rules the operations work on
+    Args:
+        items (int): Number of rules
+    Returns:
+        ModelFixture, list. The rules with their config, and their paths
+    """
+    fixture = ModelFixture()
+    fixture.create(CONFIG_PATH, 'logrotate-rule-config')
+    paths = []
+    for num in range(items):
+        path = '{0}/rules/r{1}'.format(CONFIG_PATH, num)
+        fixture.create(path, 'logrotate-rule',
+                       [('name', 'bench{0}'.format(num)),
+                        ('path', '/var/log/bench{0}.log'.format(num))])
+        paths.append(path)
+    return fixture, paths
+
+
+def plan_operations(paths, count, props_per_op, invalid_every):
+    """
+    Description:
+        Plan the operations, round robin over the items. An operation on
+        an item sets the chosen properties it lacks and deletes the ones
+        it has, so every delete is of a property that exists.
+    Args:
+        paths (list): Item paths
+        count (int): Number of operations
+        props_per_op (int): Properties each operation touches
+        invalid_every (int): Every how many operations one carries an
+                             invalid value, 0 for none
+    Returns:
+        list. {'path', 'kind', 'set', 'delete'} per operation
+    """
+    props_per_op = max(1, min(props_per_op, len(OPTIONAL_PROPS)))
+    state = dict((path, set()) for path in paths)
+    operations = []
+    for index in range(count):
+        path = paths[index % len(paths)]
+        offset = (index // len(paths)) % len(OPTIONAL_PROPS)
+        chosen = [OPTIONAL_PROPS[(offset + num) % len(OPTIONAL_PROPS)]
+                  for num in range(props_per_op)]
+        value_index = (index // len(paths)) % 2
+        if invalid_every and index % invalid_every == invalid_every - 1:
+            values = dict((name, values[value_index])
+                          for name, values in chosen)
+            values[INVALID_PROP[0]] = INVALID_PROP[1]
+            operations.append({'path': path, 'kind': INVALID,
+                               'set': values, 'delete': []})
+            continue
+        present = [name for name, _ in chosen if name in state[path]]
+        if len(present) == len(chosen) and len(chosen) > 1 \
+                and index % 2:
+            # update half of them, delete the others
+            kept = present[:len(present) // 2]
+            values = dict((name, values[1 - value_index])
+                          for name, values in chosen if name in kept)
+            deleted = present[len(present) // 2:]
+        else:
+            values = dict((name, values[value_index])
+                          for name, values in chosen
+                          if name not in state[path])
+            deleted = present
+        kind = MIXED if values and deleted else (UPDATE if values
+                                                 else DELETE)
+        state[path].update(values)
+        state[path].difference_update(deleted)
+        operations.append({'path': path, 'kind': kind, 'set': values,
+                           'delete': deleted})
+    return operations
+
+
+def get_cli_args(operation):
+    """ Arguments of the litp update command of an operation """
+    args = ['update', '-p', operation['path']]
+    if operation['set']:
+        args.append('-o')
+        args.extend('{0}={1}'.format(name, operation['set'][name])
+                    for name in sorted(operation['set']))
+    if operation['delete']:
+        args.append('-d')
+        args.extend(sorted(operation['delete']))
+    return ' '.join(args)
+
+
+def get_rest_body(operation):
+    """ Body of the PUT of an operation, deleted properties set to null """
+    props = dict(operation['set'])
+    props.update((name, None) for name in operation['delete'])
+    return {'properties': props}
+
+
+class Runner(object):
+    """
+    Makes the operations over one interface, with the item properties
+    read around each invalid operation to check they did not change
+    """
+
+    def __init__(self, target, interface, workers):
+        self.target = target
+        self.interface = interface
+        self.pool = RestConnectionPool(size=workers, **target.rest_args)
+
+    def get_properties(self, path):
+        """ Properties of an item """
+        status, _, body = self.pool.request('GET', path)
+        if status != 200:
+            return None
+        return json.loads(body).get('properties', {})
+
+    def run(self, operation):
+        """
+        Description:
+            Make one operation
+        Args:
+            operation (dict): Operation from plan_operations
+        Returns:
+            dict. kind, secs, ok (accepted, or rejected if invalid) and
+                  changed (invalid operations that altered the item)
+        """
+        before = None
+        if operation['kind'] == INVALID:
+            before = self.get_properties(operation['path'])
+        start = time.time()
+        if self.interface == CLI:
+            accepted = self.target.run_litp(
+                get_cli_args(operation))['rc'] == 0
+        else:
+            status, _, _ = self.pool.request('PUT', operation['path'],
+                                             get_rest_body(operation))
+            accepted = status == 200
+        secs = time.time() - start
+        result = {'kind': operation['kind'], 'secs': secs}
+        if operation['kind'] == INVALID:
+            after = self.get_properties(operation['path'])
+            result['ok'] = not accepted
+            result['changed'] = after != before
+        else:
+            result['ok'] = accepted
+        return result
+
+
+def run_operations(runner, operations, workers):
+    """
+    Description:
+        Make the operations on worker threads; each item belongs to one
+        worker so the operations on an item keep their order
+    Returns:
+        list, float. Result per operation and the wall clock seconds
+    """
+    paths = sorted(set(operation['path'] for operation in operations))
+    owner = dict((path, index % workers) for index, path in enumerate(paths))
+    queues = [[] for _ in range(workers)]
+    for operation in operations:
+        queues[owner[operation['path']]].append(operation)
+    results = []
+    lock = threading.Lock()
+
+    def worker(queue):
+        """ Make the operations of one worker """
+        for operation in queue:
+            result = runner.run(operation)
+            with lock:
+                results.append(result)
+
+    threads = [threading.Thread(target=worker, args=(queue,))
+               for queue in queues if queue]
+    start = time.time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, time.time() - start
+
+
+def summarise_interface(interface, results, secs):
+    """
+    Result record of one interface
+    """
+    valid = [result for result in results if result['kind'] != INVALID]
+    invalid = [result for result in results if result['kind'] == INVALID]
+    by_kind = {}
+    for kind in (UPDATE, DELETE, MIXED):
+        runs = [result['secs'] for result in valid if result['kind'] == kind]
+        if runs:
+            by_kind[kind] = summarise_secs(runs)
+    return {'interface': interface, 'ops': len(results), 'secs': secs,
+            'ops_per_sec': len(results) / secs if secs else None,
+            'latency': summarise_secs([result['secs'] for result in valid]),
+            'by_kind': by_kind,
+            'errors': len([result for result in valid if not result['ok']]),
+            'invalid': {
+                'count': len(invalid),
+                'latency': summarise_secs([result['secs']
+                                           for result in invalid]),
+                'accepted': len([result for result in invalid
+                                 if not result['ok']]),
+                'changed': len([result for result in invalid
+                                if result['changed']])}}
+
+
+def main(argv=None):
+    """
+    Run the benchmark
+    """
+    parser = argparse.ArgumentParser(description='litp update throughput')
+    add_target_args(parser)
+    parser.add_argument('--items', type=int, default=DEFAULT_ITEMS)
+    parser.add_argument('--ops', type=int, default=DEFAULT_OPS)
+    parser.add_argument('--props-per-op', type=int,
+                        default=DEFAULT_PROPS_PER_OP)
+    parser.add_argument('--invalid-every', type=int,
+                        default=DEFAULT_INVALID_EVERY)
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--interfaces', default='{0},{1}'.format(CLI, REST))
+    args = parser.parse_args(argv)
+    target = get_target(args)
+    interfaces = [interface for interface in args.interfaces.split(',')
+                  if interface == REST or target.kind == 'ms']
+    workers = max(1, args.workers)
+    results = []
+    try:
+        described = target.describe()
+        for interface in interfaces:
+            fixture, paths = build_rules(args.items)
+            operations = plan_operations(paths, args.ops, args.props_per_op,
+                                         args.invalid_every)
+            target.load_fixture(fixture)
+            runner = Runner(target, interface, workers)
+            try:
+                runs, secs = run_operations(runner, operations, workers)
+            finally:
+                runner.pool.close()
+                target.remove(CONFIG_PATH)
+            record = summarise_interface(interface, runs, secs)
+            results.append(record)
+            sys.stderr.write(
+                '{0}: {1} ops, {2:.1f} ops/s, p99 {3:.3f}s, {4} errors, '
+                '{5} invalid changed the item\n'.format(
+                    interface, record['ops'], record['ops_per_sec'] or 0,
+                    record['latency'].get('p99', 0), record['errors'],
+                    record['invalid']['changed']))
+    finally:
+        target.close()
+    params = {'items': args.items, 'ops': args.ops,
+              'props_per_op': args.props_per_op,
+              'invalid_every': args.invalid_every, 'workers': workers,
+              'interfaces': interfaces}
+    write_results(args.output, 'update_throughput', described, params,
+                  results)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,229 @@
+'''
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP CLI team
+@summary:   Compares two LITP XML exports without holding either in
+            memory. Each file is read with a SAX parser and every element
+            is reduced, when it ends, to a digest of its tag, attributes,
+            text and the sorted digests of its children, so two exports
+            are equal when their root digests are, whatever the order of
+            the items in their collections. Only when they differ are the
+            files read again, once per level of items, each time keeping
+            the digests of the children of the items found to differ on
+            the level above only, to name the items that differ. An item
+            is named when its own digest, of its tag, attributes, text and
+            properties but not its child items, differs, whether or not
+            any of its child items differ too.
+            tools/export_bench.py copies it to the MS and compares the
+            exports there.
+
+            It is standalone and runs on the Python of the MS, 2.6 onwards.
+
+            Usage:
+                python xml_digest.py FIRST.xml SECOND.xml [MAX_DIFFS]
+'''
+
+import hashlib
+import json
+import os
+import sys
+import time
+import xml.sax
+from xml.sax.handler import ContentHandler, feature_external_ges
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+DEFAULT_MAX_DIFFS = 20
+COLLECTION_SUFFIX = '-collection'
+# attributes that say where the schema is rather than what the model is
+IGNORED_ATTRS = ('xsi:schemaLocation',)
+
+
+class DigestHandler(ContentHandler):
+    """
+    Digests the elements of a document as they end, keeping only the
+    elements still open
+    """
+
+    def __init__(self, record=None):
+        ContentHandler.__init__(self)
+        self.record = record
+        # per open element: tag, attributes, text, child digests, path,
+        # digests of the children without an id
+        self.stack = []
+        self.root = None
+        self.elements = 0
+        self.items = 0
+        self.paths = {}
+        self.own = {}
+
+    def startElement(self, name, attrs):
+        """ Open an element """
+        self.elements += 1
+        path = self.stack[-1][4] if self.stack else ''
+        item_id = attrs.get('id')
+        if item_id is not None:
+            path = '{0}/{1}'.format(path, item_id)
+            if not name.endswith(COLLECTION_SUFFIX):
+                self.items += 1
+        kept = sorted((key, attrs[key]) for key in attrs.keys()
+                      if not key.startswith('xmlns')
+                      and key not in IGNORED_ATTRS)
+        self.stack.append((name, kept, [], [], path, []))
+
+    def characters(self, content):
+        """ Keep the text of the open element, not the indentation """
+        if content.strip():
+            self.stack[-1][2].append(content)
+
+    def endElement(self, name):
+        """ Digest the element and hand the digest to its parent """
+        _, attrs, text, children, path, properties = self.stack.pop()
+        value = get_digest(name, attrs, text, children)
+        parent_path = ''
+        if self.stack:
+            self.stack[-1][3].append(value)
+            parent_path = self.stack[-1][4]
+            if path == parent_path:
+                self.stack[-1][5].append(value)
+        else:
+            self.root = value
+        if self.record is None:
+            return
+        # the element of an id, or the top
+        if path in self.record and (path != parent_path or not self.stack):
+            self.own[path] = get_digest(name, attrs, text, properties)
+        if path != parent_path and parent_path in self.record:
+            self.paths[path] = value
+
+
+def get_digest(name, attrs, text, children):
+    """ Digest of an element from its parts and the digests of children """
+    digest = hashlib.sha1()
+    for part in [name, repr(attrs), ''.join(text).strip()]:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    for child in sorted(children):
+        digest.update(child)
+    return digest.digest()
+
+
+def digest_file(path, record=None):
+    """
+    Description:
+        Read an XML file and digest it
+    Args:
+        path (str): XML file
+        record (set): Paths of ids, '' for the top, whose own digest and
+                      whose children with an id have their digest kept
+                      by path
+    Returns:
+        DigestHandler. root digest, elements, items, paths and own
+    """
+    handler = DigestHandler(record)
+    parser = xml.sax.make_parser()
+    parser.setFeature(feature_external_ges, False)
+    parser.setContentHandler(handler)
+    parser.parse(path)
+    return handler
+
+
+def find_differences(first_path, second_path, max_diffs=DEFAULT_MAX_DIFFS):
+    """
+    Description:
+        Name the items that differ between two files in their own
+        digest, or are in one file only, reading them level by level and
+        going down into differing items only, at most max_diffs of them
+        on each level
+    Args:
+        first_path (str): First file
+        second_path (str): Second file
+        max_diffs (int): Most paths returned
+    Returns:
+        list. Sorted paths, each in only one file or different in both;
+              '/' when only the top differs
+    """
+    found = []
+    parents = ['']
+    while parents and len(found) < max_diffs:
+        first = digest_file(first_path, set(parents))
+        second = digest_file(second_path, set(parents))
+        differ = sorted(path for path in set(first.paths) | set(second.paths)
+                        if first.paths.get(path) != second.paths.get(path))
+        # reported whether or not some of its child items differ too
+        found.extend(parent or '/' for parent in parents
+                     if first.own.get(parent) != second.own.get(parent))
+        parents = []
+        for path in differ:
+            if len(found) + len(parents) >= max_diffs:
+                break
+            if path in first.paths and path in second.paths:
+                parents.append(path)
+            else:
+                # in one file only, nothing below it to compare
+                found.append(path)
+    return sorted(found)[:max_diffs]
+
+
+def get_max_rss_kb():
+    """ Peak resident memory of this process in KB, None if unknown """
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def compare_files(first_path, second_path, max_diffs=DEFAULT_MAX_DIFFS):
+    """
+    Description:
+        Compare two XML exports
+    Args:
+        first_path (str): First file
+        second_path (str): Second file
+        max_diffs (int): Most differing paths reported
+    Returns:
+        dict. equal, and per file bytes, elements and items, the
+              differing paths, secs and the peak memory of the comparison
+    """
+    start = time.time()
+    first = digest_file(first_path)
+    second = digest_file(second_path)
+    equal = first.root == second.root
+    differences = []
+    if not equal:
+        differences = find_differences(first_path, second_path, max_diffs)
+    return {'equal': equal,
+            'bytes': [os.path.getsize(first_path),
+                      os.path.getsize(second_path)],
+            'elements': [first.elements, second.elements],
+            'items': [first.items, second.items],
+            'differences': differences,
+            'secs': time.time() - start,
+            'max_rss_kb': get_max_rss_kb()}
+
+
+def main(argv=None):
+    """
+    Compare two files, print the result as JSON; 0 if they are equal
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) not in (2, 3):
+        sys.stderr.write('Usage: xml_digest.py FIRST.xml SECOND.xml '
+                         '[MAX_DIFFS]\n')
+        return 2
+    max_diffs = int(argv[2]) if len(argv) == 3 else DEFAULT_MAX_DIFFS
+    result = compare_files(argv[0], argv[1], max_diffs)
+    sys.stdout.write(json.dumps(result, sort_keys=True) + '\n')
+    return 0 if result['equal'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())